@@ -24,12 +24,14 @@ extras = {
         "pytest-xdist>=2.1.0",
     ],
     "docs": ["sphinx"],
+    "fast": ["orjson>=3.6.0"],
     "models": [
         "beautifulsoup4>=4.4.0",
         "inflection>=0.5.1",
         "requests>=2.18.1",
+        "httpx>=0.26.0",
         "lxml>=4.2.1",
-        "pyarrow>=1.0.1",
+        "pyarrow>=14.0.0",
         "pyjanitor>=0.23.1",
         "pyreadr>=0.4.0",
         "scipy>=1.4.0",
@@ -40,7 +42,7 @@ extras = {
     ],
 }
 
-extras["all"] = extras["tests"] + extras["docs"] + extras["models"]
+extras["all"] = extras["tests"] + extras["docs"] + extras["models"] + extras["fast"]
 
 setup(
     name="sportsdataverse",
@@ -106,8 +108,9 @@ setup(
         "beautifulsoup4>=4.4.0",
         "inflection>=0.5.1",
         "requests>=2.18.1",
+        "httpx>=0.26.0",
         "lxml>=4.2.1",
-        "pyarrow>=8.0.0",
+        "pyarrow>=14.0.0",
         "pyjanitor>=0.23.1",
         "pyreadr>=0.4.9",
         "scipy>=1.4.0",
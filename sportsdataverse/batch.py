@@ -0,0 +1,80 @@
+import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Iterable, Iterator
+
+from sportsdataverse.cfb.cfb_pbp import CFBPlayProcess
+from sportsdataverse.mbb.mbb_pbp import espn_mbb_pbp
+from sportsdataverse.nba.nba_pbp import espn_nba_pbp
+from sportsdataverse.nfl.nfl_pbp import NFLPlayProcess
+from sportsdataverse.nhl.nhl_pbp import espn_nhl_pbp
+from sportsdataverse.wbb.wbb_pbp import espn_wbb_pbp
+from sportsdataverse.wnba.wnba_pbp import espn_wnba_pbp
+
+GameResult = namedtuple("GameResult", ["game_id", "result", "error", "seconds"])
+GameResult.__doc__ = """Outcome of one game fetched by `fetch_games()`.
+
+Exactly one of `result` and `error` is set. `seconds` is the wall-clock time spent on the game.
+"""
+
+LEAGUE_FETCHERS = {
+    "cfb": lambda game_id, raw, **kwargs: CFBPlayProcess(gameId=game_id, raw=raw).espn_cfb_pbp(**kwargs),
+    "nfl": lambda game_id, raw, **kwargs: NFLPlayProcess(gameId=game_id, raw=raw).espn_nfl_pbp(**kwargs),
+    "mbb": lambda game_id, raw, **kwargs: espn_mbb_pbp(game_id=game_id, raw=raw, **kwargs),
+    "nba": lambda game_id, raw, **kwargs: espn_nba_pbp(game_id=game_id, raw=raw, **kwargs),
+    "nhl": lambda game_id, raw, **kwargs: espn_nhl_pbp(game_id=game_id, raw=raw, **kwargs),
+    "wbb": lambda game_id, raw, **kwargs: espn_wbb_pbp(game_id=game_id, raw=raw, **kwargs),
+    "wnba": lambda game_id, raw, **kwargs: espn_wnba_pbp(game_id=game_id, raw=raw, **kwargs),
+}
+
+
+def fetch_games(league: str, game_ids: Iterable[int], concurrency=8, raw=False, **kwargs) -> Iterator[GameResult]:
+    """fetch_games() - Pull many games of one league with a bounded pool of worker threads.
+
+    Results are yielded as soon as each game finishes, in completion order. At most `concurrency`
+    games are in flight and `game_ids` is consumed lazily, so memory stays flat even for seasons of
+    several thousand games as long as the caller does not keep every result around.
+
+    Args:
+        league (str): One of "cfb", "nfl", "mbb", "nba", "nhl", "wbb", "wnba".
+        game_ids (Iterable[int]): Game ids to pull, e.g. the `game_id` column of a schedule.
+        concurrency (int): Number of games fetched at the same time.
+        raw (bool): Passed to the league's pbp fetcher.
+        **kwargs: Passed to `dl_utils.download()` through the league's pbp fetcher, e.g. a shared
+            `retry_budget=dl_utils.RetryBudget(...)` so a throttled batch fails fast instead of sleeping.
+
+    Returns:
+        Iterator[GameResult]: `(game_id, result, error, seconds)` tuples. A failed game carries the
+        exception in `error` instead of stopping the whole batch.
+
+    Example:
+        `for game_id, pbp, error, seconds in sportsdataverse.batch.fetch_games("mbb", game_ids, concurrency=16): ...`
+    """
+    try:
+        fetcher = LEAGUE_FETCHERS[league.lower()]
+    except KeyError:
+        raise ValueError(f"league must be one of {sorted(LEAGUE_FETCHERS)}, got {league!r}") from None
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    def run(game_id):
+        tic = time.perf_counter()
+        try:
+            return GameResult(game_id, fetcher(game_id, raw, **kwargs), None, time.perf_counter() - tic)
+        except Exception as e:
+            return GameResult(game_id, None, e, time.perf_counter() - tic)
+
+    ids = iter(game_ids)
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        in_flight = set()
+        for game_id in ids:
+            in_flight.add(executor.submit(run, game_id))
+            if len(in_flight) >= concurrency:
+                break
+        while in_flight:
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                next_id = next(ids, None)
+                if next_id is not None:
+                    in_flight.add(executor.submit(run, next_id))
+                yield future.result()
@@ -0,0 +1,212 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+CacheEntry = namedtuple("CacheEntry", ["url", "status_code", "headers", "content", "stored_at", "expires_at"])
+
+_CACHE_LOCK = threading.Lock()
+_CACHE = None
+
+
+class ResponseCache:
+    """ResponseCache - Persistent, status-aware cache of ESPN responses backed by SQLite.
+
+    Entries are keyed on the canonical url (see `canonical_url()`), so the millisecond cache buster the
+    pbp fetchers append does not defeat the cache. How long an entry stays fresh depends on the games
+    it describes: forever once every game in the payload is completed, `live_ttl` seconds while a game
+    is in progress and `default_ttl` seconds otherwise. Stale entries that carry an `ETag` or
+    `Last-Modified` header are revalidated with a conditional request instead of being downloaded again.
+
+    Args:
+        cache_dir (str): Directory holding the `responses.sqlite` database, created if missing.
+        live_ttl (float): Freshness in seconds of payloads with an in-progress game.
+        default_ttl (float): Freshness in seconds of payloads without a completed or live game.
+
+    Example:
+        `cache = sportsdataverse.cache.ResponseCache(cache_dir="~/.sportsdataverse/http")`
+    """
+
+    def __init__(self, cache_dir, live_ttl=10, default_ttl=300):
+        self.cache_dir = os.path.abspath(os.path.expanduser(cache_dir))
+        self.live_ttl = live_ttl
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            os.path.join(self.cache_dir, "responses.sqlite"), check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, url TEXT, status_code INTEGER, headers TEXT, content BLOB, "
+            "stored_at REAL, expires_at REAL)"
+        )
+
+    def get(self, key) -> Optional[CacheEntry]:
+        """Return the entry stored under `key`, fresh or stale, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, status_code, headers, content, stored_at, expires_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        return CacheEntry(row[0], row[1], json.loads(row[2]), bytes(row[3]), row[4], row[5])
+
+    def set(self, key, url, status_code, headers, content, payload=None) -> CacheEntry:
+        """Store a 200 response under `key`, with an expiry derived from the game status in `content`.
+
+        `payload` is the already decoded `content`, when the caller has it, to avoid decoding it again.
+        """
+        stored_at = time.time()
+        ttl = self.ttl_for(content, payload)
+        expires_at = None if ttl is None else stored_at + ttl
+        headers = {k: v for k, v in dict(headers).items() if k.lower() in _KEPT_HEADERS}
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, url, status_code, json.dumps(headers), content, stored_at, expires_at),
+            )
+        return CacheEntry(url, status_code, headers, content, stored_at, expires_at)
+
+    def touch(self, key, entry) -> CacheEntry:
+        """Mark a revalidated (304) entry fresh again."""
+        self.revalidated += 1
+        return self.set(key, entry.url, entry.status_code, entry.headers, entry.content)
+
+    def delete(self, key):
+        with self._lock:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def is_fresh(self, entry) -> bool:
+        return entry.expires_at is None or entry.expires_at > time.time()
+
+    def ttl_for(self, content, payload=None) -> Optional[float]:
+        """Seconds `content` stays fresh, None meaning forever (every game in it is completed)."""
+        if payload is None:
+            try:
+                payload = json.loads(content)
+            except ValueError:
+                return self.default_ttl
+        statuses = _game_statuses(payload)
+        if not statuses:
+            return self.default_ttl
+        if any(s == "in" for s in statuses):
+            return self.live_ttl
+        if all(s == "post" for s in statuses):
+            return None
+        return self.default_ttl
+
+    def conditional_headers(self, entry) -> dict:
+        """Headers turning a request for a stale entry into a conditional one."""
+        headers = {k.lower(): v for k, v in entry.headers.items()}
+        conditional = {}
+        if "etag" in headers:
+            conditional["If-None-Match"] = headers["etag"]
+        if "last-modified" in headers:
+            conditional["If-Modified-Since"] = headers["last-modified"]
+        return conditional
+
+
+_KEPT_HEADERS = {"content-type", "etag", "last-modified", "date"}
+
+
+def _game_statuses(payload):
+    """Collect "pre"/"in"/"post" states of the games described by an ESPN or NHL API payload."""
+    if not isinstance(payload, dict):
+        return []
+    types = []
+    for competition in (payload.get("header") or {}).get("competitions") or []:
+        types.append(((competition.get("status") or {}).get("type")) or {})
+    for event in payload.get("events") or []:
+        if isinstance(event, dict):
+            types.append(((event.get("status") or {}).get("type")) or {})
+    states = []
+    for status_type in types:
+        if status_type.get("completed") is True:
+            states.append("post")
+        elif status_type.get("state") in ("pre", "in", "post"):
+            states.append(status_type["state"])
+    game_state = ((payload.get("gameData") or {}).get("status") or {}).get("abstractGameState")
+    if game_state is not None:
+        states.append({"Final": "post", "Live": "in"}.get(game_state, "pre"))
+    return states
+
+
+def canonical_url(url, params=None) -> str:
+    """canonical_url() - Cache key of a request: the url with its parameters merged and sorted.
+
+    Bare numeric query parts such as the millisecond cache buster in
+    `summary?event=401256137&1693526400000` and parameters whose value is None are dropped.
+
+    Args:
+        url (str): Request url.
+        params (dict): Query parameters sent with the request, or a list of `(key, value)` pairs.
+
+    Returns:
+        str: The canonical url.
+
+    Example:
+        `sportsdataverse.cache.canonical_url("https://site.api.espn.com/x?b=2&a=1&1693526400000")`
+    """
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if not (v == "" and k.isdigit())]
+    pairs = params.items() if isinstance(params, dict) else (params or [])
+    query += [(k, str(v)) for k, v in pairs if v is not None]
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, urlencode(sorted(query)), ""))
+
+
+def enable_cache(cache_dir="~/.sportsdataverse/http_cache", live_ttl=10, default_ttl=300) -> ResponseCache:
+    """enable_cache() - Turn on the persistent response cache for every `download()` call.
+
+    Args:
+        cache_dir (str): Directory of the cache database.
+        live_ttl (float): Freshness in seconds of payloads with an in-progress game.
+        default_ttl (float): Freshness in seconds of payloads without a completed or live game.
+
+    Returns:
+        ResponseCache: The cache now in use.
+
+    Example:
+        `sportsdataverse.cache.enable_cache(cache_dir="/data/espn_cache")`
+    """
+    global _CACHE
+    with _CACHE_LOCK:
+        if _CACHE is not None:
+            _CACHE.close()
+        _CACHE = ResponseCache(cache_dir, live_ttl=live_ttl, default_ttl=default_ttl)
+        return _CACHE
+
+
+def disable_cache():
+    """disable_cache() - Turn off the response cache enabled by `enable_cache()`."""
+    global _CACHE
+    with _CACHE_LOCK:
+        if _CACHE is not None:
+            _CACHE.close()
+        _CACHE = None
+
+
+def get_cache() -> Optional[ResponseCache]:
+    """get_cache() - The cache enabled by `enable_cache()`, or None."""
+    return _CACHE
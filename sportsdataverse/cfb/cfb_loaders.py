@@ -1,8 +1,8 @@
-from typing import List
+from typing import Dict, Iterator, List, Optional
 
 import polars as pl
-from tqdm import tqdm
 
+from sportsdataverse.cfb.cfb_schedule import most_recent_cfb_season
 from sportsdataverse.config import (
     CFB_BASE_URL,
     CFB_BETTING_LINES_URL,
@@ -11,10 +11,29 @@ from sportsdataverse.config import (
     CFB_TEAM_LOGO_URL,
     CFB_TEAM_SCHEDULE_URL,
 )
-from sportsdataverse.errors import SeasonNotFoundError
-
-
-def load_cfb_pbp(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
+from sportsdataverse.dl_utils import convert_frame
+from sportsdataverse.loader_utils import (
+    compact_frame,
+    iter_seasons,
+    load_seasons,
+    read_parquet_url,
+    refresh_seasons,
+    scan_parquet_url,
+    scan_seasons,
+)
+from sportsdataverse.store import DataStore
+
+
+def load_cfb_pbp(
+    seasons: List[int],
+    return_as_pandas=False,
+    return_as=None,
+    max_workers=None,
+    progress=True,
+    cache_dir=None,
+    columns=None,
+    compact=False,
+) -> pl.DataFrame:
     """Load college football play by play data going back to 2003
 
     Example:
@@ -23,6 +42,14 @@ def load_cfb_pbp(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
     Args:
         seasons (list): Used to define different seasons. 2003 is the earliest available season.
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        max_workers (int): Number of seasons downloaded at the same time, defaults to 4.
+        progress (bool or callable): If True, show a tqdm progress bar. A callable is called as
+            `progress(done, total)` after each season.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None. Without a file cache only these columns are downloaded.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
 
     Returns:
         pl.DataFrame: Polars dataframe containing the play-by-plays available for the requested seasons.
@@ -30,18 +57,101 @@ def load_cfb_pbp(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
     Raises:
         ValueError: If `season` is less than 2003.
     """
-    data = pl.DataFrame()
-    if type(seasons) is int:
-        seasons = [seasons]
-    for i in tqdm(seasons):
-        if int(i) < 2003:
-            raise SeasonNotFoundError("season cannot be less than 2003")
-        i_data = pl.read_parquet(CFB_BASE_URL.format(season=i), use_pyarrow=True, columns=None)
-        data = pl.concat([data, i_data], how="vertical")
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
+    data = load_seasons(
+        CFB_BASE_URL,
+        seasons,
+        min_season=2003,
+        max_workers=max_workers,
+        progress=progress,
+        cache_dir=cache_dir,
+        columns=columns,
+        compact=compact,
+    )
+    return convert_frame(data, return_as_pandas, return_as, use_pyarrow_extension_array=True)
+
+
+def scan_cfb_pbp(seasons: List[int], max_workers=None, cache_dir=None, compact=False) -> pl.LazyFrame:
+    """Lazily scan college football play by play data going back to 2003
+
+    Example:
+        `cfb_df = sportsdataverse.cfb.scan_cfb_pbp(seasons=range(2003,2021)).collect()`
+
+    Args:
+        seasons (list): Used to define different seasons. 2003 is the earliest available season.
+        max_workers (int): Number of season files downloaded at the same time, defaults to 4.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
+
+    Returns:
+        pl.LazyFrame: Lazy frame over the data of `load_cfb_pbp()`.
+
+    Raises:
+        ValueError: If `season` is less than 2003.
+    """
+    return scan_seasons(
+        CFB_BASE_URL, seasons, min_season=2003, max_workers=max_workers, cache_dir=cache_dir, compact=compact
+    )
+
+
+def iter_cfb_pbp(
+    seasons: List[int], return_as_pandas=False, return_as=None, by="season", prefetch=1, cache_dir=None, columns=None
+) -> Iterator[pl.DataFrame]:
+    """Iterate over college football play by play data going back to 2003, one season at a time
+
+    Example:
+        `for df in sportsdataverse.cfb.iter_cfb_pbp(seasons=range(2003,2021)): print(df.shape)`
+
+    Args:
+        seasons (list): Used to define different seasons. 2003 is the earliest available season.
+        return_as_pandas (bool): If True, yields pandas dataframes. If False, yields polars dataframes.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        by (str): "season" yields one dataframe per season, "row_group" one per parquet row group.
+        prefetch (int): Number of seasons downloaded in the background ahead of the current one.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None.
+
+    Returns:
+        Iterator[pl.DataFrame]: One dataframe per season (or row group) of `load_cfb_pbp()`.
+
+    Raises:
+        ValueError: If `season` is less than 2003.
+    """
+    frames = iter_seasons(
+        CFB_BASE_URL, seasons, min_season=2003, by=by, prefetch=prefetch, cache_dir=cache_dir, columns=columns
+    )
+    return (convert_frame(df, return_as_pandas, return_as, use_pyarrow_extension_array=True) for df in frames)
+
+
+def refresh_cfb_pbp(store: DataStore, seasons: Optional[List[int]] = None) -> Dict[int, int]:
+    """Refresh college football play by play data kept in a `DataStore`
 
+    Only the games missing from the store are downloaded from a changed season file.
+
+    Example:
+        `sportsdataverse.cfb.refresh_cfb_pbp(sportsdataverse.store.DataStore())`
+
+    Args:
+        store (DataStore): Store holding the copy, under `league="cfb"` and `dataset="pbp"`.
+        seasons (list): Seasons to refresh, defaults to the most recent season.
 
-def load_cfb_schedule(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
+    Returns:
+        dict: Number of rows written per season.
+    """
+    seasons = [most_recent_cfb_season()] if seasons is None else seasons
+    return refresh_seasons(CFB_BASE_URL, seasons, min_season=2003, store=store, league="cfb", dataset="pbp")
+
+
+def load_cfb_schedule(
+    seasons: List[int],
+    return_as_pandas=False,
+    return_as=None,
+    max_workers=None,
+    progress=True,
+    cache_dir=None,
+    columns=None,
+    compact=False,
+) -> pl.DataFrame:
     """Load college football schedule data
 
     Example:
@@ -50,6 +160,14 @@ def load_cfb_schedule(seasons: List[int], return_as_pandas=False) -> pl.DataFram
     Args:
         seasons (list): Used to define different seasons. 2002 is the earliest available season.
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        max_workers (int): Number of seasons downloaded at the same time, defaults to 4.
+        progress (bool or callable): If True, show a tqdm progress bar. A callable is called as
+            `progress(done, total)` after each season.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None. Without a file cache only these columns are downloaded.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
 
     Returns:
         pl.DataFrame: Polars dataframe containing the schedule for the requested seasons.
@@ -57,19 +175,103 @@ def load_cfb_schedule(seasons: List[int], return_as_pandas=False) -> pl.DataFram
     Raises:
         ValueError: If `season` is less than 2002.
     """
-    data = pl.DataFrame()
-    if type(seasons) is int:
-        seasons = [seasons]
-    for i in tqdm(seasons):
-        if int(i) < 2002:
-            raise SeasonNotFoundError("season cannot be less than 2002")
-        i_data = pl.read_parquet(CFB_TEAM_SCHEDULE_URL.format(season=i), use_pyarrow=True, columns=None)
-        # data = data.append(i_data)
-        data = pl.concat([data, i_data], how="vertical")
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
+    data = load_seasons(
+        CFB_TEAM_SCHEDULE_URL,
+        seasons,
+        min_season=2002,
+        max_workers=max_workers,
+        progress=progress,
+        cache_dir=cache_dir,
+        columns=columns,
+        compact=compact,
+    )
+    return convert_frame(data, return_as_pandas, return_as, use_pyarrow_extension_array=True)
+
+
+def scan_cfb_schedule(seasons: List[int], max_workers=None, cache_dir=None, compact=False) -> pl.LazyFrame:
+    """Lazily scan college football schedule data
+
+    Example:
+        `cfb_df = sportsdataverse.cfb.scan_cfb_schedule(seasons=range(2002,2021)).collect()`
+
+    Args:
+        seasons (list): Used to define different seasons. 2002 is the earliest available season.
+        max_workers (int): Number of season files downloaded at the same time, defaults to 4.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
+
+    Returns:
+        pl.LazyFrame: Lazy frame over the data of `load_cfb_schedule()`.
+
+    Raises:
+        ValueError: If `season` is less than 2002.
+    """
+    return scan_seasons(
+        CFB_TEAM_SCHEDULE_URL, seasons, min_season=2002, max_workers=max_workers, cache_dir=cache_dir, compact=compact
+    )
+
+
+def iter_cfb_schedule(
+    seasons: List[int], return_as_pandas=False, return_as=None, by="season", prefetch=1, cache_dir=None, columns=None
+) -> Iterator[pl.DataFrame]:
+    """Iterate over college football schedule data, one season at a time
 
+    Example:
+        `for df in sportsdataverse.cfb.iter_cfb_schedule(seasons=range(2002,2021)): print(df.shape)`
+
+    Args:
+        seasons (list): Used to define different seasons. 2002 is the earliest available season.
+        return_as_pandas (bool): If True, yields pandas dataframes. If False, yields polars dataframes.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        by (str): "season" yields one dataframe per season, "row_group" one per parquet row group.
+        prefetch (int): Number of seasons downloaded in the background ahead of the current one.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None.
+
+    Returns:
+        Iterator[pl.DataFrame]: One dataframe per season (or row group) of `load_cfb_schedule()`.
+
+    Raises:
+        ValueError: If `season` is less than 2002.
+    """
+    frames = iter_seasons(
+        CFB_TEAM_SCHEDULE_URL, seasons, min_season=2002, by=by, prefetch=prefetch, cache_dir=cache_dir, columns=columns
+    )
+    return (convert_frame(df, return_as_pandas, return_as, use_pyarrow_extension_array=True) for df in frames)
+
+
+def refresh_cfb_schedule(store: DataStore, seasons: Optional[List[int]] = None) -> Dict[int, int]:
+    """Refresh college football schedule data kept in a `DataStore`
+
+    Changed season files are re-downloaded as a whole, since their rows are updated in place.
+
+    Example:
+        `sportsdataverse.cfb.refresh_cfb_schedule(sportsdataverse.store.DataStore())`
+
+    Args:
+        store (DataStore): Store holding the copy, under `league="cfb"` and `dataset="schedule"`.
+        seasons (list): Seasons to refresh, defaults to the most recent season.
 
-def load_cfb_rosters(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
+    Returns:
+        dict: Number of rows written per season.
+    """
+    seasons = [most_recent_cfb_season()] if seasons is None else seasons
+    return refresh_seasons(
+        CFB_TEAM_SCHEDULE_URL, seasons, min_season=2002, store=store, league="cfb", dataset="schedule", key=None
+    )
+
+
+def load_cfb_rosters(
+    seasons: List[int],
+    return_as_pandas=False,
+    return_as=None,
+    max_workers=None,
+    progress=True,
+    cache_dir=None,
+    columns=None,
+    compact=False,
+) -> pl.DataFrame:
     """Load roster data
 
     Example:
@@ -78,6 +280,14 @@ def load_cfb_rosters(seasons: List[int], return_as_pandas=False) -> pl.DataFrame
     Args:
         seasons (list): Used to define different seasons. 2014 is the earliest available season.
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        max_workers (int): Number of seasons downloaded at the same time, defaults to 4.
+        progress (bool or callable): If True, show a tqdm progress bar. A callable is called as
+            `progress(done, total)` after each season.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None. Without a file cache only these columns are downloaded.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
 
     Returns:
         pl.DataFrame: Polars dataframe containing rosters available for the requested seasons.
@@ -85,18 +295,82 @@ def load_cfb_rosters(seasons: List[int], return_as_pandas=False) -> pl.DataFrame
     Raises:
         ValueError: If `season` is less than 2014.
     """
-    data = pl.DataFrame()
-    if type(seasons) is int:
-        seasons = [seasons]
-    for i in tqdm(seasons):
-        if int(i) < 2004:
-            raise SeasonNotFoundError("season cannot be less than 2004")
-        i_data = pl.read_parquet(CFB_ROSTER_URL.format(season=i), use_pyarrow=True, columns=None)
-        data = pl.concat([data, i_data], how="vertical")
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
+    data = load_seasons(
+        CFB_ROSTER_URL,
+        seasons,
+        min_season=2004,
+        max_workers=max_workers,
+        progress=progress,
+        cache_dir=cache_dir,
+        columns=columns,
+        compact=compact,
+    )
+    return convert_frame(data, return_as_pandas, return_as, use_pyarrow_extension_array=True)
+
+
+def scan_cfb_rosters(seasons: List[int], max_workers=None, cache_dir=None, compact=False) -> pl.LazyFrame:
+    """Lazily scan roster data
+
+    Example:
+        `cfb_df = sportsdataverse.cfb.scan_cfb_rosters(seasons=range(2014,2021)).collect()`
 
+    Args:
+        seasons (list): Used to define different seasons. 2014 is the earliest available season.
+        max_workers (int): Number of season files downloaded at the same time, defaults to 4.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
+
+    Returns:
+        pl.LazyFrame: Lazy frame over the data of `load_cfb_rosters()`.
+
+    Raises:
+        ValueError: If `season` is less than 2014.
+    """
+    return scan_seasons(
+        CFB_ROSTER_URL, seasons, min_season=2004, max_workers=max_workers, cache_dir=cache_dir, compact=compact
+    )
 
-def load_cfb_team_info(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
+
+def iter_cfb_rosters(
+    seasons: List[int], return_as_pandas=False, return_as=None, by="season", prefetch=1, cache_dir=None, columns=None
+) -> Iterator[pl.DataFrame]:
+    """Iterate over roster data, one season at a time
+
+    Example:
+        `for df in sportsdataverse.cfb.iter_cfb_rosters(seasons=range(2014,2021)): print(df.shape)`
+
+    Args:
+        seasons (list): Used to define different seasons. 2014 is the earliest available season.
+        return_as_pandas (bool): If True, yields pandas dataframes. If False, yields polars dataframes.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        by (str): "season" yields one dataframe per season, "row_group" one per parquet row group.
+        prefetch (int): Number of seasons downloaded in the background ahead of the current one.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None.
+
+    Returns:
+        Iterator[pl.DataFrame]: One dataframe per season (or row group) of `load_cfb_rosters()`.
+
+    Raises:
+        ValueError: If `season` is less than 2014.
+    """
+    frames = iter_seasons(
+        CFB_ROSTER_URL, seasons, min_season=2004, by=by, prefetch=prefetch, cache_dir=cache_dir, columns=columns
+    )
+    return (convert_frame(df, return_as_pandas, return_as, use_pyarrow_extension_array=True) for df in frames)
+
+
+def load_cfb_team_info(
+    seasons: List[int],
+    return_as_pandas=False,
+    return_as=None,
+    max_workers=None,
+    progress=True,
+    cache_dir=None,
+    columns=None,
+    compact=False,
+) -> pl.DataFrame:
     """Load college football team info
 
     Example:
@@ -105,6 +379,14 @@ def load_cfb_team_info(seasons: List[int], return_as_pandas=False) -> pl.DataFra
     Args:
         seasons (list): Used to define different seasons. 2002 is the earliest available season.
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        max_workers (int): Number of seasons downloaded at the same time, defaults to 4.
+        progress (bool or callable): If True, show a tqdm progress bar. A callable is called as
+            `progress(done, total)` after each season.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None. Without a file cache only these columns are downloaded.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
 
     Returns:
         pl.DataFrame: Polars dataframe containing the team info available for the requested seasons.
@@ -112,21 +394,83 @@ def load_cfb_team_info(seasons: List[int], return_as_pandas=False) -> pl.DataFra
     Raises:
         ValueError: If `season` is less than 2002.
     """
-    data = pl.DataFrame()
-    if type(seasons) is int:
-        seasons = [seasons]
-    for i in tqdm(seasons):
-        if int(i) < 2002:
-            raise SeasonNotFoundError("season cannot be less than 2002")
-        try:
-            i_data = pl.read_parquet(CFB_TEAM_INFO_URL.format(season=i), use_pyarrow=True, columns=None)
-        except Exception:
-            print(f"We don't seem to have data for the {i} season.")
-        data = pl.concat([data, i_data], how="vertical")
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
-
-
-def load_cfb_betting_lines(return_as_pandas=False) -> pl.DataFrame:
+    data = load_seasons(
+        CFB_TEAM_INFO_URL,
+        seasons,
+        min_season=2002,
+        max_workers=max_workers,
+        progress=progress,
+        skip_missing=True,
+        cache_dir=cache_dir,
+        columns=columns,
+        compact=compact,
+    )
+    return convert_frame(data, return_as_pandas, return_as, use_pyarrow_extension_array=True)
+
+
+def scan_cfb_team_info(seasons: List[int], max_workers=None, cache_dir=None, compact=False) -> pl.LazyFrame:
+    """Lazily scan college football team info
+
+    Example:
+        `cfb_df = sportsdataverse.cfb.scan_cfb_team_info(seasons=range(2002,2021)).collect()`
+
+    Args:
+        seasons (list): Used to define different seasons. 2002 is the earliest available season.
+        max_workers (int): Number of season files downloaded at the same time, defaults to 4.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
+
+    Returns:
+        pl.LazyFrame: Lazy frame over the data of `load_cfb_team_info()`.
+
+    Raises:
+        ValueError: If `season` is less than 2002.
+    """
+    return scan_seasons(
+        CFB_TEAM_INFO_URL, seasons, min_season=2002, max_workers=max_workers, skip_missing=True, cache_dir=cache_dir
+    )
+
+
+def iter_cfb_team_info(
+    seasons: List[int], return_as_pandas=False, return_as=None, by="season", prefetch=1, cache_dir=None, columns=None
+) -> Iterator[pl.DataFrame]:
+    """Iterate over college football team info, one season at a time
+
+    Example:
+        `for df in sportsdataverse.cfb.iter_cfb_team_info(seasons=range(2002,2021)): print(df.shape)`
+
+    Args:
+        seasons (list): Used to define different seasons. 2002 is the earliest available season.
+        return_as_pandas (bool): If True, yields pandas dataframes. If False, yields polars dataframes.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        by (str): "season" yields one dataframe per season, "row_group" one per parquet row group.
+        prefetch (int): Number of seasons downloaded in the background ahead of the current one.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None.
+
+    Returns:
+        Iterator[pl.DataFrame]: One dataframe per season (or row group) of `load_cfb_team_info()`.
+
+    Raises:
+        ValueError: If `season` is less than 2002.
+    """
+    frames = iter_seasons(
+        CFB_TEAM_INFO_URL,
+        seasons,
+        min_season=2002,
+        by=by,
+        prefetch=prefetch,
+        skip_missing=True,
+        cache_dir=cache_dir,
+        columns=columns,
+    )
+    return (convert_frame(df, return_as_pandas, return_as, use_pyarrow_extension_array=True) for df in frames)
+
+
+def load_cfb_betting_lines(
+    return_as_pandas=False, return_as=None, cache_dir=None, columns=None, compact=False
+) -> pl.DataFrame:
     """Load college football betting lines information
 
     Example:
@@ -134,21 +478,39 @@ def load_cfb_betting_lines(return_as_pandas=False) -> pl.DataFrame:
 
     Args:
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None. Without a file cache only these columns are downloaded.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
 
     Returns:
         pl.DataFrame: Polars dataframe containing betting lines available for the available seasons.
     """
 
-    return (
-        pl.read_parquet(CFB_BETTING_LINES_URL, use_pyarrow=True, columns=None).to_pandas(
-            use_pyarrow_extension_array=True
-        )
-        if return_as_pandas
-        else pl.read_parquet(CFB_BETTING_LINES_URL, use_pyarrow=True, columns=None)
-    )
+    data = read_parquet_url(CFB_BETTING_LINES_URL, cache_dir=cache_dir, columns=columns)
+    if compact:
+        data = compact_frame(data)
+    return convert_frame(data, return_as_pandas, return_as, use_pyarrow_extension_array=True)
+
 
+def scan_cfb_betting_lines(cache_dir=None, compact=False) -> pl.LazyFrame:
+    """Lazily scan college football betting lines information
 
-def get_cfb_teams(return_as_pandas=False) -> pl.DataFrame:
+    Example:
+        `cfb_df = sportsdataverse.cfb.scan_cfb_betting_lines().collect()`
+
+    Args:
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
+
+    Returns:
+        pl.LazyFrame: Lazy frame over the data of `load_cfb_betting_lines()`.
+    """
+    return scan_parquet_url(CFB_BETTING_LINES_URL, cache_dir=cache_dir, compact=compact)
+
+
+def get_cfb_teams(return_as_pandas=False, return_as=None, cache_dir=None) -> pl.DataFrame:
     """Load college football team ID information and logos
 
     Example:
@@ -156,13 +518,13 @@ def get_cfb_teams(return_as_pandas=False) -> pl.DataFrame:
 
     Args:
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
 
     Returns:
         pl.DataFrame: Polars dataframe containing teams available.
     """
 
-    return (
-        pl.read_parquet(CFB_TEAM_LOGO_URL, use_pyarrow=True, columns=None).to_pandas(use_pyarrow_extension_array=True)
-        if return_as_pandas
-        else pl.read_parquet(CFB_TEAM_LOGO_URL, use_pyarrow=True, columns=None)
-    )
+    data = read_parquet_url(CFB_TEAM_LOGO_URL, cache_dir=cache_dir)
+    return convert_frame(data, return_as_pandas, return_as, use_pyarrow_extension_array=True)
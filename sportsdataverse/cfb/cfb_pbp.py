@@ -4,12 +4,14 @@ import os
 import re
 import time
 from functools import reduce
+from typing import Dict, List
 
 import numpy as np
 import pandas as pd
 import polars as pl
+import pyarrow as pa
 from pkg_resources import resource_filename
-from xgboost import Booster, DMatrix
+from xgboost import DMatrix
 
 from sportsdataverse.cfb.model_vars import (
     defense_score_vec,
@@ -34,21 +36,13 @@ from sportsdataverse.cfb.model_vars import (
     wp_start_columns,
     wp_start_touchback_columns,
 )
-from sportsdataverse.dl_utils import download
+from sportsdataverse.dl_utils import adownload, convert_frame, download, run_in_thread
+from sportsdataverse.models import get_model
 
 ep_model_file = resource_filename("sportsdataverse", "cfb/models/ep_model.model")
 wp_spread_file = resource_filename("sportsdataverse", "cfb/models/wp_spread.model")
 qbr_model_file = resource_filename("sportsdataverse", "cfb/models/qbr_model.model")
 
-ep_model = Booster({"nthread": 4})  # init model
-ep_model.load_model(ep_model_file)
-
-wp_model = Booster({"nthread": 4})  # init model
-wp_model.load_model(wp_spread_file)
-
-qbr_model = Booster({"nthread": 4})  # init model
-qbr_model.load_model(qbr_model_file)
-
 logger = logging.getLogger("sdv.cfb_pbp")
 logger.addHandler(logging.NullHandler())
 
@@ -61,8 +55,9 @@ class CFBPlayProcess(object):
     raw = False
     path_to_json = "/"
     return_keys = None
+    return_as = None
 
-    def __init__(self, gameId=0, raw=False, path_to_json="/", return_keys=None, **kwargs):
+    def __init__(self, gameId=0, raw=False, path_to_json="/", return_keys=None, return_as=None, **kwargs):
         self.gameId = int(gameId)
         # self.logger = logger
         self.ran_pipeline = False
@@ -70,6 +65,7 @@ class CFBPlayProcess(object):
         self.raw = raw
         self.path_to_json = path_to_json
         self.return_keys = return_keys
+        self.return_as = return_as
 
     def espn_cfb_pbp(self, **kwargs):
         """espn_cfb_pbp() - Pull the game by id. Data from API endpoints: `college-football/playbyplay`,
@@ -90,11 +86,25 @@ class CFBPlayProcess(object):
             `cfb_df = sportsdataverse.cfb.CFBPlayProcess(gameId=401256137).espn_cfb_pbp()`
         """
         cache_buster = int(time.time() * 1000)
-        pbp_txt = {"timeouts": {}}
         # summary endpoint for pickcenter array
         summary_url = f"http://site.api.espn.com/apis/site/v2/sports/football/college-football/summary?event={self.gameId}&{cache_buster}"
         summary_resp = download(url=summary_url, **kwargs)
-        summary = summary_resp.json()
+        return self.__helper_cfb_summary(summary_resp.json())
+
+    async def aespn_cfb_pbp(self, **kwargs):
+        """aespn_cfb_pbp() - Coroutine version of `espn_cfb_pbp()`, taking the same arguments.
+
+        Example:
+            `cfb_df = await sportsdataverse.cfb.CFBPlayProcess(gameId=401256137).aespn_cfb_pbp()`
+        """
+        cache_buster = int(time.time() * 1000)
+        # summary endpoint for pickcenter array
+        summary_url = f"http://site.api.espn.com/apis/site/v2/sports/football/college-football/summary?event={self.gameId}&{cache_buster}"
+        summary_resp = await adownload(url=summary_url, **kwargs)
+        return await run_in_thread(lambda: self.__helper_cfb_summary(summary_resp.json()))
+
+    def __helper_cfb_summary(self, summary):
+        pbp_txt = {"timeouts": {}}
         incoming_keys_expected = [
             "boxscore",
             "format",
@@ -189,42 +199,63 @@ class CFBPlayProcess(object):
             pbp_txt["drives"] = {}
         return pbp_txt
 
-    def __helper_cfb_pbp_features(self, pbp_txt, init):
-        pbp_txt["plays"] = pd.DataFrame()
-        for key in pbp_txt.get("drives").keys():
+    def __helper_cfb_drive_plays(self, drives):
+        # one pass over the drives, flattening each play and its drive meta the way
+        # pd.json_normalize(record_path="plays", meta=..., meta_prefix="drive.") does, straight into arrow columns
+        meta = [
+            ["id"],
+            ["displayResult"],
+            ["isScore"],
+            ["team", "shortDisplayName"],
+            ["team", "displayName"],
+            ["team", "name"],
+            ["team", "abbreviation"],
+            ["yards"],
+            ["offensivePlays"],
+            ["result"],
+            ["description"],
+            ["shortDisplayResult"],
+            ["timeElapsed", "displayValue"],
+            ["start", "period", "number"],
+            ["start", "period", "type"],
+            ["start", "yardLine"],
+            ["start", "clock", "displayValue"],
+            ["start", "text"],
+            ["end", "period", "number"],
+            ["end", "period", "type"],
+            ["end", "yardLine"],
+            ["end", "clock", "displayValue"],
+        ]
+        meta_names = ["drive." + ".".join(path) for path in meta]
+        records = []
+        names = {}
+        for key, drive_list in drives.items():
             logging.debug(f"{self.gameId}: drives key - {key}")
-            prev_drives = pd.json_normalize(
-                data=pbp_txt.get("drives").get(f"{key}"),
-                record_path="plays",
-                meta=[
-                    "id",
-                    "displayResult",
-                    "isScore",
-                    ["team", "shortDisplayName"],
-                    ["team", "displayName"],
-                    ["team", "name"],
-                    ["team", "abbreviation"],
-                    "yards",
-                    "offensivePlays",
-                    "result",
-                    "description",
-                    "shortDisplayResult",
-                    ["timeElapsed", "displayValue"],
-                    ["start", "period", "number"],
-                    ["start", "period", "type"],
-                    ["start", "yardLine"],
-                    ["start", "clock", "displayValue"],
-                    ["start", "text"],
-                    ["end", "period", "number"],
-                    ["end", "period", "type"],
-                    ["end", "yardLine"],
-                    ["end", "clock", "displayValue"],
-                ],
-                meta_prefix="drive.",
-                errors="ignore",
-            )
-            pbp_txt["plays"] = pd.concat([pbp_txt["plays"], prev_drives], axis=0, ignore_index=True)
-        pbp_txt["plays"] = pl.from_pandas(pbp_txt["plays"])
+            # "current" holds a single drive, "previous" a list of them
+            key_records = []
+            for drive in [drive_list] if isinstance(drive_list, dict) else drive_list:
+                drive_meta = dict(zip(meta_names, (_get_path(drive, path) for path in meta)))
+                key_records.extend({**_flatten_record(play), **drive_meta} for play in drive.get("plays", []))
+            # the play columns of each drives key come first, in order of appearance, then the drive meta
+            names.update(dict.fromkeys(name for record in key_records for name in record if name not in meta_names))
+            names.update(dict.fromkeys(meta_names))
+            records.extend(key_records)
+        if len(records) == 0:
+            return pl.DataFrame()
+        plays = pl.from_arrow(
+            pa.table({name: _arrow_column([record.get(name) for record in records]) for name in names})
+        )
+        # pandas stored integer play columns with gaps as floats, keep those types
+        return plays.with_columns(
+            [
+                pl.col(name).cast(pl.Float64)
+                for name in plays.columns
+                if name not in meta_names and plays[name].dtype in pl.INTEGER_DTYPES and plays[name].null_count() > 0
+            ]
+        )
+
+    def __helper_cfb_pbp_features(self, pbp_txt, init):
+        pbp_txt["plays"] = self.__helper_cfb_drive_plays(pbp_txt.get("drives"))
         pbp_txt["timeouts"] = {
             init["homeTeamId"]: {"1": [], "2": []},
             init["awayTeamId"]: {"1": [], "2": []},
@@ -460,85 +491,19 @@ class CFBPlayProcess(object):
             .get_column("id")
             .to_list()
         )
-        # end_timeouts = pbp_txt["plays"].select(
-        #     (
-        #         3
-        #         - pl.struct(["id", "period.number"]).apply(
-        #             lambda x: (
-        #                 sum(
-        #                     (i <= x.struct.field("id")) & (x.struct.field("period.number") <= 2)
-        #                     for i in pbp_txt["timeouts"][int(init["homeTeamId"])]["1"]
-        #                 )
-        #             )
-        #             | (
-        #                 sum(
-        #                     (i <= x.struct.field("id")) & (x.struct.field("period.number") > 2)
-        #                     for i in pbp_txt["timeouts"][int(init["homeTeamId"])]["2"]
-        #                 )
-        #             ),
-        #             return_dtype=pl.Int64,
-        #         )
-        #     ).alias("end.homeTeamTimeouts"),
-        #     (
-        #         3
-        #         - pl.struct(["id", "period.number"]).apply(
-        #             lambda x: (
-        #                 sum(
-        #                     (i <= x.struct.field("id")) & (x.struct.field("period.number") <= 2)
-        #                     for i in pbp_txt["timeouts"][int(init["awayTeamId"])]["1"]
-        #                 )
-        #             )
-        #             | (
-        #                 sum(
-        #                     (i <= x.struct.field("id")) & (x.struct.field("period.number") > 2)
-        #                     for i in pbp_txt["timeouts"][int(init["awayTeamId"])]["2"]
-        #                 )
-        #             ),
-        #             return_dtype=pl.Int64,
-        #         )
-        #     ).alias("end.awayTeamTimeouts"),
-        # )
-        # pbp_txt["plays"] = pbp_txt["plays"].join(end_timeouts, on=["id", "period.number"], how="left")
         pbp_txt["plays"] = (
             pbp_txt["plays"]
+            # timeouts used so far in the half, as a running count over the plays (sorted by id above) taken at the
+            # last play of each id, so that plays sharing an id see the same count
             .with_columns(
-                (
-                    3
-                    - pl.struct(["id", "period.number"]).apply(
-                        lambda x: (
-                            sum(
-                                (i <= x["id"]) & (x["period.number"] <= 2)
-                                for i in pbp_txt["timeouts"][int(init["homeTeamId"])]["1"]
-                            )
-                        )
-                        | (
-                            sum(
-                                (i <= x["id"]) & (x["period.number"] > 2)
-                                for i in pbp_txt["timeouts"][int(init["homeTeamId"])]["2"]
-                            )
-                        ),
-                        return_dtype=pl.Int64,
-                    )
-                ).alias("end.homeTeamTimeouts"),
-                (
-                    3
-                    - pl.struct(["id", "period.number"]).apply(
-                        lambda x: (
-                            sum(
-                                (i <= x["id"]) & (x["period.number"] <= 2)
-                                for i in pbp_txt["timeouts"][int(init["awayTeamId"])]["1"]
-                            )
-                        )
-                        | (
-                            sum(
-                                (i <= x["id"]) & (x["period.number"] > 2)
-                                for i in pbp_txt["timeouts"][int(init["awayTeamId"])]["2"]
-                            )
-                        ),
-                        return_dtype=pl.Int64,
-                    )
-                ).alias("end.awayTeamTimeouts"),
+                home_timeouts_used=pl.col("homeTimeoutCalled").cast(pl.Int64).cumsum().over("half"),
+                away_timeouts_used=pl.col("awayTimeoutCalled").cast(pl.Int64).cumsum().over("half"),
+            )
+            .with_columns(
+                (3 - pl.col("home_timeouts_used").max().over(["half", "id"])).alias("end.homeTeamTimeouts"),
+                (3 - pl.col("away_timeouts_used").max().over(["half", "id"])).alias("end.awayTeamTimeouts"),
             )
+            .drop(["home_timeouts_used", "away_timeouts_used"])
             .with_columns(
                 pl.col("end.homeTeamTimeouts").shift_and_fill(periods=1, fill_value=3).alias("start.homeTeamTimeouts"),
                 pl.col("end.awayTeamTimeouts").shift_and_fill(periods=1, fill_value=3).alias("start.awayTeamTimeouts"),
@@ -834,10 +799,12 @@ class CFBPlayProcess(object):
             * id, drive_id, game_id
             * down, ydstogo (distance), game_half, period
         """
-        play_df = play_df.sort(by=["id", "start.adj_TimeSecsRem"])
+        play_df = play_df.sort(by=["game_id", "id", "start.adj_TimeSecsRem"])
 
         play_df = play_df.unique(
-            subset=["text", "id", "type.text", "start.down", "sequenceNumber"], keep="last", maintain_order=True
+            subset=["game_id", "text", "id", "type.text", "start.down", "sequenceNumber"],
+            keep="last",
+            maintain_order=True,
         )
         play_df = play_df.filter(
             pl.col("type.text").str.contains("(?i)end of|(?i)coin toss|(?i)end period|(?i)wins toss") == False
@@ -848,8 +815,8 @@ class CFBPlayProcess(object):
                 half=pl.when(pl.col("period.number") <= 2).then(1).otherwise(2),
             )
             .with_columns(
-                lead_half=pl.col("half").shift(-1),
-                lag_scoringPlay=pl.col("scoringPlay").shift(1),
+                lead_half=pl.col("half").shift(-1).over("game_id"),
+                lag_scoringPlay=pl.col("scoringPlay").shift(1).over("game_id"),
             )
             .with_columns(
                 pl.when(pl.col("lead_half").is_null()).then(2).otherwise(pl.col("lead_half")).alias("lead_half"),
@@ -1104,8 +1071,8 @@ class CFBPlayProcess(object):
             .with_columns(
                 is_home=pl.col("pos_team") == pl.col("homeTeamId"),
                 # --- Team Score variables ------
-                lag_homeScore=pl.col("homeScore").shift(1),
-                lag_awayScore=pl.col("awayScore").shift(1),
+                lag_homeScore=pl.col("homeScore").shift(1).over("game_id"),
+                lag_awayScore=pl.col("awayScore").shift(1).over("game_id"),
             )
             .with_columns(
                 lag_HA_score_diff=pl.col("lag_homeScore") - pl.col("lag_awayScore"),
@@ -1158,8 +1125,8 @@ class CFBPlayProcess(object):
             )
             .drop(["lag_homeScore", "lag_awayScore"])
             .with_columns(
-                lag_homeScore=pl.col("homeScore").shift(1),
-                lag_awayScore=pl.col("awayScore").shift(1),
+                lag_homeScore=pl.col("homeScore").shift(1).over("game_id"),
+                lag_awayScore=pl.col("awayScore").shift(1).over("game_id"),
             )
             .with_columns(
                 lag_homeScore=pl.when(pl.col("lag_homeScore").is_null()).then(0).otherwise(pl.col("lag_homeScore")),
@@ -1208,19 +1175,19 @@ class CFBPlayProcess(object):
             )
             .with_columns(
                 (pl.col("end.pos_team_score") - pl.col("end.def_pos_team_score")).alias("end.pos_score_diff"),
-                pl.col("pos_team").shift(1).alias("lag_pos_team"),
+                pl.col("pos_team").shift(1).over("game_id").alias("lag_pos_team"),
             )
             .with_columns(
                 pl.when(pl.col("lag_pos_team").is_null())
                 .then(pl.col("pos_team"))
                 .otherwise(pl.col("lag_pos_team"))
                 .alias("lag_pos_team"),
-                pl.col("pos_team").shift(-1).alias("lead_pos_team"),
-                pl.col("pos_team").shift(-2).alias("lead_pos_team2"),
+                pl.col("pos_team").shift(-1).over("game_id").alias("lead_pos_team"),
+                pl.col("pos_team").shift(-2).over("game_id").alias("lead_pos_team2"),
                 (pl.col("pos_team_score") - pl.col("def_pos_team_score")).alias("pos_score_diff"),
             )
             .with_columns(
-                pl.col("pos_score_diff").shift(1).alias("lag_pos_score_diff"),
+                pl.col("pos_score_diff").shift(1).over("game_id").alias("lag_pos_score_diff"),
             )
             .with_columns(
                 pl.when(pl.col("lag_pos_score_diff").is_null())
@@ -2003,7 +1970,7 @@ class CFBPlayProcess(object):
                 .then(pl.lit("Defense"))
                 .otherwise(pl.lit("Defense")),
                 # --- Lags/Leads play type ----
-                lead_play_type=pl.col("type.text").shift(-1),
+                lead_play_type=pl.col("type.text").shift(-1).over("game_id"),
                 sp=pl.when(
                     (pl.col("fg_attempt") == True).or_(pl.col("punt") == True).or_(pl.col("kickoff_play") == True)
                 )
@@ -3140,7 +3107,7 @@ class CFBPlayProcess(object):
         # self.logger.info(start_data.iloc[[36]].to_json(orient="records"))
 
         dtest_start_touchback = DMatrix(start_touchback_data)
-        EP_start_touchback_parts = ep_model.predict(dtest_start_touchback)
+        EP_start_touchback_parts = get_model(ep_model_file).predict(dtest_start_touchback)
         EP_start_touchback = self.__calculate_ep_exp_val(EP_start_touchback_parts)
 
         start_data = play_df[ep_start_columns]
@@ -3148,7 +3115,7 @@ class CFBPlayProcess(object):
         # self.logger.info(start_data.iloc[[36]].to_json(orient="records"))
 
         dtest_start = DMatrix(start_data)
-        EP_start_parts = ep_model.predict(dtest_start)
+        EP_start_parts = get_model(ep_model_file).predict(dtest_start)
         EP_start = self.__calculate_ep_exp_val(EP_start_parts)
 
         play_df = (
@@ -3214,7 +3181,7 @@ class CFBPlayProcess(object):
         end_data.columns = ep_final_names
         # self.logger.info(end_data.iloc[[36]].to_json(orient="records"))
         dtest_end = DMatrix(end_data)
-        EP_end_parts = ep_model.predict(dtest_end)
+        EP_end_parts = get_model(ep_model_file).predict(dtest_end)
 
         EP_end = self.__calculate_ep_exp_val(EP_end_parts)
 
@@ -3374,8 +3341,8 @@ class CFBPlayProcess(object):
                 .otherwise(pl.col("EP_end"))
             )
             .with_columns(
-                lag_EP_end=pl.col("EP_end").shift(1),
-                lag_change_of_pos_team=pl.col("change_of_pos_team").shift(1),
+                lag_EP_end=pl.col("EP_end").shift(1).over("game_id"),
+                lag_change_of_pos_team=pl.col("change_of_pos_team").shift(1).over("game_id"),
             )
             .with_columns(
                 lag_change_of_pos_team=pl.when(pl.col("lag_change_of_pos_team").is_null())
@@ -3640,19 +3607,19 @@ class CFBPlayProcess(object):
         start_touchback_data.columns = wp_final_names
         # self.logger.info(start_touchback_data.iloc[[36]].to_json(orient="records"))
         dtest_start_touchback = DMatrix(start_touchback_data)
-        WP_start_touchback = wp_model.predict(dtest_start_touchback)
+        WP_start_touchback = get_model(wp_spread_file).predict(dtest_start_touchback)
         start_data = play_df[wp_start_columns]
         start_data.columns = wp_final_names
         # self.logger.info(start_data.iloc[[36]].to_json(orient="records"))
         dtest_start = DMatrix(start_data)
-        WP_start = wp_model.predict(dtest_start)
+        WP_start = get_model(wp_spread_file).predict(dtest_start)
 
         # ---- wp_after ----
         end_data = play_df[wp_end_columns]
         end_data.columns = wp_final_names
         # self.logger.info(start_data.iloc[[36]].to_json(orient="records"))
         dtest_end = DMatrix(end_data)
-        WP_end = wp_model.predict(dtest_end)
+        WP_end = get_model(wp_spread_file).predict(dtest_end)
 
         play_df = (
             play_df.with_columns(
@@ -3675,8 +3642,8 @@ class CFBPlayProcess(object):
                 .otherwise(pl.col("def_wp_before")),
             )
             .with_columns(
-                lead_wp_before=pl.col("wp_before").shift(-1),
-                lead_wp_before2=pl.col("wp_before").shift(-2),
+                lead_wp_before=pl.col("wp_before").shift(-1).over("game_id"),
+                lead_wp_before2=pl.col("wp_before").shift(-2).over("game_id"),
             )
             .with_columns(
                 wp_after=pl.when(pl.col("type.text").is_in(["Timeout"]))
@@ -3685,7 +3652,7 @@ class CFBPlayProcess(object):
                     (pl.col("status_type_completed") == True)
                     .and_(
                         (pl.col("lead_play_type").is_null()).or_(
-                            pl.col("game_play_number") == pl.col("game_play_number").max()
+                            pl.col("game_play_number") == pl.col("game_play_number").max().over("game_id")
                         )
                     )
                     .and_(pl.col("pos_score_diff_end") > 0)
@@ -3695,7 +3662,7 @@ class CFBPlayProcess(object):
                     (pl.col("status_type_completed") == True)
                     .and_(
                         (pl.col("lead_play_type").is_null()).or_(
-                            pl.col("game_play_number") == pl.col("game_play_number").max()
+                            pl.col("game_play_number") == pl.col("game_play_number").max().over("game_id")
                         )
                     )
                     .and_(pl.col("pos_score_diff_end") < 0)
@@ -3781,20 +3748,20 @@ class CFBPlayProcess(object):
                 drive_start=pl.col("drive_start").cast(pl.Float32),
             )
             .with_columns(
-                drive_play_index=pl.col("scrimmage_play").cumsum().over("drive.id"),
+                drive_play_index=pl.col("scrimmage_play").cumsum().over(["game_id", "drive.id"]),
             )
             .with_columns(
                 drive_offense_plays=pl.when((pl.col("sp") == False).and_(pl.col("scrimmage_play") == True))
                 .then(pl.col("play").cast(pl.Int32))
                 .otherwise(0),
-                prog_drive_EPA=pl.col("EPA_scrimmage").cumsum().over("drive.id"),
-                prog_drive_WPA=pl.col("wpa").cumsum().over("drive.id"),
+                prog_drive_EPA=pl.col("EPA_scrimmage").cumsum().over(["game_id", "drive.id"]),
+                prog_drive_WPA=pl.col("wpa").cumsum().over(["game_id", "drive.id"]),
                 drive_offense_yards=pl.when((pl.col("sp") == False).and_(pl.col("scrimmage_play") == True))
                 .then(pl.col("statYardage"))
                 .otherwise(0),
             )
             .with_columns(
-                drive_total_yards=pl.col("drive_offense_yards").cumsum().over("drive.id"),
+                drive_total_yards=pl.col("drive_offense_yards").cumsum().over(["game_id", "drive.id"]),
             )
         )
         return play_df
@@ -3916,7 +3883,7 @@ class CFBPlayProcess(object):
         # # self.logger.info(pass_qbr)
 
         dtest_qbr = DMatrix(pass_qbr[qbr_vars])
-        qbr_result = qbr_model.predict(dtest_qbr)
+        qbr_result = get_model(qbr_model_file).predict(dtest_qbr)
         pass_qbr = pass_qbr.with_columns(exp_qbr=pl.lit(qbr_result))
         passer_box = passer_box.join(
             pass_qbr, left_on=["passer_player_name", "pos_team"], right_on=["athlete_name", "pos_team"]
@@ -4539,108 +4506,94 @@ class CFBPlayProcess(object):
 
     def run_processing_pipeline(self):
         if self.ran_pipeline == False:
-            pbp_txt = self.__helper_cfb_pbp_drives(self.json)
-            self.plays_json = pbp_txt["plays"]
-
-            pbp_json = {
-                "gameId": int(self.gameId),
-                "plays": self.plays_json.to_dicts(),
-                "season": pbp_txt["season"],
-                "week": pbp_txt["header"]["week"],
-                "gameInfo": pbp_txt["gameInfo"],
-                "teamInfo": pbp_txt["header"]["competitions"][0],
-                "playByPlaySource": pbp_txt.get("header").get("competitions")[0].get("playByPlaySource"),
-                "drives": pbp_txt["drives"],
-                "boxscore": pbp_txt["boxscore"],
-                "header": pbp_txt["header"],
-                "standings": pbp_txt["standings"],
-                "leaders": np.array(pbp_txt["leaders"]).tolist(),
-                "timeouts": pbp_txt["timeouts"],
-                "homeTeamSpread": np.array(pbp_txt["homeTeamSpread"]).tolist(),
-                "gameSpread": pbp_txt["gameSpread"],
-                "gameSpreadAvailable": pbp_txt["gameSpreadAvailable"],
-                "overUnder": pbp_txt["overUnder"],
-                "pickcenter": np.array(pbp_txt["pickcenter"]).tolist(),
-                "scoringPlays": np.array(pbp_txt["scoringPlays"]).tolist(),
-                "winprobability": np.array(pbp_txt["winprobability"]).tolist(),
-                "broadcasts": np.array(pbp_txt["broadcasts"]).tolist(),
-                "videos": np.array(pbp_txt["videos"]).tolist(),
-            }
-            self.json = pbp_json
-            self.plays_json = pbp_txt["plays"]
+            pbp_txt = self._prepare_pipeline()
 
             confirmed_corrupt = self.corrupt_pbp_check()
 
             if confirmed_corrupt:
                 return self.json if self.return_keys is None else {k: self.json.get(f"{k}") for k in self.return_keys}
 
-            if (pbp_json.get("header").get("competitions")[0].get("playByPlaySource") != "none") and (
-                len(pbp_txt["drives"]) > 0
-            ):
-                self.plays_json = (
-                    self.plays_json.pipe(self.__add_downs_data)
-                    .pipe(self.__add_play_type_flags)
-                    .pipe(self.__add_rush_pass_flags)
-                    .pipe(self.__add_team_score_variables)
-                    .pipe(self.__add_new_play_types)
-                    .pipe(self.__setup_penalty_data)
-                    .pipe(self.__add_play_category_flags)
-                    .pipe(self.__add_yardage_cols)
-                    .pipe(self.__add_player_cols)
-                    .pipe(self.__after_cols)
-                    .pipe(self.__add_spread_time)
-                    .pipe(self.__process_epa)
-                    .pipe(self.__process_wpa)
-                    .pipe(self.__add_drive_data)
-                    .pipe(self.__process_qbr)
-                )
-                self.ran_pipeline = True
-                advBoxScore = self.plays_json.pipe(self.create_box_score)
-                self.plays_json = self.plays_json.to_dicts()
-                pbp_json = {
-                    "gameId": int(self.gameId),
-                    "plays": self.plays_json,
-                    "season": pbp_txt["season"],
-                    "week": pbp_txt["header"]["week"],
-                    "gameInfo": pbp_txt["gameInfo"],
-                    "teamInfo": pbp_txt["header"]["competitions"][0],
-                    "playByPlaySource": pbp_txt["playByPlaySource"],
-                    "drives": pbp_txt["drives"],
-                    "boxscore": pbp_txt["boxscore"],
-                    "advBoxScore": advBoxScore,
-                    "header": pbp_txt["header"],
-                    "standings": pbp_txt["standings"],
-                    "leaders": np.array(pbp_txt["leaders"]).tolist(),
-                    "timeouts": pbp_txt["timeouts"],
-                    "homeTeamSpread": np.array(pbp_txt["homeTeamSpread"]).tolist(),
-                    "gameSpread": pbp_txt["gameSpread"],
-                    "gameSpreadAvailable": pbp_txt["gameSpreadAvailable"],
-                    "overUnder": pbp_txt["overUnder"],
-                    "pickcenter": np.array(pbp_txt["pickcenter"]).tolist(),
-                    "scoringPlays": np.array(pbp_txt["scoringPlays"]).tolist(),
-                    "winprobability": np.array(pbp_txt["winprobability"]).tolist(),
-                    "broadcasts": np.array(pbp_txt["broadcasts"]).tolist(),
-                    "videos": np.array(pbp_txt["videos"]).tolist(),
-                }
-                self.json = pbp_json
+            if self._has_drives(pbp_txt):
+                self._finish_processing(pbp_txt, self._run_stages(self.plays_json))
             self.ran_pipeline = True
             return self.json if self.return_keys is None else {k: self.json.get(f"{k}") for k in self.return_keys}
 
     def run_cleaning_pipeline(self):
         if self.ran_cleaning_pipeline == False:
-            pbp_txt = self.__helper_cfb_pbp_drives(self.json)
-            self.plays_json = pbp_txt["plays"]
-
-            pbp_json = {
-                "gameId": int(self.gameId),
-                "plays": self.plays_json.to_dicts(),
-                "season": pbp_txt["season"],
-                "week": pbp_txt["header"]["week"],
-                "gameInfo": pbp_txt["gameInfo"],
-                "teamInfo": pbp_txt["header"]["competitions"][0],
-                "playByPlaySource": pbp_txt.get("header").get("competitions")[0].get("playByPlaySource"),
-                "drives": pbp_txt["drives"],
-                "boxscore": pbp_txt["boxscore"],
+            pbp_txt = self._prepare_pipeline()
+
+            confirmed_corrupt = self.corrupt_pbp_check()
+
+            if confirmed_corrupt:
+                return self.json if self.return_keys is None else {k: self.json.get(f"{k}") for k in self.return_keys}
+
+            if self._has_drives(pbp_txt):
+                self._finish_cleaning(pbp_txt, self._run_stages(self.plays_json, cleaning=True))
+            self.ran_cleaning_pipeline = True
+            return self.json
+
+    # the pipelines are split in steps so that CFBBatchProcess can run the stages once for many games
+    def _prepare_pipeline(self):
+        pbp_txt = self.__helper_cfb_pbp_drives(self.json)
+        self.plays_json = pbp_txt["plays"]
+        self.json = self.__game_json(pbp_txt, self.__convert_plays(self.plays_json))
+        return pbp_txt
+
+    def _has_drives(self, pbp_txt):
+        return (pbp_txt.get("header").get("competitions")[0].get("playByPlaySource") != "none") and (
+            len(pbp_txt["drives"]) > 0
+        )
+
+    def _run_stages(self, play_df, cleaning=False):
+        play_df = (
+            play_df.pipe(self.__add_downs_data)
+            .pipe(self.__add_play_type_flags)
+            .pipe(self.__add_rush_pass_flags)
+            .pipe(self.__add_team_score_variables)
+            .pipe(self.__add_new_play_types)
+            .pipe(self.__setup_penalty_data)
+            .pipe(self.__add_play_category_flags)
+            .pipe(self.__add_yardage_cols)
+            .pipe(self.__add_player_cols)
+            .pipe(self.__after_cols)
+            .pipe(self.__add_spread_time)
+        )
+        if cleaning:
+            return play_df
+        return (
+            play_df.pipe(self.__process_epa)
+            .pipe(self.__process_wpa)
+            .pipe(self.__add_drive_data)
+            .pipe(self.__process_qbr)
+        )
+
+    def _finish_processing(self, pbp_txt, play_df):
+        self.plays_json = play_df
+        self.ran_pipeline = True
+        advBoxScore = self.plays_json.pipe(self.create_box_score)
+        self.plays_json = self.__convert_plays(self.plays_json)
+        self.json = self.__game_json(pbp_txt, self.plays_json, advBoxScore=advBoxScore)
+
+    def _finish_cleaning(self, pbp_txt, play_df):
+        self.plays_json = self.__convert_plays(play_df)
+        self.json = self.__game_json(pbp_txt, self.plays_json)
+
+    def __game_json(self, pbp_txt, plays, advBoxScore=None):
+        pbp_json = {
+            "gameId": int(self.gameId),
+            "plays": plays,
+            "season": pbp_txt["season"],
+            "week": pbp_txt["header"]["week"],
+            "gameInfo": pbp_txt["gameInfo"],
+            "teamInfo": pbp_txt["header"]["competitions"][0],
+            "playByPlaySource": pbp_txt.get("header").get("competitions")[0].get("playByPlaySource"),
+            "drives": pbp_txt["drives"],
+            "boxscore": pbp_txt["boxscore"],
+        }
+        if advBoxScore is not None:
+            pbp_json["advBoxScore"] = advBoxScore
+        pbp_json.update(
+            {
                 "header": pbp_txt["header"],
                 "standings": pbp_txt["standings"],
                 "leaders": np.array(pbp_txt["leaders"]).tolist(),
@@ -4655,59 +4608,12 @@ class CFBPlayProcess(object):
                 "broadcasts": np.array(pbp_txt["broadcasts"]).tolist(),
                 "videos": np.array(pbp_txt["videos"]).tolist(),
             }
-            self.json = pbp_json
-            self.plays_json = pbp_txt["plays"]
-
-            confirmed_corrupt = self.corrupt_pbp_check()
-
-            if confirmed_corrupt:
-                return self.json if self.return_keys is None else {k: self.json.get(f"{k}") for k in self.return_keys}
+        )
+        return pbp_json
 
-            if (
-                pbp_json.get("header").get("competitions")[0].get("playByPlaySource") != "none"
-                and len(pbp_txt["drives"]) > 0
-            ):
-                self.plays_json = (
-                    self.plays_json.pipe(self.__add_downs_data)
-                    .pipe(self.__add_play_type_flags)
-                    .pipe(self.__add_rush_pass_flags)
-                    .pipe(self.__add_team_score_variables)
-                    .pipe(self.__add_new_play_types)
-                    .pipe(self.__setup_penalty_data)
-                    .pipe(self.__add_play_category_flags)
-                    .pipe(self.__add_yardage_cols)
-                    .pipe(self.__add_player_cols)
-                    .pipe(self.__after_cols)
-                    .pipe(self.__add_spread_time)
-                )
-                self.plays_json = self.plays_json.to_dicts()
-                pbp_json = {
-                    "gameId": int(self.gameId),
-                    "plays": self.plays_json,
-                    "season": pbp_txt["season"],
-                    "week": pbp_txt["header"]["week"],
-                    "gameInfo": pbp_txt["gameInfo"],
-                    "teamInfo": pbp_txt["header"]["competitions"][0],
-                    "playByPlaySource": pbp_txt["playByPlaySource"],
-                    "drives": pbp_txt["drives"],
-                    "boxscore": pbp_txt["boxscore"],
-                    "header": pbp_txt["header"],
-                    "standings": pbp_txt["standings"],
-                    "leaders": np.array(pbp_txt["leaders"]).tolist(),
-                    "timeouts": pbp_txt["timeouts"],
-                    "homeTeamSpread": np.array(pbp_txt["homeTeamSpread"]).tolist(),
-                    "gameSpread": pbp_txt["gameSpread"],
-                    "gameSpreadAvailable": pbp_txt["gameSpreadAvailable"],
-                    "overUnder": pbp_txt["overUnder"],
-                    "pickcenter": np.array(pbp_txt["pickcenter"]).tolist(),
-                    "scoringPlays": np.array(pbp_txt["scoringPlays"]).tolist(),
-                    "winprobability": np.array(pbp_txt["winprobability"]).tolist(),
-                    "broadcasts": np.array(pbp_txt["broadcasts"]).tolist(),
-                    "videos": np.array(pbp_txt["videos"]).tolist(),
-                }
-                self.json = pbp_json
-            self.ran_cleaning_pipeline = True
-            return self.json
+    def __convert_plays(self, plays):
+        # dicts by default; return_as="arrow" hands back a pyarrow.Table sharing the polars buffers
+        return plays.to_dicts() if self.return_as is None else convert_frame(plays, return_as=self.return_as)
 
     def corrupt_pbp_check(self):
         if len(self.json["plays"]) == 0:
@@ -4730,3 +4636,131 @@ class CFBPlayProcess(object):
             )
             return True
         return False
+
+
+class CFBBatchProcess(object):
+    """CFBBatchProcess - Process many games at once, running the play pipeline a single time over all their plays.
+
+    Each game is prepared as in `CFBPlayProcess`, then the plays of every game are stacked into one frame keyed by
+    `game_id`. The feature stages run once over that frame, with lags and leads windowed by `game_id`, and each of
+    the EP, WP and QBR models predicts once for the whole slate. The plays are split back per game at the end and
+    each game gets the same result as `CFBPlayProcess` would return for it, except that columns typed differently
+    across games (e.g. integer in one game and float in another) are unified to a common type.
+
+    Args:
+        games (list): Summary json of each game, as returned by `CFBPlayProcess(gameId=...).espn_cfb_pbp()`.
+        return_keys (list): Keys kept in each game's result, all keys if None.
+        return_as (str): Format of each game's plays, as in `CFBPlayProcess`.
+
+    Example:
+        `games = [r.result for r in sportsdataverse.batch.fetch_games("cfb", game_ids) if r.error is None]`
+        `results = sportsdataverse.cfb.CFBBatchProcess(games).run_processing_pipeline()`
+    """
+
+    def __init__(self, games, return_keys=None, return_as=None):
+        self.games = list(games)
+        self.return_keys = return_keys
+        self.return_as = return_as
+
+    def run_processing_pipeline(self) -> Dict[int, Dict]:
+        """run_processing_pipeline() - Run the full pipeline, with EPA, WPA and the advanced box score, for every game.
+
+        Returns:
+            Dict: Result of each game keyed by game id, as returned by `CFBPlayProcess.run_processing_pipeline()`.
+        """
+        return self.__run(cleaning=False)
+
+    def run_cleaning_pipeline(self) -> Dict[int, Dict]:
+        """run_cleaning_pipeline() - Run the cleaning stages only, without the models, for every game.
+
+        Returns:
+            Dict: Result of each game keyed by game id, as returned by `CFBPlayProcess.run_cleaning_pipeline()`.
+        """
+        return self.__run(cleaning=True)
+
+    def __run(self, cleaning):
+        processes = []
+        ready = []
+        for game in self.games:
+            process = CFBPlayProcess(
+                gameId=game["header"]["id"], return_keys=self.return_keys, return_as=self.return_as
+            )
+            process.json = game
+            pbp_txt = process._prepare_pipeline()
+            processes.append(process)
+            if not process.corrupt_pbp_check() and process._has_drives(pbp_txt):
+                ready.append((process, pbp_txt, process.plays_json))
+        if ready:
+            stacked = _stack_plays([frame for _, _, frame in ready])
+            plays = ready[0][0]._run_stages(stacked, cleaning=cleaning)
+            games = plays.partition_by("game_id", as_dict=True)
+            for process, pbp_txt, frame in ready:
+                play_df = _own_columns(games.get(process.gameId, plays.head(0)), frame.columns, stacked.columns)
+                if cleaning:
+                    process._finish_cleaning(pbp_txt, play_df)
+                else:
+                    process._finish_processing(pbp_txt, play_df)
+        results = {}
+        for process in processes:
+            if cleaning:
+                process.ran_cleaning_pipeline = True
+            else:
+                process.ran_pipeline = True
+            results[process.gameId] = (
+                process.json if self.return_keys is None else {k: process.json.get(f"{k}") for k in self.return_keys}
+            )
+        return results
+
+
+def _stack_plays(frames: List[pl.DataFrame]) -> pl.DataFrame:
+    # games carry different columns (e.g. no scoring plays) and types, so fill the gaps and relax the types
+    columns = list(dict.fromkeys(column for frame in frames for column in frame.columns))
+    return pl.concat(
+        [
+            frame.with_columns(
+                [pl.lit(None).alias(column) for column in columns if column not in frame.columns]
+            ).select(columns)
+            for frame in frames
+        ],
+        how="vertical_relaxed",
+    )
+
+
+def _own_columns(play_df: pl.DataFrame, game_columns, stacked_columns) -> pl.DataFrame:
+    # drop the columns only other games had, keeping any the stages filled in for this one
+    missing = set(stacked_columns) - set(game_columns)
+    return play_df.drop(
+        [column for column in play_df.columns if column in missing and play_df[column].null_count() == len(play_df)]
+    )
+
+
+def _flatten_record(record, prefix=""):
+    # as in pd.json_normalize, nested dicts become "parent.child" keys (empty ones are dropped, lists are kept), placed
+    # after the plain values at the top level and in place below it
+    flat = {}
+    nested = flat if prefix else {}
+    for key, value in record.items():
+        if isinstance(value, dict):
+            nested.update(_flatten_record(value, f"{prefix}{key}."))
+        else:
+            flat[f"{prefix}{key}"] = value
+    if not prefix:
+        flat.update(nested)
+    return flat
+
+
+def _get_path(record, path):
+    for key in path:
+        if not isinstance(record, dict) or key not in record:
+            return None
+        record = record[key]
+    return record
+
+
+def _arrow_column(values):
+    # pd.json_normalize kept a field holding an int in one play and a string in another as an object column, so
+    # such a column is kept as strings instead of failing the whole game
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return pa.array([None if value is None else str(value) for value in values], pa.string())
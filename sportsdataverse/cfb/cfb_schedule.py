@@ -3,11 +3,11 @@ import datetime
 import pandas as pd
 import polars as pl
 
-from sportsdataverse.dl_utils import download
+from sportsdataverse.dl_utils import adownload, convert_frame, download, run_in_thread
 
 
 def espn_cfb_schedule(
-    dates=None, week=None, season_type=None, groups=None, limit=500, return_as_pandas=False, **kwargs
+    dates=None, week=None, season_type=None, groups=None, limit=500, return_as_pandas=False, return_as=None, **kwargs
 ) -> pl.DataFrame:
     """espn_cfb_schedule - look up the college football schedule for a given season
 
@@ -25,6 +25,8 @@ def espn_cfb_schedule(
         limit (int): number of records to return, default: 500.
 
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
 
 
     Returns:
@@ -43,10 +45,39 @@ def espn_cfb_schedule(
     url = "http://site.api.espn.com/apis/site/v2/sports/football/college-football/scoreboard"
 
     resp = download(url=url, params=params, **kwargs)
+    return helper_cfb_schedule(resp.json(), return_as_pandas=return_as_pandas, return_as=return_as)
+
+
+async def aespn_cfb_schedule(
+    dates=None, week=None, season_type=None, groups=None, limit=500, return_as_pandas=False, return_as=None, **kwargs
+) -> pl.DataFrame:
+    """aespn_cfb_schedule - Coroutine version of `espn_cfb_schedule()`, taking the same arguments.
+
+    Returns:
+        pl.DataFrame: Polars dataframe containing schedule dates for the requested season.
+
+    Example:
+        `cfb_df = await sportsdataverse.cfb.aespn_cfb_schedule(dates=2023, week=1)`
+    """
+
+    params = {
+        "week": week,
+        "dates": dates,
+        "seasonType": season_type,
+        "groups": groups if groups is not None else "80",
+        "limit": limit,
+    }
+
+    url = "http://site.api.espn.com/apis/site/v2/sports/football/college-football/scoreboard"
+
+    resp = await adownload(url=url, params=params, **kwargs)
+    return await run_in_thread(
+        lambda: helper_cfb_schedule(resp.json(), return_as_pandas=return_as_pandas, return_as=return_as)
+    )
 
-    ev = pd.DataFrame()
 
-    events_txt = resp.json()
+def helper_cfb_schedule(events_txt, return_as_pandas=False, return_as=None):
+    ev = pd.DataFrame()
 
     events = events_txt.get("events")
 
@@ -82,7 +113,7 @@ def espn_cfb_schedule(
     ev = pl.from_pandas(ev)
     ev = ev.janitor.clean_names()
 
-    return ev.to_pandas() if return_as_pandas else ev
+    return convert_frame(ev, return_as_pandas, return_as)
 
 
 def scoreboard_event_parsing(event):
@@ -168,7 +199,9 @@ def __extract_home_away(event, arg1, arg2):
     return event
 
 
-def espn_cfb_calendar(season=None, groups=None, ondays=None, return_as_pandas=False, **kwargs) -> pl.DataFrame:
+def espn_cfb_calendar(
+    season=None, groups=None, ondays=None, return_as_pandas=False, return_as=None, **kwargs
+) -> pl.DataFrame:
     """espn_cfb_calendar - look up the men's college football calendar for a given season
 
 
@@ -181,6 +214,8 @@ def espn_cfb_calendar(season=None, groups=None, ondays=None, return_as_pandas=Fa
         ondays (boolean): Used to return dates for calendar ondays
 
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
 
 
     Returns:
@@ -202,52 +237,83 @@ def espn_cfb_calendar(season=None, groups=None, ondays=None, return_as_pandas=Fa
         params = {"dates": season, "groups": groups if groups is not None else "80"}
 
         resp = download(url=url, params=params, **kwargs)
+        full_schedule = helper_cfb_calendar(season, resp.json())
+
+    return convert_frame(full_schedule, return_as_pandas, return_as)
+
+
+async def aespn_cfb_calendar(
+    season=None, groups=None, ondays=None, return_as_pandas=False, return_as=None, **kwargs
+) -> pl.DataFrame:
+    """aespn_cfb_calendar - Coroutine version of `espn_cfb_calendar()`, taking the same arguments.
 
-        txt = resp.json()
+    Returns:
+        pl.DataFrame: Polars dataframe containing calendar dates for the requested season.
+
+    Example:
+        `cfb_df = await sportsdataverse.cfb.aespn_cfb_calendar(season=2023)`
+    """
+    if ondays is not None:
+        full_schedule = await __aondays_cfb_calendar(season, **kwargs)
+    else:
+        url = "http://site.api.espn.com/apis/site/v2/sports/football/college-football/scoreboard"
+        params = {"dates": season, "groups": groups if groups is not None else "80"}
+        resp = await adownload(url=url, params=params, **kwargs)
+        full_schedule = await run_in_thread(lambda: helper_cfb_calendar(season, resp.json()))
+    return convert_frame(full_schedule, return_as_pandas, return_as)
 
-        txt = txt.get("leagues")[0].get("calendar")
 
-        full_schedule = pl.DataFrame()
+def helper_cfb_calendar(season, resp_txt):
+    txt = resp_txt.get("leagues")[0].get("calendar")
 
-        for i in range(len(txt)):
-            if txt[i].get("entries", None) is not None:
-                reg = pd.json_normalize(
-                    data=txt[i],
-                    record_path="entries",
-                    meta=["label", "value", "startDate", "endDate"],
-                    meta_prefix="season_type_",
-                    record_prefix="week_",
-                    errors="ignore",
-                    sep="_",
-                )
+    full_schedule = pl.DataFrame()
 
-                full_schedule = pl.concat([full_schedule, pl.from_pandas(reg)], how="vertical")
+    for i in range(len(txt)):
+        if txt[i].get("entries", None) is not None:
+            reg = pd.json_normalize(
+                data=txt[i],
+                record_path="entries",
+                meta=["label", "value", "startDate", "endDate"],
+                meta_prefix="season_type_",
+                record_prefix="week_",
+                errors="ignore",
+                sep="_",
+            )
 
-        full_schedule = full_schedule.with_columns(season=season)
+            full_schedule = pl.concat([full_schedule, pl.from_pandas(reg)], how="vertical")
 
-        full_schedule = full_schedule.janitor.clean_names()
+    full_schedule = full_schedule.with_columns(season=season)
 
-        full_schedule = full_schedule.rename({"week_value": "week", "season_type_value": "season_type"})
+    full_schedule = full_schedule.janitor.clean_names()
 
-    return full_schedule.to_pandas() if return_as_pandas else full_schedule
+    full_schedule = full_schedule.rename({"week_value": "week", "season_type_value": "season_type"})
+    return full_schedule
 
 
 def __ondays_cfb_calendar(season, **kwargs):
     url = f"https://sports.core.api.espn.com/v2/sports/football/leagues/college-football/seasons/{season}/types/2/calendar/ondays"
 
     resp = download(url=url, **kwargs)
+    return helper_cfb_ondays_calendar(resp.json())
+
 
-    if resp is not None:
-        txt = resp.json().get("eventDate").get("dates")
+async def __aondays_cfb_calendar(season, **kwargs):
+    url = f"https://sports.core.api.espn.com/v2/sports/football/leagues/college-football/seasons/{season}/types/2/calendar/ondays"
+    resp = await adownload(url=url, **kwargs)
+    return await run_in_thread(lambda: helper_cfb_ondays_calendar(resp.json()))
 
-        result = pl.DataFrame(txt, schema=["dates"])
 
-        result = result.with_columns(dateURL=pl.col("dates").str.slice(0, 10))
+def helper_cfb_ondays_calendar(resp_txt):
+    txt = resp_txt.get("eventDate").get("dates")
 
-        result = result.with_columns(
-            url="http://site.api.espn.com/apis/site/v2/sports/football/college-football/scoreboard?dates="
-            + pl.col("dateURL")
-        )
+    result = pl.DataFrame(txt, schema=["dates"])
+
+    result = result.with_columns(dateURL=pl.col("dates").str.slice(0, 10))
+
+    result = result.with_columns(
+        url="http://site.api.espn.com/apis/site/v2/sports/football/college-football/scoreboard?dates="
+        + pl.col("dateURL")
+    )
 
     return result
 
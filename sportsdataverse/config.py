@@ -78,3 +78,4 @@ NFL_DEPTH_CHARTS_URL = NFLVERSEGITHUB + "depth_charts/depth_charts_{season}.parq
 NFL_OFFICIALS_URL = f"{NFLVERSEGITHUB}officials/officials.parquet"
 NFL_TEAM_LOGO_URL = f"{NFLVERSEGITHUBPBP}nflverse-pbp/master/teams_colors_logos.csv"
 NFL_TEAM_SCHEDULE_URL = NFLVERSEGITHUBPBP + "nflverse-pbp/master/schedules/sched_{season}.rds"
+NFL_TEAM_SCHEDULE_PARQUET_URL = NFLVERSEGITHUBPBP + "nflverse-pbp/master/schedules/sched_{season}.parquet"
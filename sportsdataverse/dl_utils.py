@@ -1,57 +1,724 @@
+import asyncio
+import datetime
+import functools
 import json
 import logging
+import random
 import re
+import threading
 import time
+import weakref
+from email.utils import parsedate_to_datetime
 from itertools import chain, starmap
+from typing import Dict
+from urllib.parse import urlsplit
 
+import httpx
 import numpy as np
 import polars as pl
+import pyarrow as pa
 import requests
+from requests.adapters import HTTPAdapter
 
-from sportsdataverse.errors import no_espn_data
+from sportsdataverse.cache import canonical_url, get_cache
+from sportsdataverse.errors import NoESPNDataError, no_espn_data
+from sportsdataverse.metrics import RequestTrace
+from sportsdataverse.transport import CassetteMissError, get_transport
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger("sdv.dl_utils")
 logger.addHandler(logging.NullHandler())
 
+_SESSION_LOCK = threading.Lock()
+_SESSIONS = {}
+_SESSION_STATS = {}
+_SESSION_CONFIG = {
+    "pool_connections": 10,
+    "pool_maxsize": 32,
+    "pool_block": False,
+    "keep_alive": True,
+}
+RETURN_TYPES = ("polars", "pandas", "arrow")
+RETRYABLE_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+_MAX_RETRY_AFTER = 120
+_ASYNC_CLIENTS = weakref.WeakKeyDictionary()
+_ASYNC_SEMAPHORES = weakref.WeakKeyDictionary()
+_FLIGHT_LOCK = threading.Lock()
+_FLIGHTS = {}
+_ASYNC_FLIGHTS = weakref.WeakKeyDictionary()
+_FLIGHT_STATS = {"requests": 0, "deduplicated": 0}
+_ASYNC_CONFIG = {
+    "max_concurrency": 64,
+    "max_connections": 100,
+    "max_keepalive_connections": 32,
+}
+
+
+def configure_sessions(pool_connections=None, pool_maxsize=None, pool_block=None, keep_alive=None) -> Dict:
+    """configure_sessions() - Set the connection pool options used by the shared session registry.
+
+    Any session already in the registry is closed so the new settings apply to the next request.
+
+    Args:
+        pool_connections (int): Number of connection pools to cache per session.
+        pool_maxsize (int): Maximum number of connections kept alive per host, should be at least
+            the number of threads hitting the same host.
+        pool_block (bool): If True, block when the pool is exhausted instead of opening throwaway connections.
+        keep_alive (bool): If False, send `Connection: close` and do not reuse connections.
+
+    Returns:
+        Dict: The registry settings now in effect.
+
+    Example:
+        `sportsdataverse.dl_utils.configure_sessions(pool_maxsize=64)`
+    """
+    with _SESSION_LOCK:
+        for k, v in {
+            "pool_connections": pool_connections,
+            "pool_maxsize": pool_maxsize,
+            "pool_block": pool_block,
+            "keep_alive": keep_alive,
+        }.items():
+            if v is not None:
+                _SESSION_CONFIG[k] = v
+        _close_sessions()
+        return dict(_SESSION_CONFIG)
+
+
+def get_session(url) -> requests.Session:
+    """get_session() - Return the shared `requests.Session` for the host of `url`, creating it on first use.
+
+    Sessions are keyed on scheme and host, so every request to `site.api.espn.com` reuses the same
+    keep-alive connection pool regardless of which function or thread issues it.
+
+    Args:
+        url (str): Any url on the host of interest.
+
+    Returns:
+        requests.Session: The pooled session for that host.
+    """
+    key = _session_key(url)
+    with _SESSION_LOCK:
+        session = _SESSIONS.get(key)
+        if session is None:
+            session = _new_session()
+            _SESSIONS[key] = session
+            _SESSION_STATS[key] = {"created": time.time(), "requests": 0}
+        _SESSION_STATS[key]["requests"] += 1
+    return session
+
+
+def session_registry_info() -> Dict:
+    """session_registry_info() - Inspect the shared session registry.
+
+    Returns:
+        Dict: Dictionary with keys "config" (the pool settings) and "sessions", a mapping of
+        host to the number of requests served and the creation timestamp of its session.
+    """
+    with _SESSION_LOCK:
+        return {
+            "config": dict(_SESSION_CONFIG),
+            "sessions": {k: dict(v) for k, v in _SESSION_STATS.items()},
+        }
+
+
+def reset_sessions():
+    """reset_sessions() - Close and drop every session in the shared registry."""
+    with _SESSION_LOCK:
+        _close_sessions()
+
+
+def _close_sessions():
+    for session in _SESSIONS.values():
+        session.close()
+    _SESSIONS.clear()
+    _SESSION_STATS.clear()
+
+
+def _session_key(url):
+    parts = urlsplit(url)
+    return f"{parts.scheme.lower()}://{parts.netloc.lower()}"
+
+
+def _new_session():
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=_SESSION_CONFIG["pool_connections"],
+        pool_maxsize=_SESSION_CONFIG["pool_maxsize"],
+        pool_block=_SESSION_CONFIG["pool_block"],
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["Connection"] = "keep-alive" if _SESSION_CONFIG["keep_alive"] else "close"
+    return session
+
+
+def json_loads(content):
+    """json_loads() - Decode JSON bytes or text with `orjson` when it is installed, else the standard library."""
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
+
+class DownloadResponse:
+    """DownloadResponse - Response returned by `download()` and `adownload()`.
+
+    Wraps the `requests` or `httpx` response, which stays reachable as `.response` and through
+    attribute access (`status_code`, `url`, `headers`, `content`, `text`, ...). `json()` decodes the
+    body once with `json_loads()` and returns the same object on every later call, so the 404 check
+    in `no_espn_data()` and the caller share a single parse. Treat the payload as read-only, or copy
+    it before mutating it if `json()` may be called again.
+    """
+
+    __slots__ = ("response", "from_cache", "_payload")
+
+    _UNSET = object()
+
+    def __init__(self, response, from_cache=False):
+        self.response = response
+        self.from_cache = from_cache
+        self._payload = self._UNSET
+
+    def json(self, **kwargs):
+        if self._payload is self._UNSET:
+            self._payload = json_loads(self.response.content)
+        return self._payload
+
+    def share(self):
+        """A new wrapper over the same response, with its own `json()` payload to mutate freely."""
+        return DownloadResponse(self.response, from_cache=self.from_cache)
+
+    def __getattr__(self, name):
+        return getattr(self.response, name)
+
+    def __repr__(self):
+        return f"<DownloadResponse [{self.response.status_code}]>"
+
+
+class RetryBudget:
+    """RetryBudget - A cap on the total number of retries shared by a group of downloads.
+
+    Pass the same budget to every call of a batch (`download(..., retry_budget=budget)`, or through the
+    `**kwargs` of any fetcher) so that, once ESPN starts throttling, the batch stops retrying and fails
+    fast instead of every request sleeping through its own retry allowance.
 
-def download(url, params=None, headers=None, proxy=None, timeout=30, num_retries=15, session=None, logger=None):
-    session, params, logger = init_request_settings(params, session, logger)
+    Args:
+        max_retries (int): Number of retries the whole group may spend.
+
+    Example:
+        `budget = sportsdataverse.dl_utils.RetryBudget(max_retries=200)`
+    """
+
+    def __init__(self, max_retries):
+        self.max_retries = max_retries
+        self.used = 0
+        self._lock = threading.Lock()
+
+    @property
+    def remaining(self):
+        return max(self.max_retries - self.used, 0)
+
+    def acquire(self) -> bool:
+        """Take one retry from the budget, returning False if it is spent."""
+        with self._lock:
+            if self.used >= self.max_retries:
+                return False
+            self.used += 1
+            return True
+
+
+def download(
+    url,
+    params=None,
+    headers=None,
+    proxy=None,
+    timeout=30,
+    num_retries=15,
+    session=None,
+    logger=None,
+    backoff_factor=0.5,
+    max_backoff=10,
+    retry_budget=None,
+    cache=None,
+    single_flight=True,
+):
+    """download() - GET a url with the shared session, retrying transient failures.
+
+    Connection errors, timeouts and the statuses in `RETRYABLE_STATUSES` are retried with exponential
+    backoff and full jitter, honouring a `Retry-After` header when the server sends one. A 404 (raised
+    as `NoESPNDataError`) and other client errors fail immediately. When the retries run out the last
+    error is raised. Requests go through the transport of `sportsdataverse.transport`, which by default
+    waits for the limiter of `sportsdataverse.rate_limit`, if one is configured, and then hits the
+    network. Each call is reported to the hooks of `sportsdataverse.metrics` as a `RequestEvent`.
+
+    When a response cache is in use (see `sportsdataverse.cache`), fresh entries are served without a
+    request and stale ones are revalidated with `If-None-Match`/`If-Modified-Since`.
+
+    Args:
+        url (str): Url to request.
+        params (dict): Query parameters.
+        headers (dict): Request headers.
+        proxy (dict): `requests` proxies mapping.
+        timeout (float): Timeout in seconds.
+        num_retries (int): Maximum number of retries after the first attempt.
+        session (requests.Session): Session to use instead of the shared one for the url's host.
+        logger (logging.Logger): Logger to use.
+        backoff_factor (float): Base delay in seconds, doubled on every retry.
+        max_backoff (float): Upper bound in seconds of a single backoff delay.
+        retry_budget (RetryBudget): Optional budget shared with other downloads.
+        cache (cache.ResponseCache): Response cache to use. Defaults to the one turned on by
+            `cache.enable_cache()`, if any, and False bypasses caching.
+        single_flight (bool): If True, identical requests already in flight from other threads are
+            joined instead of sent again, see `single_flight_stats()`.
+
+    Returns:
+        DownloadResponse: The `requests` response, with `json()` decoded once.
+    """
+    fetch = functools.partial(
+        _download,
+        url,
+        params,
+        headers,
+        proxy,
+        timeout,
+        num_retries,
+        session,
+        logger,
+        backoff_factor,
+        max_backoff,
+        retry_budget,
+        cache,
+    )
+    if not single_flight:
+        return fetch()
+    return _single_flight(_flight_key(url, params, headers, proxy, session, timeout, cache, retry_budget), fetch)
+
+
+def _download(
+    url, params, headers, proxy, timeout, num_retries, session, logger, backoff_factor, max_backoff, retry_budget, cache
+):
+    session, params, logger = init_request_settings(params, session, logger, url=url)
+    trace = RequestTrace(url)
     try:
-        response = session.get(url, params=params, proxies=proxy, headers=headers, timeout=timeout)
-        response = no_espn_data(response)
-
-    except Exception as e:
-        if num_retries == 0:
-            logger.error(f"Retry Limit Exceeded: {url} \nparams: {params}\n {e}")
-
-        if hasattr(e, "code") and getattr(e, "code") == 404:
-            logger.error(f"404: {url} \nparams: {params}")
-
-        if num_retries > 0:
-            logger.warning("%s: %i - %s for url (%s)", e, response.status_code, response.reason, response.url)
-            time.sleep(2)
-            return download(
-                url,
-                params=params,
-                proxy=proxy,
-                headers=headers,
-                timeout=timeout,
-                num_retries=num_retries - 1,
-                session=session,
-                logger=logger,
-            )
+        response_cache, key, entry, headers = _cache_lookup(cache, url, params, headers)
+        if response_cache is not None:
+            trace.cache = "miss"
+        if entry is not None and response_cache.is_fresh(entry):
+            trace.cache = "hit"
+            trace.response = _requests_response(entry)
+            return trace.response
+        for attempt in range(num_retries + 1):
+            trace.attempts = attempt + 1
+            response = None
+            try:
+                response = DownloadResponse(
+                    get_transport().get(session, url, params=params, proxies=proxy, headers=headers, timeout=timeout)
+                )
+                trace.response = response
+                trace.ttfb = response.elapsed.total_seconds()
+                if entry is not None and response.status_code == 304:
+                    trace.cache = "revalidated"
+                    trace.response = _requests_response(response_cache.touch(key, entry))
+                    return trace.response
+                _raise_for_retryable_status(response)
+                response = no_espn_data(response)
+                if response_cache is not None and response.status_code == 200:
+                    response_cache.set(key, response.url, 200, response.headers, response.content, response.json())
+                return response
+            except Exception as e:
+                if not _should_retry(e, response, attempt, num_retries, retry_budget, url, params, logger):
+                    raise
+                time.sleep(_retry_delay(attempt, response, backoff_factor, max_backoff))
+    except BaseException as e:
+        trace.error = e
+        raise
+    finally:
+        trace.finish()
+
+
+def single_flight_stats() -> Dict:
+    """single_flight_stats() - Counters of the request coalescing done by `download()` and `adownload()`.
+
+    Returns:
+        Dict: "requests" sent, "deduplicated" calls that joined an identical request already in flight
+        instead, and the number of requests "in_flight" right now.
+
+    Example:
+        `sportsdataverse.dl_utils.single_flight_stats()`
+    """
+    with _FLIGHT_LOCK:
+        in_flight = len(_FLIGHTS) + sum(len(flights) for flights in _ASYNC_FLIGHTS.values())
+        return {**_FLIGHT_STATS, "in_flight": in_flight}
+
+
+def reset_single_flight_stats():
+    """reset_single_flight_stats() - Zero the counters reported by `single_flight_stats()`."""
+    with _FLIGHT_LOCK:
+        for k in _FLIGHT_STATS:
+            _FLIGHT_STATS[k] = 0
+
+
+class _Flight:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+def _flight_key(url, params, headers, proxy, session, timeout, cache, retry_budget):
+    # calls only join a request sent with the same settings, as those decide what the request returns
+    return (
+        canonical_url(url, params),
+        tuple(sorted((headers or {}).items())),
+        repr(proxy),
+        None if session is None else id(session),
+        repr(timeout),
+        cache if cache is None or isinstance(cache, bool) else id(cache),
+        None if retry_budget is None else id(retry_budget),
+    )
+
+
+def _single_flight(key, fetch):
+    with _FLIGHT_LOCK:
+        flight = _FLIGHTS.get(key)
+        leader = flight is None
+        if leader:
+            flight = _FLIGHTS[key] = _Flight()
+            _FLIGHT_STATS["requests"] += 1
         else:
-            logger.error(f"Download Error: {url} \nparams: {params}\n {e}")
-
-    return response
+            _FLIGHT_STATS["deduplicated"] += 1
+    if not leader:
+        flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        return flight.result.share()
+    try:
+        flight.result = fetch()
+        return flight.result
+    except BaseException as e:
+        flight.error = e
+        raise
+    finally:
+        with _FLIGHT_LOCK:
+            del _FLIGHTS[key]
+        flight.done.set()
+
+
+async def _asingle_flight(key, fetch):
+    loop = asyncio.get_running_loop()
+    with _FLIGHT_LOCK:
+        flights = _ASYNC_FLIGHTS.setdefault(loop, {})
+        task = flights.get(key)
+        leader = task is None
+        if leader:
+            task = flights[key] = loop.create_task(fetch())
+            task.add_done_callback(functools.partial(_end_async_flight, flights, key))
+            _FLIGHT_STATS["requests"] += 1
+        else:
+            _FLIGHT_STATS["deduplicated"] += 1
+    try:
+        # shielded so that cancelling one caller, the leader included, leaves the request to the others
+        response = await asyncio.shield(task)
+    except asyncio.CancelledError:
+        if not task.cancelled():
+            raise
+        # the shared request itself was cancelled, send this caller's own
+        return await fetch()
+    return response if leader else response.share()
+
+
+def _end_async_flight(flights, key, task):
+    with _FLIGHT_LOCK:
+        if flights.get(key) is task:
+            del flights[key]
+    if not task.cancelled():
+        # mark the error as retrieved when every caller was cancelled before the request failed
+        task.exception()
+
+
+def _raise_for_retryable_status(response):
+    if response.status_code in RETRYABLE_STATUSES:
+        raise requests.HTTPError(f"{response.status_code} for url: {response.url}", response=response)
+
+
+def _should_retry(e, response, attempt, num_retries, retry_budget, url, params, logger):
+    if isinstance(e, NoESPNDataError):
+        logger.error(f"404: {url} \nparams: {params}")
+        return False
+    if isinstance(e, CassetteMissError):
+        return False
+    status = getattr(response, "status_code", None)
+    if status is not None and 400 <= status < 500 and status not in RETRYABLE_STATUSES:
+        logger.error(f"Download Error: {url} \nparams: {params}\n {e}")
+        return False
+    if attempt >= num_retries:
+        logger.error(f"Retry Limit Exceeded: {url} \nparams: {params}\n {e}")
+        return False
+    if retry_budget is not None and not retry_budget.acquire():
+        logger.error(f"Retry Budget Exhausted: {url} \nparams: {params}\n {e}")
+        return False
+    logger.warning("%s for url (%s), retry %i of %i", e, url, attempt + 1, num_retries)
+    return True
+
+
+def _retry_delay(attempt, response, backoff_factor, max_backoff):
+    retry_after = _parse_retry_after(getattr(response, "headers", {}).get("Retry-After"))
+    if retry_after is not None:
+        return min(retry_after, _MAX_RETRY_AFTER)
+    return random.uniform(0, min(max_backoff, backoff_factor * 2**attempt))
+
+
+def _parse_retry_after(value):
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when is None:
+        return None
+    return max((when - datetime.datetime.now(when.tzinfo)).total_seconds(), 0.0)
+
+
+def _cache_lookup(cache, url, params, headers):
+    response_cache = get_cache() if cache is None else (None if cache is False else cache)
+    if response_cache is None:
+        return None, None, None, headers
+    key = canonical_url(url, params)
+    entry = response_cache.get(key)
+    if entry is not None and response_cache.is_fresh(entry):
+        response_cache.hits += 1
+        return response_cache, key, entry, headers
+    response_cache.misses += 1
+    if entry is not None:
+        headers = {**(headers or {}), **response_cache.conditional_headers(entry)}
+    return response_cache, key, entry, headers
+
+
+def _requests_response(entry):
+    response = requests.Response()
+    response.status_code = entry.status_code
+    response.url = entry.url
+    response.headers.update(entry.headers)
+    response.encoding = "utf-8"
+    response._content = entry.content
+    return DownloadResponse(response, from_cache=True)
+
+
+def _httpx_response(entry):
+    response = httpx.Response(
+        entry.status_code, headers=entry.headers, content=entry.content, request=httpx.Request("GET", entry.url)
+    )
+    return DownloadResponse(response, from_cache=True)
+
+
+def configure_async(max_concurrency=None, max_connections=None, max_keepalive_connections=None) -> Dict:
+    """configure_async() - Set the limits used by the shared async client behind `adownload()`.
+
+    The settings apply to clients created afterwards, each event loop gets its own client on first use.
+    Call `aclose_async_client()` from a running loop to recycle its client and semaphore with the new limits.
+
+    Args:
+        max_concurrency (int): Maximum number of `adownload()` requests in flight at once per event loop,
+            including the ones sent with a `client` passed by the caller.
+        max_connections (int): Maximum number of open connections held by the async client.
+        max_keepalive_connections (int): Maximum number of idle keep-alive connections held by the async client.
+
+    Returns:
+        Dict: The async client settings now in effect.
+
+    Example:
+        `sportsdataverse.dl_utils.configure_async(max_concurrency=200, max_connections=200)`
+    """
+    for k, v in {
+        "max_concurrency": max_concurrency,
+        "max_connections": max_connections,
+        "max_keepalive_connections": max_keepalive_connections,
+    }.items():
+        if v is not None:
+            _ASYNC_CONFIG[k] = v
+    return dict(_ASYNC_CONFIG)
+
+
+def _get_async_client():
+    loop = asyncio.get_running_loop()
+    state = _ASYNC_CLIENTS.get(loop)
+    if state is None:
+        client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=_ASYNC_CONFIG["max_connections"],
+                max_keepalive_connections=_ASYNC_CONFIG["max_keepalive_connections"],
+            ),
+            follow_redirects=True,
+        )
+        state = (client, _get_async_semaphore())
+        _ASYNC_CLIENTS[loop] = state
+    return state
+
+
+def _get_async_semaphore():
+    # one semaphore per event loop, shared by the shared client and the clients passed in by callers
+    loop = asyncio.get_running_loop()
+    semaphore = _ASYNC_SEMAPHORES.get(loop)
+    if semaphore is None:
+        semaphore = _ASYNC_SEMAPHORES[loop] = asyncio.Semaphore(_ASYNC_CONFIG["max_concurrency"])
+    return semaphore
+
+
+async def aclose_async_client():
+    """aclose_async_client() - Close the shared async client of the running event loop, if any."""
+    loop = asyncio.get_running_loop()
+    _ASYNC_SEMAPHORES.pop(loop, None)
+    state = _ASYNC_CLIENTS.pop(loop, None)
+    if state is not None:
+        await state[0].aclose()
+
+
+async def adownload(
+    url,
+    params=None,
+    headers=None,
+    proxy=None,
+    timeout=30,
+    num_retries=15,
+    client=None,
+    logger=None,
+    backoff_factor=0.5,
+    max_backoff=10,
+    retry_budget=None,
+    cache=None,
+    single_flight=True,
+) -> DownloadResponse:
+    """adownload() - Coroutine counterpart of `download()`.
+
+    Requests go through one shared `httpx.AsyncClient` per event loop, and at most `max_concurrency`
+    of them (see `configure_async()`) are in flight at the same time, so callers can `asyncio.gather`
+    hundreds of ESPN requests without opening hundreds of sockets.
+
+    Args:
+        url (str): Url to request.
+        params (dict): Query parameters, keys with a None value are dropped like `requests` does.
+        headers (dict): Request headers.
+        proxy (dict): `requests`-style proxies mapping, e.g. `{"https": "http://localhost:8080"}`.
+        timeout (float): Timeout in seconds.
+        num_retries (int): Number of retries after a failed attempt.
+        client (httpx.AsyncClient): Client to use instead of the shared one.
+        logger (logging.Logger): Logger to use.
+        backoff_factor (float): Base delay in seconds, doubled on every retry.
+        max_backoff (float): Upper bound in seconds of a single backoff delay.
+        retry_budget (RetryBudget): Optional budget shared with other downloads.
+        cache (cache.ResponseCache): Response cache to use. Defaults to the one turned on by
+            `cache.enable_cache()`, if any, and False bypasses caching.
+        single_flight (bool): If True, identical requests already in flight on the same event loop are
+            joined instead of sent again.
+
+    Returns:
+        DownloadResponse: The `httpx` response, which exposes `status_code`, `url` and `json()` like `requests`.
+    """
+    fetch = functools.partial(
+        _adownload,
+        url,
+        params,
+        headers,
+        proxy,
+        timeout,
+        num_retries,
+        client,
+        logger,
+        backoff_factor,
+        max_backoff,
+        retry_budget,
+        cache,
+    )
+    if not single_flight:
+        return await fetch()
+    return await _asingle_flight(_flight_key(url, params, headers, proxy, client, timeout, cache, retry_budget), fetch)
+
+
+async def _adownload(
+    url, params, headers, proxy, timeout, num_retries, client, logger, backoff_factor, max_backoff, retry_budget, cache
+):
+    params = {k: v for k, v in (params or {}).items() if v is not None}
+    if logger is None:
+        logger = logging.getLogger("sdv.dl_utils")
+    own_client = None
+    if client is None and proxy:
+        own_client = client = httpx.AsyncClient(
+            mounts={f"{k}://": httpx.AsyncHTTPTransport(proxy=v) for k, v in proxy.items()},
+            follow_redirects=True,
+        )
+    if client is None:
+        client, semaphore = _get_async_client()
+    else:
+        semaphore = _get_async_semaphore()
+    trace = RequestTrace(url)
+    try:
+        response_cache, key, entry, headers = _cache_lookup(cache, url, params, headers)
+        if response_cache is not None:
+            trace.cache = "miss"
+        if entry is not None and response_cache.is_fresh(entry):
+            trace.cache = "hit"
+            trace.response = _httpx_response(entry)
+            return trace.response
+        for attempt in range(num_retries + 1):
+            trace.attempts = attempt + 1
+            response = None
+            try:
+                async with semaphore:
+                    response = DownloadResponse(
+                        await get_transport().aget(client, url, params=params, headers=headers, timeout=timeout)
+                    )
+                trace.response = response
+                if entry is not None and response.status_code == 304:
+                    trace.cache = "revalidated"
+                    trace.response = _httpx_response(response_cache.touch(key, entry))
+                    return trace.response
+                _raise_for_retryable_status(response)
+                response = no_espn_data(response)
+                if response_cache is not None and response.status_code == 200:
+                    response_cache.set(key, str(response.url), 200, response.headers, response.content, response.json())
+                return response
+            except Exception as e:
+                if not _should_retry(e, response, attempt, num_retries, retry_budget, url, params, logger):
+                    raise
+                await asyncio.sleep(_retry_delay(attempt, response, backoff_factor, max_backoff))
+    except BaseException as e:
+        trace.error = e
+        raise
+    finally:
+        trace.finish()
+        if own_client is not None:
+            await own_client.aclose()
+
+
+async def run_in_thread(func, *args, **kwargs):
+    """run_in_thread() - Run a blocking function in the default executor of the running event loop.
+
+    Used by the async fetchers to keep the JSON to polars transforms off the event loop.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
 
 
-def init_request_settings(params, session, logger):
+def init_request_settings(params, session, logger, url=None):
     if params is None:
         params = {}
 
     if session is None:
-        session = requests.Session()
+        session = get_session(url) if url is not None else requests.Session()
 
     if logger is None:
         logger = logging.getLogger("sdv.dl_utils")
@@ -59,6 +726,40 @@ def init_request_settings(params, session, logger):
     return session, params, logger
 
 
+def convert_frame(data, return_as_pandas=False, return_as=None, use_pyarrow_extension_array=False):
+    """convert_frame() - Hand back a frame as the type asked of a loader or `espn_*` function.
+
+    Polars frames become a `pyarrow.Table` without copying their buffers, so `return_as="arrow"` can be
+    handed to Arrow-native consumers (DuckDB, Arrow Flight) as is.
+
+    Args:
+        data (pl.DataFrame or pd.DataFrame): Frame to convert.
+        return_as_pandas (bool): If True, returns a pandas dataframe. Only used when `return_as` is None.
+        return_as (str): One of `RETURN_TYPES`: "polars", "pandas" or "arrow".
+        use_pyarrow_extension_array (bool): Back a pandas dataframe with Arrow arrays instead of numpy.
+
+    Returns:
+        pl.DataFrame, pd.DataFrame or pa.Table: `data` as the requested type.
+
+    Raises:
+        ValueError: If `return_as` is not one of `RETURN_TYPES`.
+
+    Example:
+        `sportsdataverse.dl_utils.convert_frame(pl.DataFrame({"game_id": [401220403]}), return_as="arrow")`
+    """
+    if return_as is None:
+        return_as = "pandas" if return_as_pandas else "polars"
+    if return_as not in RETURN_TYPES:
+        raise ValueError(f"return_as must be one of {RETURN_TYPES}, not {return_as!r}")
+    if not isinstance(data, pl.DataFrame):
+        if return_as == "pandas":
+            return data
+        return pa.Table.from_pandas(data, preserve_index=False) if return_as == "arrow" else pl.from_pandas(data)
+    if return_as == "pandas":
+        return data.to_pandas(use_pyarrow_extension_array=use_pyarrow_extension_array)
+    return data.to_arrow() if return_as == "arrow" else data
+
+
 def flatten_json_iterative(dictionary, sep=".", ind_start=0):
     """Flattening a nested json file"""
 
@@ -241,7 +942,7 @@ class ESPNResponse:
         return self._response
 
     def get_dict(self):
-        return json.loads(self._response)
+        return json_loads(self._response)
 
     def get_json(self):
         return json.dumps(self.get_dict())
@@ -298,7 +999,9 @@ class ESPNHTTP:
         parameters = sorted(parameters.items(), key=lambda kv: kv[0])
 
         if not contents:
-            response = requests.get(url=base_url, params=parameters, headers=request_headers, timeout=timeout)
+            response = get_transport().get(
+                get_session(base_url), base_url, params=parameters, headers=request_headers, timeout=timeout
+            )
 
             url = response.url
 
@@ -0,0 +1,756 @@
+import datetime
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
+from typing import Callable, Dict, Iterator, List, Optional, Union
+from urllib.parse import urlsplit
+
+import polars as pl
+import pyarrow.parquet as pq
+import requests
+from tqdm import tqdm
+
+from sportsdataverse.dl_utils import get_session
+from sportsdataverse.errors import season_not_found_error
+from sportsdataverse.metrics import RequestTrace
+from sportsdataverse.range_reader import open_parquet_url, read_parquet_columns
+from sportsdataverse.rate_limit import wait_for_rate_limit
+from sportsdataverse.store import DataStore
+
+logger = logging.getLogger("sdv.loader_utils")
+logger.addHandler(logging.NullHandler())
+
+DEFAULT_MAX_WORKERS = 4
+COMPACT_MAX_UNIQUE_RATIO = 0.5
+COMPACT_CATEGORICAL_COLUMNS = re.compile(r"team|abbrev|type|position|conference|division|roof|surface|weekday|status")
+SCAN_CACHE_DIR = os.path.join(tempfile.gettempdir(), "sportsdataverse-files")
+MISSING_TTL = 24 * 60 * 60
+
+_FILE_CACHE_LOCK = threading.Lock()
+_FILE_CACHE = None
+_FILE_CACHES = {}
+
+
+class FileCache:
+    """FileCache - Local copies of the parquet and rds files behind the `load_*` loaders.
+
+    Files are stored by url as `<cache_dir>/<host>/<sha1 of the url><suffix>`, next to a `.json` file
+    holding the `ETag`/`Last-Modified` of the download. Before a cached file is used it is revalidated
+    with a HEAD request and downloaded again only if the server reports a different version. If the
+    server cannot be reached, the cached copy is used. Immutable files, such as completed seasons
+    when `pin_past_seasons` is on, are used without asking the server at all.
+
+    Args:
+        cache_dir (str): Directory of the cached files, created if missing.
+        pin_past_seasons (bool): If True, seasons before last year are immutable once downloaded.
+        timeout (float): Timeout in seconds of the HEAD and GET requests.
+
+    Example:
+        `cache = sportsdataverse.loader_utils.FileCache(cache_dir="~/.sportsdataverse/files")`
+    """
+
+    def __init__(self, cache_dir, pin_past_seasons=True, timeout=30):
+        self.cache_dir = os.path.abspath(os.path.expanduser(cache_dir))
+        self.pin_past_seasons = pin_past_seasons
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.stale = 0
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def path_for(self, url) -> str:
+        parts = urlsplit(url)
+        name = os.path.basename(parts.path)
+        suffix = name[name.index(".") :] if "." in name else ""
+        return os.path.join(
+            self.cache_dir, parts.netloc.lower() or "_", hashlib.sha1(url.encode()).hexdigest() + suffix
+        )
+
+    def is_immutable_season(self, season) -> bool:
+        """Whether `season` is old enough to be complete in every league (before last calendar year)."""
+        return self.pin_past_seasons and int(season) < datetime.date.today().year - 1
+
+    def fetch(self, url, immutable=False) -> str:
+        """fetch() - Local path of an up to date copy of `url`, downloading it if needed.
+
+        Args:
+            url (str): Url of the file.
+            immutable (bool): If True, a cached copy is used as is, and the copy is pinned for later calls.
+
+        Returns:
+            str: Path of the local copy.
+        """
+        path = self.path_for(url)
+        meta = self._read_meta(path)
+        with RequestTrace(url) as trace:
+            trace.cache = "miss"
+            if meta is not None:
+                if meta.get("immutable") or immutable:
+                    if immutable and not meta.get("immutable"):
+                        self._write_meta(path, dict(meta, immutable=True))
+                    trace.cache = "hit"
+                    self.hits += 1
+                    return path
+                try:
+                    trace.attempts = 1
+                    wait_for_rate_limit(url)
+                    head = get_session(url).head(url, allow_redirects=True, timeout=self.timeout)
+                except requests.RequestException as e:
+                    trace.cache = "hit"
+                    trace.error = e
+                    self.stale += 1
+                    return path
+                trace.response = head
+                trace.ttfb = head.elapsed.total_seconds()
+                if head.ok and _same_version(meta, head.headers):
+                    trace.cache = "revalidated"
+                    self.revalidated += 1
+                    return path
+            self._download(url, path, immutable, trace)
+            self.misses += 1
+            return path
+
+    def is_missing(self, url, immutable=False) -> bool:
+        """Whether `mark_missing()` saw a 404 of `url` in the last `MISSING_TTL` seconds, or ever if `immutable`."""
+        try:
+            with open(f"{self.path_for(url)}.missing") as f:
+                stored_at = json.load(f)["stored_at"]
+        except (OSError, ValueError, KeyError):
+            return False
+        return immutable or time.time() - stored_at < MISSING_TTL
+
+    def mark_missing(self, url):
+        """Remember that the server answered 404 for `url`, so that optional files are not asked for again."""
+        path = f"{self.path_for(url)}.missing"
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"url": url, "stored_at": time.time()}, f)
+        os.replace(tmp_path, path)
+
+    def clear(self):
+        """Delete every cached file."""
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                os.remove(os.path.join(root, name))
+
+    def _download(self, url, path, immutable, trace):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        wait_for_rate_limit(url)
+        with get_session(url).get(url, stream=True, timeout=self.timeout) as response:
+            trace.attempts = 1
+            trace.response = response
+            trace.ttfb = response.elapsed.total_seconds()
+            trace.bytes = 0
+            response.raise_for_status()
+            with open(tmp_path, "wb") as f:
+                for chunk in response.iter_content(chunk_size=1 << 20):
+                    f.write(chunk)
+                    trace.bytes += len(chunk)
+            headers = response.headers
+        os.replace(tmp_path, path)
+        self._write_meta(
+            path,
+            {
+                "url": url,
+                "etag": headers.get("ETag"),
+                "last_modified": headers.get("Last-Modified"),
+                "stored_at": time.time(),
+                "immutable": bool(immutable),
+            },
+        )
+
+    def _read_meta(self, path):
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(f"{path}.json") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_meta(self, path, meta):
+        tmp_path = f"{path}.json.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, f"{path}.json")
+
+
+def _same_version(meta, headers) -> bool:
+    etag = headers.get("ETag")
+    if etag is not None and meta.get("etag") is not None:
+        return etag == meta["etag"]
+    last_modified = headers.get("Last-Modified")
+    return last_modified is not None and last_modified == meta.get("last_modified")
+
+
+def enable_file_cache(cache_dir="~/.sportsdataverse/files", pin_past_seasons=True) -> FileCache:
+    """enable_file_cache() - Keep local copies of the files read by every `load_*` loader.
+
+    Args:
+        cache_dir (str): Directory of the cached files.
+        pin_past_seasons (bool): If True, seasons before last year are never revalidated once downloaded.
+
+    Returns:
+        FileCache: The cache now in use.
+
+    Example:
+        `sportsdataverse.loader_utils.enable_file_cache(cache_dir="/data/sdv_files")`
+    """
+    global _FILE_CACHE
+    with _FILE_CACHE_LOCK:
+        _FILE_CACHE = FileCache(cache_dir, pin_past_seasons=pin_past_seasons)
+        return _FILE_CACHE
+
+
+def disable_file_cache():
+    """disable_file_cache() - Turn off the file cache enabled by `enable_file_cache()`, keeping the files on disk."""
+    global _FILE_CACHE
+    with _FILE_CACHE_LOCK:
+        _FILE_CACHE = None
+
+
+def get_file_cache(cache_dir=None) -> Optional[FileCache]:
+    """get_file_cache() - The file cache of `cache_dir`, or the one enabled by `enable_file_cache()` if None.
+
+    Returns:
+        FileCache: The cache, or None when `cache_dir` is None and no cache is enabled.
+    """
+    if cache_dir is None:
+        return _FILE_CACHE
+    if isinstance(cache_dir, FileCache):
+        return cache_dir
+    key = os.path.abspath(os.path.expanduser(cache_dir))
+    with _FILE_CACHE_LOCK:
+        cache = _FILE_CACHES.get(key)
+        if cache is None:
+            cache = _FILE_CACHES[key] = FileCache(key)
+        return cache
+
+
+def cached_path(url, cache_dir=None, immutable=False) -> str:
+    """cached_path() - Local copy of `url` when a file cache applies, else `url` itself."""
+    cache = get_file_cache(cache_dir)
+    return url if cache is None else cache.fetch(url, immutable=immutable)
+
+
+def read_parquet_url(url, cache_dir=None, immutable=False, columns=None) -> pl.DataFrame:
+    """read_parquet_url() - Read a remote parquet file, through the file cache when one applies.
+
+    Args:
+        url (str): Url of the parquet file.
+        cache_dir (str): Directory of the file cache, defaults to the one enabled by `enable_file_cache()`.
+        immutable (bool): If True, a cached copy is used without revalidation.
+        columns (list): Columns to read, all of them if None. Without a file cache only these columns
+            are downloaded, see `range_reader.read_parquet_columns()`.
+
+    Returns:
+        pl.DataFrame: Polars dataframe of the file.
+    """
+    if columns is not None and get_file_cache(cache_dir) is None:
+        return read_parquet_columns(url, columns=columns)
+    return _read_parquet(cached_path(url, cache_dir, immutable), columns=columns)
+
+
+def _read_parquet(source, columns=None) -> pl.DataFrame:
+    return pl.read_parquet(source, use_pyarrow=True, columns=columns)
+
+
+def read_rds_url(url, cache_dir=None, immutable=False) -> pl.DataFrame:
+    """read_rds_url() - Read a remote rds file through a parquet copy converted once per download.
+
+    The rds file is kept in the file cache (the one of `cache_dir`, the global one or `SCAN_CACHE_DIR`)
+    and converted to a parquet file next to it the first time it is read after a download, so later
+    reads skip `pyreadr` and pandas entirely. `pyreadr` is only imported when a conversion is needed.
+
+    Args:
+        url (str): Url of the rds file.
+        cache_dir (str): Directory of the file cache.
+        immutable (bool): If True, a cached copy is used without revalidation.
+
+    Returns:
+        pl.DataFrame: Polars dataframe of the file.
+    """
+    return _read_parquet(rds_parquet_path(url, cache_dir, immutable))
+
+
+def rds_parquet_path(url, cache_dir=None, immutable=False) -> str:
+    """rds_parquet_path() - Local parquet copy of a remote rds file, as read by `read_rds_url()`.
+
+    Returns:
+        str: Path of the parquet file converted from the cached rds file, e.g. to `pl.scan_parquet()` it.
+    """
+    rds_path = _scan_cache(cache_dir).fetch(url, immutable=immutable)
+    parquet_path = f"{rds_path}.parquet"
+    if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= os.path.getmtime(rds_path):
+        return parquet_path
+    from pyreadr import read_r
+
+    data = pl.from_pandas(read_r(rds_path)[None])
+    tmp_path = f"{parquet_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    data.write_parquet(tmp_path)
+    os.replace(tmp_path, parquet_path)
+    return parquet_path
+
+
+def load_seasons(
+    url_template: Union[str, Callable[[int], pl.DataFrame]],
+    seasons: List[int],
+    min_season: int,
+    read: Callable[[str], pl.DataFrame] = _read_parquet,
+    max_workers: Optional[int] = None,
+    progress=True,
+    skip_missing=False,
+    cache_dir=None,
+    columns=None,
+    compact=False,
+) -> pl.DataFrame:
+    """load_seasons() - Download one file per season concurrently and stack them with a single concat.
+
+    Every season is validated before anything is downloaded. The frames are concatenated once, in the
+    order of `seasons`, instead of growing the result inside the loop.
+
+    Args:
+        url_template (str or callable): Url with a `{season}` placeholder, e.g. `config.NFL_BASE_URL`, or a
+            function loading one season into a polars dataframe by itself (`read`, `cache_dir` and `columns`
+            are then ignored).
+        seasons (list): Seasons to load, or a single season.
+        min_season (int): Earliest available season.
+        read (callable): Reads one season, given its url or the path of its cached copy, into a polars dataframe.
+        max_workers (int): Number of seasons downloaded at the same time, defaults to `DEFAULT_MAX_WORKERS`.
+        progress (bool or callable): If True, show a tqdm progress bar. A callable is called as
+            `progress(done, total)` after each season finishes.
+        skip_missing (bool): If True, a season that fails to download is reported and skipped instead
+            of raising.
+        cache_dir (str): Directory of the file cache, defaults to the one enabled by `enable_file_cache()`.
+            Past seasons are read from the cache without revalidation if the cache pins them.
+        columns (list): Columns to read, all of them if None. `read` must then accept a `columns` keyword.
+            Without a file cache, the default parquet reader downloads only these columns with HTTP
+            range requests.
+        compact (bool): If True, every season is passed through `compact_frame()` as soon as it is read, so
+            the uncompacted seasons are never all in memory at once.
+
+    Returns:
+        pl.DataFrame: Polars dataframe of every requested season.
+
+    Raises:
+        SeasonNotFoundError: If a season is less than `min_season`.
+    """
+    seasons = _check_seasons(seasons, min_season)
+    fetch = partial(_fetch_season, url_template, read=read, cache=get_file_cache(cache_dir), columns=columns)
+    if compact:
+        # categoricals of different seasons can only be concatenated under one string cache
+        with pl.StringCache():
+            frames = _map_seasons(
+                lambda season: compact_frame(fetch(season)), seasons, max_workers, progress, skip_missing
+            )
+            return _concat_compact(frames)
+    frames = _map_seasons(fetch, seasons, max_workers, progress, skip_missing)
+    if not frames:
+        return pl.DataFrame()
+    return pl.concat(frames, how="vertical")
+
+
+def _fetch_season(url_template, season, read=_read_parquet, cache=None, columns=None) -> pl.DataFrame:
+    if callable(url_template):
+        return url_template(season)
+    url = url_template.format(season=season)
+    if cache is not None:
+        url = cache.fetch(url, immutable=cache.is_immutable_season(season))
+    elif columns is not None and read is _read_parquet:
+        return read_parquet_columns(url, columns=columns)
+    return read(url) if columns is None else read(url, columns=columns)
+
+
+def iter_seasons(
+    url_template: Union[str, Callable[[int], pl.DataFrame]],
+    seasons: List[int],
+    min_season: int,
+    by="season",
+    prefetch=1,
+    skip_missing=False,
+    cache_dir=None,
+    columns=None,
+) -> Iterator[pl.DataFrame]:
+    """iter_seasons() - Yield the seasons of `load_seasons()` one at a time instead of concatenating them.
+
+    While the caller works on one season, the next `prefetch` seasons are downloaded in the background,
+    so at most `prefetch + 1` seasons are held in memory. Seasons are validated before the first one is
+    downloaded.
+
+    Args:
+        url_template (str or callable): Url with a `{season}` placeholder, or a function loading one season.
+        seasons (list): Seasons to iterate over, or a single season.
+        min_season (int): Earliest available season.
+        by (str): "season" yields one dataframe per season. "row_group" yields one dataframe per parquet
+            row group of each season, read from a local copy of the file (see `scan_seasons()`).
+        prefetch (int): Number of seasons downloaded ahead of the one being consumed, 0 to disable.
+        skip_missing (bool): If True, a season that fails to download is reported and skipped.
+        cache_dir (str): Directory of the file cache.
+        columns (list): Columns to read, all of them if None.
+
+    Returns:
+        Iterator[pl.DataFrame]: One polars dataframe per season or row group, in the order of `seasons`.
+
+    Raises:
+        SeasonNotFoundError: If a season is less than `min_season`.
+
+    Example:
+        `for pbp in sportsdataverse.loader_utils.iter_seasons(config.NFL_BASE_URL, range(1999, 2023), 1999):
+            ...`
+    """
+    if by not in ("season", "row_group"):
+        raise ValueError("by must be 'season' or 'row_group'")
+    if by == "row_group" and callable(url_template):
+        raise ValueError("by='row_group' needs a url template")
+    seasons = _check_seasons(seasons, min_season)
+    if by == "season":
+        fetch = partial(_fetch_season, url_template, cache=get_file_cache(cache_dir), columns=columns)
+    else:
+        cache = _scan_cache(cache_dir)
+
+        def fetch(season):
+            return cache.fetch(url_template.format(season=season), immutable=cache.is_immutable_season(season))
+
+    return _iter_prefetched(fetch, seasons, prefetch, skip_missing, by, columns)
+
+
+def _iter_prefetched(fetch, seasons, prefetch, skip_missing, by, columns):
+    pending = deque()
+    remaining = iter(seasons)
+    executor = ThreadPoolExecutor(max_workers=max(prefetch, 1))
+    try:
+        while True:
+            while len(pending) <= prefetch:
+                season = next(remaining, None)
+                if season is None:
+                    break
+                pending.append((season, executor.submit(fetch, season)))
+            if not pending:
+                return
+            season, future = pending.popleft()
+            try:
+                result = future.result()
+            except Exception:
+                if not skip_missing:
+                    raise
+                print(f"We don't seem to have data for the {season} season.")
+                continue
+            if by == "season":
+                yield result
+            else:
+                parquet_file = pq.ParquetFile(result)
+                for i in range(parquet_file.num_row_groups):
+                    yield pl.from_arrow(parquet_file.read_row_group(i, columns=columns))
+    finally:
+        for _, future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def scan_seasons(
+    url_template: Union[str, Callable[[int, FileCache], str]],
+    seasons: List[int],
+    min_season: int,
+    max_workers: Optional[int] = None,
+    progress=False,
+    skip_missing=False,
+    cache_dir=None,
+    compact=False,
+) -> pl.LazyFrame:
+    """scan_seasons() - Lazy counterpart of `load_seasons()`, one `pl.scan_parquet()` per season.
+
+    The season files are brought into the file cache concurrently (the global one, the one of
+    `cache_dir`, or `SCAN_CACHE_DIR` when neither is set) and scanned from local disk, so `.select()`
+    and `.filter()` on the result are pushed down to the parquet reader of every season and nothing is
+    read into memory before `.collect()`.
+
+    Args:
+        url_template (str or callable): Url with a `{season}` placeholder, or a function bringing one season
+            into the file cache by itself, called with the season and the `FileCache`, and returning the path
+            of its parquet file.
+        seasons (list): Seasons to scan, or a single season.
+        min_season (int): Earliest available season.
+        max_workers (int): Number of season files downloaded at the same time, defaults to `DEFAULT_MAX_WORKERS`.
+        progress (bool or callable): Progress of the downloads, as in `load_seasons()`.
+        skip_missing (bool): If True, a season that fails to download is reported and skipped.
+        cache_dir (str): Directory of the file cache.
+        compact (bool): If True, pass the lazy frame through `compact_frame()`.
+
+    Returns:
+        pl.LazyFrame: Lazy frame over every requested season.
+
+    Raises:
+        SeasonNotFoundError: If a season is less than `min_season`.
+
+    Example:
+        `sportsdataverse.loader_utils.scan_seasons(config.NFL_BASE_URL, range(2019, 2023), 1999).select(["game_id", "epa"]).collect()`
+    """
+    seasons = _check_seasons(seasons, min_season)
+    cache = _scan_cache(cache_dir)
+
+    def fetch(season):
+        if callable(url_template):
+            return pl.scan_parquet(url_template(season, cache))
+        path = cache.fetch(url_template.format(season=season), immutable=cache.is_immutable_season(season))
+        return pl.scan_parquet(path)
+
+    frames = _map_seasons(fetch, seasons, max_workers, progress, skip_missing)
+    if not frames:
+        return pl.LazyFrame()
+    data = pl.concat(frames, how="vertical")
+    return compact_frame(data) if compact else data
+
+
+def scan_parquet_url(url, cache_dir=None, compact=False) -> pl.LazyFrame:
+    """scan_parquet_url() - Lazy counterpart of `read_parquet_url()`, scanning a local copy of `url`."""
+    data = pl.scan_parquet(_scan_cache(cache_dir).fetch(url))
+    return compact_frame(data) if compact else data
+
+
+def scan_csv_url(url, cache_dir=None) -> pl.LazyFrame:
+    """scan_csv_url() - Lazily scan a local copy of the csv file at `url`, kept as by `scan_parquet_url()`."""
+    return pl.scan_csv(_scan_cache(cache_dir).fetch(url))
+
+
+def refresh_seasons(
+    url_template: str,
+    seasons: List[int],
+    min_season: int,
+    store: DataStore,
+    league: str,
+    dataset: str,
+    key: Optional[str] = "game_id",
+    footer_cache_dir=None,
+) -> Dict[int, int]:
+    """refresh_seasons() - Bring the copy of changing seasons kept in a `DataStore` up to date.
+
+    Each season file is checked with a HEAD request against the `ETag` recorded at its last refresh, and
+    nothing else is downloaded if it has not changed. When it has, only the `key` column is read, with
+    HTTP range requests, and the row groups holding keys missing from the store are downloaded and their
+    new rows appended. With `key=None`, or when the store has nothing for the season yet, the season is
+    downloaded and replaced as a whole.
+
+    Rows already in the store are not compared again: use `key=None` for files whose rows are updated in
+    place, such as schedules with live scores.
+
+    Args:
+        url_template (str): Url with a `{season}` placeholder.
+        seasons (list): Seasons to refresh, or a single season.
+        min_season (int): Earliest available season.
+        store (DataStore): Store holding the local copy.
+        league (str): League of the dataset in the store.
+        dataset (str): Name of the dataset in the store.
+        key (str): Column identifying the units appended, `game_id` by default.
+        footer_cache_dir (str): Directory of the cached parquet footers, see `range_reader`.
+
+    Returns:
+        dict: Number of rows written per season.
+
+    Raises:
+        SeasonNotFoundError: If a season is less than `min_season`.
+
+    Example:
+        `sportsdataverse.loader_utils.refresh_seasons(config.NFL_BASE_URL, 2023, 1999, DataStore(), "nfl", "pbp")`
+    """
+    seasons = _check_seasons(seasons, min_season)
+    state_path = os.path.join(store.dataset_path(league, dataset), "_refresh.json")
+    state = _read_json(state_path)
+    written = {}
+    for season in seasons:
+        url = url_template.format(season=season)
+        f = open_parquet_url(url, footer_cache_dir=footer_cache_dir)
+        if f.etag is not None and state.get(url) == f.etag:
+            written[season] = 0
+            continue
+        parquet_file = pq.ParquetFile(f, pre_buffer=True)
+        stored = any(p.get("season") == season for p in store.partitions(league, dataset))
+        if key is None or not stored:
+            data = pl.from_arrow(parquet_file.read(use_threads=True))
+            if not data.height:
+                # an empty file does not replace the stored season, and is checked again next time
+                written[season] = 0
+                continue
+            store.replace(data, league, dataset, season=season)
+        else:
+            data = _new_rows(parquet_file, store.scan(league, dataset).filter(pl.col("season") == season), key)
+            if data.height:
+                store.write(data.with_columns(season=pl.lit(season, dtype=pl.Int32)), league, dataset)
+        written[season] = data.height
+        state[url] = f.etag
+        _write_json(state_path, state)
+    return written
+
+
+def _new_rows(parquet_file, stored: pl.LazyFrame, key) -> pl.DataFrame:
+    """Rows of `parquet_file` whose `key` is not in `stored`, reading only the row groups that hold them."""
+    remote = pl.from_arrow(parquet_file.read(columns=[key]))[key]
+    known = stored.select(pl.col(key).unique()).collect()[key].cast(remote.dtype)
+    is_new = ~remote.is_in(known)
+    if not is_new.any():
+        return pl.DataFrame()
+    row_groups, start = [], 0
+    for i in range(parquet_file.num_row_groups):
+        end = start + parquet_file.metadata.row_group(i).num_rows
+        if is_new[start:end].any():
+            row_groups.append(i)
+        start = end
+    data = pl.from_arrow(parquet_file.read_row_groups(row_groups, use_threads=True))
+    return data.filter(~pl.col(key).is_in(known))
+
+
+def _read_json(path) -> dict:
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_json(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+def compact_frame(data: Union[pl.DataFrame, pl.LazyFrame], max_unique_ratio=COMPACT_MAX_UNIQUE_RATIO):
+    """compact_frame() - Cast a loader output to smaller dtypes without losing any value.
+
+    On a dataframe, `Utf8` columns with at most `max_unique_ratio` distinct values per row become
+    `pl.Categorical`, integer columns are narrowed to the smallest signed type holding their minimum and
+    maximum, and `Float64` columns become `Float32` when every value survives the round trip. The memory
+    saved is logged at INFO level on the `sdv.loader_utils` logger.
+
+    A lazy frame cannot be inspected without reading it, so only the `Utf8` columns whose names match
+    `COMPACT_CATEGORICAL_COLUMNS` (team abbreviations, play and season types, positions...) are cast to
+    `pl.Categorical`.
+
+    Categoricals built under different string caches cannot be concatenated: compact several frames that
+    are to be combined inside one `with pl.StringCache():` block, as `load_seasons()` does.
+
+    Args:
+        data (pl.DataFrame or pl.LazyFrame): Frame to compact.
+        max_unique_ratio (float): Largest ratio of distinct values to rows of a string column cast to
+            `pl.Categorical`.
+
+    Returns:
+        pl.DataFrame or pl.LazyFrame: The compacted frame, of the same kind as `data`.
+
+    Example:
+        `sportsdataverse.loader_utils.compact_frame(sportsdataverse.nfl.load_nfl_pbp(seasons=[2022]))`
+    """
+    if isinstance(data, pl.LazyFrame):
+        return data.with_columns(
+            [
+                pl.col(name).cast(pl.Categorical)
+                for name, dtype in data.schema.items()
+                if dtype == pl.Utf8 and COMPACT_CATEGORICAL_COLUMNS.search(name)
+            ]
+        )
+    casts = []
+    for column in data.get_columns():
+        dtype = _compact_dtype(column, max_unique_ratio)
+        if dtype is not None:
+            casts.append(column.cast(dtype))
+    if not casts:
+        return data
+    before = data.estimated_size()
+    data = data.with_columns(casts)
+    after = data.estimated_size()
+    logger.info(
+        "Compacted %d of %d columns from %.1f MB to %.1f MB (%.0f%% saved)",
+        len(casts),
+        data.width,
+        before / 2**20,
+        after / 2**20,
+        100 * (1 - after / before) if before else 0,
+    )
+    return data
+
+
+_INT_BOUNDS = [(pl.Int8, 2**7), (pl.Int16, 2**15), (pl.Int32, 2**31)]
+
+
+def _compact_dtype(column: pl.Series, max_unique_ratio):
+    """The smaller dtype `column` can be cast to without losing values, or None."""
+    non_null = len(column) - column.null_count()
+    if not non_null:
+        return None
+    if column.dtype == pl.Utf8:
+        return pl.Categorical if column.n_unique() <= max_unique_ratio * len(column) else None
+    if column.dtype in (pl.Int64, pl.Int32, pl.Int16):
+        low, high = column.min(), column.max()
+        for dtype, bound in _INT_BOUNDS:
+            if dtype == column.dtype:
+                return None
+            if -bound <= low and high < bound:
+                return dtype
+        return None
+    if column.dtype == pl.Float64:
+        lossless = (column.cast(pl.Float32).cast(pl.Float64) == column) | column.is_null() | column.is_nan()
+        return pl.Float32 if lossless.all() else None
+    return None
+
+
+def _concat_compact(frames) -> pl.DataFrame:
+    """Concatenate compacted seasons, casting a column back to the widest dtype any season needed."""
+    if not frames:
+        return pl.DataFrame()
+    categorical = {name for df in frames for name, dtype in df.schema.items() if dtype == pl.Categorical}
+    frames = [
+        df.with_columns([pl.col(name).cast(pl.Categorical) for name in categorical if df.schema.get(name) == pl.Utf8])
+        for df in frames
+    ]
+    return pl.concat(frames, how="vertical_relaxed")
+
+
+def _scan_cache(cache_dir):
+    return get_file_cache(cache_dir) or get_file_cache(SCAN_CACHE_DIR)
+
+
+def _check_seasons(seasons, min_season) -> List[int]:
+    if type(seasons) is int:
+        seasons = [seasons]
+    seasons = list(seasons)
+    for season in seasons:
+        season_not_found_error(int(season), min_season)
+    return seasons
+
+
+def _map_seasons(fetch, seasons, max_workers, progress, skip_missing) -> list:
+    """Run `fetch(season)` on a thread pool, returning the results in the order of `seasons`."""
+    if not seasons:
+        return []
+    bar = tqdm(total=len(seasons)) if progress is True else None
+    results = {}
+    try:
+        with ThreadPoolExecutor(max_workers=min(max_workers or DEFAULT_MAX_WORKERS, len(seasons))) as executor:
+            futures = {executor.submit(fetch, season): season for season in seasons}
+            for done, future in enumerate(as_completed(futures), start=1):
+                season = futures[future]
+                try:
+                    results[season] = future.result()
+                except Exception:
+                    if not skip_missing:
+                        raise
+                    print(f"We don't seem to have data for the {season} season.")
+                if bar is not None:
+                    bar.update(1)
+                elif callable(progress):
+                    progress(done, len(seasons))
+    finally:
+        if bar is not None:
+            bar.close()
+    return [results[season] for season in seasons if season in results]
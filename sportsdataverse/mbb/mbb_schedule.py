@@ -3,12 +3,12 @@ import datetime
 import pandas as pd
 import polars as pl
 
-from sportsdataverse.dl_utils import download
+from sportsdataverse.dl_utils import adownload, convert_frame, download, run_in_thread
 from sportsdataverse.errors import SeasonNotFoundError
 
 
 def espn_mbb_schedule(
-    dates=None, groups=50, season_type=None, limit=500, return_as_pandas=False, **kwargs
+    dates=None, groups=50, season_type=None, limit=500, return_as_pandas=False, return_as=None, **kwargs
 ) -> pl.DataFrame:
     """espn_mbb_schedule - look up the men's college basketball scheduler for a given season
 
@@ -18,6 +18,8 @@ def espn_mbb_schedule(
         season_type (int): 2 for regular season, 3 for post-season, 4 for off-season.
         limit (int): number of records to return, default: 500.
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
     Returns:
         pl.DataFrame: Polars dataframe containing schedule dates for the requested season. Returns None if no games
     """
@@ -29,14 +31,40 @@ def espn_mbb_schedule(
         "limit": limit,
     }
     resp = download(url=url, params=params, **kwargs)
+    return helper_mbb_schedule(resp.json(), return_as_pandas=return_as_pandas, return_as=return_as)
 
+
+async def aespn_mbb_schedule(
+    dates=None, groups=50, season_type=None, limit=500, return_as_pandas=False, return_as=None, **kwargs
+) -> pl.DataFrame:
+    """aespn_mbb_schedule - Coroutine version of `espn_mbb_schedule()`, taking the same arguments.
+
+    Returns:
+        pl.DataFrame: Polars dataframe containing schedule dates for the requested season.
+
+    Example:
+        `mbb_df = await sportsdataverse.mbb.aespn_mbb_schedule(dates=20230101)`
+    """
+    url = "http://site.api.espn.com/apis/site/v2/sports/basketball/mens-college-basketball/scoreboard"
+    params = {
+        "dates": dates,
+        "seasonType": season_type,
+        "groups": groups if groups is not None else "50",
+        "limit": limit,
+    }
+    resp = await adownload(url=url, params=params, **kwargs)
+    return await run_in_thread(
+        lambda: helper_mbb_schedule(resp.json(), return_as_pandas=return_as_pandas, return_as=return_as)
+    )
+
+
+def helper_mbb_schedule(events_txt, return_as_pandas=False, return_as=None):
     ev = pd.DataFrame()
-    events_txt = resp.json()
     events = events_txt.get("events")
     if events is None:
-        return pd.DataFrame() if return_as_pandas else pl.DataFrame()
+        return convert_frame(pl.DataFrame(), return_as_pandas, return_as)
     if len(events) == 0:
-        return pd.DataFrame() if return_as_pandas else pl.DataFrame()
+        return convert_frame(pl.DataFrame(), return_as_pandas, return_as)
 
     for event in events:
         event = scoreboard_event_parsing(event)
@@ -60,7 +88,7 @@ def espn_mbb_schedule(
     ev = pl.from_pandas(ev)
     ev = ev.janitor.clean_names()
 
-    return ev.to_pandas() if return_as_pandas else ev
+    return convert_frame(ev, return_as_pandas, return_as)
 
 
 def scoreboard_event_parsing(event):
@@ -133,13 +161,15 @@ def __extract_home_away(event, arg1, arg2):
     return event
 
 
-def espn_mbb_calendar(season=None, ondays=None, return_as_pandas=False, **kwargs) -> pl.DataFrame:
+def espn_mbb_calendar(season=None, ondays=None, return_as_pandas=False, return_as=None, **kwargs) -> pl.DataFrame:
     """espn_mbb_calendar - look up the men's college basketball calendar for a given season
 
     Args:
         season (int): Used to define different seasons. 2002 is the earliest available season.
         ondays (boolean): Used to return dates for calendar ondays
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
 
     Returns:
         pl.DataFrame: Polars dataframe containing calendar dates for the requested season.
@@ -154,33 +184,70 @@ def espn_mbb_calendar(season=None, ondays=None, return_as_pandas=False, **kwargs
     else:
         url = f"http://site.api.espn.com/apis/site/v2/sports/basketball/mens-college-basketball/scoreboard?dates={season}"
         resp = download(url=url, **kwargs)
-        txt = resp.json().get("leagues")[0].get("calendar")
-        datenum = list(map(lambda x: x[:10].replace("-", ""), txt))
-        date = list(map(lambda x: x[:10], txt))
-        year = list(map(lambda x: x[:4], txt))
-        month = list(map(lambda x: x[5:7], txt))
-        day = list(map(lambda x: x[8:10], txt))
-        data = {
-            "season": season,
-            "datetime": txt,
-            "date": date,
-            "year": year,
-            "month": month,
-            "day": day,
-            "dateURL": datenum,
-        }
-        full_schedule = pl.DataFrame(data)
-        full_schedule = full_schedule.with_columns(
-            url="http://site.api.espn.com/apis/site/v2/sports/basketball/mens-college-basketball/scoreboard?dates="
-            + pl.col("dateURL")
-        )
-    return full_schedule.to_pandas() if return_as_pandas else full_schedule
+        full_schedule = helper_mbb_calendar(season, resp.json())
+    return convert_frame(full_schedule, return_as_pandas, return_as)
+
+
+async def aespn_mbb_calendar(
+    season=None, ondays=None, return_as_pandas=False, return_as=None, **kwargs
+) -> pl.DataFrame:
+    """aespn_mbb_calendar - Coroutine version of `espn_mbb_calendar()`, taking the same arguments.
+
+    Returns:
+        pl.DataFrame: Polars dataframe containing calendar dates for the requested season.
+
+    Example:
+        `mbb_df = await sportsdataverse.mbb.aespn_mbb_calendar(season=2023)`
+    """
+    if int(season) < 2002:
+        raise SeasonNotFoundError("season cannot be less than 2002")
+    if ondays is not None:
+        full_schedule = await __aondays_mbb_calendar(season, **kwargs)
+    else:
+        url = f"http://site.api.espn.com/apis/site/v2/sports/basketball/mens-college-basketball/scoreboard?dates={season}"
+        resp = await adownload(url=url, **kwargs)
+        full_schedule = await run_in_thread(lambda: helper_mbb_calendar(season, resp.json()))
+    return convert_frame(full_schedule, return_as_pandas, return_as)
+
+
+def helper_mbb_calendar(season, resp_txt):
+    txt = resp_txt.get("leagues")[0].get("calendar")
+    datenum = list(map(lambda x: x[:10].replace("-", ""), txt))
+    date = list(map(lambda x: x[:10], txt))
+    year = list(map(lambda x: x[:4], txt))
+    month = list(map(lambda x: x[5:7], txt))
+    day = list(map(lambda x: x[8:10], txt))
+    data = {
+        "season": season,
+        "datetime": txt,
+        "date": date,
+        "year": year,
+        "month": month,
+        "day": day,
+        "dateURL": datenum,
+    }
+    full_schedule = pl.DataFrame(data)
+    full_schedule = full_schedule.with_columns(
+        url="http://site.api.espn.com/apis/site/v2/sports/basketball/mens-college-basketball/scoreboard?dates="
+        + pl.col("dateURL")
+    )
+    return full_schedule
 
 
 def __ondays_mbb_calendar(season, **kwargs):
     url = f"https://sports.core.api.espn.com/v2/sports/basketball/leagues/mens-college-basketball/seasons/{season}/types/2/calendar/ondays"
     resp = download(url=url, **kwargs)
-    txt = resp.json().get("eventDate").get("dates")
+    return helper_mbb_ondays_calendar(resp.json())
+
+
+async def __aondays_mbb_calendar(season, **kwargs):
+    url = f"https://sports.core.api.espn.com/v2/sports/basketball/leagues/mens-college-basketball/seasons/{season}/types/2/calendar/ondays"
+    resp = await adownload(url=url, **kwargs)
+    return await run_in_thread(lambda: helper_mbb_ondays_calendar(resp.json()))
+
+
+def helper_mbb_ondays_calendar(resp_txt):
+    txt = resp_txt.get("eventDate").get("dates")
     result = pl.DataFrame(txt, schema=["dates"])
     result = result.with_columns(dateURL=pl.col("dates").str.slice(0, 10))
     result = result.with_columns(
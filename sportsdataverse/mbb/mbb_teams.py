@@ -3,16 +3,18 @@ from functools import lru_cache
 import pandas as pd
 import polars as pl
 
-from sportsdataverse.dl_utils import download, underscore
+from sportsdataverse.dl_utils import adownload, convert_frame, download, run_in_thread, underscore
 
 
 @lru_cache(maxsize=None)
-def espn_mbb_teams(groups=None, return_as_pandas=False, **kwargs) -> pl.DataFrame:
+def espn_mbb_teams(groups=None, return_as_pandas=False, return_as=None, **kwargs) -> pl.DataFrame:
     """espn_mbb_teams - look up the men's college basketball teams
 
     Args:
         groups (int): Used to define different divisions. 50 is Division I, 51 is Division II/Division III.
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
 
     Returns:
         pl.DataFrame: Polars dataframe containing teams for the requested league.
@@ -26,14 +28,38 @@ def espn_mbb_teams(groups=None, return_as_pandas=False, **kwargs) -> pl.DataFram
     url = "http://site.api.espn.com/apis/site/v2/sports/basketball/mens-college-basketball/teams"
     params = {"groups": groups if groups is not None else "50", "limit": 1000}
     resp = download(url=url, params=params, **kwargs)
-    if resp is not None:
-        events_txt = resp.json()
-
-        teams = events_txt.get("sports")[0].get("leagues")[0].get("teams")
-        del_keys = ["record", "links"]
-        for team in teams:
-            for k in del_keys:
-                team.get("team").pop(k, None)
-        teams = pd.json_normalize(teams, sep="_")
+    return helper_mbb_teams(resp.json(), return_as_pandas=return_as_pandas, return_as=return_as)
+
+
+async def aespn_mbb_teams(groups=None, return_as_pandas=False, return_as=None, **kwargs) -> pl.DataFrame:
+    """aespn_mbb_teams - Coroutine version of `espn_mbb_teams()`, without the result caching.
+
+    Args:
+        groups (int): Used to define different divisions. 50 is Division I, 51 is Division II/Division III.
+        return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+
+    Returns:
+        pl.DataFrame: Polars dataframe containing teams for the requested league.
+
+    Example:
+        `mbb_df = await sportsdataverse.mbb.aespn_mbb_teams()`
+    """
+    url = "http://site.api.espn.com/apis/site/v2/sports/basketball/mens-college-basketball/teams"
+    params = {"groups": groups if groups is not None else "50", "limit": 1000}
+    resp = await adownload(url=url, params=params, **kwargs)
+    return await run_in_thread(
+        lambda: helper_mbb_teams(resp.json(), return_as_pandas=return_as_pandas, return_as=return_as)
+    )
+
+
+def helper_mbb_teams(events_txt, return_as_pandas=False, return_as=None):
+    teams = events_txt.get("sports")[0].get("leagues")[0].get("teams")
+    del_keys = ["record", "links"]
+    for team in teams:
+        for k in del_keys:
+            team.get("team").pop(k, None)
+    teams = pd.json_normalize(teams, sep="_")
     teams.columns = [underscore(c) for c in teams.columns.tolist()]
-    return teams if return_as_pandas else pl.from_pandas(teams)
+    return convert_frame(teams, return_as_pandas, return_as)
@@ -0,0 +1,230 @@
+import logging
+import re
+import threading
+import time
+from collections import namedtuple
+from typing import Callable
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import polars as pl
+
+from sportsdataverse.rate_limit import endpoint_family
+
+logger = logging.getLogger("sdv.metrics")
+logger.addHandler(logging.NullHandler())
+
+_HOOKS_LOCK = threading.Lock()
+_HOOKS = ()
+
+RequestEvent = namedtuple(
+    "RequestEvent",
+    [
+        "url",
+        "url_template",
+        "host",
+        "family",
+        "status",
+        "bytes",
+        "dns",
+        "connect",
+        "ttfb",
+        "total",
+        "retries",
+        "cache",
+        "error",
+    ],
+)
+RequestEvent.__doc__ = """One request made by `download()`, `adownload()`, the loaders' `FileCache` or the
+`range_reader` module, as passed to the hooks.
+
+Times are in seconds. `dns` and `connect` are None because neither `requests` nor `httpx` exposes
+them, and `ttfb` is None where it cannot be measured (`adownload()`). `total` covers every attempt
+including backoff sleeps, `retries` counts the attempts after the first one and `cache` is None
+(no response cache in use), "hit", "miss" or "revalidated". `error` is the exception name of a
+failed request.
+"""
+
+_NUMERIC = re.compile(r"^\d+$")
+
+
+def url_template(url) -> str:
+    """url_template() - The url with numeric ids replaced by `{id}`, grouping requests by endpoint.
+
+    Args:
+        url (str): Request url.
+
+    Returns:
+        str: The url template.
+
+    Example:
+        `sportsdataverse.metrics.url_template("https://site.api.espn.com/apis/site/v2/sports/football/nfl/summary?event=401220403&1693526400000")`
+    """
+    parts = urlsplit(url)
+    path = "/".join("{id}" if _NUMERIC.match(seg) else seg for seg in parts.path.split("/"))
+    query = [
+        (k, "{id}" if _NUMERIC.match(v) else v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not (v == "" and _NUMERIC.match(k))
+    ]
+    return urlunsplit((parts.scheme, parts.netloc.lower(), path, urlencode(query, safe="{}"), ""))
+
+
+def add_hook(hook: Callable[[RequestEvent], None]):
+    """add_hook() - Call `hook(event)` with a `RequestEvent` after every `download()`/`adownload()` request.
+
+    Exceptions raised by a hook are logged and otherwise ignored.
+
+    Example:
+        `sportsdataverse.metrics.add_hook(print)`
+    """
+    global _HOOKS
+    with _HOOKS_LOCK:
+        _HOOKS = _HOOKS + (hook,)
+
+
+def remove_hook(hook: Callable[[RequestEvent], None]):
+    """remove_hook() - Stop calling a hook registered with `add_hook()`."""
+    global _HOOKS
+    with _HOOKS_LOCK:
+        _HOOKS = tuple(h for h in _HOOKS if h is not hook)
+
+
+def emit(event: RequestEvent):
+    for hook in _HOOKS:
+        try:
+            hook(event)
+        except Exception:
+            logger.exception("metrics hook %r failed", hook)
+
+
+class RequestTrace:
+    """Collects what `download()` learns about one request and emits it as a `RequestEvent`.
+
+    Also usable as a context manager, which records the exception raised inside the block, if any,
+    and emits the event on exit.
+    """
+
+    __slots__ = ("url", "started", "attempts", "cache", "response", "ttfb", "error", "bytes")
+
+    def __init__(self, url):
+        self.url = url
+        self.started = time.perf_counter()
+        self.attempts = 0
+        self.cache = None
+        self.response = None
+        self.ttfb = None
+        self.error = None
+        self.bytes = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc is not None:
+            self.error = exc
+        self.finish()
+        return False
+
+    def finish(self):
+        if not _HOOKS:
+            return
+        response = self.response
+        parts = urlsplit(self.url)
+        emit(
+            RequestEvent(
+                url=self.url,
+                url_template=url_template(self.url),
+                host=parts.netloc.lower(),
+                family=endpoint_family(self.url),
+                status=getattr(response, "status_code", None),
+                bytes=self.bytes if self.bytes is not None else len(response.content) if response is not None else 0,
+                dns=None,
+                connect=None,
+                ttfb=self.ttfb,
+                total=time.perf_counter() - self.started,
+                retries=max(self.attempts - 1, 0),
+                cache=self.cache,
+                error=None if self.error is None else type(self.error).__name__,
+            )
+        )
+
+
+class MetricsAggregator:
+    """MetricsAggregator - In-memory sink of `RequestEvent`s that summarizes latency per endpoint family.
+
+    Args:
+        register (bool): If True, register the aggregator with `add_hook()` right away.
+
+    Example:
+        `agg = sportsdataverse.metrics.MetricsAggregator()`
+        `... run a batch ...`
+        `agg.summary()`
+    """
+
+    def __init__(self, register=True):
+        self.events = []
+        self._lock = threading.Lock()
+        if register:
+            add_hook(self)
+
+    def __call__(self, event: RequestEvent):
+        with self._lock:
+            self.events.append(event)
+
+    def close(self):
+        """Unregister the aggregator, keeping the events collected so far."""
+        remove_hook(self)
+
+    def reset(self):
+        with self._lock:
+            self.events = []
+
+    def to_frame(self, return_as_pandas=False) -> pl.DataFrame:
+        """Every collected event as one row."""
+        with self._lock:
+            rows = [e._asdict() for e in self.events]
+        schema = {
+            "url": pl.Utf8,
+            "url_template": pl.Utf8,
+            "host": pl.Utf8,
+            "family": pl.Utf8,
+            "status": pl.Int64,
+            "bytes": pl.Int64,
+            "dns": pl.Float64,
+            "connect": pl.Float64,
+            "ttfb": pl.Float64,
+            "total": pl.Float64,
+            "retries": pl.Int64,
+            "cache": pl.Utf8,
+            "error": pl.Utf8,
+        }
+        df = pl.DataFrame(rows, schema=schema)
+        return df.to_pandas() if return_as_pandas else df
+
+    def summary(self, by="family", return_as_pandas=False) -> pl.DataFrame:
+        """summary() - Request counts, bytes, retries, cache hits and p50/p95/p99 latency per group.
+
+        Args:
+            by (str): Column to group by, "family", "host" or "url_template".
+            return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+
+        Returns:
+            pl.DataFrame: One row per group, latencies in seconds.
+        """
+        df = (
+            self.to_frame()
+            .groupby(by)
+            .agg(
+                requests=pl.count(),
+                errors=pl.col("error").is_not_null().sum(),
+                retries=pl.col("retries").sum(),
+                cache_hits=(pl.col("cache") == "hit").sum(),
+                bytes=pl.col("bytes").sum(),
+                p50=pl.col("total").quantile(0.5),
+                p95=pl.col("total").quantile(0.95),
+                p99=pl.col("total").quantile(0.99),
+                max=pl.col("total").max(),
+            )
+            .sort(by)
+        )
+        return df.to_pandas() if return_as_pandas else df
@@ -0,0 +1,103 @@
+import hashlib
+import logging
+import os
+import threading
+import time
+from typing import Dict
+
+from xgboost import Booster
+
+logger = logging.getLogger("sdv.models")
+logger.addHandler(logging.NullHandler())
+
+DEFAULT_NTHREAD = 4
+
+_MODEL_LOCK = threading.Lock()
+_MODELS = {}
+_MODEL_STATS = {}
+_MODEL_DIGESTS = {}
+_MODEL_CONFIG = {"nthread": DEFAULT_NTHREAD}
+
+
+def get_model(path) -> Booster:
+    """get_model() - Return the shared `xgboost.Booster` of a model file, loading it on first use.
+
+    Models are keyed on the sha256 of the file contents, so the CFB and NFL copies of an identical model
+    are loaded once and the same booster is handed to every caller and thread.
+
+    Args:
+        path (str): Path of the saved model, such as `sportsdataverse.cfb.cfb_pbp.wp_spread_file`.
+
+    Returns:
+        xgboost.Booster: The loaded booster, configured with the registry `nthread`.
+
+    Example:
+        `wp_model = sportsdataverse.models.get_model(sportsdataverse.cfb.cfb_pbp.wp_spread_file)`
+    """
+    path = os.path.abspath(path)
+    with _MODEL_LOCK:
+        digest = _MODEL_DIGESTS.get(path)
+        if digest is None:
+            with open(path, "rb") as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+            _MODEL_DIGESTS[path] = digest
+        model = _MODELS.get(digest)
+        if model is None:
+            start = time.perf_counter()
+            model = Booster({"nthread": _MODEL_CONFIG["nthread"]})
+            model.load_model(path)
+            elapsed = time.perf_counter() - start
+            _MODELS[digest] = model
+            _MODEL_STATS[digest] = {"paths": [], "load_seconds": elapsed, "loaded": time.time(), "requests": 0}
+            logger.debug("loaded model %s in %.3fs", path, elapsed)
+        stats = _MODEL_STATS[digest]
+        if path not in stats["paths"]:
+            stats["paths"].append(path)
+        stats["requests"] += 1
+    return model
+
+
+def configure_models(nthread=None) -> Dict:
+    """configure_models() - Set the options of the boosters in the shared model registry.
+
+    Boosters already loaded are updated in place, later ones are created with the new settings.
+
+    Args:
+        nthread (int): Number of threads each booster uses to predict. Lower it when games are processed
+            by several worker threads or processes at once, so that they do not oversubscribe the cores.
+
+    Returns:
+        Dict: The registry settings now in effect.
+
+    Example:
+        `sportsdataverse.models.configure_models(nthread=1)`
+    """
+    with _MODEL_LOCK:
+        if nthread is not None:
+            _MODEL_CONFIG["nthread"] = nthread
+            for model in _MODELS.values():
+                model.set_param({"nthread": nthread})
+        return dict(_MODEL_CONFIG)
+
+
+def model_registry_info() -> Dict:
+    """model_registry_info() - Inspect the shared model registry.
+
+    Returns:
+        Dict: Dictionary with keys "config" (the booster settings) and "models", a mapping of the sha256 of
+        each loaded model to the paths it was requested from, its load time in seconds, the timestamp it was
+        loaded at and the number of times it was requested.
+    """
+    with _MODEL_LOCK:
+        return {
+            "config": dict(_MODEL_CONFIG),
+            "models": {k: dict(v, paths=list(v["paths"])) for k, v in _MODEL_STATS.items()},
+        }
+
+
+def reset_models():
+    """reset_models() - Drop every booster in the shared registry, they are reloaded on next use."""
+    with _MODEL_LOCK:
+        _MODELS.clear()
+        _MODEL_STATS.clear()
+        _MODEL_DIGESTS.clear()
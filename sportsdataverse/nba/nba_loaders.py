@@ -1,7 +1,6 @@
-from typing import List
+from typing import Dict, Iterator, List, Optional
 
 import polars as pl
-from tqdm import tqdm
 
 from sportsdataverse.config import (
     NBA_BASE_URL,
@@ -9,10 +8,22 @@ from sportsdataverse.config import (
     NBA_TEAM_BOX_URL,
     NBA_TEAM_SCHEDULE_URL,
 )
-from sportsdataverse.errors import SeasonNotFoundError
+from sportsdataverse.dl_utils import convert_frame
+from sportsdataverse.loader_utils import iter_seasons, load_seasons, refresh_seasons, scan_seasons
+from sportsdataverse.nba.nba_schedule import most_recent_nba_season
+from sportsdataverse.store import DataStore
 
 
-def load_nba_pbp(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
+def load_nba_pbp(
+    seasons: List[int],
+    return_as_pandas=False,
+    return_as=None,
+    max_workers=None,
+    progress=True,
+    cache_dir=None,
+    columns=None,
+    compact=False,
+) -> pl.DataFrame:
     """Load NBA play by play data going back to 2002
 
     Example:
@@ -21,6 +32,14 @@ def load_nba_pbp(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
     Args:
         seasons (list): Used to define different seasons. 2002 is the earliest available season.
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        max_workers (int): Number of seasons downloaded at the same time, defaults to 4.
+        progress (bool or callable): If True, show a tqdm progress bar. A callable is called as
+            `progress(done, total)` after each season.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None. Without a file cache only these columns are downloaded.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
 
     Returns:
         pl.DataFrame: Polars dataframe containing the
@@ -29,18 +48,101 @@ def load_nba_pbp(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
     Raises:
         ValueError: If `season` is less than 2002.
     """
-    data = pl.DataFrame()
-    if type(seasons) is int:
-        seasons = [seasons]
-    for i in tqdm(seasons):
-        if int(i) < 2002:
-            raise SeasonNotFoundError("season cannot be less than 2002")
-        i_data = pl.read_parquet(NBA_BASE_URL.format(season=i), use_pyarrow=True, columns=None)
-        data = pl.concat([data, i_data], how="vertical")
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
+    data = load_seasons(
+        NBA_BASE_URL,
+        seasons,
+        min_season=2002,
+        max_workers=max_workers,
+        progress=progress,
+        cache_dir=cache_dir,
+        columns=columns,
+        compact=compact,
+    )
+    return convert_frame(data, return_as_pandas, return_as, use_pyarrow_extension_array=True)
 
 
-def load_nba_team_boxscore(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
+def scan_nba_pbp(seasons: List[int], max_workers=None, cache_dir=None, compact=False) -> pl.LazyFrame:
+    """Lazily scan NBA play by play data going back to 2002
+
+    Example:
+        `nba_df = sportsdataverse.nba.scan_nba_pbp(seasons=range(2002,2022)).collect()`
+
+    Args:
+        seasons (list): Used to define different seasons. 2002 is the earliest available season.
+        max_workers (int): Number of season files downloaded at the same time, defaults to 4.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
+
+    Returns:
+        pl.LazyFrame: Lazy frame over the data of `load_nba_pbp()`.
+
+    Raises:
+        ValueError: If `season` is less than 2002.
+    """
+    return scan_seasons(
+        NBA_BASE_URL, seasons, min_season=2002, max_workers=max_workers, cache_dir=cache_dir, compact=compact
+    )
+
+
+def iter_nba_pbp(
+    seasons: List[int], return_as_pandas=False, return_as=None, by="season", prefetch=1, cache_dir=None, columns=None
+) -> Iterator[pl.DataFrame]:
+    """Iterate over NBA play by play data going back to 2002, one season at a time
+
+    Example:
+        `for df in sportsdataverse.nba.iter_nba_pbp(seasons=range(2002,2022)): print(df.shape)`
+
+    Args:
+        seasons (list): Used to define different seasons. 2002 is the earliest available season.
+        return_as_pandas (bool): If True, yields pandas dataframes. If False, yields polars dataframes.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        by (str): "season" yields one dataframe per season, "row_group" one per parquet row group.
+        prefetch (int): Number of seasons downloaded in the background ahead of the current one.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None.
+
+    Returns:
+        Iterator[pl.DataFrame]: One dataframe per season (or row group) of `load_nba_pbp()`.
+
+    Raises:
+        ValueError: If `season` is less than 2002.
+    """
+    frames = iter_seasons(
+        NBA_BASE_URL, seasons, min_season=2002, by=by, prefetch=prefetch, cache_dir=cache_dir, columns=columns
+    )
+    return (convert_frame(df, return_as_pandas, return_as, use_pyarrow_extension_array=True) for df in frames)
+
+
+def refresh_nba_pbp(store: DataStore, seasons: Optional[List[int]] = None) -> Dict[int, int]:
+    """Refresh NBA play by play data kept in a `DataStore`
+
+    Only the games missing from the store are downloaded from a changed season file.
+
+    Example:
+        `sportsdataverse.nba.refresh_nba_pbp(sportsdataverse.store.DataStore())`
+
+    Args:
+        store (DataStore): Store holding the copy, under `league="nba"` and `dataset="pbp"`.
+        seasons (list): Seasons to refresh, defaults to the most recent season.
+
+    Returns:
+        dict: Number of rows written per season.
+    """
+    seasons = [most_recent_nba_season()] if seasons is None else seasons
+    return refresh_seasons(NBA_BASE_URL, seasons, min_season=2002, store=store, league="nba", dataset="pbp")
+
+
+def load_nba_team_boxscore(
+    seasons: List[int],
+    return_as_pandas=False,
+    return_as=None,
+    max_workers=None,
+    progress=True,
+    cache_dir=None,
+    columns=None,
+    compact=False,
+) -> pl.DataFrame:
     """Load NBA team boxscore data
 
     Example:
@@ -49,6 +151,14 @@ def load_nba_team_boxscore(seasons: List[int], return_as_pandas=False) -> pl.Dat
     Args:
         seasons (list): Used to define different seasons. 2002 is the earliest available season.
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        max_workers (int): Number of seasons downloaded at the same time, defaults to 4.
+        progress (bool or callable): If True, show a tqdm progress bar. A callable is called as
+            `progress(done, total)` after each season.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None. Without a file cache only these columns are downloaded.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
 
     Returns:
         pl.DataFrame: Polars dataframe containing the
@@ -57,18 +167,101 @@ def load_nba_team_boxscore(seasons: List[int], return_as_pandas=False) -> pl.Dat
     Raises:
         ValueError: If `season` is less than 2002.
     """
-    data = pl.DataFrame()
-    if type(seasons) is int:
-        seasons = [seasons]
-    for i in tqdm(seasons):
-        if int(i) < 2002:
-            raise SeasonNotFoundError("season cannot be less than 2002")
-        i_data = pl.read_parquet(NBA_TEAM_BOX_URL.format(season=i), use_pyarrow=True, columns=None)
-        data = pl.concat([data, i_data], how="vertical")
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
+    data = load_seasons(
+        NBA_TEAM_BOX_URL,
+        seasons,
+        min_season=2002,
+        max_workers=max_workers,
+        progress=progress,
+        cache_dir=cache_dir,
+        columns=columns,
+        compact=compact,
+    )
+    return convert_frame(data, return_as_pandas, return_as, use_pyarrow_extension_array=True)
+
+
+def scan_nba_team_boxscore(seasons: List[int], max_workers=None, cache_dir=None, compact=False) -> pl.LazyFrame:
+    """Lazily scan NBA team boxscore data
+
+    Example:
+        `nba_df = sportsdataverse.nba.scan_nba_team_boxscore(seasons=range(2002,2022)).collect()`
+
+    Args:
+        seasons (list): Used to define different seasons. 2002 is the earliest available season.
+        max_workers (int): Number of season files downloaded at the same time, defaults to 4.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
+
+    Returns:
+        pl.LazyFrame: Lazy frame over the data of `load_nba_team_boxscore()`.
+
+    Raises:
+        ValueError: If `season` is less than 2002.
+    """
+    return scan_seasons(
+        NBA_TEAM_BOX_URL, seasons, min_season=2002, max_workers=max_workers, cache_dir=cache_dir, compact=compact
+    )
+
+
+def iter_nba_team_boxscore(
+    seasons: List[int], return_as_pandas=False, return_as=None, by="season", prefetch=1, cache_dir=None, columns=None
+) -> Iterator[pl.DataFrame]:
+    """Iterate over NBA team boxscore data, one season at a time
+
+    Example:
+        `for df in sportsdataverse.nba.iter_nba_team_boxscore(seasons=range(2002,2022)): print(df.shape)`
+
+    Args:
+        seasons (list): Used to define different seasons. 2002 is the earliest available season.
+        return_as_pandas (bool): If True, yields pandas dataframes. If False, yields polars dataframes.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        by (str): "season" yields one dataframe per season, "row_group" one per parquet row group.
+        prefetch (int): Number of seasons downloaded in the background ahead of the current one.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None.
+
+    Returns:
+        Iterator[pl.DataFrame]: One dataframe per season (or row group) of `load_nba_team_boxscore()`.
+
+    Raises:
+        ValueError: If `season` is less than 2002.
+    """
+    frames = iter_seasons(
+        NBA_TEAM_BOX_URL, seasons, min_season=2002, by=by, prefetch=prefetch, cache_dir=cache_dir, columns=columns
+    )
+    return (convert_frame(df, return_as_pandas, return_as, use_pyarrow_extension_array=True) for df in frames)
+
+
+def refresh_nba_team_boxscore(store: DataStore, seasons: Optional[List[int]] = None) -> Dict[int, int]:
+    """Refresh NBA team boxscore data kept in a `DataStore`
+
+    Only the games missing from the store are downloaded from a changed season file.
+
+    Example:
+        `sportsdataverse.nba.refresh_nba_team_boxscore(sportsdataverse.store.DataStore())`
+
+    Args:
+        store (DataStore): Store holding the copy, under `league="nba"` and `dataset="team_box"`.
+        seasons (list): Seasons to refresh, defaults to the most recent season.
+
+    Returns:
+        dict: Number of rows written per season.
+    """
+    seasons = [most_recent_nba_season()] if seasons is None else seasons
+    return refresh_seasons(NBA_TEAM_BOX_URL, seasons, min_season=2002, store=store, league="nba", dataset="team_box")
 
 
-def load_nba_player_boxscore(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
+def load_nba_player_boxscore(
+    seasons: List[int],
+    return_as_pandas=False,
+    return_as=None,
+    max_workers=None,
+    progress=True,
+    cache_dir=None,
+    columns=None,
+    compact=False,
+) -> pl.DataFrame:
     """Load NBA player boxscore data
 
     Example:
@@ -77,6 +270,14 @@ def load_nba_player_boxscore(seasons: List[int], return_as_pandas=False) -> pl.D
     Args:
         seasons (list): Used to define different seasons. 2002 is the earliest available season.
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        max_workers (int): Number of seasons downloaded at the same time, defaults to 4.
+        progress (bool or callable): If True, show a tqdm progress bar. A callable is called as
+            `progress(done, total)` after each season.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None. Without a file cache only these columns are downloaded.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
 
     Returns:
         pl.DataFrame: Polars dataframe containing the
@@ -85,18 +286,103 @@ def load_nba_player_boxscore(seasons: List[int], return_as_pandas=False) -> pl.D
     Raises:
         ValueError: If `season` is less than 2002.
     """
-    data = pl.DataFrame()
-    if type(seasons) is int:
-        seasons = [seasons]
-    for i in tqdm(seasons):
-        if int(i) < 2002:
-            raise SeasonNotFoundError("season cannot be less than 2002")
-        i_data = pl.read_parquet(NBA_PLAYER_BOX_URL.format(season=i), use_pyarrow=True, columns=None)
-        data = pl.concat([data, i_data], how="vertical")
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
+    data = load_seasons(
+        NBA_PLAYER_BOX_URL,
+        seasons,
+        min_season=2002,
+        max_workers=max_workers,
+        progress=progress,
+        cache_dir=cache_dir,
+        columns=columns,
+        compact=compact,
+    )
+    return convert_frame(data, return_as_pandas, return_as, use_pyarrow_extension_array=True)
 
 
-def load_nba_schedule(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
+def scan_nba_player_boxscore(seasons: List[int], max_workers=None, cache_dir=None, compact=False) -> pl.LazyFrame:
+    """Lazily scan NBA player boxscore data
+
+    Example:
+        `nba_df = sportsdataverse.nba.scan_nba_player_boxscore(seasons=range(2002,2022)).collect()`
+
+    Args:
+        seasons (list): Used to define different seasons. 2002 is the earliest available season.
+        max_workers (int): Number of season files downloaded at the same time, defaults to 4.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
+
+    Returns:
+        pl.LazyFrame: Lazy frame over the data of `load_nba_player_boxscore()`.
+
+    Raises:
+        ValueError: If `season` is less than 2002.
+    """
+    return scan_seasons(
+        NBA_PLAYER_BOX_URL, seasons, min_season=2002, max_workers=max_workers, cache_dir=cache_dir, compact=compact
+    )
+
+
+def iter_nba_player_boxscore(
+    seasons: List[int], return_as_pandas=False, return_as=None, by="season", prefetch=1, cache_dir=None, columns=None
+) -> Iterator[pl.DataFrame]:
+    """Iterate over NBA player boxscore data, one season at a time
+
+    Example:
+        `for df in sportsdataverse.nba.iter_nba_player_boxscore(seasons=range(2002,2022)): print(df.shape)`
+
+    Args:
+        seasons (list): Used to define different seasons. 2002 is the earliest available season.
+        return_as_pandas (bool): If True, yields pandas dataframes. If False, yields polars dataframes.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        by (str): "season" yields one dataframe per season, "row_group" one per parquet row group.
+        prefetch (int): Number of seasons downloaded in the background ahead of the current one.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None.
+
+    Returns:
+        Iterator[pl.DataFrame]: One dataframe per season (or row group) of `load_nba_player_boxscore()`.
+
+    Raises:
+        ValueError: If `season` is less than 2002.
+    """
+    frames = iter_seasons(
+        NBA_PLAYER_BOX_URL, seasons, min_season=2002, by=by, prefetch=prefetch, cache_dir=cache_dir, columns=columns
+    )
+    return (convert_frame(df, return_as_pandas, return_as, use_pyarrow_extension_array=True) for df in frames)
+
+
+def refresh_nba_player_boxscore(store: DataStore, seasons: Optional[List[int]] = None) -> Dict[int, int]:
+    """Refresh NBA player boxscore data kept in a `DataStore`
+
+    Only the games missing from the store are downloaded from a changed season file.
+
+    Example:
+        `sportsdataverse.nba.refresh_nba_player_boxscore(sportsdataverse.store.DataStore())`
+
+    Args:
+        store (DataStore): Store holding the copy, under `league="nba"` and `dataset="player_box"`.
+        seasons (list): Seasons to refresh, defaults to the most recent season.
+
+    Returns:
+        dict: Number of rows written per season.
+    """
+    seasons = [most_recent_nba_season()] if seasons is None else seasons
+    return refresh_seasons(
+        NBA_PLAYER_BOX_URL, seasons, min_season=2002, store=store, league="nba", dataset="player_box"
+    )
+
+
+def load_nba_schedule(
+    seasons: List[int],
+    return_as_pandas=False,
+    return_as=None,
+    max_workers=None,
+    progress=True,
+    cache_dir=None,
+    columns=None,
+    compact=False,
+) -> pl.DataFrame:
     """Load NBA schedule data
 
     Example:
@@ -105,6 +391,14 @@ def load_nba_schedule(seasons: List[int], return_as_pandas=False) -> pl.DataFram
     Args:
         seasons (list): Used to define different seasons. 2002 is the earliest available season.
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        max_workers (int): Number of seasons downloaded at the same time, defaults to 4.
+        progress (bool or callable): If True, show a tqdm progress bar. A callable is called as
+            `progress(done, total)` after each season.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None. Without a file cache only these columns are downloaded.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
 
     Returns:
         pl.DataFrame: Polars dataframe containing the
@@ -113,12 +407,88 @@ def load_nba_schedule(seasons: List[int], return_as_pandas=False) -> pl.DataFram
     Raises:
         ValueError: If `season` is less than 2002.
     """
-    data = pl.DataFrame()
-    if type(seasons) is int:
-        seasons = [seasons]
-    for i in tqdm(seasons):
-        if int(i) < 2002:
-            raise SeasonNotFoundError("season cannot be less than 2002")
-        i_data = pl.read_parquet(NBA_TEAM_SCHEDULE_URL.format(season=i), use_pyarrow=True, columns=None)
-        data = pl.concat([data, i_data], how="vertical")
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
+    data = load_seasons(
+        NBA_TEAM_SCHEDULE_URL,
+        seasons,
+        min_season=2002,
+        max_workers=max_workers,
+        progress=progress,
+        cache_dir=cache_dir,
+        columns=columns,
+        compact=compact,
+    )
+    return convert_frame(data, return_as_pandas, return_as, use_pyarrow_extension_array=True)
+
+
+def scan_nba_schedule(seasons: List[int], max_workers=None, cache_dir=None, compact=False) -> pl.LazyFrame:
+    """Lazily scan NBA schedule data
+
+    Example:
+        `nba_df = sportsdataverse.nba.scan_nba_schedule(seasons=range(2002,2022)).collect()`
+
+    Args:
+        seasons (list): Used to define different seasons. 2002 is the earliest available season.
+        max_workers (int): Number of season files downloaded at the same time, defaults to 4.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
+
+    Returns:
+        pl.LazyFrame: Lazy frame over the data of `load_nba_schedule()`.
+
+    Raises:
+        ValueError: If `season` is less than 2002.
+    """
+    return scan_seasons(
+        NBA_TEAM_SCHEDULE_URL, seasons, min_season=2002, max_workers=max_workers, cache_dir=cache_dir, compact=compact
+    )
+
+
+def iter_nba_schedule(
+    seasons: List[int], return_as_pandas=False, return_as=None, by="season", prefetch=1, cache_dir=None, columns=None
+) -> Iterator[pl.DataFrame]:
+    """Iterate over NBA schedule data, one season at a time
+
+    Example:
+        `for df in sportsdataverse.nba.iter_nba_schedule(seasons=range(2002,2022)): print(df.shape)`
+
+    Args:
+        seasons (list): Used to define different seasons. 2002 is the earliest available season.
+        return_as_pandas (bool): If True, yields pandas dataframes. If False, yields polars dataframes.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        by (str): "season" yields one dataframe per season, "row_group" one per parquet row group.
+        prefetch (int): Number of seasons downloaded in the background ahead of the current one.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None.
+
+    Returns:
+        Iterator[pl.DataFrame]: One dataframe per season (or row group) of `load_nba_schedule()`.
+
+    Raises:
+        ValueError: If `season` is less than 2002.
+    """
+    frames = iter_seasons(
+        NBA_TEAM_SCHEDULE_URL, seasons, min_season=2002, by=by, prefetch=prefetch, cache_dir=cache_dir, columns=columns
+    )
+    return (convert_frame(df, return_as_pandas, return_as, use_pyarrow_extension_array=True) for df in frames)
+
+
+def refresh_nba_schedule(store: DataStore, seasons: Optional[List[int]] = None) -> Dict[int, int]:
+    """Refresh NBA schedule data kept in a `DataStore`
+
+    Changed season files are re-downloaded as a whole, since their rows are updated in place.
+
+    Example:
+        `sportsdataverse.nba.refresh_nba_schedule(sportsdataverse.store.DataStore())`
+
+    Args:
+        store (DataStore): Store holding the copy, under `league="nba"` and `dataset="schedule"`.
+        seasons (list): Seasons to refresh, defaults to the most recent season.
+
+    Returns:
+        dict: Number of rows written per season.
+    """
+    seasons = [most_recent_nba_season()] if seasons is None else seasons
+    return refresh_seasons(
+        NBA_TEAM_SCHEDULE_URL, seasons, min_season=2002, store=store, league="nba", dataset="schedule", key=None
+    )
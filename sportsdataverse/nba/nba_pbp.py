@@ -7,7 +7,7 @@ import numpy as np
 import pandas as pd
 import polars as pl
 
-from sportsdataverse.dl_utils import download, flatten_json_iterative
+from sportsdataverse.dl_utils import adownload, download, flatten_json_iterative, run_in_thread
 
 
 def espn_nba_pbp(game_id: int, raw=False, **kwargs) -> Dict:
@@ -26,12 +26,34 @@ def espn_nba_pbp(game_id: int, raw=False, **kwargs) -> Dict:
     Example:
         `nba_df = sportsdataverse.nba.espn_nba_pbp(game_id=401307514)`
     """
-    # play by play
-    pbp_txt = {"timeouts": {}}
     # summary endpoint for pickcenter array
     summary_url = f"http://site.api.espn.com/apis/site/v2/sports/basketball/nba/summary?event={game_id}"
     summary_resp = download(summary_url, **kwargs)
-    summary = summary_resp.json()
+    return helper_nba_summary(game_id, summary_resp.json(), raw=raw)
+
+
+async def aespn_nba_pbp(game_id: int, raw=False, **kwargs) -> Dict:
+    """aespn_nba_pbp() - Coroutine version of `espn_nba_pbp()`. The summary is downloaded with
+    `dl_utils.adownload()` and the play-by-play processing runs in a worker thread.
+
+    Args:
+        game_id (int): Unique game_id, can be obtained from espn_nba_schedule().
+        raw (bool): If True, returns the raw json from the API endpoint. If False, returns a cleaned dictionary of datasets.
+
+    Returns:
+        Dict: Same dictionary as `espn_nba_pbp()`.
+
+    Example:
+        `nba_df = await sportsdataverse.nba.aespn_nba_pbp(game_id=401307514)`
+    """
+    summary_url = f"http://site.api.espn.com/apis/site/v2/sports/basketball/nba/summary?event={game_id}"
+    summary_resp = await adownload(summary_url, **kwargs)
+    return await run_in_thread(lambda: helper_nba_summary(game_id, summary_resp.json(), raw=raw))
+
+
+def helper_nba_summary(game_id, summary, raw=False):
+    # play by play
+    pbp_txt = {"timeouts": {}}
 
     incoming_keys_expected = [
         "boxscore",
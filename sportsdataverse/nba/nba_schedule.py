@@ -3,10 +3,12 @@ import datetime
 import pandas as pd
 import polars as pl
 
-from sportsdataverse.dl_utils import download
+from sportsdataverse.dl_utils import adownload, convert_frame, download, run_in_thread
 
 
-def espn_nba_schedule(dates=None, season_type=None, limit=500, return_as_pandas=False, **kwargs) -> pl.DataFrame:
+def espn_nba_schedule(
+    dates=None, season_type=None, limit=500, return_as_pandas=False, return_as=None, **kwargs
+) -> pl.DataFrame:
     """espn_nba_schedule - look up the NBA schedule for a given date from ESPN
 
     Args:
@@ -15,6 +17,8 @@ def espn_nba_schedule(dates=None, season_type=None, limit=500, return_as_pandas=
         4 for all-star, 5 for off-season
         limit (int): number of records to return, default: 500.
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
 
     Returns:
         pl.DataFrame: Polars dataframe containing schedule dates for the requested season. Returns None if no games
@@ -22,14 +26,35 @@ def espn_nba_schedule(dates=None, season_type=None, limit=500, return_as_pandas=
     url = "http://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard"
     params = {"dates": dates, "seasonType": season_type, "limit": limit}
     resp = download(url=url, params=params, **kwargs)
+    return helper_nba_schedule(resp.json(), return_as_pandas=return_as_pandas, return_as=return_as)
 
+
+async def aespn_nba_schedule(
+    dates=None, season_type=None, limit=500, return_as_pandas=False, return_as=None, **kwargs
+) -> pl.DataFrame:
+    """aespn_nba_schedule - Coroutine version of `espn_nba_schedule()`, taking the same arguments.
+
+    Returns:
+        pl.DataFrame: Polars dataframe containing schedule dates for the requested season.
+
+    Example:
+        `nba_df = await sportsdataverse.nba.aespn_nba_schedule(dates=20230101)`
+    """
+    url = "http://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard"
+    params = {"dates": dates, "seasonType": season_type, "limit": limit}
+    resp = await adownload(url=url, params=params, **kwargs)
+    return await run_in_thread(
+        lambda: helper_nba_schedule(resp.json(), return_as_pandas=return_as_pandas, return_as=return_as)
+    )
+
+
+def helper_nba_schedule(events_txt, return_as_pandas=False, return_as=None):
     ev = pd.DataFrame()
-    events_txt = resp.json()
     events = events_txt.get("events")
     if events is None:
-        return pd.DataFrame() if return_as_pandas else pl.DataFrame()
+        return convert_frame(pl.DataFrame(), return_as_pandas, return_as)
     if len(events) == 0:
-        return pd.DataFrame() if return_as_pandas else pl.DataFrame()
+        return convert_frame(pl.DataFrame(), return_as_pandas, return_as)
 
     for event in events:
         event = scoreboard_event_parsing(event)
@@ -53,7 +78,7 @@ def espn_nba_schedule(dates=None, season_type=None, limit=500, return_as_pandas=
     ev = pl.from_pandas(ev)
     ev = ev.janitor.clean_names()
 
-    return ev.to_pandas() if return_as_pandas else ev
+    return convert_frame(ev, return_as_pandas, return_as)
 
 
 def scoreboard_event_parsing(event):
@@ -126,13 +151,15 @@ def __extract_home_away(event, arg1, arg2):
     return event
 
 
-def espn_nba_calendar(season=None, ondays=None, return_as_pandas=False, **kwargs) -> pl.DataFrame:
+def espn_nba_calendar(season=None, ondays=None, return_as_pandas=False, return_as=None, **kwargs) -> pl.DataFrame:
     """espn_nba_calendar - look up the NBA calendar for a given season from ESPN
 
     Args:
         season (int): Used to define different seasons. 2002 is the earliest available season.
         ondays (boolean): Used to return dates for calendar ondays
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
 
     Returns:
         pl.DataFrame: Polars dataframe containing calendar dates for the requested season.
@@ -145,32 +172,67 @@ def espn_nba_calendar(season=None, ondays=None, return_as_pandas=False, **kwargs
     else:
         url = f"http://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard?dates={season}"
         resp = download(url=url, **kwargs)
-        txt = resp.json().get("leagues")[0].get("calendar")
-        datenum = list(map(lambda x: x[:10].replace("-", ""), txt))
-        date = list(map(lambda x: x[:10], txt))
-        year = list(map(lambda x: x[:4], txt))
-        month = list(map(lambda x: x[5:7], txt))
-        day = list(map(lambda x: x[8:10], txt))
-        data = {
-            "season": season,
-            "datetime": txt,
-            "date": date,
-            "year": year,
-            "month": month,
-            "day": day,
-            "dateURL": datenum,
-        }
-        full_schedule = pl.DataFrame(data)
-        full_schedule = full_schedule.with_columns(
-            url="http://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard?dates=" + pl.col("dateURL")
-        )
-    return full_schedule.to_pandas() if return_as_pandas else full_schedule
+        full_schedule = helper_nba_calendar(season, resp.json())
+    return convert_frame(full_schedule, return_as_pandas, return_as)
+
+
+async def aespn_nba_calendar(
+    season=None, ondays=None, return_as_pandas=False, return_as=None, **kwargs
+) -> pl.DataFrame:
+    """aespn_nba_calendar - Coroutine version of `espn_nba_calendar()`, taking the same arguments.
+
+    Returns:
+        pl.DataFrame: Polars dataframe containing calendar dates for the requested season.
+
+    Example:
+        `nba_df = await sportsdataverse.nba.aespn_nba_calendar(season=2023)`
+    """
+    if ondays is not None:
+        full_schedule = await __aondays_nba_calendar(season, **kwargs)
+    else:
+        url = f"http://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard?dates={season}"
+        resp = await adownload(url=url, **kwargs)
+        full_schedule = await run_in_thread(lambda: helper_nba_calendar(season, resp.json()))
+    return convert_frame(full_schedule, return_as_pandas, return_as)
+
+
+def helper_nba_calendar(season, resp_txt):
+    txt = resp_txt.get("leagues")[0].get("calendar")
+    datenum = list(map(lambda x: x[:10].replace("-", ""), txt))
+    date = list(map(lambda x: x[:10], txt))
+    year = list(map(lambda x: x[:4], txt))
+    month = list(map(lambda x: x[5:7], txt))
+    day = list(map(lambda x: x[8:10], txt))
+    data = {
+        "season": season,
+        "datetime": txt,
+        "date": date,
+        "year": year,
+        "month": month,
+        "day": day,
+        "dateURL": datenum,
+    }
+    full_schedule = pl.DataFrame(data)
+    full_schedule = full_schedule.with_columns(
+        url="http://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard?dates=" + pl.col("dateURL")
+    )
+    return full_schedule
 
 
 def __ondays_nba_calendar(season, **kwargs):
     url = f"https://sports.core.api.espn.com/v2/sports/basketball/leagues/nba/seasons/{season}/types/2/calendar/ondays"
     resp = download(url=url, **kwargs)
-    txt = resp.json().get("eventDate").get("dates")
+    return helper_nba_ondays_calendar(resp.json())
+
+
+async def __aondays_nba_calendar(season, **kwargs):
+    url = f"https://sports.core.api.espn.com/v2/sports/basketball/leagues/nba/seasons/{season}/types/2/calendar/ondays"
+    resp = await adownload(url=url, **kwargs)
+    return await run_in_thread(lambda: helper_nba_ondays_calendar(resp.json()))
+
+
+def helper_nba_ondays_calendar(resp_txt):
+    txt = resp_txt.get("eventDate").get("dates")
     result = pl.DataFrame(txt, schema=["dates"])
     result = result.with_columns(dateURL=pl.col("dates").str.slice(0, 10))
     result = result.with_columns(
@@ -1,15 +1,19 @@
+import asyncio
+
 import pandas as pd
 import polars as pl
 
-from sportsdataverse.dl_utils import download, underscore
+from sportsdataverse.dl_utils import adownload, convert_frame, download, run_in_thread, underscore
 
 
-def espn_nfl_game_rosters(game_id: int, raw=False, return_as_pandas=False, **kwargs) -> pl.DataFrame:
+def espn_nfl_game_rosters(game_id: int, raw=False, return_as_pandas=False, return_as=None, **kwargs) -> pl.DataFrame:
     """espn_nfl_game_rosters() - Pull the game by id.
 
     Args:
         game_id (int): Unique game_id, can be obtained from espn_nfl_schedule().
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
 
     Returns:
         pl.DataFrame: Polars dataframe of game roster data with columns:
@@ -48,7 +52,48 @@ def espn_nfl_game_rosters(game_id: int, raw=False, return_as_pandas=False, **kwa
     rosters = athletes.join(teams_rosters, how="left", left_on="athlete_id", right_on="player_id")
     rosters = rosters.with_columns(game_id=pl.lit(game_id).cast(pl.Int32))
     rosters.columns = [underscore(c) for c in rosters.columns]
-    return rosters.to_pandas() if return_as_pandas else rosters
+    return convert_frame(rosters, return_as_pandas, return_as)
+
+
+async def aespn_nfl_game_rosters(
+    game_id: int, raw=False, return_as_pandas=False, return_as=None, **kwargs
+) -> pl.DataFrame:
+    """aespn_nfl_game_rosters() - Coroutine version of `espn_nfl_game_rosters()`, taking the same arguments.
+
+    The team, roster and athlete documents are requested concurrently rather than one at a time.
+
+    Returns:
+        pl.DataFrame: Polars dataframe of game roster data, as in `espn_nfl_game_rosters()`.
+
+    Example:
+        `nfl_df = await sportsdataverse.nfl.aespn_nfl_game_rosters(game_id=401220403)`
+    """
+    # summary endpoint for pickcenter array
+    summary_url = "https://sports.core.api.espn.com/v2/sports/football/leagues/nfl/events/{x}/competitions/{x}/competitors".format(
+        x=game_id
+    )
+    summary_resp = await adownload(summary_url, **kwargs)
+    items = await run_in_thread(helper_nfl_game_items, summary_resp.json())
+    teams_resps, roster_resps = await asyncio.gather(
+        asyncio.gather(*[adownload(x, **kwargs) for x in items["team_href"]]),
+        asyncio.gather(*[adownload("{x}/{t}/roster".format(x=summary_url, t=tm), **kwargs) for tm in items["team_id"]]),
+    )
+    team_rosters = await run_in_thread(
+        helper_nfl_roster_items, items=items, summary_url=summary_url, rosters=[r.json() for r in roster_resps]
+    )
+    athlete_resps = await asyncio.gather(*[adownload(x, **kwargs) for x in team_rosters["athlete_href"]])
+
+    def _assemble():
+        joined = team_rosters.join(items[["team_id", "order", "home_away", "winner"]], how="left", on="team_id")
+        teams_df = helper_nfl_team_items(items=items, teams=[r.json() for r in teams_resps])
+        teams_rosters = joined.join(teams_df, how="left", on="team_id")
+        athletes = helper_nfl_athlete_items(teams_rosters=joined, athletes=[r.json() for r in athlete_resps])
+        rosters = athletes.join(teams_rosters, how="left", left_on="athlete_id", right_on="player_id")
+        rosters = rosters.with_columns(game_id=pl.lit(game_id).cast(pl.Int32))
+        rosters.columns = [underscore(c) for c in rosters.columns]
+        return convert_frame(rosters, return_as_pandas, return_as)
+
+    return await run_in_thread(_assemble)
 
 
 def helper_nfl_game_items(summary):
@@ -63,7 +108,7 @@ def helper_nfl_game_items(summary):
     return items
 
 
-def helper_nfl_team_items(items, **kwargs):
+def helper_nfl_team_items(items, teams=None, **kwargs):
     pop_cols = [
         "$ref",
         "record",
@@ -87,8 +132,9 @@ def helper_nfl_team_items(items, **kwargs):
         "attendance",
     ]
     teams_df = pl.DataFrame()
-    for x in items["team_href"]:
-        team = download(x, **kwargs).json()
+    if teams is None:
+        teams = [download(x, **kwargs).json() for x in items["team_href"]]
+    for team in teams:
         for k in pop_cols:
             team.pop(k, None)
         team_row = pl.from_pandas(pd.json_normalize(team, sep="_"))
@@ -124,13 +170,13 @@ def helper_nfl_team_items(items, **kwargs):
     return teams_df
 
 
-def helper_nfl_roster_items(items, summary_url, **kwargs):
+def helper_nfl_roster_items(items, summary_url, rosters=None, **kwargs):
     team_ids = list(items["team_id"])
     game_rosters = pl.DataFrame()
-    for tm in team_ids:
-        team_roster_url = "{x}/{t}/roster".format(x=summary_url, t=tm)
-        team_roster_resp = download(team_roster_url, **kwargs)
-        team_roster = pl.from_pandas(pd.json_normalize(team_roster_resp.json().get("entries", []), sep="_"))
+    if rosters is None:
+        rosters = [download("{x}/{t}/roster".format(x=summary_url, t=tm), **kwargs).json() for tm in team_ids]
+    for tm, team_roster_json in zip(team_ids, rosters):
+        team_roster = pl.from_pandas(pd.json_normalize(team_roster_json.get("entries", []), sep="_"))
         team_roster.columns = [col.replace("$ref", "href") for col in team_roster.columns]
         team_roster.columns = [underscore(c) for c in team_roster.columns]
         team_roster = team_roster.with_columns(team_id=pl.lit(tm).cast(pl.Int32))
@@ -142,7 +188,7 @@ def helper_nfl_roster_items(items, summary_url, **kwargs):
     return game_rosters
 
 
-def helper_nfl_athlete_items(teams_rosters, **kwargs):
+def helper_nfl_athlete_items(teams_rosters, athletes=None, **kwargs):
     athlete_hrefs = list(teams_rosters["athlete_href"])
     game_athletes = pl.DataFrame()
     pop_cols = [
@@ -158,9 +204,9 @@ def helper_nfl_athlete_items(teams_rosters, **kwargs):
         "$ref",
         "position",
     ]
-    for athlete_href in athlete_hrefs:
-        athlete_res = download(athlete_href, **kwargs)
-        athlete_resp = athlete_res.json()
+    if athletes is None:
+        athletes = [download(athlete_href, **kwargs).json() for athlete_href in athlete_hrefs]
+    for athlete_resp in athletes:
         for k in pop_cols:
             athlete_resp.pop(k, None)
         athlete = pl.from_pandas(pd.json_normalize(athlete_resp, sep="_"))
@@ -1,9 +1,9 @@
 import tempfile
-from typing import List
+from functools import partial
+from typing import Dict, Iterator, List, Optional
 
 import polars as pl
-from pyreadr import download_file, read_r
-from tqdm import tqdm
+import requests
 
 from sportsdataverse.config import (
     NFL_BASE_URL,
@@ -31,13 +31,39 @@ from sportsdataverse.config import (
     NFL_ROSTER_URL,
     NFL_SNAP_COUNTS_URL,
     NFL_TEAM_LOGO_URL,
+    NFL_TEAM_SCHEDULE_PARQUET_URL,
     NFL_TEAM_SCHEDULE_URL,
     NFL_WEEKLY_ROSTER_URL,
 )
-from sportsdataverse.errors import season_not_found_error
-
-
-def load_nfl_pbp(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
+from sportsdataverse.dl_utils import convert_frame
+from sportsdataverse.loader_utils import (
+    FileCache,
+    cached_path,
+    compact_frame,
+    get_file_cache,
+    iter_seasons,
+    load_seasons,
+    rds_parquet_path,
+    read_parquet_url,
+    refresh_seasons,
+    scan_csv_url,
+    scan_parquet_url,
+    scan_seasons,
+)
+from sportsdataverse.nfl.nfl_schedule import most_recent_nfl_season
+from sportsdataverse.store import DataStore
+
+
+def load_nfl_pbp(
+    seasons: List[int],
+    return_as_pandas=False,
+    return_as=None,
+    max_workers=None,
+    progress=True,
+    cache_dir=None,
+    columns=None,
+    compact=False,
+) -> pl.DataFrame:
     """Load NFL play by play data going back to 1999
 
     Example:
@@ -46,6 +72,14 @@ def load_nfl_pbp(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
     Args:
         seasons (list): Used to define different seasons. 1999 is the earliest available season.
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        max_workers (int): Number of seasons downloaded at the same time, defaults to 4.
+        progress (bool or callable): If True, show a tqdm progress bar. A callable is called as
+            `progress(done, total)` after each season.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None. Without a file cache only these columns are downloaded.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
 
     Returns:
         pl.DataFrame: Polars dataframe containing the play-by-plays available for the requested seasons.
@@ -53,25 +87,119 @@ def load_nfl_pbp(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
     Raises:
         ValueError: If `season` is less than 1999.
     """
-    data = pl.DataFrame()
-    if type(seasons) is int:
-        seasons = [seasons]
-    for i in tqdm(seasons):
-        season_not_found_error(int(i), 1999)
-        i_data = pl.read_parquet(NFL_BASE_URL.format(season=i), use_pyarrow=True, columns=None)
-        data = pl.concat([data, i_data], how="vertical")
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
+    data = load_seasons(
+        NFL_BASE_URL,
+        seasons,
+        min_season=1999,
+        max_workers=max_workers,
+        progress=progress,
+        cache_dir=cache_dir,
+        columns=columns,
+        compact=compact,
+    )
+    return convert_frame(data, return_as_pandas, return_as, use_pyarrow_extension_array=True)
+
+
+def scan_nfl_pbp(seasons: List[int], max_workers=None, cache_dir=None, compact=False) -> pl.LazyFrame:
+    """Lazily scan NFL play by play data going back to 1999
+
+    Example:
+        `nfl_df = sportsdataverse.nfl.scan_nfl_pbp(seasons=range(2019,2023)).filter(pl.col("week") == 1).select(["game_id", "play_id", "epa"]).collect()`
+
+    Args:
+        seasons (list): Used to define different seasons. 1999 is the earliest available season.
+        max_workers (int): Number of season files downloaded at the same time, defaults to 4.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
+
+    Returns:
+        pl.LazyFrame: Lazy frame over the data of `load_nfl_pbp()`.
+
+    Raises:
+        ValueError: If `season` is less than 1999.
+    """
+    return scan_seasons(
+        NFL_BASE_URL, seasons, min_season=1999, max_workers=max_workers, cache_dir=cache_dir, compact=compact
+    )
+
+
+def iter_nfl_pbp(
+    seasons: List[int], return_as_pandas=False, return_as=None, by="season", prefetch=1, cache_dir=None, columns=None
+) -> Iterator[pl.DataFrame]:
+    """Iterate over NFL play by play data going back to 1999, one season at a time
+
+    Example:
+        `for df in sportsdataverse.nfl.iter_nfl_pbp(seasons=range(2019,2023)): print(df.shape)`
+
+    Args:
+        seasons (list): Used to define different seasons. 1999 is the earliest available season.
+        return_as_pandas (bool): If True, yields pandas dataframes. If False, yields polars dataframes.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        by (str): "season" yields one dataframe per season, "row_group" one per parquet row group.
+        prefetch (int): Number of seasons downloaded in the background ahead of the current one.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None.
+
+    Returns:
+        Iterator[pl.DataFrame]: One dataframe per season (or row group) of `load_nfl_pbp()`.
+
+    Raises:
+        ValueError: If `season` is less than 1999.
+    """
+    frames = iter_seasons(
+        NFL_BASE_URL, seasons, min_season=1999, by=by, prefetch=prefetch, cache_dir=cache_dir, columns=columns
+    )
+    return (convert_frame(df, return_as_pandas, return_as, use_pyarrow_extension_array=True) for df in frames)
+
+
+def refresh_nfl_pbp(store: DataStore, seasons: Optional[List[int]] = None) -> Dict[int, int]:
+    """Refresh NFL play by play data kept in a `DataStore`
+
+    Only the games missing from the store are downloaded from a changed season file.
 
+    Example:
+        `sportsdataverse.nfl.refresh_nfl_pbp(sportsdataverse.store.DataStore())`
+
+    Args:
+        store (DataStore): Store holding the copy, under `league="nfl"` and `dataset="pbp"`.
+        seasons (list): Seasons to refresh, defaults to the most recent season.
 
-def load_nfl_schedule(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
+    Returns:
+        dict: Number of rows written per season.
+    """
+    seasons = [most_recent_nfl_season()] if seasons is None else seasons
+    return refresh_seasons(NFL_BASE_URL, seasons, min_season=1999, store=store, league="nfl", dataset="pbp")
+
+
+def load_nfl_schedule(
+    seasons: List[int],
+    return_as_pandas=False,
+    return_as=None,
+    max_workers=None,
+    progress=True,
+    cache_dir=None,
+    compact=False,
+) -> pl.DataFrame:
     """Load NFL schedule data
 
+    Seasons are read from parquet when upstream publishes it. Otherwise the season's rds file is
+    converted to parquet once and kept in the file cache, see `loader_utils.read_rds_url()`. Without
+    a file cache, the rds file is read from a temporary directory removed afterwards.
+
     Example:
         `nfl_df = sportsdataverse.nfl.load_nfl_schedule(seasons=range(1999,2021))`
 
     Args:
         seasons (list): Used to define different seasons. 1999 is the earliest available season.
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        max_workers (int): Number of seasons downloaded at the same time, defaults to 4.
+        progress (bool or callable): If True, show a tqdm progress bar. A callable is called as
+            `progress(done, total)` after each season.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
 
     Returns:
         pl.DataFrame: Polars dataframe containing the schedule for the requested seasons.
@@ -79,21 +207,79 @@ def load_nfl_schedule(seasons: List[int], return_as_pandas=False) -> pl.DataFram
     Raises:
         ValueError: If `season` is less than 1999.
     """
-    data = pl.DataFrame()
-    if type(seasons) is int:
-        seasons = [seasons]
-    with tempfile.TemporaryDirectory() as tempdirname:
-        for i in tqdm(seasons):
-            season_not_found_error(int(i), 1999)
-            schedule_url = NFL_TEAM_SCHEDULE_URL.format(season=i)
-            # i_data = pd.read_parquet(NFL_TEAM_SCHEDULE_URL.format(season = i), engine='auto', columns=None)
-            i_data = read_r(download_file(schedule_url, f"{tempdirname}/nfl_sched_{i}.rds"))[None]
-            i_data = pl.DataFrame(i_data)
-            data = pl.concat([data, i_data], how="vertical")
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
-
-
-def load_nfl_player_stats(kicking=False, return_as_pandas=False) -> pl.DataFrame:
+    data = load_seasons(
+        partial(_load_nfl_schedule_season, cache_dir=cache_dir),
+        seasons,
+        min_season=1999,
+        max_workers=max_workers,
+        progress=progress,
+        compact=compact,
+    )
+    return convert_frame(data, return_as_pandas, return_as, use_pyarrow_extension_array=True)
+
+
+_MISSING_PARQUET_SCHEDULES = set()
+
+
+def _load_nfl_schedule_season(season, cache_dir=None) -> pl.DataFrame:
+    """One season of `load_nfl_schedule()`: the parquet file when upstream has it, else the converted rds file."""
+    cache = get_file_cache(cache_dir)
+    if cache is None:
+        # without a file cache both files go through a temporary one, so that a missing parquet file raises the
+        # requests.HTTPError handled below instead of the urllib error of the polars reader
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            return pl.read_parquet(_nfl_schedule_path(season, FileCache(tmp_dir)), use_pyarrow=True)
+    return pl.read_parquet(_nfl_schedule_path(season, cache), use_pyarrow=True)
+
+
+def _nfl_schedule_path(season, cache) -> str:
+    """Local parquet file of one season of the schedule in `cache`, downloaded or converted from rds."""
+    immutable = cache.is_immutable_season(season)
+    parquet_url = NFL_TEAM_SCHEDULE_PARQUET_URL.format(season=season)
+    # a 404 is remembered in the file cache, so that later processes do not ask again for a while
+    if season not in _MISSING_PARQUET_SCHEDULES and not cache.is_missing(parquet_url, immutable):
+        try:
+            return cache.fetch(parquet_url, immutable=immutable)
+        except requests.HTTPError as e:
+            if e.response is None or e.response.status_code != 404:
+                raise
+            _MISSING_PARQUET_SCHEDULES.add(season)
+            cache.mark_missing(parquet_url)
+    return rds_parquet_path(NFL_TEAM_SCHEDULE_URL.format(season=season), cache, immutable)
+
+
+def scan_nfl_schedule(seasons: List[int], max_workers=None, cache_dir=None, compact=False) -> pl.LazyFrame:
+    """Lazily scan NFL schedule data
+
+    Example:
+        `nfl_df = sportsdataverse.nfl.scan_nfl_schedule(seasons=range(2019,2023)).filter(pl.col("week") == 1).collect()`
+
+    Args:
+        seasons (list): Used to define different seasons. 1999 is the earliest available season.
+        max_workers (int): Number of seasons downloaded at the same time, defaults to 4.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
+
+    Returns:
+        pl.LazyFrame: Lazy frame over the data of `load_nfl_schedule()`, scanned from the parquet file of each
+        season, or from the parquet copy of its rds file.
+
+    Raises:
+        SeasonNotFoundError: If `season` is less than 1999.
+    """
+    return scan_seasons(
+        _nfl_schedule_path,
+        seasons,
+        min_season=1999,
+        max_workers=max_workers,
+        cache_dir=cache_dir,
+        compact=compact,
+    )
+
+
+def load_nfl_player_stats(
+    kicking=False, return_as_pandas=False, return_as=None, cache_dir=None, columns=None, compact=False
+) -> pl.DataFrame:
     """Load NFL player stats data
 
     Example:
@@ -102,24 +288,57 @@ def load_nfl_player_stats(kicking=False, return_as_pandas=False) -> pl.DataFrame
     Args:
         kicking (bool): If True, load kicking stats. If False, load all other stats.
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None. Without a file cache only these columns are downloaded.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
 
     Returns:
         pl.DataFrame: Polars dataframe containing player stats.
     """
     data = pl.DataFrame()
     if kicking is False:
-        data = pl.read_parquet(NFL_PLAYER_STATS_URL, use_pyarrow=True, columns=None)
+        data = read_parquet_url(NFL_PLAYER_STATS_URL, cache_dir=cache_dir, columns=columns)
     else:
-        data = pl.read_parquet(NFL_PLAYER_KICKING_STATS_URL, use_pyarrow=True, columns=None)
+        data = read_parquet_url(NFL_PLAYER_KICKING_STATS_URL, cache_dir=cache_dir, columns=columns)
+
+    if compact:
+        data = compact_frame(data)
+    return convert_frame(data, return_as_pandas, return_as, use_pyarrow_extension_array=True)
+
+
+def scan_nfl_player_stats(kicking=False, cache_dir=None, compact=False) -> pl.LazyFrame:
+    """Lazily scan NFL player stats data
+
+    Example:
+        `nfl_df = sportsdataverse.nfl.scan_nfl_player_stats().collect()`
+
+    Args:
+        kicking (bool): If True, scan kicking stats. If False, scan all other stats.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
 
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
+    Returns:
+        pl.LazyFrame: Lazy frame over the data of `load_nfl_player_stats()`.
+    """
+    return scan_parquet_url(
+        NFL_PLAYER_KICKING_STATS_URL if kicking else NFL_PLAYER_STATS_URL, cache_dir=cache_dir, compact=compact
+    )
 
 
-def load_nfl_ngs_passing(return_as_pandas=False) -> pl.DataFrame:
+def load_nfl_ngs_passing(
+    return_as_pandas=False, return_as=None, cache_dir=None, columns=None, compact=False
+) -> pl.DataFrame:
     """Load NFL NextGen Stats Passing data going back to 2016
 
     Args:
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None. Without a file cache only these columns are downloaded.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
 
     Example:
         `nfl_df = sportsdataverse.nfl.load_nfl_ngs_passing()`
@@ -128,20 +347,40 @@ def load_nfl_ngs_passing(return_as_pandas=False) -> pl.DataFrame:
         pl.DataFrame: Polars dataframe containing the NextGen Stats Passing data available.
 
     """
-    return (
-        pl.read_parquet(NFL_NGS_PASSING_URL, use_pyarrow=True, columns=None).to_pandas(
-            use_pyarrow_extension_array=True
-        )
-        if return_as_pandas
-        else pl.read_parquet(NFL_NGS_PASSING_URL, use_pyarrow=True, columns=None)
-    )
+    data = read_parquet_url(NFL_NGS_PASSING_URL, cache_dir=cache_dir, columns=columns)
+    if compact:
+        data = compact_frame(data)
+    return convert_frame(data, return_as_pandas, return_as, use_pyarrow_extension_array=True)
+
+
+def scan_nfl_ngs_passing(cache_dir=None, compact=False) -> pl.LazyFrame:
+    """Lazily scan NFL NextGen Stats Passing data going back to 2016
+
+    Example:
+        `nfl_df = sportsdataverse.nfl.scan_nfl_ngs_passing().collect()`
 
+    Args:
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
+
+    Returns:
+        pl.LazyFrame: Lazy frame over the data of `load_nfl_ngs_passing()`.
+    """
+    return scan_parquet_url(NFL_NGS_PASSING_URL, cache_dir=cache_dir, compact=compact)
 
-def load_nfl_ngs_rushing(return_as_pandas=False) -> pl.DataFrame:
+
+def load_nfl_ngs_rushing(
+    return_as_pandas=False, return_as=None, cache_dir=None, columns=None, compact=False
+) -> pl.DataFrame:
     """Load NFL NextGen Stats Rushing data going back to 2016
 
     Args:
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None. Without a file cache only these columns are downloaded.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
 
     Example:
         `nfl_df = sportsdataverse.nfl.load_nfl_ngs_rushing()`
@@ -150,20 +389,40 @@ def load_nfl_ngs_rushing(return_as_pandas=False) -> pl.DataFrame:
         pl.DataFrame: Polars dataframe containing the NextGen Stats Rushing data available.
 
     """
-    return (
-        pl.read_parquet(NFL_NGS_RUSHING_URL, use_pyarrow=True, columns=None).to_pandas(
-            use_pyarrow_extension_array=True
-        )
-        if return_as_pandas
-        else pl.read_parquet(NFL_NGS_RUSHING_URL, use_pyarrow=True, columns=None)
-    )
+    data = read_parquet_url(NFL_NGS_RUSHING_URL, cache_dir=cache_dir, columns=columns)
+    if compact:
+        data = compact_frame(data)
+    return convert_frame(data, return_as_pandas, return_as, use_pyarrow_extension_array=True)
+
+
+def scan_nfl_ngs_rushing(cache_dir=None, compact=False) -> pl.LazyFrame:
+    """Lazily scan NFL NextGen Stats Rushing data going back to 2016
 
+    Example:
+        `nfl_df = sportsdataverse.nfl.scan_nfl_ngs_rushing().collect()`
+
+    Args:
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
+
+    Returns:
+        pl.LazyFrame: Lazy frame over the data of `load_nfl_ngs_rushing()`.
+    """
+    return scan_parquet_url(NFL_NGS_RUSHING_URL, cache_dir=cache_dir, compact=compact)
 
-def load_nfl_ngs_receiving(return_as_pandas=False) -> pl.DataFrame:
+
+def load_nfl_ngs_receiving(
+    return_as_pandas=False, return_as=None, cache_dir=None, columns=None, compact=False
+) -> pl.DataFrame:
     """Load NFL NextGen Stats Receiving data going back to 2016
 
     Args:
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None. Without a file cache only these columns are downloaded.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
 
     Example:
         `nfl_df = sportsdataverse.nfl.load_nfl_ngs_receiving()`
@@ -172,20 +431,40 @@ def load_nfl_ngs_receiving(return_as_pandas=False) -> pl.DataFrame:
         pl.DataFrame: Polars dataframe containing the NextGen Stats Receiving data available.
 
     """
-    return (
-        pl.read_parquet(NFL_NGS_RECEIVING_URL, use_pyarrow=True, columns=None).to_pandas(
-            use_pyarrow_extension_array=True
-        )
-        if return_as_pandas
-        else pl.read_parquet(NFL_NGS_RECEIVING_URL, use_pyarrow=True, columns=None)
-    )
+    data = read_parquet_url(NFL_NGS_RECEIVING_URL, cache_dir=cache_dir, columns=columns)
+    if compact:
+        data = compact_frame(data)
+    return convert_frame(data, return_as_pandas, return_as, use_pyarrow_extension_array=True)
 
 
-def load_nfl_pfr_pass(return_as_pandas=False) -> pl.DataFrame:
+def scan_nfl_ngs_receiving(cache_dir=None, compact=False) -> pl.LazyFrame:
+    """Lazily scan NFL NextGen Stats Receiving data going back to 2016
+
+    Example:
+        `nfl_df = sportsdataverse.nfl.scan_nfl_ngs_receiving().collect()`
+
+    Args:
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
+
+    Returns:
+        pl.LazyFrame: Lazy frame over the data of `load_nfl_ngs_receiving()`.
+    """
+    return scan_parquet_url(NFL_NGS_RECEIVING_URL, cache_dir=cache_dir, compact=compact)
+
+
+def load_nfl_pfr_pass(
+    return_as_pandas=False, return_as=None, cache_dir=None, columns=None, compact=False
+) -> pl.DataFrame:
     """Load NFL Pro-Football Reference Advanced Passing data going back to 2018
 
     Args:
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None. Without a file cache only these columns are downloaded.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
 
     Example:
         `nfl_df = sportsdataverse.nfl.load_nfl_pfr_pass()`
@@ -195,426 +474,1494 @@ def load_nfl_pfr_pass(return_as_pandas=False) -> pl.DataFrame:
             advanced passing stats data available.
 
     """
-    return (
-        pl.read_parquet(NFL_PFR_SEASON_PASS_URL, use_pyarrow=True, columns=None).to_pandas(
-            use_pyarrow_extension_array=True
-        )
-        if return_as_pandas
-        else pl.read_parquet(NFL_PFR_SEASON_PASS_URL, use_pyarrow=True, columns=None)
-    )
+    data = read_parquet_url(NFL_PFR_SEASON_PASS_URL, cache_dir=cache_dir, columns=columns)
+    if compact:
+        data = compact_frame(data)
+    return convert_frame(data, return_as_pandas, return_as, use_pyarrow_extension_array=True)
 
 
-def load_nfl_pfr_weekly_pass(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
-    """Load NFL Pro-Football Reference Weekly Advanced Passing data going back to 2018
+def scan_nfl_pfr_pass(cache_dir=None, compact=False) -> pl.LazyFrame:
+    """Lazily scan NFL Pro-Football Reference Advanced Passing data going back to 2018
 
     Example:
-        `nfl_df = sportsdataverse.nfl.load_nfl_pfr_weekly_pass(seasons=range(2018,2021))`
+        `nfl_df = sportsdataverse.nfl.scan_nfl_pfr_pass().collect()`
 
     Args:
-        seasons (list): Used to define different seasons. 2018 is the earliest available season.
-        return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
 
     Returns:
-        pl.DataFrame: Polars dataframe containing Pro-Football Reference
-            advanced passing stats data available for the requested seasons.
-
+        pl.LazyFrame: Lazy frame over the data of `load_nfl_pfr_pass()`.
     """
-    data = pl.DataFrame()
-    if type(seasons) is int:
-        seasons = [seasons]
-    for i in tqdm(seasons):
-        season_not_found_error(int(i), 2018)
-        i_data = pl.read_parquet(NFL_PFR_WEEK_PASS_URL.format(season=i), use_pyarrow=True, columns=None)
-        data = pl.concat([data, i_data], how="vertical")
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
-
+    return scan_parquet_url(NFL_PFR_SEASON_PASS_URL, cache_dir=cache_dir, compact=compact)
+
+
+def load_nfl_pfr_weekly_pass(
+    seasons: List[int],
+    return_as_pandas=False,
+    return_as=None,
+    max_workers=None,
+    progress=True,
+    cache_dir=None,
+    columns=None,
+    compact=False,
+) -> pl.DataFrame:
+    """Load NFL Pro-Football Reference Weekly Advanced Passing data going back to 2018
 
-def load_nfl_pfr_rush(return_as_pandas=False) -> pl.DataFrame:
-    """Load NFL Pro-Football Reference Advanced Rushing data going back to 2018
+    Example:
+        `nfl_df = sportsdataverse.nfl.load_nfl_pfr_weekly_pass(seasons=range(2018,2021))`
 
     Args:
+        seasons (list): Used to define different seasons. 2018 is the earliest available season.
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
-
-    Example:
-        `nfl_df = sportsdataverse.nfl.load_nfl_pfr_rush()`
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        max_workers (int): Number of seasons downloaded at the same time, defaults to 4.
+        progress (bool or callable): If True, show a tqdm progress bar. A callable is called as
+            `progress(done, total)` after each season.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None. Without a file cache only these columns are downloaded.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
 
     Returns:
         pl.DataFrame: Polars dataframe containing Pro-Football Reference
-            advanced rushing stats data available.
+            advanced passing stats data available for the requested seasons.
 
     """
-    return (
-        pl.read_parquet(NFL_PFR_SEASON_RUSH_URL, use_pyarrow=True, columns=None).to_pandas(
-            use_pyarrow_extension_array=True
-        )
-        if return_as_pandas
-        else pl.read_parquet(NFL_PFR_SEASON_RUSH_URL, use_pyarrow=True, columns=None)
+    data = load_seasons(
+        NFL_PFR_WEEK_PASS_URL,
+        seasons,
+        min_season=2018,
+        max_workers=max_workers,
+        progress=progress,
+        cache_dir=cache_dir,
+        columns=columns,
+        compact=compact,
     )
+    return convert_frame(data, return_as_pandas, return_as, use_pyarrow_extension_array=True)
 
 
-def load_nfl_pfr_weekly_rush(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
-    """Load NFL Pro-Football Reference Weekly Advanced Rushing data going back to 2018
+def scan_nfl_pfr_weekly_pass(seasons: List[int], max_workers=None, cache_dir=None, compact=False) -> pl.LazyFrame:
+    """Lazily scan NFL Pro-Football Reference Weekly Advanced Passing data going back to 2018
 
     Example:
-        `nfl_df = sportsdataverse.nfl.load_nfl_pfr_weekly_rush(seasons=range(2018,2021))`
+        `nfl_df = sportsdataverse.nfl.scan_nfl_pfr_weekly_pass(seasons=range(2018,2021)).collect()`
 
     Args:
         seasons (list): Used to define different seasons. 2018 is the earliest available season.
-        return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        max_workers (int): Number of season files downloaded at the same time, defaults to 4.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
 
     Returns:
-        pl.DataFrame: Polars dataframe containing Pro-Football Reference
-            advanced rushing stats data available for the requested seasons.
-
+        pl.LazyFrame: Lazy frame over the data of `load_nfl_pfr_weekly_pass()`.
     """
-    data = pl.DataFrame()
-    if type(seasons) is int:
-        seasons = [seasons]
-    for i in tqdm(seasons):
-        season_not_found_error(int(i), 2018)
-        i_data = pl.read_parquet(NFL_PFR_WEEK_RUSH_URL.format(season=i), use_pyarrow=True, columns=None)
-        data = pl.concat([data, i_data], how="vertical")
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
-
+    return scan_seasons(
+        NFL_PFR_WEEK_PASS_URL, seasons, min_season=2018, max_workers=max_workers, cache_dir=cache_dir, compact=compact
+    )
 
-def load_nfl_pfr_rec(return_as_pandas=False) -> pl.DataFrame:
-    """Load NFL Pro-Football Reference Advanced Receiving data going back to 2018
 
-    Args:
-        return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+def iter_nfl_pfr_weekly_pass(
+    seasons: List[int], return_as_pandas=False, return_as=None, by="season", prefetch=1, cache_dir=None, columns=None
+) -> Iterator[pl.DataFrame]:
+    """Iterate over NFL Pro-Football Reference Weekly Advanced Passing data going back to 2018, one season at a time
 
     Example:
-        `nfl_df = sportsdataverse.nfl.load_nfl_pfr_rec()`
+        `for df in sportsdataverse.nfl.iter_nfl_pfr_weekly_pass(seasons=range(2018,2021)): print(df.shape)`
 
-    Returns:
-        pl.DataFrame: Polars dataframe containing Pro-Football Reference
-            advanced receiving stats data available.
+    Args:
+        seasons (list): Used to define different seasons. 2018 is the earliest available season.
+        return_as_pandas (bool): If True, yields pandas dataframes. If False, yields polars dataframes.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        by (str): "season" yields one dataframe per season, "row_group" one per parquet row group.
+        prefetch (int): Number of seasons downloaded in the background ahead of the current one.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None.
 
+    Returns:
+        Iterator[pl.DataFrame]: One dataframe per season (or row group) of `load_nfl_pfr_weekly_pass()`.
     """
-    return (
-        pl.read_parquet(NFL_PFR_SEASON_REC_URL, use_pyarrow=True, columns=None).to_pandas(
-            use_pyarrow_extension_array=True
-        )
-        if return_as_pandas
-        else pl.read_parquet(NFL_PFR_SEASON_REC_URL, use_pyarrow=True, columns=None)
+    frames = iter_seasons(
+        NFL_PFR_WEEK_PASS_URL, seasons, min_season=2018, by=by, prefetch=prefetch, cache_dir=cache_dir, columns=columns
     )
+    return (convert_frame(df, return_as_pandas, return_as, use_pyarrow_extension_array=True) for df in frames)
 
 
-def load_nfl_pfr_weekly_rec(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
-    """Load NFL Pro-Football Reference Weekly Advanced Receiving data going back to 2018
+def refresh_nfl_pfr_weekly_pass(store: DataStore, seasons: Optional[List[int]] = None) -> Dict[int, int]:
+    """Refresh NFL Pro-Football Reference Weekly Advanced Passing data kept in a `DataStore`
+
+    Changed season files are re-downloaded as a whole, since their rows are updated in place.
 
     Example:
-        `nfl_df = sportsdataverse.nfl.load_nfl_pfr_weekly_rec(seasons=range(2018,2021))`
+        `sportsdataverse.nfl.refresh_nfl_pfr_weekly_pass(sportsdataverse.store.DataStore())`
 
     Args:
-        seasons (list): Used to define different seasons. 2018 is the earliest available season.
-        return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        store (DataStore): Store holding the copy, under `league="nfl"` and `dataset="pfr_weekly_pass"`.
+        seasons (list): Seasons to refresh, defaults to the most recent season.
 
     Returns:
-        pl.DataFrame: Polars dataframe containing Pro-Football Reference
-            advanced receiving stats data available for the requested seasons.
-
+        dict: Number of rows written per season.
     """
-    data = pl.DataFrame()
-    if type(seasons) is int:
-        seasons = [seasons]
-    for i in tqdm(seasons):
-        season_not_found_error(int(i), 2018)
-        i_data = pl.read_parquet(NFL_PFR_WEEK_REC_URL.format(season=i), use_pyarrow=True, columns=None)
-        data = pl.concat([data, i_data], how="vertical")
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
+    seasons = [most_recent_nfl_season()] if seasons is None else seasons
+    return refresh_seasons(
+        NFL_PFR_WEEK_PASS_URL, seasons, min_season=2018, store=store, league="nfl", dataset="pfr_weekly_pass", key=None
+    )
 
 
-def load_nfl_pfr_def(return_as_pandas=False) -> pl.DataFrame:
-    """Load NFL Pro-Football Reference Advanced Defensive data going back to 2018
+def load_nfl_pfr_rush(
+    return_as_pandas=False, return_as=None, cache_dir=None, columns=None, compact=False
+) -> pl.DataFrame:
+    """Load NFL Pro-Football Reference Advanced Rushing data going back to 2018
 
     Args:
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None. Without a file cache only these columns are downloaded.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
 
     Example:
-        `nfl_df = sportsdataverse.nfl.load_nfl_pfr_def()`
+        `nfl_df = sportsdataverse.nfl.load_nfl_pfr_rush()`
 
     Returns:
         pl.DataFrame: Polars dataframe containing Pro-Football Reference
-            advanced defensive stats data available.
+            advanced rushing stats data available.
 
     """
-    return (
-        pl.read_parquet(NFL_PFR_SEASON_DEF_URL, use_pyarrow=True, columns=None).to_pandas(
-            use_pyarrow_extension_array=True
-        )
-        if return_as_pandas
-        else pl.read_parquet(NFL_PFR_SEASON_DEF_URL, use_pyarrow=True, columns=None)
-    )
+    data = read_parquet_url(NFL_PFR_SEASON_RUSH_URL, cache_dir=cache_dir, columns=columns)
+    if compact:
+        data = compact_frame(data)
+    return convert_frame(data, return_as_pandas, return_as, use_pyarrow_extension_array=True)
 
 
-def load_nfl_pfr_weekly_def(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
-    """Load NFL Pro-Football Reference Weekly Advanced Defensive data going back to 2018
+def scan_nfl_pfr_rush(cache_dir=None, compact=False) -> pl.LazyFrame:
+    """Lazily scan NFL Pro-Football Reference Advanced Rushing data going back to 2018
 
     Example:
-        `nfl_df = sportsdataverse.nfl.load_nfl_pfr_weekly_def(seasons=range(2018,2021))`
+        `nfl_df = sportsdataverse.nfl.scan_nfl_pfr_rush().collect()`
 
     Args:
-        seasons (list): Used to define different seasons. 2018 is the earliest available season.
-        return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
 
     Returns:
-        pl.DataFrame: Polars dataframe containing Pro-Football Reference
-            advanced defensive stats data available for the requested seasons.
-
+        pl.LazyFrame: Lazy frame over the data of `load_nfl_pfr_rush()`.
     """
-    data = pl.DataFrame()
-    if type(seasons) is int:
-        seasons = [seasons]
-    for i in tqdm(seasons):
-        season_not_found_error(int(i), 2018)
-        i_data = pl.read_parquet(NFL_PFR_WEEK_DEF_URL.format(season=i), use_pyarrow=True, columns=None)
-        data = pl.concat([data, i_data], how="vertical")
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
-
-
-def load_nfl_rosters(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
-    """Load NFL roster data for all seasons
+    return scan_parquet_url(NFL_PFR_SEASON_RUSH_URL, cache_dir=cache_dir, compact=compact)
+
+
+def load_nfl_pfr_weekly_rush(
+    seasons: List[int],
+    return_as_pandas=False,
+    return_as=None,
+    max_workers=None,
+    progress=True,
+    cache_dir=None,
+    columns=None,
+    compact=False,
+) -> pl.DataFrame:
+    """Load NFL Pro-Football Reference Weekly Advanced Rushing data going back to 2018
 
     Example:
-        `nfl_df = sportsdataverse.nfl.load_nfl_rosters(seasons=range(1999,2021))`
+        `nfl_df = sportsdataverse.nfl.load_nfl_pfr_weekly_rush(seasons=range(2018,2021))`
 
     Args:
-        seasons (list): Used to define different seasons. 1920 is the earliest available season.
+        seasons (list): Used to define different seasons. 2018 is the earliest available season.
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        max_workers (int): Number of seasons downloaded at the same time, defaults to 4.
+        progress (bool or callable): If True, show a tqdm progress bar. A callable is called as
+            `progress(done, total)` after each season.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None. Without a file cache only these columns are downloaded.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
 
     Returns:
-        pl.DataFrame: Polars dataframe containing rosters available for the requested seasons.
+        pl.DataFrame: Polars dataframe containing Pro-Football Reference
+            advanced rushing stats data available for the requested seasons.
 
     """
-    data = pl.DataFrame()
-    if type(seasons) is int:
-        seasons = [seasons]
-    for i in tqdm(seasons):
-        season_not_found_error(int(i), 1920)
-        i_data = pl.read_parquet(NFL_ROSTER_URL.format(season=i), use_pyarrow=True, columns=None)
-        data = pl.concat([data, i_data], how="vertical")
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
+    data = load_seasons(
+        NFL_PFR_WEEK_RUSH_URL,
+        seasons,
+        min_season=2018,
+        max_workers=max_workers,
+        progress=progress,
+        cache_dir=cache_dir,
+        columns=columns,
+        compact=compact,
+    )
+    return convert_frame(data, return_as_pandas, return_as, use_pyarrow_extension_array=True)
 
 
-def load_nfl_weekly_rosters(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
-    """Load NFL weekly roster data for selected seasons
+def scan_nfl_pfr_weekly_rush(seasons: List[int], max_workers=None, cache_dir=None, compact=False) -> pl.LazyFrame:
+    """Lazily scan NFL Pro-Football Reference Weekly Advanced Rushing data going back to 2018
 
     Example:
-        `nfl_df = sportsdataverse.nfl.load_nfl_weekly_rosters(seasons=range(2002,2021))`
+        `nfl_df = sportsdataverse.nfl.scan_nfl_pfr_weekly_rush(seasons=range(2018,2021)).collect()`
 
     Args:
-        seasons (list): Used to define different seasons. 2002 is the earliest available season.
-        return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        seasons (list): Used to define different seasons. 2018 is the earliest available season.
+        max_workers (int): Number of season files downloaded at the same time, defaults to 4.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
 
     Returns:
-        pl.DataFrame: Polars dataframe containing weekly rosters available for the requested seasons.
-
+        pl.LazyFrame: Lazy frame over the data of `load_nfl_pfr_weekly_rush()`.
     """
-    data = pl.DataFrame()
-    if type(seasons) is int:
-        seasons = [seasons]
-    for i in tqdm(seasons):
-        season_not_found_error(int(i), 2002)
-        i_data = pl.read_parquet(NFL_WEEKLY_ROSTER_URL.format(season=i), use_pyarrow=True, columns=None)
-        data = pl.concat([data, i_data], how="vertical")
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
+    return scan_seasons(
+        NFL_PFR_WEEK_RUSH_URL, seasons, min_season=2018, max_workers=max_workers, cache_dir=cache_dir, compact=compact
+    )
 
 
-def load_nfl_teams(return_as_pandas=False) -> pl.DataFrame:
-    """Load NFL team ID information and logos
+def iter_nfl_pfr_weekly_rush(
+    seasons: List[int], return_as_pandas=False, return_as=None, by="season", prefetch=1, cache_dir=None, columns=None
+) -> Iterator[pl.DataFrame]:
+    """Iterate over NFL Pro-Football Reference Weekly Advanced Rushing data going back to 2018, one season at a time
 
     Example:
-        `nfl_df = sportsdataverse.nfl.load_nfl_teams()`
+        `for df in sportsdataverse.nfl.iter_nfl_pfr_weekly_rush(seasons=range(2018,2021)): print(df.shape)`
 
     Args:
-        return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        seasons (list): Used to define different seasons. 2018 is the earliest available season.
+        return_as_pandas (bool): If True, yields pandas dataframes. If False, yields polars dataframes.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        by (str): "season" yields one dataframe per season, "row_group" one per parquet row group.
+        prefetch (int): Number of seasons downloaded in the background ahead of the current one.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None.
 
     Returns:
-        pl.DataFrame: Polars dataframe containing teams available.
+        Iterator[pl.DataFrame]: One dataframe per season (or row group) of `load_nfl_pfr_weekly_rush()`.
     """
-    return (
-        pl.read_csv(NFL_TEAM_LOGO_URL).to_pandas(use_pyarrow_extension_array=True)
-        if return_as_pandas
-        else pl.read_csv(NFL_TEAM_LOGO_URL)
+    frames = iter_seasons(
+        NFL_PFR_WEEK_RUSH_URL, seasons, min_season=2018, by=by, prefetch=prefetch, cache_dir=cache_dir, columns=columns
     )
+    return (convert_frame(df, return_as_pandas, return_as, use_pyarrow_extension_array=True) for df in frames)
 
 
-def load_nfl_players(return_as_pandas=False) -> pl.DataFrame:
-    """Load NFL Player ID information
+def refresh_nfl_pfr_weekly_rush(store: DataStore, seasons: Optional[List[int]] = None) -> Dict[int, int]:
+    """Refresh NFL Pro-Football Reference Weekly Advanced Rushing data kept in a `DataStore`
+
+    Changed season files are re-downloaded as a whole, since their rows are updated in place.
 
     Example:
-        `nfl_df = sportsdataverse.nfl.load_nfl_players()`
+        `sportsdataverse.nfl.refresh_nfl_pfr_weekly_rush(sportsdataverse.store.DataStore())`
 
     Args:
-        return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        store (DataStore): Store holding the copy, under `league="nfl"` and `dataset="pfr_weekly_rush"`.
+        seasons (list): Seasons to refresh, defaults to the most recent season.
 
     Returns:
-        pl.DataFrame: Polars dataframe containing players available.
+        dict: Number of rows written per season.
     """
-    return (
-        pl.read_parquet(NFL_PLAYER_URL, use_pyarrow=True, columns=None).to_pandas(use_pyarrow_extension_array=True)
-        if return_as_pandas
-        else pl.read_parquet(NFL_OFFICIALS_URL, use_pyarrow=True, columns=None)
+    seasons = [most_recent_nfl_season()] if seasons is None else seasons
+    return refresh_seasons(
+        NFL_PFR_WEEK_RUSH_URL, seasons, min_season=2018, store=store, league="nfl", dataset="pfr_weekly_rush", key=None
     )
 
 
-def load_nfl_snap_counts(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
-    """Load NFL snap counts data for selected seasons
-
-    Example:
-        `nfl_df = sportsdataverse.nfl.load_nfl_snap_counts(seasons=range(2012,2021))`
+def load_nfl_pfr_rec(
+    return_as_pandas=False, return_as=None, cache_dir=None, columns=None, compact=False
+) -> pl.DataFrame:
+    """Load NFL Pro-Football Reference Advanced Receiving data going back to 2018
 
     Args:
-        seasons (list): Used to define different seasons. 2012 is the earliest available season.
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None. Without a file cache only these columns are downloaded.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
+
+    Example:
+        `nfl_df = sportsdataverse.nfl.load_nfl_pfr_rec()`
 
     Returns:
-        pl.DataFrame: Polars dataframe containing snap counts available for the requested seasons.
+        pl.DataFrame: Polars dataframe containing Pro-Football Reference
+            advanced receiving stats data available.
 
     """
-    data = pl.DataFrame()
-    if type(seasons) is int:
-        seasons = [seasons]
-    for i in tqdm(seasons):
-        season_not_found_error(int(i), 2012)
-        i_data = pl.read_parquet(NFL_SNAP_COUNTS_URL.format(season=i), use_pyarrow=True, columns=None)
-        data = pl.concat([data, i_data], how="vertical")
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
+    data = read_parquet_url(NFL_PFR_SEASON_REC_URL, cache_dir=cache_dir, columns=columns)
+    if compact:
+        data = compact_frame(data)
+    return convert_frame(data, return_as_pandas, return_as, use_pyarrow_extension_array=True)
 
 
-def load_nfl_pbp_participation(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
-    """Load NFL play-by-play participation data for selected seasons
+def scan_nfl_pfr_rec(cache_dir=None, compact=False) -> pl.LazyFrame:
+    """Lazily scan NFL Pro-Football Reference Advanced Receiving data going back to 2018
 
     Example:
-        `nfl_df = sportsdataverse.nfl.load_nfl_pbp_participation(seasons=range(2016,2021))`
+        `nfl_df = sportsdataverse.nfl.scan_nfl_pfr_rec().collect()`
 
     Args:
-        seasons (list): Used to define different seasons. 2016 is the earliest available season.
-        return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
 
     Returns:
-        pl.DataFrame: Polars dataframe containing play-by-play participation data available for the requested seasons.
-
+        pl.LazyFrame: Lazy frame over the data of `load_nfl_pfr_rec()`.
     """
-    data = pl.DataFrame()
-    if type(seasons) is int:
-        seasons = [seasons]
-    for i in tqdm(seasons):
-        season_not_found_error(int(i), 2016)
-        i_data = pl.read_parquet(NFL_PBP_PARTICIPATION_URL.format(season=i), use_pyarrow=True, columns=None)
-        data = pl.concat([data, i_data], how="vertical")
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
-
-
-def load_nfl_injuries(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
-    """Load NFL injuries data for selected seasons
+    return scan_parquet_url(NFL_PFR_SEASON_REC_URL, cache_dir=cache_dir, compact=compact)
+
+
+def load_nfl_pfr_weekly_rec(
+    seasons: List[int],
+    return_as_pandas=False,
+    return_as=None,
+    max_workers=None,
+    progress=True,
+    cache_dir=None,
+    columns=None,
+    compact=False,
+) -> pl.DataFrame:
+    """Load NFL Pro-Football Reference Weekly Advanced Receiving data going back to 2018
 
     Example:
-        `nfl_df = sportsdataverse.nfl.load_nfl_injuries(seasons=range(2009,2021))`
+        `nfl_df = sportsdataverse.nfl.load_nfl_pfr_weekly_rec(seasons=range(2018,2021))`
 
     Args:
-        seasons (list): Used to define different seasons. 2009 is the earliest available season.
+        seasons (list): Used to define different seasons. 2018 is the earliest available season.
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        max_workers (int): Number of seasons downloaded at the same time, defaults to 4.
+        progress (bool or callable): If True, show a tqdm progress bar. A callable is called as
+            `progress(done, total)` after each season.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None. Without a file cache only these columns are downloaded.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
 
     Returns:
-        pl.DataFrame: Polars dataframe containing injuries data available for the requested seasons.
+        pl.DataFrame: Polars dataframe containing Pro-Football Reference
+            advanced receiving stats data available for the requested seasons.
 
     """
-    data = pl.DataFrame()
-    if type(seasons) is int:
-        seasons = [seasons]
-    for i in tqdm(seasons):
-        season_not_found_error(int(i), 2009)
-        i_data = pl.read_parquet(NFL_INJURIES_URL.format(season=i), use_pyarrow=True, columns=None)
-        data = pl.concat([data, i_data], how="vertical")
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
+    data = load_seasons(
+        NFL_PFR_WEEK_REC_URL,
+        seasons,
+        min_season=2018,
+        max_workers=max_workers,
+        progress=progress,
+        cache_dir=cache_dir,
+        columns=columns,
+        compact=compact,
+    )
+    return convert_frame(data, return_as_pandas, return_as, use_pyarrow_extension_array=True)
 
 
-def load_nfl_depth_charts(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
-    """Load NFL Depth Chart data for selected seasons
+def scan_nfl_pfr_weekly_rec(seasons: List[int], max_workers=None, cache_dir=None, compact=False) -> pl.LazyFrame:
+    """Lazily scan NFL Pro-Football Reference Weekly Advanced Receiving data going back to 2018
 
     Example:
-        `nfl_df = sportsdataverse.nfl.load_nfl_depth_charts(seasons=range(2001,2021))`
+        `nfl_df = sportsdataverse.nfl.scan_nfl_pfr_weekly_rec(seasons=range(2018,2021)).collect()`
 
     Args:
-        seasons (list): Used to define different seasons. 2001 is the earliest available season.
-        return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        seasons (list): Used to define different seasons. 2018 is the earliest available season.
+        max_workers (int): Number of season files downloaded at the same time, defaults to 4.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
 
     Returns:
-        pl.DataFrame: Polars dataframe containing depth chart data available for the requested seasons.
-
+        pl.LazyFrame: Lazy frame over the data of `load_nfl_pfr_weekly_rec()`.
     """
-    data = pl.DataFrame()
-    if type(seasons) is int:
-        seasons = [seasons]
-    for i in tqdm(seasons):
-        season_not_found_error(int(i), 2001)
-        i_data = pl.read_parquet(NFL_DEPTH_CHARTS_URL.format(season=i), use_pyarrow=True, columns=None)
-        data = pl.concat([data, i_data], how="vertical")
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
+    return scan_seasons(
+        NFL_PFR_WEEK_REC_URL, seasons, min_season=2018, max_workers=max_workers, cache_dir=cache_dir, compact=compact
+    )
 
 
-def load_nfl_contracts(return_as_pandas=False) -> pl.DataFrame:
-    """Load NFL Historical contracts information
+def iter_nfl_pfr_weekly_rec(
+    seasons: List[int], return_as_pandas=False, return_as=None, by="season", prefetch=1, cache_dir=None, columns=None
+) -> Iterator[pl.DataFrame]:
+    """Iterate over NFL Pro-Football Reference Weekly Advanced Receiving data going back to 2018, one season at a time
 
     Example:
-        `nfl_df = sportsdataverse.nfl.load_nfl_contracts()`
+        `for df in sportsdataverse.nfl.iter_nfl_pfr_weekly_rec(seasons=range(2018,2021)): print(df.shape)`
 
     Args:
-        return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        seasons (list): Used to define different seasons. 2018 is the earliest available season.
+        return_as_pandas (bool): If True, yields pandas dataframes. If False, yields polars dataframes.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        by (str): "season" yields one dataframe per season, "row_group" one per parquet row group.
+        prefetch (int): Number of seasons downloaded in the background ahead of the current one.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None.
 
     Returns:
-        pl.DataFrame: Polars dataframe containing historical contracts available.
+        Iterator[pl.DataFrame]: One dataframe per season (or row group) of `load_nfl_pfr_weekly_rec()`.
     """
-    return (
-        pl.read_parquet(NFL_CONTRACTS_URL, use_pyarrow=True, columns=None).to_pandas(use_pyarrow_extension_array=True)
-        if return_as_pandas
-        else pl.read_parquet(NFL_CONTRACTS_URL, use_pyarrow=True, columns=None)
+    frames = iter_seasons(
+        NFL_PFR_WEEK_REC_URL, seasons, min_season=2018, by=by, prefetch=prefetch, cache_dir=cache_dir, columns=columns
     )
+    return (convert_frame(df, return_as_pandas, return_as, use_pyarrow_extension_array=True) for df in frames)
 
 
-def load_nfl_combine(return_as_pandas=False) -> pl.DataFrame:
-    """Load NFL Combine information
+def refresh_nfl_pfr_weekly_rec(store: DataStore, seasons: Optional[List[int]] = None) -> Dict[int, int]:
+    """Refresh NFL Pro-Football Reference Weekly Advanced Receiving data kept in a `DataStore`
+
+    Changed season files are re-downloaded as a whole, since their rows are updated in place.
 
     Example:
-        `nfl_df = sportsdataverse.nfl.load_nfl_combine()`
+        `sportsdataverse.nfl.refresh_nfl_pfr_weekly_rec(sportsdataverse.store.DataStore())`
 
     Args:
-        return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        store (DataStore): Store holding the copy, under `league="nfl"` and `dataset="pfr_weekly_rec"`.
+        seasons (list): Seasons to refresh, defaults to the most recent season.
 
     Returns:
-        pl.DataFrame: Polars dataframe containing NFL combine data available.
+        dict: Number of rows written per season.
     """
-    return (
-        pl.read_parquet(NFL_COMBINE_URL, use_pyarrow=True, columns=None).to_pandas(use_pyarrow_extension_array=True)
-        if return_as_pandas
-        else pl.read_parquet(NFL_COMBINE_URL, use_pyarrow=True, columns=None)
+    seasons = [most_recent_nfl_season()] if seasons is None else seasons
+    return refresh_seasons(
+        NFL_PFR_WEEK_REC_URL, seasons, min_season=2018, store=store, league="nfl", dataset="pfr_weekly_rec", key=None
     )
 
 
-def load_nfl_draft_picks(return_as_pandas=False) -> pl.DataFrame:
-    """Load NFL Draft picks information
+def load_nfl_pfr_def(
+    return_as_pandas=False, return_as=None, cache_dir=None, columns=None, compact=False
+) -> pl.DataFrame:
+    """Load NFL Pro-Football Reference Advanced Defensive data going back to 2018
 
-    Example:
+    Args:
+        return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None. Without a file cache only these columns are downloaded.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
+
+    Example:
+        `nfl_df = sportsdataverse.nfl.load_nfl_pfr_def()`
+
+    Returns:
+        pl.DataFrame: Polars dataframe containing Pro-Football Reference
+            advanced defensive stats data available.
+
+    """
+    data = read_parquet_url(NFL_PFR_SEASON_DEF_URL, cache_dir=cache_dir, columns=columns)
+    if compact:
+        data = compact_frame(data)
+    return convert_frame(data, return_as_pandas, return_as, use_pyarrow_extension_array=True)
+
+
+def scan_nfl_pfr_def(cache_dir=None, compact=False) -> pl.LazyFrame:
+    """Lazily scan NFL Pro-Football Reference Advanced Defensive data going back to 2018
+
+    Example:
+        `nfl_df = sportsdataverse.nfl.scan_nfl_pfr_def().collect()`
+
+    Args:
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
+
+    Returns:
+        pl.LazyFrame: Lazy frame over the data of `load_nfl_pfr_def()`.
+    """
+    return scan_parquet_url(NFL_PFR_SEASON_DEF_URL, cache_dir=cache_dir, compact=compact)
+
+
+def load_nfl_pfr_weekly_def(
+    seasons: List[int],
+    return_as_pandas=False,
+    return_as=None,
+    max_workers=None,
+    progress=True,
+    cache_dir=None,
+    columns=None,
+    compact=False,
+) -> pl.DataFrame:
+    """Load NFL Pro-Football Reference Weekly Advanced Defensive data going back to 2018
+
+    Example:
+        `nfl_df = sportsdataverse.nfl.load_nfl_pfr_weekly_def(seasons=range(2018,2021))`
+
+    Args:
+        seasons (list): Used to define different seasons. 2018 is the earliest available season.
+        return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        max_workers (int): Number of seasons downloaded at the same time, defaults to 4.
+        progress (bool or callable): If True, show a tqdm progress bar. A callable is called as
+            `progress(done, total)` after each season.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None. Without a file cache only these columns are downloaded.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
+
+    Returns:
+        pl.DataFrame: Polars dataframe containing Pro-Football Reference
+            advanced defensive stats data available for the requested seasons.
+
+    """
+    data = load_seasons(
+        NFL_PFR_WEEK_DEF_URL,
+        seasons,
+        min_season=2018,
+        max_workers=max_workers,
+        progress=progress,
+        cache_dir=cache_dir,
+        columns=columns,
+        compact=compact,
+    )
+    return convert_frame(data, return_as_pandas, return_as, use_pyarrow_extension_array=True)
+
+
+def scan_nfl_pfr_weekly_def(seasons: List[int], max_workers=None, cache_dir=None, compact=False) -> pl.LazyFrame:
+    """Lazily scan NFL Pro-Football Reference Weekly Advanced Defensive data going back to 2018
+
+    Example:
+        `nfl_df = sportsdataverse.nfl.scan_nfl_pfr_weekly_def(seasons=range(2018,2021)).collect()`
+
+    Args:
+        seasons (list): Used to define different seasons. 2018 is the earliest available season.
+        max_workers (int): Number of season files downloaded at the same time, defaults to 4.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
+
+    Returns:
+        pl.LazyFrame: Lazy frame over the data of `load_nfl_pfr_weekly_def()`.
+    """
+    return scan_seasons(
+        NFL_PFR_WEEK_DEF_URL, seasons, min_season=2018, max_workers=max_workers, cache_dir=cache_dir, compact=compact
+    )
+
+
+def iter_nfl_pfr_weekly_def(
+    seasons: List[int], return_as_pandas=False, return_as=None, by="season", prefetch=1, cache_dir=None, columns=None
+) -> Iterator[pl.DataFrame]:
+    """Iterate over NFL Pro-Football Reference Weekly Advanced Defensive data going back to 2018, one season at a time
+
+    Example:
+        `for df in sportsdataverse.nfl.iter_nfl_pfr_weekly_def(seasons=range(2018,2021)): print(df.shape)`
+
+    Args:
+        seasons (list): Used to define different seasons. 2018 is the earliest available season.
+        return_as_pandas (bool): If True, yields pandas dataframes. If False, yields polars dataframes.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        by (str): "season" yields one dataframe per season, "row_group" one per parquet row group.
+        prefetch (int): Number of seasons downloaded in the background ahead of the current one.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None.
+
+    Returns:
+        Iterator[pl.DataFrame]: One dataframe per season (or row group) of `load_nfl_pfr_weekly_def()`.
+    """
+    frames = iter_seasons(
+        NFL_PFR_WEEK_DEF_URL, seasons, min_season=2018, by=by, prefetch=prefetch, cache_dir=cache_dir, columns=columns
+    )
+    return (convert_frame(df, return_as_pandas, return_as, use_pyarrow_extension_array=True) for df in frames)
+
+
+def refresh_nfl_pfr_weekly_def(store: DataStore, seasons: Optional[List[int]] = None) -> Dict[int, int]:
+    """Refresh NFL Pro-Football Reference Weekly Advanced Defensive data kept in a `DataStore`
+
+    Changed season files are re-downloaded as a whole, since their rows are updated in place.
+
+    Example:
+        `sportsdataverse.nfl.refresh_nfl_pfr_weekly_def(sportsdataverse.store.DataStore())`
+
+    Args:
+        store (DataStore): Store holding the copy, under `league="nfl"` and `dataset="pfr_weekly_def"`.
+        seasons (list): Seasons to refresh, defaults to the most recent season.
+
+    Returns:
+        dict: Number of rows written per season.
+    """
+    seasons = [most_recent_nfl_season()] if seasons is None else seasons
+    return refresh_seasons(
+        NFL_PFR_WEEK_DEF_URL, seasons, min_season=2018, store=store, league="nfl", dataset="pfr_weekly_def", key=None
+    )
+
+
+def load_nfl_rosters(
+    seasons: List[int],
+    return_as_pandas=False,
+    return_as=None,
+    max_workers=None,
+    progress=True,
+    cache_dir=None,
+    columns=None,
+    compact=False,
+) -> pl.DataFrame:
+    """Load NFL roster data for all seasons
+
+    Example:
+        `nfl_df = sportsdataverse.nfl.load_nfl_rosters(seasons=range(1999,2021))`
+
+    Args:
+        seasons (list): Used to define different seasons. 1920 is the earliest available season.
+        return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        max_workers (int): Number of seasons downloaded at the same time, defaults to 4.
+        progress (bool or callable): If True, show a tqdm progress bar. A callable is called as
+            `progress(done, total)` after each season.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None. Without a file cache only these columns are downloaded.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
+
+    Returns:
+        pl.DataFrame: Polars dataframe containing rosters available for the requested seasons.
+
+    """
+    data = load_seasons(
+        NFL_ROSTER_URL,
+        seasons,
+        min_season=1920,
+        max_workers=max_workers,
+        progress=progress,
+        cache_dir=cache_dir,
+        columns=columns,
+        compact=compact,
+    )
+    return convert_frame(data, return_as_pandas, return_as, use_pyarrow_extension_array=True)
+
+
+def scan_nfl_rosters(seasons: List[int], max_workers=None, cache_dir=None, compact=False) -> pl.LazyFrame:
+    """Lazily scan NFL roster data for all seasons
+
+    Example:
+        `nfl_df = sportsdataverse.nfl.scan_nfl_rosters(seasons=range(1999,2021)).collect()`
+
+    Args:
+        seasons (list): Used to define different seasons. 1920 is the earliest available season.
+        max_workers (int): Number of season files downloaded at the same time, defaults to 4.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
+
+    Returns:
+        pl.LazyFrame: Lazy frame over the data of `load_nfl_rosters()`.
+    """
+    return scan_seasons(
+        NFL_ROSTER_URL, seasons, min_season=1920, max_workers=max_workers, cache_dir=cache_dir, compact=compact
+    )
+
+
+def iter_nfl_rosters(
+    seasons: List[int], return_as_pandas=False, return_as=None, by="season", prefetch=1, cache_dir=None, columns=None
+) -> Iterator[pl.DataFrame]:
+    """Iterate over NFL roster data for all seasons, one season at a time
+
+    Example:
+        `for df in sportsdataverse.nfl.iter_nfl_rosters(seasons=range(1999,2021)): print(df.shape)`
+
+    Args:
+        seasons (list): Used to define different seasons. 1920 is the earliest available season.
+        return_as_pandas (bool): If True, yields pandas dataframes. If False, yields polars dataframes.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        by (str): "season" yields one dataframe per season, "row_group" one per parquet row group.
+        prefetch (int): Number of seasons downloaded in the background ahead of the current one.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None.
+
+    Returns:
+        Iterator[pl.DataFrame]: One dataframe per season (or row group) of `load_nfl_rosters()`.
+    """
+    frames = iter_seasons(
+        NFL_ROSTER_URL, seasons, min_season=1920, by=by, prefetch=prefetch, cache_dir=cache_dir, columns=columns
+    )
+    return (convert_frame(df, return_as_pandas, return_as, use_pyarrow_extension_array=True) for df in frames)
+
+
+def refresh_nfl_rosters(store: DataStore, seasons: Optional[List[int]] = None) -> Dict[int, int]:
+    """Refresh NFL roster data kept in a `DataStore`
+
+    Changed season files are re-downloaded as a whole, since their rows are updated in place.
+
+    Example:
+        `sportsdataverse.nfl.refresh_nfl_rosters(sportsdataverse.store.DataStore())`
+
+    Args:
+        store (DataStore): Store holding the copy, under `league="nfl"` and `dataset="rosters"`.
+        seasons (list): Seasons to refresh, defaults to the most recent season.
+
+    Returns:
+        dict: Number of rows written per season.
+    """
+    seasons = [most_recent_nfl_season()] if seasons is None else seasons
+    return refresh_seasons(
+        NFL_ROSTER_URL, seasons, min_season=1920, store=store, league="nfl", dataset="rosters", key=None
+    )
+
+
+def load_nfl_weekly_rosters(
+    seasons: List[int],
+    return_as_pandas=False,
+    return_as=None,
+    max_workers=None,
+    progress=True,
+    cache_dir=None,
+    columns=None,
+    compact=False,
+) -> pl.DataFrame:
+    """Load NFL weekly roster data for selected seasons
+
+    Example:
+        `nfl_df = sportsdataverse.nfl.load_nfl_weekly_rosters(seasons=range(2002,2021))`
+
+    Args:
+        seasons (list): Used to define different seasons. 2002 is the earliest available season.
+        return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        max_workers (int): Number of seasons downloaded at the same time, defaults to 4.
+        progress (bool or callable): If True, show a tqdm progress bar. A callable is called as
+            `progress(done, total)` after each season.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None. Without a file cache only these columns are downloaded.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
+
+    Returns:
+        pl.DataFrame: Polars dataframe containing weekly rosters available for the requested seasons.
+
+    """
+    data = load_seasons(
+        NFL_WEEKLY_ROSTER_URL,
+        seasons,
+        min_season=2002,
+        max_workers=max_workers,
+        progress=progress,
+        cache_dir=cache_dir,
+        columns=columns,
+        compact=compact,
+    )
+    return convert_frame(data, return_as_pandas, return_as, use_pyarrow_extension_array=True)
+
+
+def scan_nfl_weekly_rosters(seasons: List[int], max_workers=None, cache_dir=None, compact=False) -> pl.LazyFrame:
+    """Lazily scan NFL weekly roster data for selected seasons
+
+    Example:
+        `nfl_df = sportsdataverse.nfl.scan_nfl_weekly_rosters(seasons=range(2002,2021)).collect()`
+
+    Args:
+        seasons (list): Used to define different seasons. 2002 is the earliest available season.
+        max_workers (int): Number of season files downloaded at the same time, defaults to 4.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
+
+    Returns:
+        pl.LazyFrame: Lazy frame over the data of `load_nfl_weekly_rosters()`.
+    """
+    return scan_seasons(
+        NFL_WEEKLY_ROSTER_URL, seasons, min_season=2002, max_workers=max_workers, cache_dir=cache_dir, compact=compact
+    )
+
+
+def iter_nfl_weekly_rosters(
+    seasons: List[int], return_as_pandas=False, return_as=None, by="season", prefetch=1, cache_dir=None, columns=None
+) -> Iterator[pl.DataFrame]:
+    """Iterate over NFL weekly roster data for selected seasons, one season at a time
+
+    Example:
+        `for df in sportsdataverse.nfl.iter_nfl_weekly_rosters(seasons=range(2002,2021)): print(df.shape)`
+
+    Args:
+        seasons (list): Used to define different seasons. 2002 is the earliest available season.
+        return_as_pandas (bool): If True, yields pandas dataframes. If False, yields polars dataframes.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        by (str): "season" yields one dataframe per season, "row_group" one per parquet row group.
+        prefetch (int): Number of seasons downloaded in the background ahead of the current one.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None.
+
+    Returns:
+        Iterator[pl.DataFrame]: One dataframe per season (or row group) of `load_nfl_weekly_rosters()`.
+    """
+    frames = iter_seasons(
+        NFL_WEEKLY_ROSTER_URL, seasons, min_season=2002, by=by, prefetch=prefetch, cache_dir=cache_dir, columns=columns
+    )
+    return (convert_frame(df, return_as_pandas, return_as, use_pyarrow_extension_array=True) for df in frames)
+
+
+def refresh_nfl_weekly_rosters(store: DataStore, seasons: Optional[List[int]] = None) -> Dict[int, int]:
+    """Refresh NFL weekly roster data kept in a `DataStore`
+
+    Changed season files are re-downloaded as a whole, since their rows are updated in place.
+
+    Example:
+        `sportsdataverse.nfl.refresh_nfl_weekly_rosters(sportsdataverse.store.DataStore())`
+
+    Args:
+        store (DataStore): Store holding the copy, under `league="nfl"` and `dataset="weekly_rosters"`.
+        seasons (list): Seasons to refresh, defaults to the most recent season.
+
+    Returns:
+        dict: Number of rows written per season.
+    """
+    seasons = [most_recent_nfl_season()] if seasons is None else seasons
+    return refresh_seasons(
+        NFL_WEEKLY_ROSTER_URL, seasons, min_season=2002, store=store, league="nfl", dataset="weekly_rosters", key=None
+    )
+
+
+def load_nfl_teams(return_as_pandas=False, return_as=None, cache_dir=None) -> pl.DataFrame:
+    """Load NFL team ID information and logos
+
+    Example:
+        `nfl_df = sportsdataverse.nfl.load_nfl_teams()`
+
+    Args:
+        return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+
+    Returns:
+        pl.DataFrame: Polars dataframe containing teams available.
+    """
+    data = pl.read_csv(cached_path(NFL_TEAM_LOGO_URL, cache_dir))
+    return convert_frame(data, return_as_pandas, return_as, use_pyarrow_extension_array=True)
+
+
+def scan_nfl_teams(cache_dir=None) -> pl.LazyFrame:
+    """Lazily scan NFL team ID information and logos
+
+    Example:
+        `nfl_df = sportsdataverse.nfl.scan_nfl_teams().collect()`
+
+    Args:
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+
+    Returns:
+        pl.LazyFrame: Lazy frame over the data of `load_nfl_teams()`, scanned from the cached csv file.
+    """
+    return scan_csv_url(NFL_TEAM_LOGO_URL, cache_dir=cache_dir)
+
+
+def load_nfl_players(
+    return_as_pandas=False, return_as=None, cache_dir=None, columns=None, compact=False
+) -> pl.DataFrame:
+    """Load NFL Player ID information
+
+    Example:
+        `nfl_df = sportsdataverse.nfl.load_nfl_players()`
+
+    Args:
+        return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None. Without a file cache only these columns are downloaded.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
+
+    Returns:
+        pl.DataFrame: Polars dataframe containing players available.
+    """
+    data = read_parquet_url(NFL_PLAYER_URL, cache_dir=cache_dir, columns=columns)
+    if compact:
+        data = compact_frame(data)
+    return convert_frame(data, return_as_pandas, return_as, use_pyarrow_extension_array=True)
+
+
+def scan_nfl_players(cache_dir=None, compact=False) -> pl.LazyFrame:
+    """Lazily scan NFL Player ID information
+
+    Example:
+        `nfl_df = sportsdataverse.nfl.scan_nfl_players().collect()`
+
+    Args:
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
+
+    Returns:
+        pl.LazyFrame: Lazy frame over the data of `load_nfl_players()`.
+    """
+    return scan_parquet_url(NFL_PLAYER_URL, cache_dir=cache_dir, compact=compact)
+
+
+def load_nfl_snap_counts(
+    seasons: List[int],
+    return_as_pandas=False,
+    return_as=None,
+    max_workers=None,
+    progress=True,
+    cache_dir=None,
+    columns=None,
+    compact=False,
+) -> pl.DataFrame:
+    """Load NFL snap counts data for selected seasons
+
+    Example:
+        `nfl_df = sportsdataverse.nfl.load_nfl_snap_counts(seasons=range(2012,2021))`
+
+    Args:
+        seasons (list): Used to define different seasons. 2012 is the earliest available season.
+        return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        max_workers (int): Number of seasons downloaded at the same time, defaults to 4.
+        progress (bool or callable): If True, show a tqdm progress bar. A callable is called as
+            `progress(done, total)` after each season.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None. Without a file cache only these columns are downloaded.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
+
+    Returns:
+        pl.DataFrame: Polars dataframe containing snap counts available for the requested seasons.
+
+    """
+    data = load_seasons(
+        NFL_SNAP_COUNTS_URL,
+        seasons,
+        min_season=2012,
+        max_workers=max_workers,
+        progress=progress,
+        cache_dir=cache_dir,
+        columns=columns,
+        compact=compact,
+    )
+    return convert_frame(data, return_as_pandas, return_as, use_pyarrow_extension_array=True)
+
+
+def scan_nfl_snap_counts(seasons: List[int], max_workers=None, cache_dir=None, compact=False) -> pl.LazyFrame:
+    """Lazily scan NFL snap counts data for selected seasons
+
+    Example:
+        `nfl_df = sportsdataverse.nfl.scan_nfl_snap_counts(seasons=range(2012,2021)).collect()`
+
+    Args:
+        seasons (list): Used to define different seasons. 2012 is the earliest available season.
+        max_workers (int): Number of season files downloaded at the same time, defaults to 4.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
+
+    Returns:
+        pl.LazyFrame: Lazy frame over the data of `load_nfl_snap_counts()`.
+    """
+    return scan_seasons(
+        NFL_SNAP_COUNTS_URL, seasons, min_season=2012, max_workers=max_workers, cache_dir=cache_dir, compact=compact
+    )
+
+
+def iter_nfl_snap_counts(
+    seasons: List[int], return_as_pandas=False, return_as=None, by="season", prefetch=1, cache_dir=None, columns=None
+) -> Iterator[pl.DataFrame]:
+    """Iterate over NFL snap counts data for selected seasons, one season at a time
+
+    Example:
+        `for df in sportsdataverse.nfl.iter_nfl_snap_counts(seasons=range(2012,2021)): print(df.shape)`
+
+    Args:
+        seasons (list): Used to define different seasons. 2012 is the earliest available season.
+        return_as_pandas (bool): If True, yields pandas dataframes. If False, yields polars dataframes.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        by (str): "season" yields one dataframe per season, "row_group" one per parquet row group.
+        prefetch (int): Number of seasons downloaded in the background ahead of the current one.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None.
+
+    Returns:
+        Iterator[pl.DataFrame]: One dataframe per season (or row group) of `load_nfl_snap_counts()`.
+    """
+    frames = iter_seasons(
+        NFL_SNAP_COUNTS_URL, seasons, min_season=2012, by=by, prefetch=prefetch, cache_dir=cache_dir, columns=columns
+    )
+    return (convert_frame(df, return_as_pandas, return_as, use_pyarrow_extension_array=True) for df in frames)
+
+
+def refresh_nfl_snap_counts(store: DataStore, seasons: Optional[List[int]] = None) -> Dict[int, int]:
+    """Refresh NFL snap counts data kept in a `DataStore`
+
+    Changed season files are re-downloaded as a whole, since their rows are updated in place.
+
+    Example:
+        `sportsdataverse.nfl.refresh_nfl_snap_counts(sportsdataverse.store.DataStore())`
+
+    Args:
+        store (DataStore): Store holding the copy, under `league="nfl"` and `dataset="snap_counts"`.
+        seasons (list): Seasons to refresh, defaults to the most recent season.
+
+    Returns:
+        dict: Number of rows written per season.
+    """
+    seasons = [most_recent_nfl_season()] if seasons is None else seasons
+    return refresh_seasons(
+        NFL_SNAP_COUNTS_URL, seasons, min_season=2012, store=store, league="nfl", dataset="snap_counts", key=None
+    )
+
+
+def load_nfl_pbp_participation(
+    seasons: List[int],
+    return_as_pandas=False,
+    return_as=None,
+    max_workers=None,
+    progress=True,
+    cache_dir=None,
+    columns=None,
+    compact=False,
+) -> pl.DataFrame:
+    """Load NFL play-by-play participation data for selected seasons
+
+    Example:
+        `nfl_df = sportsdataverse.nfl.load_nfl_pbp_participation(seasons=range(2016,2021))`
+
+    Args:
+        seasons (list): Used to define different seasons. 2016 is the earliest available season.
+        return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        max_workers (int): Number of seasons downloaded at the same time, defaults to 4.
+        progress (bool or callable): If True, show a tqdm progress bar. A callable is called as
+            `progress(done, total)` after each season.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None. Without a file cache only these columns are downloaded.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
+
+    Returns:
+        pl.DataFrame: Polars dataframe containing play-by-play participation data available for the requested seasons.
+
+    """
+    data = load_seasons(
+        NFL_PBP_PARTICIPATION_URL,
+        seasons,
+        min_season=2016,
+        max_workers=max_workers,
+        progress=progress,
+        cache_dir=cache_dir,
+        columns=columns,
+        compact=compact,
+    )
+    return convert_frame(data, return_as_pandas, return_as, use_pyarrow_extension_array=True)
+
+
+def scan_nfl_pbp_participation(seasons: List[int], max_workers=None, cache_dir=None, compact=False) -> pl.LazyFrame:
+    """Lazily scan NFL play-by-play participation data for selected seasons
+
+    Example:
+        `nfl_df = sportsdataverse.nfl.scan_nfl_pbp_participation(seasons=range(2016,2021)).collect()`
+
+    Args:
+        seasons (list): Used to define different seasons. 2016 is the earliest available season.
+        max_workers (int): Number of season files downloaded at the same time, defaults to 4.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
+
+    Returns:
+        pl.LazyFrame: Lazy frame over the data of `load_nfl_pbp_participation()`.
+    """
+    return scan_seasons(
+        NFL_PBP_PARTICIPATION_URL, seasons, min_season=2016, max_workers=max_workers, cache_dir=cache_dir
+    )
+
+
+def iter_nfl_pbp_participation(
+    seasons: List[int], return_as_pandas=False, return_as=None, by="season", prefetch=1, cache_dir=None, columns=None
+) -> Iterator[pl.DataFrame]:
+    """Iterate over NFL play-by-play participation data for selected seasons, one season at a time
+
+    Example:
+        `for df in sportsdataverse.nfl.iter_nfl_pbp_participation(seasons=range(2016,2021)): print(df.shape)`
+
+    Args:
+        seasons (list): Used to define different seasons. 2016 is the earliest available season.
+        return_as_pandas (bool): If True, yields pandas dataframes. If False, yields polars dataframes.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        by (str): "season" yields one dataframe per season, "row_group" one per parquet row group.
+        prefetch (int): Number of seasons downloaded in the background ahead of the current one.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None.
+
+    Returns:
+        Iterator[pl.DataFrame]: One dataframe per season (or row group) of `load_nfl_pbp_participation()`.
+    """
+    frames = iter_seasons(
+        NFL_PBP_PARTICIPATION_URL,
+        seasons,
+        min_season=2016,
+        by=by,
+        prefetch=prefetch,
+        cache_dir=cache_dir,
+        columns=columns,
+    )
+    return (convert_frame(df, return_as_pandas, return_as, use_pyarrow_extension_array=True) for df in frames)
+
+
+def refresh_nfl_pbp_participation(store: DataStore, seasons: Optional[List[int]] = None) -> Dict[int, int]:
+    """Refresh NFL play-by-play participation data kept in a `DataStore`
+
+    Changed season files are re-downloaded as a whole, since their rows are updated in place.
+
+    Example:
+        `sportsdataverse.nfl.refresh_nfl_pbp_participation(sportsdataverse.store.DataStore())`
+
+    Args:
+        store (DataStore): Store holding the copy, under `league="nfl"` and `dataset="pbp_participation"`.
+        seasons (list): Seasons to refresh, defaults to the most recent season.
+
+    Returns:
+        dict: Number of rows written per season.
+    """
+    seasons = [most_recent_nfl_season()] if seasons is None else seasons
+    return refresh_seasons(
+        NFL_PBP_PARTICIPATION_URL,
+        seasons,
+        min_season=2016,
+        store=store,
+        league="nfl",
+        dataset="pbp_participation",
+        key=None,
+    )
+
+
+def load_nfl_injuries(
+    seasons: List[int],
+    return_as_pandas=False,
+    return_as=None,
+    max_workers=None,
+    progress=True,
+    cache_dir=None,
+    columns=None,
+    compact=False,
+) -> pl.DataFrame:
+    """Load NFL injuries data for selected seasons
+
+    Example:
+        `nfl_df = sportsdataverse.nfl.load_nfl_injuries(seasons=range(2009,2021))`
+
+    Args:
+        seasons (list): Used to define different seasons. 2009 is the earliest available season.
+        return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        max_workers (int): Number of seasons downloaded at the same time, defaults to 4.
+        progress (bool or callable): If True, show a tqdm progress bar. A callable is called as
+            `progress(done, total)` after each season.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None. Without a file cache only these columns are downloaded.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
+
+    Returns:
+        pl.DataFrame: Polars dataframe containing injuries data available for the requested seasons.
+
+    """
+    data = load_seasons(
+        NFL_INJURIES_URL,
+        seasons,
+        min_season=2009,
+        max_workers=max_workers,
+        progress=progress,
+        cache_dir=cache_dir,
+        columns=columns,
+        compact=compact,
+    )
+    return convert_frame(data, return_as_pandas, return_as, use_pyarrow_extension_array=True)
+
+
+def scan_nfl_injuries(seasons: List[int], max_workers=None, cache_dir=None, compact=False) -> pl.LazyFrame:
+    """Lazily scan NFL injuries data for selected seasons
+
+    Example:
+        `nfl_df = sportsdataverse.nfl.scan_nfl_injuries(seasons=range(2009,2021)).collect()`
+
+    Args:
+        seasons (list): Used to define different seasons. 2009 is the earliest available season.
+        max_workers (int): Number of season files downloaded at the same time, defaults to 4.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
+
+    Returns:
+        pl.LazyFrame: Lazy frame over the data of `load_nfl_injuries()`.
+    """
+    return scan_seasons(
+        NFL_INJURIES_URL, seasons, min_season=2009, max_workers=max_workers, cache_dir=cache_dir, compact=compact
+    )
+
+
+def iter_nfl_injuries(
+    seasons: List[int], return_as_pandas=False, return_as=None, by="season", prefetch=1, cache_dir=None, columns=None
+) -> Iterator[pl.DataFrame]:
+    """Iterate over NFL injuries data for selected seasons, one season at a time
+
+    Example:
+        `for df in sportsdataverse.nfl.iter_nfl_injuries(seasons=range(2009,2021)): print(df.shape)`
+
+    Args:
+        seasons (list): Used to define different seasons. 2009 is the earliest available season.
+        return_as_pandas (bool): If True, yields pandas dataframes. If False, yields polars dataframes.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        by (str): "season" yields one dataframe per season, "row_group" one per parquet row group.
+        prefetch (int): Number of seasons downloaded in the background ahead of the current one.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None.
+
+    Returns:
+        Iterator[pl.DataFrame]: One dataframe per season (or row group) of `load_nfl_injuries()`.
+    """
+    frames = iter_seasons(
+        NFL_INJURIES_URL, seasons, min_season=2009, by=by, prefetch=prefetch, cache_dir=cache_dir, columns=columns
+    )
+    return (convert_frame(df, return_as_pandas, return_as, use_pyarrow_extension_array=True) for df in frames)
+
+
+def refresh_nfl_injuries(store: DataStore, seasons: Optional[List[int]] = None) -> Dict[int, int]:
+    """Refresh NFL injuries data kept in a `DataStore`
+
+    Changed season files are re-downloaded as a whole, since their rows are updated in place.
+
+    Example:
+        `sportsdataverse.nfl.refresh_nfl_injuries(sportsdataverse.store.DataStore())`
+
+    Args:
+        store (DataStore): Store holding the copy, under `league="nfl"` and `dataset="injuries"`.
+        seasons (list): Seasons to refresh, defaults to the most recent season.
+
+    Returns:
+        dict: Number of rows written per season.
+    """
+    seasons = [most_recent_nfl_season()] if seasons is None else seasons
+    return refresh_seasons(
+        NFL_INJURIES_URL, seasons, min_season=2009, store=store, league="nfl", dataset="injuries", key=None
+    )
+
+
+def load_nfl_depth_charts(
+    seasons: List[int],
+    return_as_pandas=False,
+    return_as=None,
+    max_workers=None,
+    progress=True,
+    cache_dir=None,
+    columns=None,
+    compact=False,
+) -> pl.DataFrame:
+    """Load NFL Depth Chart data for selected seasons
+
+    Example:
+        `nfl_df = sportsdataverse.nfl.load_nfl_depth_charts(seasons=range(2001,2021))`
+
+    Args:
+        seasons (list): Used to define different seasons. 2001 is the earliest available season.
+        return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        max_workers (int): Number of seasons downloaded at the same time, defaults to 4.
+        progress (bool or callable): If True, show a tqdm progress bar. A callable is called as
+            `progress(done, total)` after each season.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None. Without a file cache only these columns are downloaded.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
+
+    Returns:
+        pl.DataFrame: Polars dataframe containing depth chart data available for the requested seasons.
+
+    """
+    data = load_seasons(
+        NFL_DEPTH_CHARTS_URL,
+        seasons,
+        min_season=2001,
+        max_workers=max_workers,
+        progress=progress,
+        cache_dir=cache_dir,
+        columns=columns,
+        compact=compact,
+    )
+    return convert_frame(data, return_as_pandas, return_as, use_pyarrow_extension_array=True)
+
+
+def scan_nfl_depth_charts(seasons: List[int], max_workers=None, cache_dir=None, compact=False) -> pl.LazyFrame:
+    """Lazily scan NFL Depth Chart data for selected seasons
+
+    Example:
+        `nfl_df = sportsdataverse.nfl.scan_nfl_depth_charts(seasons=range(2001,2021)).collect()`
+
+    Args:
+        seasons (list): Used to define different seasons. 2001 is the earliest available season.
+        max_workers (int): Number of season files downloaded at the same time, defaults to 4.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
+
+    Returns:
+        pl.LazyFrame: Lazy frame over the data of `load_nfl_depth_charts()`.
+    """
+    return scan_seasons(
+        NFL_DEPTH_CHARTS_URL, seasons, min_season=2001, max_workers=max_workers, cache_dir=cache_dir, compact=compact
+    )
+
+
+def iter_nfl_depth_charts(
+    seasons: List[int], return_as_pandas=False, return_as=None, by="season", prefetch=1, cache_dir=None, columns=None
+) -> Iterator[pl.DataFrame]:
+    """Iterate over NFL Depth Chart data for selected seasons, one season at a time
+
+    Example:
+        `for df in sportsdataverse.nfl.iter_nfl_depth_charts(seasons=range(2001,2021)): print(df.shape)`
+
+    Args:
+        seasons (list): Used to define different seasons. 2001 is the earliest available season.
+        return_as_pandas (bool): If True, yields pandas dataframes. If False, yields polars dataframes.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        by (str): "season" yields one dataframe per season, "row_group" one per parquet row group.
+        prefetch (int): Number of seasons downloaded in the background ahead of the current one.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None.
+
+    Returns:
+        Iterator[pl.DataFrame]: One dataframe per season (or row group) of `load_nfl_depth_charts()`.
+    """
+    frames = iter_seasons(
+        NFL_DEPTH_CHARTS_URL, seasons, min_season=2001, by=by, prefetch=prefetch, cache_dir=cache_dir, columns=columns
+    )
+    return (convert_frame(df, return_as_pandas, return_as, use_pyarrow_extension_array=True) for df in frames)
+
+
+def refresh_nfl_depth_charts(store: DataStore, seasons: Optional[List[int]] = None) -> Dict[int, int]:
+    """Refresh NFL Depth Chart data kept in a `DataStore`
+
+    Changed season files are re-downloaded as a whole, since their rows are updated in place.
+
+    Example:
+        `sportsdataverse.nfl.refresh_nfl_depth_charts(sportsdataverse.store.DataStore())`
+
+    Args:
+        store (DataStore): Store holding the copy, under `league="nfl"` and `dataset="depth_charts"`.
+        seasons (list): Seasons to refresh, defaults to the most recent season.
+
+    Returns:
+        dict: Number of rows written per season.
+    """
+    seasons = [most_recent_nfl_season()] if seasons is None else seasons
+    return refresh_seasons(
+        NFL_DEPTH_CHARTS_URL, seasons, min_season=2001, store=store, league="nfl", dataset="depth_charts", key=None
+    )
+
+
+def load_nfl_contracts(
+    return_as_pandas=False, return_as=None, cache_dir=None, columns=None, compact=False
+) -> pl.DataFrame:
+    """Load NFL Historical contracts information
+
+    Example:
+        `nfl_df = sportsdataverse.nfl.load_nfl_contracts()`
+
+    Args:
+        return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None. Without a file cache only these columns are downloaded.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
+
+    Returns:
+        pl.DataFrame: Polars dataframe containing historical contracts available.
+    """
+    data = read_parquet_url(NFL_CONTRACTS_URL, cache_dir=cache_dir, columns=columns)
+    if compact:
+        data = compact_frame(data)
+    return convert_frame(data, return_as_pandas, return_as, use_pyarrow_extension_array=True)
+
+
+def scan_nfl_contracts(cache_dir=None, compact=False) -> pl.LazyFrame:
+    """Lazily scan NFL Historical contracts information
+
+    Example:
+        `nfl_df = sportsdataverse.nfl.scan_nfl_contracts().collect()`
+
+    Args:
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
+
+    Returns:
+        pl.LazyFrame: Lazy frame over the data of `load_nfl_contracts()`.
+    """
+    return scan_parquet_url(NFL_CONTRACTS_URL, cache_dir=cache_dir, compact=compact)
+
+
+def load_nfl_combine(
+    return_as_pandas=False, return_as=None, cache_dir=None, columns=None, compact=False
+) -> pl.DataFrame:
+    """Load NFL Combine information
+
+    Example:
+        `nfl_df = sportsdataverse.nfl.load_nfl_combine()`
+
+    Args:
+        return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None. Without a file cache only these columns are downloaded.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
+
+    Returns:
+        pl.DataFrame: Polars dataframe containing NFL combine data available.
+    """
+    data = read_parquet_url(NFL_COMBINE_URL, cache_dir=cache_dir, columns=columns)
+    if compact:
+        data = compact_frame(data)
+    return convert_frame(data, return_as_pandas, return_as, use_pyarrow_extension_array=True)
+
+
+def scan_nfl_combine(cache_dir=None, compact=False) -> pl.LazyFrame:
+    """Lazily scan NFL Combine information
+
+    Example:
+        `nfl_df = sportsdataverse.nfl.scan_nfl_combine().collect()`
+
+    Args:
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
+
+    Returns:
+        pl.LazyFrame: Lazy frame over the data of `load_nfl_combine()`.
+    """
+    return scan_parquet_url(NFL_COMBINE_URL, cache_dir=cache_dir, compact=compact)
+
+
+def load_nfl_draft_picks(
+    return_as_pandas=False, return_as=None, cache_dir=None, columns=None, compact=False
+) -> pl.DataFrame:
+    """Load NFL Draft picks information
+
+    Example:
         `nfl_df = sportsdataverse.nfl.load_nfl_draft_picks()`
 
     Args:
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None. Without a file cache only these columns are downloaded.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
 
     Returns:
         pl.DataFrame: Polars dataframe containing NFL Draft picks data available.
     """
-    return (
-        pl.read_parquet(NFL_DRAFT_PICKS_URL, use_pyarrow=True, columns=None).to_pandas(
-            use_pyarrow_extension_array=True
-        )
-        if return_as_pandas
-        else pl.read_parquet(NFL_DRAFT_PICKS_URL, use_pyarrow=True, columns=None)
-    )
+    data = read_parquet_url(NFL_DRAFT_PICKS_URL, cache_dir=cache_dir, columns=columns)
+    if compact:
+        data = compact_frame(data)
+    return convert_frame(data, return_as_pandas, return_as, use_pyarrow_extension_array=True)
+
+
+def scan_nfl_draft_picks(cache_dir=None, compact=False) -> pl.LazyFrame:
+    """Lazily scan NFL Draft picks information
 
+    Example:
+        `nfl_df = sportsdataverse.nfl.scan_nfl_draft_picks().collect()`
+
+    Args:
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
 
-def load_nfl_officials(return_as_pandas=False) -> pl.DataFrame:
+    Returns:
+        pl.LazyFrame: Lazy frame over the data of `load_nfl_draft_picks()`.
+    """
+    return scan_parquet_url(NFL_DRAFT_PICKS_URL, cache_dir=cache_dir, compact=compact)
+
+
+def load_nfl_officials(
+    return_as_pandas=False, return_as=None, cache_dir=None, columns=None, compact=False
+) -> pl.DataFrame:
     """Load NFL Officials information
 
     Example:
@@ -622,15 +1969,35 @@ def load_nfl_officials(return_as_pandas=False) -> pl.DataFrame:
 
     Args:
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None. Without a file cache only these columns are downloaded.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
 
     Returns:
         pl.DataFrame: Polars dataframe containing officials available.
     """
-    return (
-        pl.read_parquet(NFL_OFFICIALS_URL, use_pyarrow=True, columns=None).to_pandas(use_pyarrow_extension_array=True)
-        if return_as_pandas
-        else pl.read_parquet(NFL_OFFICIALS_URL, use_pyarrow=True, columns=None)
-    )
+    data = read_parquet_url(NFL_OFFICIALS_URL, cache_dir=cache_dir, columns=columns)
+    if compact:
+        data = compact_frame(data)
+    return convert_frame(data, return_as_pandas, return_as, use_pyarrow_extension_array=True)
+
+
+def scan_nfl_officials(cache_dir=None, compact=False) -> pl.LazyFrame:
+    """Lazily scan NFL Officials information
+
+    Example:
+        `nfl_df = sportsdataverse.nfl.scan_nfl_officials().collect()`
+
+    Args:
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
+
+    Returns:
+        pl.LazyFrame: Lazy frame over the data of `load_nfl_officials()`.
+    """
+    return scan_parquet_url(NFL_OFFICIALS_URL, cache_dir=cache_dir, compact=compact)
 
 
 ## Currently removed due to unsupported features of pyreadr's method.
@@ -9,9 +9,10 @@ import numpy as np
 import pandas as pd
 import polars as pl
 from pkg_resources import resource_filename
-from xgboost import Booster, DMatrix
+from xgboost import DMatrix
 
-from sportsdataverse.dl_utils import download
+from sportsdataverse.dl_utils import adownload, convert_frame, download, run_in_thread
+from sportsdataverse.models import get_model
 from sportsdataverse.nfl.model_vars import (
     defense_score_vec,
     end_change_vec,
@@ -47,15 +48,6 @@ ep_model_file = resource_filename("sportsdataverse", "nfl/models/ep_model.model"
 wp_spread_file = resource_filename("sportsdataverse", "nfl/models/wp_spread.model")
 qbr_model_file = resource_filename("sportsdataverse", "nfl/models/qbr_model.model")
 
-ep_model = Booster({"nthread": 4})  # init model
-ep_model.load_model(ep_model_file)
-
-wp_model = Booster({"nthread": 4})  # init model
-wp_model.load_model(wp_spread_file)
-
-qbr_model = Booster({"nthread": 4})  # init model
-qbr_model.load_model(qbr_model_file)
-
 logger = logging.getLogger("sdv.nfl_pbp")
 logger.addHandler(logging.NullHandler())
 
@@ -68,8 +60,9 @@ class NFLPlayProcess(object):
     raw = False
     path_to_json = "/"
     return_keys = None
+    return_as = None
 
-    def __init__(self, gameId=0, raw=False, path_to_json="/", return_keys=None, **kwargs):
+    def __init__(self, gameId=0, raw=False, path_to_json="/", return_keys=None, return_as=None, **kwargs):
         self.gameId = int(gameId)
         # self.logger = logger
         self.ran_pipeline = False
@@ -77,6 +70,7 @@ class NFLPlayProcess(object):
         self.raw = raw
         self.path_to_json = path_to_json
         self.return_keys = return_keys
+        self.return_as = return_as
 
     def espn_nfl_pbp(self, **kwargs):
         """espn_nfl_pbp() - Pull the game by id. Data from API endpoints: `nfl/playbyplay`, `nfl/summary`
@@ -94,13 +88,29 @@ class NFLPlayProcess(object):
             `nfl_df = sportsdataverse.nfl.NFLPlayProcess(gameId=401220403).espn_nfl_pbp()`
         """
         cache_buster = int(time.time() * 1000)
-        pbp_txt = {"timeouts": {}}
         # summary endpoint for pickcenter array
         summary_url = (
             f"http://site.api.espn.com/apis/site/v2/sports/football/nfl/summary?event={self.gameId}&{cache_buster}"
         )
         summary_resp = download(url=summary_url, **kwargs)
-        summary = summary_resp.json()
+        return self.__helper_nfl_summary(summary_resp.json())
+
+    async def aespn_nfl_pbp(self, **kwargs):
+        """aespn_nfl_pbp() - Coroutine version of `espn_nfl_pbp()`, taking the same arguments.
+
+        Example:
+            `nfl_df = await sportsdataverse.nfl.NFLPlayProcess(gameId=401220403).aespn_nfl_pbp()`
+        """
+        cache_buster = int(time.time() * 1000)
+        # summary endpoint for pickcenter array
+        summary_url = (
+            f"http://site.api.espn.com/apis/site/v2/sports/football/nfl/summary?event={self.gameId}&{cache_buster}"
+        )
+        summary_resp = await adownload(url=summary_url, **kwargs)
+        return await run_in_thread(lambda: self.__helper_nfl_summary(summary_resp.json()))
+
+    def __helper_nfl_summary(self, summary):
+        pbp_txt = {"timeouts": {}}
         incoming_keys_expected = [
             "boxscore",
             "format",
@@ -468,42 +478,17 @@ class NFLPlayProcess(object):
         )
         pbp_txt["plays"] = (
             pbp_txt["plays"]
+            # timeouts used so far in the half, as a running count over the plays (sorted by id above) taken at the
+            # last play of each id, so that plays sharing an id see the same count
             .with_columns(
-                (
-                    3
-                    - pl.struct(pl.col(["id", "period.number"])).apply(
-                        lambda x: (
-                            sum(
-                                (i <= x["id"]) & (x["period.number"] <= 2)
-                                for i in pbp_txt["timeouts"][int(init["homeTeamId"])]["1"]
-                            )
-                        )
-                        | (
-                            sum(
-                                (i <= x["id"]) & (x["period.number"] > 2)
-                                for i in pbp_txt["timeouts"][int(init["homeTeamId"])]["2"]
-                            )
-                        ),
-                    )
-                ).alias("end.homeTeamTimeouts"),
-                (
-                    3
-                    - pl.struct(pl.col(["id", "period.number"])).apply(
-                        lambda x: (
-                            sum(
-                                (i <= x["id"]) & (x["period.number"] <= 2)
-                                for i in pbp_txt["timeouts"][int(init["awayTeamId"])]["1"]
-                            )
-                        )
-                        | (
-                            sum(
-                                (i <= x["id"]) & (x["period.number"] > 2)
-                                for i in pbp_txt["timeouts"][int(init["awayTeamId"])]["2"]
-                            )
-                        ),
-                    )
-                ).alias("end.awayTeamTimeouts"),
+                home_timeouts_used=pl.col("homeTimeoutCalled").cast(pl.Int64).cumsum().over("half"),
+                away_timeouts_used=pl.col("awayTimeoutCalled").cast(pl.Int64).cumsum().over("half"),
             )
+            .with_columns(
+                (3 - pl.col("home_timeouts_used").max().over(["half", "id"])).alias("end.homeTeamTimeouts"),
+                (3 - pl.col("away_timeouts_used").max().over(["half", "id"])).alias("end.awayTeamTimeouts"),
+            )
+            .drop(["home_timeouts_used", "away_timeouts_used"])
             .with_columns(
                 pl.col("end.homeTeamTimeouts").shift_and_fill(periods=1, fill_value=3).alias("start.homeTeamTimeouts"),
                 pl.col("end.awayTeamTimeouts").shift_and_fill(periods=1, fill_value=3).alias("start.awayTeamTimeouts"),
@@ -3105,7 +3090,7 @@ class NFLPlayProcess(object):
         # self.logger.info(start_data.iloc[[36]].to_json(orient="records"))
 
         dtest_start_touchback = DMatrix(start_touchback_data)
-        EP_start_touchback_parts = ep_model.predict(dtest_start_touchback)
+        EP_start_touchback_parts = get_model(ep_model_file).predict(dtest_start_touchback)
         EP_start_touchback = self.__calculate_ep_exp_val(EP_start_touchback_parts)
 
         start_data = play_df[ep_start_columns]
@@ -3113,7 +3098,7 @@ class NFLPlayProcess(object):
         # self.logger.info(start_data.iloc[[36]].to_json(orient="records"))
 
         dtest_start = DMatrix(start_data)
-        EP_start_parts = ep_model.predict(dtest_start)
+        EP_start_parts = get_model(ep_model_file).predict(dtest_start)
         EP_start = self.__calculate_ep_exp_val(EP_start_parts)
 
         play_df = (
@@ -3179,7 +3164,7 @@ class NFLPlayProcess(object):
         end_data.columns = ep_final_names
         # self.logger.info(end_data.iloc[[36]].to_json(orient="records"))
         dtest_end = DMatrix(end_data)
-        EP_end_parts = ep_model.predict(dtest_end)
+        EP_end_parts = get_model(ep_model_file).predict(dtest_end)
 
         EP_end = self.__calculate_ep_exp_val(EP_end_parts)
 
@@ -3605,19 +3590,19 @@ class NFLPlayProcess(object):
         start_touchback_data.columns = wp_final_names
         # self.logger.info(start_touchback_data.iloc[[36]].to_json(orient="records"))
         dtest_start_touchback = DMatrix(start_touchback_data)
-        WP_start_touchback = wp_model.predict(dtest_start_touchback)
+        WP_start_touchback = get_model(wp_spread_file).predict(dtest_start_touchback)
         start_data = play_df[wp_start_columns]
         start_data.columns = wp_final_names
         # self.logger.info(start_data.iloc[[36]].to_json(orient="records"))
         dtest_start = DMatrix(start_data)
-        WP_start = wp_model.predict(dtest_start)
+        WP_start = get_model(wp_spread_file).predict(dtest_start)
 
         # ---- wp_after ----
         end_data = play_df[wp_end_columns]
         end_data.columns = wp_final_names
         # self.logger.info(start_data.iloc[[36]].to_json(orient="records"))
         dtest_end = DMatrix(end_data)
-        WP_end = wp_model.predict(dtest_end)
+        WP_end = get_model(wp_spread_file).predict(dtest_end)
 
         play_df = (
             play_df.with_columns(
@@ -3881,7 +3866,7 @@ class NFLPlayProcess(object):
         # # self.logger.info(pass_qbr)
 
         dtest_qbr = DMatrix(pass_qbr[qbr_vars])
-        qbr_result = qbr_model.predict(dtest_qbr)
+        qbr_result = get_model(qbr_model_file).predict(dtest_qbr)
         pass_qbr = pass_qbr.with_columns(exp_qbr=pl.lit(qbr_result))
         passer_box = passer_box.join(
             pass_qbr, left_on=["passer_player_name", "pos_team"], right_on=["athlete_name", "pos_team"]
@@ -4509,7 +4494,7 @@ class NFLPlayProcess(object):
 
             pbp_json = {
                 "gameId": int(self.gameId),
-                "plays": self.plays_json.to_dicts(),
+                "plays": self.__convert_plays(self.plays_json),
                 "season": pbp_txt["season"],
                 "week": pbp_txt["header"]["week"],
                 "gameInfo": pbp_txt["gameInfo"],
@@ -4561,7 +4546,7 @@ class NFLPlayProcess(object):
                 )
                 self.ran_pipeline = True
                 advBoxScore = self.plays_json.pipe(self.create_box_score)
-                self.plays_json = self.plays_json.to_dicts()
+                self.plays_json = self.__convert_plays(self.plays_json)
                 pbp_json = {
                     "gameId": int(self.gameId),
                     "plays": self.plays_json,
@@ -4598,7 +4583,7 @@ class NFLPlayProcess(object):
 
             pbp_json = {
                 "gameId": int(self.gameId),
-                "plays": self.plays_json.to_dicts(),
+                "plays": self.__convert_plays(self.plays_json),
                 "season": pbp_txt["season"],
                 "week": pbp_txt["header"]["week"],
                 "gameInfo": pbp_txt["gameInfo"],
@@ -4645,7 +4630,7 @@ class NFLPlayProcess(object):
                     .pipe(self.__after_cols)
                     .pipe(self.__add_spread_time)
                 )
-                self.plays_json = self.plays_json.to_dicts()
+                self.plays_json = self.__convert_plays(self.plays_json)
                 pbp_json = {
                     "gameId": int(self.gameId),
                     "plays": self.plays_json,
@@ -4674,6 +4659,10 @@ class NFLPlayProcess(object):
             self.ran_cleaning_pipeline = True
             return self.json
 
+    def __convert_plays(self, plays):
+        # dicts by default; return_as="arrow" hands back a pyarrow.Table sharing the polars buffers
+        return plays.to_dicts() if self.return_as is None else convert_frame(plays, return_as=self.return_as)
+
     def corrupt_pbp_check(self):
         if len(self.json["plays"]) == 0:
             logging.debug(
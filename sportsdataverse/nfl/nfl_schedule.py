@@ -3,11 +3,11 @@ import datetime
 import pandas as pd
 import polars as pl
 
-from sportsdataverse.dl_utils import download
+from sportsdataverse.dl_utils import adownload, convert_frame, download, run_in_thread
 
 
 def espn_nfl_schedule(
-    dates=None, week=None, season_type=None, groups=None, limit=500, return_as_pandas=False, **kwargs
+    dates=None, week=None, season_type=None, groups=None, limit=500, return_as_pandas=False, return_as=None, **kwargs
 ) -> pl.DataFrame:
     """espn_nfl_schedule - look up the NFL schedule for a given season
 
@@ -17,6 +17,8 @@ def espn_nfl_schedule(
         season_type (int): 2 for regular season, 3 for post-season, 4 for off-season.
         limit (int): number of records to return, default: 500.
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
 
     Returns:
         pl.DataFrame: Polars dataframe containing schedule dates for the requested season. Returns None if no games
@@ -26,14 +28,37 @@ def espn_nfl_schedule(
 
     url = "http://site.api.espn.com/apis/site/v2/sports/football/nfl/scoreboard"
     resp = download(url=url, params=params, **kwargs)
+    return helper_nfl_schedule(resp.json(), return_as_pandas=return_as_pandas, return_as=return_as)
 
+
+async def aespn_nfl_schedule(
+    dates=None, week=None, season_type=None, groups=None, limit=500, return_as_pandas=False, return_as=None, **kwargs
+) -> pl.DataFrame:
+    """aespn_nfl_schedule - Coroutine version of `espn_nfl_schedule()`, taking the same arguments.
+
+    Returns:
+        pl.DataFrame: Polars dataframe containing schedule dates for the requested season.
+
+    Example:
+        `nfl_df = await sportsdataverse.nfl.aespn_nfl_schedule(dates=20230101)`
+    """
+
+    params = {"week": week, "dates": dates, "seasonType": season_type, "limit": limit}
+
+    url = "http://site.api.espn.com/apis/site/v2/sports/football/nfl/scoreboard"
+    resp = await adownload(url=url, params=params, **kwargs)
+    return await run_in_thread(
+        lambda: helper_nfl_schedule(resp.json(), return_as_pandas=return_as_pandas, return_as=return_as)
+    )
+
+
+def helper_nfl_schedule(events_txt, return_as_pandas=False, return_as=None):
     ev = pd.DataFrame()
-    events_txt = resp.json()
     events = events_txt.get("events")
     if events is None:
-        return pd.DataFrame() if return_as_pandas else pl.DataFrame()
+        return convert_frame(pl.DataFrame(), return_as_pandas, return_as)
     if len(events) == 0:
-        return pd.DataFrame() if return_as_pandas else pl.DataFrame()
+        return convert_frame(pl.DataFrame(), return_as_pandas, return_as)
 
     for event in events:
         event = scoreboard_event_parsing(event)
@@ -59,7 +84,7 @@ def espn_nfl_schedule(
     ev = pl.from_pandas(ev)
     ev = ev.janitor.clean_names()
 
-    return ev.to_pandas() if return_as_pandas else ev
+    return convert_frame(ev, return_as_pandas, return_as)
 
 
 def scoreboard_event_parsing(event):
@@ -135,13 +160,15 @@ def __extract_home_away(event, arg1, arg2):
     return event
 
 
-def espn_nfl_calendar(season=None, ondays=None, return_as_pandas=False, **kwargs) -> pl.DataFrame:
+def espn_nfl_calendar(season=None, ondays=None, return_as_pandas=False, return_as=None, **kwargs) -> pl.DataFrame:
     """espn_nfl_calendar - look up the NFL calendar for a given season
 
     Args:
         season (int): Used to define different seasons. 2002 is the earliest available season.
         ondays (boolean): Used to return dates for calendar ondays
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
 
     Returns:
         pl.DataFrame: Polars dataframe containing calendar dates for the requested season.
@@ -155,37 +182,71 @@ def espn_nfl_calendar(season=None, ondays=None, return_as_pandas=False, **kwargs
         url = "http://site.api.espn.com/apis/site/v2/sports/football/nfl/scoreboard"
         params = {"dates": season}
         resp = download(url=url, params=params, **kwargs)
-        txt = resp.json()
-        txt = txt.get("leagues")[0].get("calendar")
-        full_schedule = pl.DataFrame()
-        for i in range(len(txt)):
-            if txt[i].get("entries", None) is not None:
-                reg = pd.json_normalize(
-                    data=txt[i],
-                    record_path="entries",
-                    meta=["label", "value", "startDate", "endDate"],
-                    meta_prefix="season_type_",
-                    record_prefix="week_",
-                    errors="ignore",
-                    sep="_",
-                )
-                full_schedule = pl.concat([full_schedule, pl.from_pandas(reg)], how="vertical")
-        full_schedule = full_schedule.with_columns(season=season)
-        full_schedule = full_schedule.janitor.clean_names()
-        full_schedule = full_schedule.rename({"week_value": "week", "season_type_value": "season_type"})
-    return full_schedule.to_pandas() if return_as_pandas else full_schedule
+        full_schedule = helper_nfl_calendar(season, resp.json())
+    return convert_frame(full_schedule, return_as_pandas, return_as)
+
+
+async def aespn_nfl_calendar(
+    season=None, ondays=None, return_as_pandas=False, return_as=None, **kwargs
+) -> pl.DataFrame:
+    """aespn_nfl_calendar - Coroutine version of `espn_nfl_calendar()`, taking the same arguments.
+
+    Returns:
+        pl.DataFrame: Polars dataframe containing calendar dates for the requested season.
+
+    Example:
+        `nfl_df = await sportsdataverse.nfl.aespn_nfl_calendar(season=2023)`
+    """
+    if ondays is not None:
+        full_schedule = await __aondays_nfl_calendar(season, **kwargs)
+    else:
+        url = "http://site.api.espn.com/apis/site/v2/sports/football/nfl/scoreboard"
+        params = {"dates": season}
+        resp = await adownload(url=url, params=params, **kwargs)
+        full_schedule = await run_in_thread(lambda: helper_nfl_calendar(season, resp.json()))
+    return convert_frame(full_schedule, return_as_pandas, return_as)
+
+
+def helper_nfl_calendar(season, resp_txt):
+    txt = resp_txt.get("leagues")[0].get("calendar")
+    full_schedule = pl.DataFrame()
+    for i in range(len(txt)):
+        if txt[i].get("entries", None) is not None:
+            reg = pd.json_normalize(
+                data=txt[i],
+                record_path="entries",
+                meta=["label", "value", "startDate", "endDate"],
+                meta_prefix="season_type_",
+                record_prefix="week_",
+                errors="ignore",
+                sep="_",
+            )
+            full_schedule = pl.concat([full_schedule, pl.from_pandas(reg)], how="vertical")
+    full_schedule = full_schedule.with_columns(season=season)
+    full_schedule = full_schedule.janitor.clean_names()
+    full_schedule = full_schedule.rename({"week_value": "week", "season_type_value": "season_type"})
+    return full_schedule
 
 
 def __ondays_nfl_calendar(season, **kwargs):
     url = f"https://sports.core.api.espn.com/v2/sports/football/leagues/nfl/seasons/{season}/types/2/calendar/ondays"
     resp = download(url=url, **kwargs)
-    if resp is not None:
-        txt = resp.json().get("eventDate").get("dates")
-        result = pl.DataFrame(txt, schema=["dates"])
-        result = result.with_columns(dateURL=pl.col("dates").str.slice(0, 10))
-        result = result.with_columns(
-            url="http://site.api.espn.com/apis/site/v2/sports/football/nfl/scoreboard?dates=" + pl.col("dateURL")
-        )
+    return helper_nfl_ondays_calendar(resp.json())
+
+
+async def __aondays_nfl_calendar(season, **kwargs):
+    url = f"https://sports.core.api.espn.com/v2/sports/football/leagues/nfl/seasons/{season}/types/2/calendar/ondays"
+    resp = await adownload(url=url, **kwargs)
+    return await run_in_thread(lambda: helper_nfl_ondays_calendar(resp.json()))
+
+
+def helper_nfl_ondays_calendar(resp_txt):
+    txt = resp_txt.get("eventDate").get("dates")
+    result = pl.DataFrame(txt, schema=["dates"])
+    result = result.with_columns(dateURL=pl.col("dates").str.slice(0, 10))
+    result = result.with_columns(
+        url="http://site.api.espn.com/apis/site/v2/sports/football/nfl/scoreboard?dates=" + pl.col("dateURL")
+    )
 
     return result
 
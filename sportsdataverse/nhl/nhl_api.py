@@ -3,7 +3,7 @@ from typing import Dict
 import pandas as pd
 import polars as pl
 
-from sportsdataverse.dl_utils import download
+from sportsdataverse.dl_utils import adownload, convert_frame, download, run_in_thread
 
 
 def nhl_api_pbp(game_id: int, **kwargs) -> Dict:
@@ -23,7 +23,21 @@ def nhl_api_pbp(game_id: int, **kwargs) -> Dict:
     # summary endpoint for pickcenter array
     summary_url = f"https://statsapi.web.nhl.com/api/v1/game/{game_id}/feed/live?site=en_nhl"
     summary_resp = download(summary_url, **kwargs)
-    summary = summary_resp.json()
+    return helper_nhl_api_pbp(summary_resp.json())
+
+
+async def anhl_api_pbp(game_id: int, **kwargs) -> Dict:
+    """anhl_api_pbp() - Coroutine version of `nhl_api_pbp()`, taking the same arguments.
+
+    Example:
+        `nhl_df = await sportsdataverse.nhl.anhl_api_pbp(game_id=2021020079)`
+    """
+    summary_url = f"https://statsapi.web.nhl.com/api/v1/game/{game_id}/feed/live?site=en_nhl"
+    summary_resp = await adownload(summary_url, **kwargs)
+    return await run_in_thread(lambda: helper_nhl_api_pbp(summary_resp.json()))
+
+
+def helper_nhl_api_pbp(summary):
     pbp_txt = {"datetime": summary.get("gameData").get("datetime")}
     pbp_txt["game"] = summary.get("gameData").get("game")
     pbp_txt["players"] = summary.get("gameData").get("players")
@@ -35,13 +49,15 @@ def nhl_api_pbp(game_id: int, **kwargs) -> Dict:
     return pbp_txt
 
 
-def nhl_api_schedule(start_date: str, end_date: str, return_as_pandas=False, **kwargs) -> pl.DataFrame:
+def nhl_api_schedule(start_date: str, end_date: str, return_as_pandas=False, return_as=None, **kwargs) -> pl.DataFrame:
     """nhl_api_schedule() - Pull the schedule by start and end date. Data from API endpoints - `nhl/schedule`
 
     Args:
         start_date (str): Start date to pull the NHL API schedule.
         end_date (str): End date to pull the NHL API schedule.
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
 
     Returns:
         pl.DataFrame: Polars dataframe containing the schedule for the requested seasons.
@@ -53,10 +69,29 @@ def nhl_api_schedule(start_date: str, end_date: str, return_as_pandas=False, **k
     summary_url = "https://statsapi.web.nhl.com/api/v1/schedule"
     params = {"site": "en_nhl", "startDate": start_date, "endDate": end_date}
     summary_resp = download(summary_url, params=params, **kwargs)
-    summary = summary_resp.json()
+    return helper_nhl_api_schedule(summary_resp.json(), return_as_pandas=return_as_pandas, return_as=return_as)
+
+
+async def anhl_api_schedule(
+    start_date: str, end_date: str, return_as_pandas=False, return_as=None, **kwargs
+) -> pl.DataFrame:
+    """anhl_api_schedule() - Coroutine version of `nhl_api_schedule()`, taking the same arguments.
+
+    Example:
+        `nhl_sched_df = await sportsdataverse.nhl.anhl_api_schedule(start_date=2021-10-23, end_date=2021-10-28)`
+    """
+    summary_url = "https://statsapi.web.nhl.com/api/v1/schedule"
+    params = {"site": "en_nhl", "startDate": start_date, "endDate": end_date}
+    summary_resp = await adownload(summary_url, params=params, **kwargs)
+    return await run_in_thread(
+        lambda: helper_nhl_api_schedule(summary_resp.json(), return_as_pandas=return_as_pandas, return_as=return_as)
+    )
+
+
+def helper_nhl_api_schedule(summary, return_as_pandas=False, return_as=None):
     pbp_txt = {"dates": summary.get("dates")}
     pbp_txt_games = pl.DataFrame()
     for date in pbp_txt["dates"]:
         game = pl.from_pandas(pd.json_normalize(date, record_path="games", meta=["date"]))
         pbp_txt_games = pl.concat([pbp_txt_games, game], how="vertical")
-    return pbp_txt_games.to_pandas() if return_as_pandas else pbp_txt_games
+    return convert_frame(pbp_txt_games, return_as_pandas, return_as)
@@ -1,7 +1,6 @@
-from typing import List
+from typing import Dict, Iterator, List, Optional
 
 import polars as pl
-from tqdm import tqdm
 
 from sportsdataverse.config import (
     NHL_BASE_URL,
@@ -10,10 +9,22 @@ from sportsdataverse.config import (
     NHL_TEAM_LOGO_URL,
     NHL_TEAM_SCHEDULE_URL,
 )
-from sportsdataverse.errors import SeasonNotFoundError
+from sportsdataverse.dl_utils import convert_frame
+from sportsdataverse.loader_utils import iter_seasons, load_seasons, refresh_seasons, scan_seasons
+from sportsdataverse.nhl.nhl_schedule import most_recent_nhl_season
+from sportsdataverse.store import DataStore
 
 
-def load_nhl_pbp(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
+def load_nhl_pbp(
+    seasons: List[int],
+    return_as_pandas=False,
+    return_as=None,
+    max_workers=None,
+    progress=True,
+    cache_dir=None,
+    columns=None,
+    compact=False,
+) -> pl.DataFrame:
     """Load NHL play by play data going back to 2011
 
     Example:
@@ -22,6 +33,14 @@ def load_nhl_pbp(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
     Args:
         seasons (list): Used to define different seasons. 2011 is the earliest available season.
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        max_workers (int): Number of seasons downloaded at the same time, defaults to 4.
+        progress (bool or callable): If True, show a tqdm progress bar. A callable is called as
+            `progress(done, total)` after each season.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None. Without a file cache only these columns are downloaded.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
 
     Returns:
         pl.DataFrame: Polars dataframe containing the play-by-plays available for the requested seasons.
@@ -29,18 +48,101 @@ def load_nhl_pbp(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
     Raises:
         ValueError: If `season` is less than 2011.
     """
-    data = pl.DataFrame()
-    if type(seasons) is int:
-        seasons = [seasons]
-    for i in tqdm(seasons):
-        if int(i) < 2011:
-            raise SeasonNotFoundError("season cannot be less than 2011")
-        i_data = pl.read_parquet(NHL_BASE_URL.format(season=i), use_pyarrow=True, columns=None)
-        data = pl.concat([data, i_data], how="vertical")
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
+    data = load_seasons(
+        NHL_BASE_URL,
+        seasons,
+        min_season=2011,
+        max_workers=max_workers,
+        progress=progress,
+        cache_dir=cache_dir,
+        columns=columns,
+        compact=compact,
+    )
+    return convert_frame(data, return_as_pandas, return_as, use_pyarrow_extension_array=True)
 
 
-def load_nhl_schedule(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
+def scan_nhl_pbp(seasons: List[int], max_workers=None, cache_dir=None, compact=False) -> pl.LazyFrame:
+    """Lazily scan NHL play by play data going back to 2011
+
+    Example:
+        `nhl_df = sportsdataverse.nhl.scan_nhl_pbp(seasons=range(2011,2021)).collect()`
+
+    Args:
+        seasons (list): Used to define different seasons. 2011 is the earliest available season.
+        max_workers (int): Number of season files downloaded at the same time, defaults to 4.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
+
+    Returns:
+        pl.LazyFrame: Lazy frame over the data of `load_nhl_pbp()`.
+
+    Raises:
+        ValueError: If `season` is less than 2011.
+    """
+    return scan_seasons(
+        NHL_BASE_URL, seasons, min_season=2011, max_workers=max_workers, cache_dir=cache_dir, compact=compact
+    )
+
+
+def iter_nhl_pbp(
+    seasons: List[int], return_as_pandas=False, return_as=None, by="season", prefetch=1, cache_dir=None, columns=None
+) -> Iterator[pl.DataFrame]:
+    """Iterate over NHL play by play data going back to 2011, one season at a time
+
+    Example:
+        `for df in sportsdataverse.nhl.iter_nhl_pbp(seasons=range(2011,2021)): print(df.shape)`
+
+    Args:
+        seasons (list): Used to define different seasons. 2011 is the earliest available season.
+        return_as_pandas (bool): If True, yields pandas dataframes. If False, yields polars dataframes.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        by (str): "season" yields one dataframe per season, "row_group" one per parquet row group.
+        prefetch (int): Number of seasons downloaded in the background ahead of the current one.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None.
+
+    Returns:
+        Iterator[pl.DataFrame]: One dataframe per season (or row group) of `load_nhl_pbp()`.
+
+    Raises:
+        ValueError: If `season` is less than 2011.
+    """
+    frames = iter_seasons(
+        NHL_BASE_URL, seasons, min_season=2011, by=by, prefetch=prefetch, cache_dir=cache_dir, columns=columns
+    )
+    return (convert_frame(df, return_as_pandas, return_as, use_pyarrow_extension_array=True) for df in frames)
+
+
+def refresh_nhl_pbp(store: DataStore, seasons: Optional[List[int]] = None) -> Dict[int, int]:
+    """Refresh NHL play by play data kept in a `DataStore`
+
+    Only the games missing from the store are downloaded from a changed season file.
+
+    Example:
+        `sportsdataverse.nhl.refresh_nhl_pbp(sportsdataverse.store.DataStore())`
+
+    Args:
+        store (DataStore): Store holding the copy, under `league="nhl"` and `dataset="pbp"`.
+        seasons (list): Seasons to refresh, defaults to the most recent season.
+
+    Returns:
+        dict: Number of rows written per season.
+    """
+    seasons = [most_recent_nhl_season()] if seasons is None else seasons
+    return refresh_seasons(NHL_BASE_URL, seasons, min_season=2011, store=store, league="nhl", dataset="pbp")
+
+
+def load_nhl_schedule(
+    seasons: List[int],
+    return_as_pandas=False,
+    return_as=None,
+    max_workers=None,
+    progress=True,
+    cache_dir=None,
+    columns=None,
+    compact=False,
+) -> pl.DataFrame:
     """Load NHL schedule data
 
     Example:
@@ -49,6 +151,14 @@ def load_nhl_schedule(seasons: List[int], return_as_pandas=False) -> pl.DataFram
     Args:
         seasons (list): Used to define different seasons. 2002 is the earliest available season.
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        max_workers (int): Number of seasons downloaded at the same time, defaults to 4.
+        progress (bool or callable): If True, show a tqdm progress bar. A callable is called as
+            `progress(done, total)` after each season.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None. Without a file cache only these columns are downloaded.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
 
     Returns:
         pl.DataFrame: Polars dataframe containing the schedule for the requested seasons.
@@ -56,18 +166,103 @@ def load_nhl_schedule(seasons: List[int], return_as_pandas=False) -> pl.DataFram
     Raises:
         ValueError: If `season` is less than 2002.
     """
-    data = pl.DataFrame()
-    if type(seasons) is int:
-        seasons = [seasons]
-    for i in tqdm(seasons):
-        if int(i) < 2002:
-            raise SeasonNotFoundError("season cannot be less than 2002")
-        i_data = pl.read_parquet(NHL_TEAM_SCHEDULE_URL.format(season=i), use_pyarrow=True, columns=None)
-        data = pl.concat([data, i_data], how="vertical")
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
+    data = load_seasons(
+        NHL_TEAM_SCHEDULE_URL,
+        seasons,
+        min_season=2002,
+        max_workers=max_workers,
+        progress=progress,
+        cache_dir=cache_dir,
+        columns=columns,
+        compact=compact,
+    )
+    return convert_frame(data, return_as_pandas, return_as, use_pyarrow_extension_array=True)
+
+
+def scan_nhl_schedule(seasons: List[int], max_workers=None, cache_dir=None, compact=False) -> pl.LazyFrame:
+    """Lazily scan NHL schedule data
+
+    Example:
+        `nhl_df = sportsdataverse.nhl.scan_nhl_schedule(seasons=range(2002,2021)).collect()`
+
+    Args:
+        seasons (list): Used to define different seasons. 2002 is the earliest available season.
+        max_workers (int): Number of season files downloaded at the same time, defaults to 4.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
+
+    Returns:
+        pl.LazyFrame: Lazy frame over the data of `load_nhl_schedule()`.
+
+    Raises:
+        ValueError: If `season` is less than 2002.
+    """
+    return scan_seasons(
+        NHL_TEAM_SCHEDULE_URL, seasons, min_season=2002, max_workers=max_workers, cache_dir=cache_dir, compact=compact
+    )
+
+
+def iter_nhl_schedule(
+    seasons: List[int], return_as_pandas=False, return_as=None, by="season", prefetch=1, cache_dir=None, columns=None
+) -> Iterator[pl.DataFrame]:
+    """Iterate over NHL schedule data, one season at a time
+
+    Example:
+        `for df in sportsdataverse.nhl.iter_nhl_schedule(seasons=range(2002,2021)): print(df.shape)`
+
+    Args:
+        seasons (list): Used to define different seasons. 2002 is the earliest available season.
+        return_as_pandas (bool): If True, yields pandas dataframes. If False, yields polars dataframes.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        by (str): "season" yields one dataframe per season, "row_group" one per parquet row group.
+        prefetch (int): Number of seasons downloaded in the background ahead of the current one.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None.
+
+    Returns:
+        Iterator[pl.DataFrame]: One dataframe per season (or row group) of `load_nhl_schedule()`.
+
+    Raises:
+        ValueError: If `season` is less than 2002.
+    """
+    frames = iter_seasons(
+        NHL_TEAM_SCHEDULE_URL, seasons, min_season=2002, by=by, prefetch=prefetch, cache_dir=cache_dir, columns=columns
+    )
+    return (convert_frame(df, return_as_pandas, return_as, use_pyarrow_extension_array=True) for df in frames)
+
+
+def refresh_nhl_schedule(store: DataStore, seasons: Optional[List[int]] = None) -> Dict[int, int]:
+    """Refresh NHL schedule data kept in a `DataStore`
+
+    Changed season files are re-downloaded as a whole, since their rows are updated in place.
+
+    Example:
+        `sportsdataverse.nhl.refresh_nhl_schedule(sportsdataverse.store.DataStore())`
+
+    Args:
+        store (DataStore): Store holding the copy, under `league="nhl"` and `dataset="schedule"`.
+        seasons (list): Seasons to refresh, defaults to the most recent season.
+
+    Returns:
+        dict: Number of rows written per season.
+    """
+    seasons = [most_recent_nhl_season()] if seasons is None else seasons
+    return refresh_seasons(
+        NHL_TEAM_SCHEDULE_URL, seasons, min_season=2002, store=store, league="nhl", dataset="schedule", key=None
+    )
 
 
-def load_nhl_team_boxscore(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
+def load_nhl_team_boxscore(
+    seasons: List[int],
+    return_as_pandas=False,
+    return_as=None,
+    max_workers=None,
+    progress=True,
+    cache_dir=None,
+    columns=None,
+    compact=False,
+) -> pl.DataFrame:
     """Load NHL team boxscore data
 
     Example:
@@ -76,6 +271,14 @@ def load_nhl_team_boxscore(seasons: List[int], return_as_pandas=False) -> pl.Dat
     Args:
         seasons (list): Used to define different seasons. 2011 is the earliest available season.
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        max_workers (int): Number of seasons downloaded at the same time, defaults to 4.
+        progress (bool or callable): If True, show a tqdm progress bar. A callable is called as
+            `progress(done, total)` after each season.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None. Without a file cache only these columns are downloaded.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
 
     Returns:
         pl.DataFrame: Polars dataframe containing the
@@ -84,18 +287,101 @@ def load_nhl_team_boxscore(seasons: List[int], return_as_pandas=False) -> pl.Dat
     Raises:
         ValueError: If `season` is less than 2011.
     """
-    data = pl.DataFrame()
-    if type(seasons) is int:
-        seasons = [seasons]
-    for i in tqdm(seasons):
-        if int(i) < 2011:
-            raise SeasonNotFoundError("season cannot be less than 2011")
-        i_data = pl.read_parquet(NHL_TEAM_BOX_URL.format(season=i), use_pyarrow=True, columns=None)
-        data = pl.concat([data, i_data], how="vertical")
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
+    data = load_seasons(
+        NHL_TEAM_BOX_URL,
+        seasons,
+        min_season=2011,
+        max_workers=max_workers,
+        progress=progress,
+        cache_dir=cache_dir,
+        columns=columns,
+        compact=compact,
+    )
+    return convert_frame(data, return_as_pandas, return_as, use_pyarrow_extension_array=True)
 
 
-def load_nhl_player_boxscore(seasons: List[int], return_as_pandas=False) -> pl.DataFrame:
+def scan_nhl_team_boxscore(seasons: List[int], max_workers=None, cache_dir=None, compact=False) -> pl.LazyFrame:
+    """Lazily scan NHL team boxscore data
+
+    Example:
+        `nhl_df = sportsdataverse.nhl.scan_nhl_team_boxscore(seasons=range(2011,2022)).collect()`
+
+    Args:
+        seasons (list): Used to define different seasons. 2011 is the earliest available season.
+        max_workers (int): Number of season files downloaded at the same time, defaults to 4.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
+
+    Returns:
+        pl.LazyFrame: Lazy frame over the data of `load_nhl_team_boxscore()`.
+
+    Raises:
+        ValueError: If `season` is less than 2011.
+    """
+    return scan_seasons(
+        NHL_TEAM_BOX_URL, seasons, min_season=2011, max_workers=max_workers, cache_dir=cache_dir, compact=compact
+    )
+
+
+def iter_nhl_team_boxscore(
+    seasons: List[int], return_as_pandas=False, return_as=None, by="season", prefetch=1, cache_dir=None, columns=None
+) -> Iterator[pl.DataFrame]:
+    """Iterate over NHL team boxscore data, one season at a time
+
+    Example:
+        `for df in sportsdataverse.nhl.iter_nhl_team_boxscore(seasons=range(2011,2022)): print(df.shape)`
+
+    Args:
+        seasons (list): Used to define different seasons. 2011 is the earliest available season.
+        return_as_pandas (bool): If True, yields pandas dataframes. If False, yields polars dataframes.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        by (str): "season" yields one dataframe per season, "row_group" one per parquet row group.
+        prefetch (int): Number of seasons downloaded in the background ahead of the current one.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None.
+
+    Returns:
+        Iterator[pl.DataFrame]: One dataframe per season (or row group) of `load_nhl_team_boxscore()`.
+
+    Raises:
+        ValueError: If `season` is less than 2011.
+    """
+    frames = iter_seasons(
+        NHL_TEAM_BOX_URL, seasons, min_season=2011, by=by, prefetch=prefetch, cache_dir=cache_dir, columns=columns
+    )
+    return (convert_frame(df, return_as_pandas, return_as, use_pyarrow_extension_array=True) for df in frames)
+
+
+def refresh_nhl_team_boxscore(store: DataStore, seasons: Optional[List[int]] = None) -> Dict[int, int]:
+    """Refresh NHL team boxscore data kept in a `DataStore`
+
+    Only the games missing from the store are downloaded from a changed season file.
+
+    Example:
+        `sportsdataverse.nhl.refresh_nhl_team_boxscore(sportsdataverse.store.DataStore())`
+
+    Args:
+        store (DataStore): Store holding the copy, under `league="nhl"` and `dataset="team_box"`.
+        seasons (list): Seasons to refresh, defaults to the most recent season.
+
+    Returns:
+        dict: Number of rows written per season.
+    """
+    seasons = [most_recent_nhl_season()] if seasons is None else seasons
+    return refresh_seasons(NHL_TEAM_BOX_URL, seasons, min_season=2011, store=store, league="nhl", dataset="team_box")
+
+
+def load_nhl_player_boxscore(
+    seasons: List[int],
+    return_as_pandas=False,
+    return_as=None,
+    max_workers=None,
+    progress=True,
+    cache_dir=None,
+    columns=None,
+    compact=False,
+) -> pl.DataFrame:
     """Load NHL player boxscore data
 
     Example:
@@ -104,6 +390,14 @@ def load_nhl_player_boxscore(seasons: List[int], return_as_pandas=False) -> pl.D
     Args:
         seasons (list): Used to define different seasons. 2011 is the earliest available season.
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        max_workers (int): Number of seasons downloaded at the same time, defaults to 4.
+        progress (bool or callable): If True, show a tqdm progress bar. A callable is called as
+            `progress(done, total)` after each season.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None. Without a file cache only these columns are downloaded.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
 
     Returns:
         pl.DataFrame: Polars dataframe containing the
@@ -112,18 +406,94 @@ def load_nhl_player_boxscore(seasons: List[int], return_as_pandas=False) -> pl.D
     Raises:
         ValueError: If `season` is less than 2011.
     """
-    data = pl.DataFrame()
-    if type(seasons) is int:
-        seasons = [seasons]
-    for i in tqdm(seasons):
-        if int(i) < 2011:
-            raise SeasonNotFoundError("season cannot be less than 2011")
-        i_data = pl.read_parquet(NHL_PLAYER_BOX_URL.format(season=i), use_pyarrow=True, columns=None)
-        data = pl.concat([data, i_data], how="vertical")
-    return data.to_pandas(use_pyarrow_extension_array=True) if return_as_pandas else data
+    data = load_seasons(
+        NHL_PLAYER_BOX_URL,
+        seasons,
+        min_season=2011,
+        max_workers=max_workers,
+        progress=progress,
+        cache_dir=cache_dir,
+        columns=columns,
+        compact=compact,
+    )
+    return convert_frame(data, return_as_pandas, return_as, use_pyarrow_extension_array=True)
+
+
+def scan_nhl_player_boxscore(seasons: List[int], max_workers=None, cache_dir=None, compact=False) -> pl.LazyFrame:
+    """Lazily scan NHL player boxscore data
+
+    Example:
+        `nhl_df = sportsdataverse.nhl.scan_nhl_player_boxscore(seasons=range(2011,2022)).collect()`
+
+    Args:
+        seasons (list): Used to define different seasons. 2011 is the earliest available season.
+        max_workers (int): Number of season files downloaded at the same time, defaults to 4.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        compact (bool): If True, cast the data to smaller dtypes with `loader_utils.compact_frame()`.
+
+    Returns:
+        pl.LazyFrame: Lazy frame over the data of `load_nhl_player_boxscore()`.
+
+    Raises:
+        ValueError: If `season` is less than 2011.
+    """
+    return scan_seasons(
+        NHL_PLAYER_BOX_URL, seasons, min_season=2011, max_workers=max_workers, cache_dir=cache_dir, compact=compact
+    )
+
+
+def iter_nhl_player_boxscore(
+    seasons: List[int], return_as_pandas=False, return_as=None, by="season", prefetch=1, cache_dir=None, columns=None
+) -> Iterator[pl.DataFrame]:
+    """Iterate over NHL player boxscore data, one season at a time
+
+    Example:
+        `for df in sportsdataverse.nhl.iter_nhl_player_boxscore(seasons=range(2011,2022)): print(df.shape)`
+
+    Args:
+        seasons (list): Used to define different seasons. 2011 is the earliest available season.
+        return_as_pandas (bool): If True, yields pandas dataframes. If False, yields polars dataframes.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
+        by (str): "season" yields one dataframe per season, "row_group" one per parquet row group.
+        prefetch (int): Number of seasons downloaded in the background ahead of the current one.
+        cache_dir (str): Directory of the local file cache, defaults to `loader_utils.enable_file_cache()`.
+        columns (list): Columns to read, all of them if None.
+
+    Returns:
+        Iterator[pl.DataFrame]: One dataframe per season (or row group) of `load_nhl_player_boxscore()`.
+
+    Raises:
+        ValueError: If `season` is less than 2011.
+    """
+    frames = iter_seasons(
+        NHL_PLAYER_BOX_URL, seasons, min_season=2011, by=by, prefetch=prefetch, cache_dir=cache_dir, columns=columns
+    )
+    return (convert_frame(df, return_as_pandas, return_as, use_pyarrow_extension_array=True) for df in frames)
+
+
+def refresh_nhl_player_boxscore(store: DataStore, seasons: Optional[List[int]] = None) -> Dict[int, int]:
+    """Refresh NHL player boxscore data kept in a `DataStore`
+
+    Only the games missing from the store are downloaded from a changed season file.
+
+    Example:
+        `sportsdataverse.nhl.refresh_nhl_player_boxscore(sportsdataverse.store.DataStore())`
+
+    Args:
+        store (DataStore): Store holding the copy, under `league="nhl"` and `dataset="player_box"`.
+        seasons (list): Seasons to refresh, defaults to the most recent season.
+
+    Returns:
+        dict: Number of rows written per season.
+    """
+    seasons = [most_recent_nhl_season()] if seasons is None else seasons
+    return refresh_seasons(
+        NHL_PLAYER_BOX_URL, seasons, min_season=2011, store=store, league="nhl", dataset="player_box"
+    )
 
 
-def nhl_teams(return_as_pandas=False) -> pl.DataFrame:
+def nhl_teams(return_as_pandas=False, return_as=None) -> pl.DataFrame:
     """Load NHL team ID information and logos
 
     Example:
@@ -131,8 +501,11 @@ def nhl_teams(return_as_pandas=False) -> pl.DataFrame:
 
     Args:
         return_as_pandas (bool): If True, returns a pandas dataframe. If False, returns a polars dataframe.
+        return_as (str): "polars", "pandas" or "arrow" (a `pyarrow.Table`, without copying), overriding
+            `return_as_pandas`.
 
     Returns:
         pl.DataFrame: Polars dataframe containing teams available for the requested seasons.
     """
-    return pl.read_csv(NHL_TEAM_LOGO_URL).to_pandas if return_as_pandas else pl.read_csv(NHL_TEAM_LOGO_URL)
+    data = pl.read_csv(NHL_TEAM_LOGO_URL)
+    return convert_frame(data, return_as_pandas, return_as, use_pyarrow_extension_array=True)
@@ -7,7 +7,7 @@ import numpy as np
 import pandas as pd
 import polars as pl
 
-from sportsdataverse.dl_utils import download, flatten_json_iterative, key_check
+from sportsdataverse.dl_utils import adownload, download, flatten_json_iterative, key_check, run_in_thread
 
 
 def espn_nhl_pbp(game_id: int, raw=False, **kwargs) -> Dict:
@@ -24,10 +24,32 @@ def espn_nhl_pbp(game_id: int, raw=False, **kwargs) -> Dict:
     Example:
         `nhl_df = sportsdataverse.nhl.espn_nhl_pbp(game_id=401247153)`
     """
-    pbp_txt = {}
     summary_url = f"http://site.api.espn.com/apis/site/v2/sports/hockey/nhl/summary?event={game_id}"
     summary_resp = download(summary_url, **kwargs)
-    summary = summary_resp.json()
+    return helper_nhl_summary(game_id, summary_resp.json(), raw=raw)
+
+
+async def aespn_nhl_pbp(game_id: int, raw=False, **kwargs) -> Dict:
+    """aespn_nhl_pbp() - Coroutine version of `espn_nhl_pbp()`. The summary is downloaded with
+    `dl_utils.adownload()` and the play-by-play processing runs in a worker thread.
+
+    Args:
+        game_id (int): Unique game_id, can be obtained from espn_nhl_schedule().
+        raw (bool): If True, returns the raw json from the API endpoint. If False, returns a cleaned dictionary of datasets.
+
+    Returns:
+        Dict: Same dictionary as `espn_nhl_pbp()`.
+
+    Example:
+        `nhl_df = await sportsdataverse.nhl.aespn_nhl_pbp(game_id=401247153)`
+    """
+    summary_url = f"http://site.api.espn.com/apis/site/v2/sports/hockey/nhl/summary?event={game_id}"
+    summary_resp = await adownload(summary_url, **kwargs)
+    return await run_in_thread(lambda: helper_nhl_summary(game_id, summary_resp.json(), raw=raw))
+
+
+def helper_nhl_summary(game_id, summary, raw=False):
+    pbp_txt = {}
     for k in [
         "plays",
         "seasonseries",
@@ -0,0 +1,209 @@
+import hashlib
+import io
+import os
+import tempfile
+import threading
+from typing import List, Optional
+
+import polars as pl
+import pyarrow.parquet as pq
+
+from sportsdataverse.dl_utils import get_session
+from sportsdataverse.metrics import RequestTrace
+from sportsdataverse.rate_limit import wait_for_rate_limit
+
+FOOTER_CACHE_DIR = os.path.join(tempfile.gettempdir(), "sportsdataverse-footers")
+TAIL_SIZE = 64 * 1024
+
+
+class HTTPRangeFile(io.RawIOBase):
+    """HTTPRangeFile - Seekable, read-only file over an url that downloads only the byte ranges read from it.
+
+    Every read is one `Range` request, except reads from the preloaded `tail` (the parquet footer). If the
+    server ignores `Range` and answers 200, the whole body it sent is kept and served from memory.
+
+    Args:
+        url (str): Url of the file, after redirects.
+        size (int): Size of the file in bytes.
+        tail (bytes): The last `len(tail)` bytes of the file, if already known.
+        timeout (float): Timeout in seconds of each request.
+        etag (str): Version of the file (`ETag`, else `Last-Modified`) when it was opened.
+    """
+
+    def __init__(self, url, size, tail=b"", timeout=30, etag=None):
+        super().__init__()
+        self.url = url
+        self.size = size
+        self.etag = etag
+        self.timeout = timeout
+        self.requests = 0
+        self.bytes_fetched = 0
+        self._pos = 0
+        self._tail = tail
+        self._body = None
+        self._lock = threading.Lock()
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._pos
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            self._pos = offset
+        elif whence == io.SEEK_CUR:
+            self._pos += offset
+        else:
+            self._pos = self.size + offset
+        return self._pos
+
+    def readinto(self, b):
+        with self._lock:
+            n = max(min(len(b), self.size - self._pos), 0)
+            if n:
+                b[:n] = self.read_range(self._pos, self._pos + n)
+                self._pos += n
+            return n
+
+    def read_range(self, start, end) -> bytes:
+        tail_start = self.size - len(self._tail)
+        if self._tail and start >= tail_start:
+            return self._tail[start - tail_start : end - tail_start]
+        if self._body is not None:
+            return self._body[start:end]
+        response = _get(self.url, {"Range": f"bytes={start}-{end - 1}"}, self.timeout)
+        self.requests += 1
+        self.bytes_fetched += len(response.content)
+        if response.status_code != 206:
+            self._body = response.content
+            return self._body[start:end]
+        return response.content
+
+
+def read_parquet_columns(
+    url,
+    columns: Optional[List[str]] = None,
+    row_groups: Optional[List[int]] = None,
+    footer_cache_dir=None,
+    timeout=30,
+) -> pl.DataFrame:
+    """read_parquet_columns() - Read some columns of a remote parquet file with HTTP range requests.
+
+    The last `TAIL_SIZE` bytes, which hold the footer, are read first, from the footer cache when the
+    file's `ETag` still matches, and then only the column chunks of `columns` in `row_groups` are downloaded.
+
+    Args:
+        url (str): Url of the parquet file. Redirects, such as those of GitHub release assets, are
+            resolved once with a HEAD request.
+        columns (list): Columns to read, all of them if None.
+        row_groups (list): Indices of the row groups to read, all of them if None.
+        footer_cache_dir (str): Directory of the cached footers, defaults to `FOOTER_CACHE_DIR`.
+        timeout (float): Timeout in seconds of each request.
+
+    Returns:
+        pl.DataFrame: Polars dataframe of the requested columns.
+
+    Example:
+        `sportsdataverse.range_reader.read_parquet_columns(config.NFL_BASE_URL.format(season=2022), columns=["game_id", "play_id", "epa"])`
+    """
+    f = open_parquet_url(url, footer_cache_dir=footer_cache_dir, timeout=timeout)
+    parquet_file = pq.ParquetFile(f, pre_buffer=True)
+    if row_groups is None:
+        table = parquet_file.read(columns=columns, use_threads=True)
+    else:
+        table = parquet_file.read_row_groups(row_groups, columns=columns, use_threads=True)
+    return pl.from_arrow(table)
+
+
+def open_parquet_url(url, footer_cache_dir=None, timeout=30) -> HTTPRangeFile:
+    """open_parquet_url() - `HTTPRangeFile` over a remote parquet file with its footer already loaded.
+
+    The size of the file comes from the `Content-Length` of a HEAD request. When the server does not send
+    one (chunked or compressed responses), the tail is requested with a suffix `Range` and the size read
+    from its `Content-Range`, and failing that the whole file is downloaded.
+    """
+    with RequestTrace(url) as trace:
+        trace.attempts = 1
+        wait_for_rate_limit(url)
+        trace.response = head = get_session(url).head(url, allow_redirects=True, timeout=timeout)
+        trace.ttfb = head.elapsed.total_seconds()
+        head.raise_for_status()
+    etag = head.headers.get("ETag") or head.headers.get("Last-Modified")
+    footer_path = _footer_path(url, etag, footer_cache_dir)
+    size = _content_length(head.headers)
+    if size is None:
+        f = _open_by_suffix(head.url, timeout, etag)
+    else:
+        tail = _read_footer(footer_path)
+        if tail is not None and len(tail) <= size:
+            return HTTPRangeFile(head.url, size, tail=tail, timeout=timeout, etag=etag)
+        f = HTTPRangeFile(head.url, size, timeout=timeout, etag=etag)
+
+    tail = f.read_range(max(f.size - TAIL_SIZE, 0), f.size)
+    footer_size = int.from_bytes(tail[-8:-4], "little") + 8
+    if footer_size > len(tail):
+        tail = f.read_range(f.size - footer_size, f.size - len(tail)) + tail
+    # keep the whole tail: pyarrow itself reads the last 64 KiB when it opens the file
+    f._tail = tail
+    if footer_path is not None:
+        _write_footer(footer_path, tail)
+    return f
+
+
+def _content_length(headers) -> Optional[int]:
+    length = headers.get("Content-Length")
+    # the length of a compressed body is not the size of the file
+    if length is None or not length.isdigit() or headers.get("Content-Encoding", "identity") != "identity":
+        return None
+    return int(length)
+
+
+def _open_by_suffix(url, timeout, etag) -> HTTPRangeFile:
+    response = _get(url, {"Range": f"bytes=-{TAIL_SIZE}"}, timeout)
+    total = response.headers.get("Content-Range", "").rpartition("/")[2]
+    if response.status_code == 206 and total.isdigit():
+        return HTTPRangeFile(url, int(total), tail=response.content, timeout=timeout, etag=etag)
+    if response.status_code == 206:
+        response = _get(url, None, timeout)
+    f = HTTPRangeFile(url, len(response.content), timeout=timeout, etag=etag)
+    f._body = response.content
+    return f
+
+
+def _get(url, headers, timeout):
+    with RequestTrace(url) as trace:
+        trace.attempts = 1
+        wait_for_rate_limit(url)
+        trace.response = response = get_session(url).get(url, headers=headers, timeout=timeout)
+        trace.ttfb = response.elapsed.total_seconds()
+        response.raise_for_status()
+    return response
+
+
+def _footer_path(url, etag, footer_cache_dir):
+    if etag is None:
+        return None
+    key = hashlib.sha1(f"{url}\n{etag}".encode()).hexdigest()
+    return os.path.join(footer_cache_dir or FOOTER_CACHE_DIR, f"{key}.footer")
+
+
+def _read_footer(path):
+    if path is None:
+        return None
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _write_footer(path, tail):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(tail)
+    os.replace(tmp_path, path)
@@ -0,0 +1,242 @@
+import asyncio
+import os
+import re
+import tempfile
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+_LIMITER_LOCK = threading.Lock()
+_LIMITER = None
+
+_ATHLETE_PATH = re.compile(r"/athletes?/")
+_RELEASE_SUFFIXES = (".parquet", ".csv", ".csv.gz", ".rds")
+_RELEASE_HOSTS = {"github.com", "raw.githubusercontent.com", "objects.githubusercontent.com"}
+
+
+def endpoint_family(url) -> str:
+    """endpoint_family() - Coarse endpoint family of an ESPN url, used to pick a rate limit.
+
+    Args:
+        url (str): Request url.
+
+    Returns:
+        str: One of "athletes" (core API athlete lookups), "summary", "scoreboard", "teams", "releases"
+        (parquet/csv/rds data files of the sportsdataverse data repositories) or "other".
+
+    Example:
+        `sportsdataverse.rate_limit.endpoint_family("https://site.api.espn.com/apis/site/v2/sports/basketball/nba/summary")`
+    """
+    parts = urlsplit(url)
+    path = parts.path.lower()
+    if path.endswith(_RELEASE_SUFFIXES) or parts.netloc.lower() in _RELEASE_HOSTS:
+        return "releases"
+    if _ATHLETE_PATH.search(path):
+        return "athletes"
+    for family in ("summary", "scoreboard", "teams"):
+        if f"/{family}" in path:
+            return family
+    return "other"
+
+
+class TokenBucket:
+    """TokenBucket - Thread-safe token bucket refilled at `rate` tokens per second up to `burst` tokens.
+
+    `reserve()` takes a token immediately and returns how long the caller must wait before using it,
+    which lets blocking and asyncio callers share one bucket.
+
+    Args:
+        rate (float): Sustained requests per second.
+        burst (int): Maximum number of requests that may go out back to back.
+    """
+
+    def __init__(self, rate, burst=1):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.burst = float(max(burst, 1))
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens, delay = _take(self._tokens, now - self._updated, self.rate, self.burst)
+            self._updated = now
+            return delay
+
+
+class FileTokenBucket(TokenBucket):
+    """FileTokenBucket - Token bucket whose state lives in a file guarded by `fcntl.flock`.
+
+    Every process pointing at the same `path` shares the bucket, so a pool of worker processes stays
+    under one combined rate. Only available where `fcntl` is (Linux, macOS).
+
+    Args:
+        rate (float): Sustained requests per second, across all processes.
+        burst (int): Maximum number of requests that may go out back to back.
+        path (str): State file, created if missing.
+    """
+
+    def __init__(self, rate, burst=1, path=None):
+        if fcntl is None:
+            raise RuntimeError("FileTokenBucket needs fcntl, use backend='thread' on this platform")
+        super().__init__(rate, burst)
+        self.path = path
+
+    def reserve(self) -> float:
+        with self._lock:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                now = time.time()
+                state = os.read(fd, 64).split()
+                tokens, updated = (float(state[0]), float(state[1])) if len(state) == 2 else (self.burst, now)
+                tokens, delay = _take(tokens, now - updated, self.rate, self.burst)
+                os.lseek(fd, 0, os.SEEK_SET)
+                os.ftruncate(fd, 0)
+                os.write(fd, f"{tokens!r} {now!r}".encode())
+                return delay
+            finally:
+                os.close(fd)
+
+
+def _take(tokens, elapsed, rate, burst):
+    tokens = min(burst, tokens + max(elapsed, 0.0) * rate) - 1
+    return tokens, max(-tokens / rate, 0.0)
+
+
+class RateLimiter:
+    """RateLimiter - Token buckets keyed by host and endpoint family.
+
+    A url uses the first of these rules that is configured: `(host, family)`, `(host, None)`,
+    `(None, family)`, `(None, None)`. Urls matching no rule are not limited.
+
+    Args:
+        rates (Dict[Tuple[str, str], Tuple[float, int]]): Maps `(host, family)` to `(rate, burst)`,
+            where either key part may be None as a wildcard.
+        backend (str): "thread" for a limiter shared by the threads of this process, "file" to share
+            it across processes through lock files in `lock_dir`.
+        lock_dir (str): Directory of the state files of the "file" backend.
+    """
+
+    def __init__(self, rates, backend="thread", lock_dir=None):
+        if backend not in ("thread", "file"):
+            raise ValueError("backend must be 'thread' or 'file'")
+        if backend == "file":
+            lock_dir = lock_dir or os.path.join(tempfile.gettempdir(), "sportsdataverse-rate-limits")
+            os.makedirs(lock_dir, exist_ok=True)
+        self.rates = dict(rates)
+        self.backend = backend
+        self.lock_dir = lock_dir
+        self.waited = 0.0
+        self.throttled = 0
+        self._buckets = {}
+        self._lock = threading.Lock()
+        for rule, (rate, burst) in self.rates.items():
+            self._buckets[rule] = self._new_bucket(rule, rate, burst)
+
+    def _new_bucket(self, rule, rate, burst):
+        if self.backend == "thread":
+            return TokenBucket(rate, burst)
+        name = re.sub(r"[^A-Za-z0-9.-]", "_", f"{rule[0] or 'any'}__{rule[1] or 'any'}")
+        return FileTokenBucket(rate, burst, path=os.path.join(self.lock_dir, f"{name}.bucket"))
+
+    def bucket_for(self, url) -> Optional[TokenBucket]:
+        host = urlsplit(url).netloc.lower()
+        family = endpoint_family(url)
+        for rule in ((host, family), (host, None), (None, family), (None, None)):
+            bucket = self._buckets.get(rule)
+            if bucket is not None:
+                return bucket
+        return None
+
+    def reserve(self, url) -> float:
+        bucket = self.bucket_for(url)
+        if bucket is None:
+            return 0.0
+        delay = bucket.reserve()
+        if delay > 0:
+            with self._lock:
+                self.throttled += 1
+                self.waited += delay
+        return delay
+
+    def acquire(self, url) -> float:
+        """Block until a request to `url` may go out, returning the seconds waited."""
+        delay = self.reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def aacquire(self, url) -> float:
+        """Coroutine version of `acquire()`."""
+        delay = self.reserve(url)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+
+DEFAULT_RATES = {
+    ("site.api.espn.com", "summary"): (10, 20),
+    ("site.api.espn.com", None): (20, 40),
+    ("sports.core.api.espn.com", "athletes"): (40, 80),
+    ("sports.core.api.espn.com", None): (20, 40),
+}
+
+
+def configure_rate_limits(
+    rates: Optional[Dict[Tuple[Optional[str], Optional[str]], Tuple[float, int]]] = None,
+    backend="thread",
+    lock_dir=None,
+) -> RateLimiter:
+    """configure_rate_limits() - Turn on the rate limiter consulted by every `download()` call.
+
+    Args:
+        rates (Dict): Maps `(host, family)` to `(requests per second, burst)`, see `RateLimiter`.
+            Defaults to `DEFAULT_RATES`, which keeps core API athlete lookups and site API summaries
+            on separate buckets.
+        backend (str): "thread" (this process) or "file" (all processes sharing `lock_dir`).
+        lock_dir (str): Directory of the "file" backend state files.
+
+    Returns:
+        RateLimiter: The limiter now in use.
+
+    Example:
+        `sportsdataverse.rate_limit.configure_rate_limits({("sports.core.api.espn.com", "athletes"): (50, 100)}, backend="file")`
+    """
+    global _LIMITER
+    with _LIMITER_LOCK:
+        _LIMITER = RateLimiter(DEFAULT_RATES if rates is None else rates, backend=backend, lock_dir=lock_dir)
+        return _LIMITER
+
+
+def disable_rate_limits():
+    """disable_rate_limits() - Turn off the rate limiter set up by `configure_rate_limits()`."""
+    global _LIMITER
+    with _LIMITER_LOCK:
+        _LIMITER = None
+
+
+def get_rate_limiter() -> Optional[RateLimiter]:
+    """get_rate_limiter() - The limiter set up by `configure_rate_limits()`, or None."""
+    return _LIMITER
+
+
+def wait_for_rate_limit(url) -> float:
+    """wait_for_rate_limit() - Block until the configured limiter lets a request to `url` go out."""
+    limiter = _LIMITER
+    return limiter.acquire(url) if limiter is not None else 0.0
+
+
+async def await_rate_limit(url) -> float:
+    """await_rate_limit() - Coroutine version of `wait_for_rate_limit()`."""
+    limiter = _LIMITER
+    return await limiter.aacquire(url) if limiter is not None else 0.0
@@ -0,0 +1,302 @@
+import os
+import shutil
+import threading
+import uuid
+from typing import Callable, Dict, List, Optional, Sequence
+
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+DEFAULT_STORE_DIR = "~/.sportsdataverse/store"
+DEFAULT_PARTITION_BY = ("season", "week")
+WRITE_MODES = ("append", "overwrite")
+SCHEMA_FILE = "_common_metadata"
+
+_SCHEMA_LOCK = threading.Lock()
+
+
+class DataStore:
+    """DataStore - Local hive-partitioned parquet lake of loader outputs and processed plays.
+
+    Files are laid out as `<root>/league=<league>/dataset=<dataset>/season=<season>/week=<week>/*.parquet`.
+    The partition columns are stored in the directory names only, as hive readers expect, and are added
+    back by `scan()`, so `scan().filter(pl.col("season") == 2022)` only opens the files of 2022.
+
+    Writes go to hidden temporary files and directories (ignored by readers) that are renamed into place,
+    so a scan never sees half-written data. The schema of every file written to a dataset is merged into
+    its `_common_metadata` file, which `scan()` reads instead of the footer of every file.
+
+    Args:
+        root (str): Directory of the store.
+
+    Example:
+        `store = sportsdataverse.store.DataStore()`
+        `store.materialize(sportsdataverse.nfl.load_nfl_pbp, "nfl", "pbp", seasons=range(2019, 2023))`
+        `store.scan("nfl", "pbp").filter(pl.col("season") >= 2021).select(["game_id", "epa"]).collect()`
+    """
+
+    def __init__(self, root=DEFAULT_STORE_DIR):
+        self.root = os.path.abspath(os.path.expanduser(root))
+
+    def dataset_path(self, league, dataset) -> str:
+        return os.path.join(self.root, f"league={league}", f"dataset={dataset}")
+
+    def write(
+        self,
+        data,
+        league: str,
+        dataset: str,
+        mode="append",
+        partition_by: Sequence[str] = DEFAULT_PARTITION_BY,
+        name: Optional[str] = None,
+    ) -> List[str]:
+        """write() - Write a frame into the partitions of its `partition_by` values.
+
+        Args:
+            data (pl.DataFrame, pd.DataFrame, pa.Table or list): Rows to write. A list is read as a list
+                of dicts, such as the processed plays of `CFBPlayProcess`.
+            league (str): League of the data, e.g. "nfl".
+            dataset (str): Name of the dataset, e.g. "pbp" or "schedule".
+            mode (str): "append" adds a file to each partition; "overwrite" replaces every partition present
+                in `data` and leaves the other ones alone.
+            partition_by (list): Partition columns, in directory order. Columns missing from `data` are
+                skipped, so a dataset without weeks is partitioned by season only.
+            name (str): File name (without extension) inside each partition. A file of the same name is
+                replaced, which lets one game be rewritten without touching the rest of its week.
+
+        Returns:
+            list: Paths of the written files.
+
+        Raises:
+            ValueError: If `mode` is unknown or a partition column has nulls.
+        """
+        if mode not in WRITE_MODES:
+            raise ValueError(f"mode must be one of {WRITE_MODES}, not {mode!r}")
+        data = _to_polars(data)
+        keys = [key for key in partition_by if key in data.columns]
+        base = self.dataset_path(league, dataset)
+        return _write_parts(data, base, base, keys, mode, name)
+
+    def replace(
+        self, data, league: str, dataset: str, partition_by: Sequence[str] = DEFAULT_PARTITION_BY, **partition
+    ) -> List[str]:
+        """replace() - Replace one partition as a whole, e.g. a season, with the rows of `data`.
+
+        The new partition is written to a hidden directory that is then swapped with the old one, so the old
+        rows stay in place if the write fails, and sub-partitions missing from `data` (weeks) are removed.
+
+        Args:
+            data (pl.DataFrame, pd.DataFrame, pa.Table or list): New rows of the partition.
+            league (str): League of the data.
+            dataset (str): Name of the dataset.
+            partition_by (list): Partition columns, in directory order.
+            **partition: Values of the partition replaced, e.g. `season=2023`.
+
+        Returns:
+            list: Paths of the written files.
+
+        Raises:
+            ValueError: If no partition is given or a partition column of `data` has nulls.
+
+        Example:
+            `store.replace(sportsdataverse.nfl.load_nfl_schedule(seasons=[2023]), "nfl", "schedule", season=2023)`
+        """
+        if not partition:
+            raise ValueError("replace() needs the partition to replace, e.g. season=2023")
+        data = _to_polars(data)
+        data = data.drop([key for key in partition if key in data.columns])
+        base = self.dataset_path(league, dataset)
+        directory = os.path.join(base, *(f"{key}={partition[key]}" for key in _partition_keys(partition)))
+        parent, leaf = os.path.split(directory)
+        token = uuid.uuid4().hex
+        tmp_dir = os.path.join(parent, f".{leaf}.{token}.tmp")
+        keys = [key for key in partition_by if key in data.columns]
+        try:
+            paths = _write_parts(data, base, tmp_dir, keys, "append", None)
+            os.makedirs(tmp_dir, exist_ok=True)
+            if os.path.isdir(directory):
+                old_dir = os.path.join(parent, f".{leaf}.{token}.old")
+                os.rename(directory, old_dir)
+                try:
+                    os.rename(tmp_dir, directory)
+                except OSError:
+                    os.rename(old_dir, directory)
+                    raise
+                shutil.rmtree(old_dir, ignore_errors=True)
+            else:
+                os.rename(tmp_dir, directory)
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        return [directory + path[len(tmp_dir) :] for path in paths]
+
+    def write_plays(self, result: Dict, league: str, dataset="plays") -> List[str]:
+        """write_plays() - Write the plays of one processed game, replacing any earlier copy of that game.
+
+        Args:
+            result (dict): Output of `CFBPlayProcess` or `NFLPlayProcess` (`run_processing_pipeline()` or
+                `run_cleaning_pipeline()`), with any `return_as`.
+            league (str): "cfb" or "nfl".
+            dataset (str): Name of the dataset.
+
+        Returns:
+            list: Paths of the written files.
+
+        Example:
+            `store.write_plays(sportsdataverse.cfb.CFBPlayProcess(gameId=401256137, return_as="arrow").run_processing_pipeline(), "cfb")`
+        """
+        plays = _to_polars(result["plays"])
+        if plays.is_empty():
+            return []
+        return self.write(plays, league, dataset, mode="append", name=f"game-{result['gameId']}")
+
+    def materialize(
+        self, loader: Callable, league: str, dataset: str, seasons, mode="overwrite", **kwargs
+    ) -> List[str]:
+        """materialize() - Load seasons one at a time with a `load_*` function and write them to the store.
+
+        Args:
+            loader (callable): Loader taking `seasons`, such as `sportsdataverse.nfl.load_nfl_pbp`.
+            league (str): League of the data.
+            dataset (str): Name of the dataset.
+            seasons (list): Seasons to load, or a single season.
+            mode (str): Write mode, "overwrite" by default so that a season is refreshed as a whole.
+            **kwargs: Passed to `loader`.
+
+        Returns:
+            list: Paths of the written files.
+        """
+        seasons = [seasons] if isinstance(seasons, int) else list(seasons)
+        paths = []
+        for season in seasons:
+            data = _to_polars(loader(seasons=[season], **kwargs))
+            if "season" not in data.columns:
+                data = data.with_columns(season=pl.lit(season, dtype=pl.Int32))
+            paths.extend(self.write(data, league, dataset, mode=mode))
+        return paths
+
+    def partitions(self, league, dataset) -> List[Dict]:
+        """partitions() - Partition values present in a dataset, e.g. `[{"season": 2022, "week": 1}, ...]`."""
+        base = self.dataset_path(league, dataset)
+        found = []
+        for directory, subdirs, files in os.walk(base):
+            subdirs[:] = [d for d in subdirs if not d.startswith((".", "_"))]
+            if subdirs or not any(f.endswith(".parquet") for f in files):
+                continue
+            values = {}
+            for level in os.path.relpath(directory, base).split(os.sep):
+                key, _, value = level.partition("=")
+                values[key] = int(value) if value.lstrip("-").isdigit() else value
+            found.append(values)
+        return sorted(found, key=lambda p: tuple(p.values()))
+
+    def scan(self, league, dataset) -> pl.LazyFrame:
+        """scan() - Lazy frame over a dataset, with its partition columns added back.
+
+        Filters on the partition columns are pushed down to `pyarrow.dataset`, which skips the other
+        partitions without opening their files. Partition columns are read back as `Int32` when numeric.
+        Files with different columns are unified, missing columns being null, and a column whose type
+        differs between files is read as the type both promote to (e.g. int64 and double as double).
+
+        Args:
+            league (str): League of the data.
+            dataset (str): Name of the dataset.
+
+        Returns:
+            pl.LazyFrame: Lazy frame over the dataset, empty if nothing was written.
+        """
+        base = self.dataset_path(league, dataset)
+        if not os.path.isdir(base):
+            return pl.LazyFrame()
+        dataset = ds.dataset(base, format="parquet", partitioning="hive")
+        if not dataset.files:
+            return pl.LazyFrame()
+        schema = pa.unify_schemas([_read_schema(base, dataset.files), dataset.partitioning.schema])
+        return pl.scan_pyarrow_dataset(ds.dataset(base, schema=schema, format="parquet", partitioning="hive"))
+
+    def delete(self, league, dataset, **partition):
+        """delete() - Remove a dataset, or one of its partitions given as keywords, e.g. `season=2022`."""
+        path = self.dataset_path(league, dataset)
+        for key in _partition_keys(partition):
+            path = os.path.join(path, f"{key}={partition[key]}")
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def _partition_keys(partition) -> List[str]:
+    return [k for k in DEFAULT_PARTITION_BY if k in partition] + [k for k in partition if k not in DEFAULT_PARTITION_BY]
+
+
+def _to_polars(data) -> pl.DataFrame:
+    if isinstance(data, pl.DataFrame):
+        return data
+    if isinstance(data, pa.Table):
+        return pl.from_arrow(data)
+    if isinstance(data, pd.DataFrame):
+        return pl.from_pandas(data)
+    return pl.DataFrame(data)
+
+
+def _write_parts(data: pl.DataFrame, base, root, keys, mode, name) -> List[str]:
+    # rows of a dataset under `base` go to the hive directories of their `keys` values below `root`
+    for key in keys:
+        if data[key].null_count():
+            raise ValueError(f"partition column {key!r} has nulls")
+    parts = data.partition_by(keys, as_dict=True, maintain_order=True) if keys else {(): data}
+    if parts:
+        # before the files, so that a type that cannot be merged fails without writing anything
+        os.makedirs(base, exist_ok=True)
+        _merge_schema(base, data.drop(keys).to_arrow().schema)
+    paths = []
+    for values, part in parts.items():
+        values = values if isinstance(values, tuple) else (values,)
+        directory = os.path.join(root, *(f"{key}={value}" for key, value in zip(keys, values)))
+        paths.append(_write_partition(part.drop(keys), directory, mode, name))
+    return paths
+
+
+def _merge_schema(base, schema: pa.Schema):
+    path = os.path.join(base, SCHEMA_FILE)
+    with _SCHEMA_LOCK:
+        if os.path.exists(path):
+            schema = _unify([pq.read_schema(path), schema])
+        tmp_path = os.path.join(base, f".{uuid.uuid4().hex}.tmp")
+        pq.write_metadata(schema, tmp_path)
+        os.replace(tmp_path, path)
+
+
+def _read_schema(base, files) -> pa.Schema:
+    path = os.path.join(base, SCHEMA_FILE)
+    if os.path.exists(path):
+        return pq.read_schema(path)
+    # dataset written before the schema file existed: unify the footers once and keep the result
+    schema = _unify([pq.read_schema(f) for f in files])
+    _merge_schema(base, schema)
+    return schema
+
+
+def _unify(schemas) -> pa.Schema:
+    return pa.unify_schemas(schemas, promote_options="permissive")
+
+
+def _write_partition(data: pl.DataFrame, directory, mode, name) -> str:
+    token = uuid.uuid4().hex
+    file_name = f"{name or 'part-' + token}.parquet"
+    if mode == "append" or not os.path.isdir(directory):
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, file_name)
+        tmp_path = os.path.join(directory, f".{token}.tmp")
+        data.write_parquet(tmp_path)
+        os.replace(tmp_path, path)
+        return path
+    # overwrite: build the new partition next to the old one and swap the directories
+    parent, leaf = os.path.split(directory)
+    tmp_dir = os.path.join(parent, f".{leaf}.{token}.tmp")
+    os.makedirs(tmp_dir)
+    data.write_parquet(os.path.join(tmp_dir, file_name))
+    old_dir = os.path.join(parent, f".{leaf}.{token}.old")
+    os.rename(directory, old_dir)
+    os.rename(tmp_dir, directory)
+    shutil.rmtree(old_dir, ignore_errors=True)
+    return os.path.join(directory, file_name)
@@ -0,0 +1,178 @@
+import contextlib
+import gzip
+import hashlib
+import json
+import os
+import threading
+from urllib.parse import urlsplit
+
+import httpx
+import requests
+
+from sportsdataverse.cache import canonical_url
+from sportsdataverse.rate_limit import await_rate_limit, wait_for_rate_limit
+
+_TRANSPORT_LOCK = threading.Lock()
+_TRANSPORT = None
+
+
+class CassetteMissError(Exception):
+    pass
+
+
+class Transport:
+    """Transport - Sends the GET requests of `download()`, `adownload()` and `ESPNHTTP`.
+
+    The default transport goes to the network, waiting on the configured rate limiter first. Subclass
+    it and install the subclass with `set_transport()` to change how requests are answered.
+    """
+
+    def get(self, session, url, params=None, headers=None, proxies=None, timeout=None) -> requests.Response:
+        wait_for_rate_limit(url)
+        return session.get(url, params=params, proxies=proxies, headers=headers, timeout=timeout)
+
+    async def aget(self, client, url, params=None, headers=None, timeout=None) -> httpx.Response:
+        await await_rate_limit(url)
+        return await client.get(url, params=params, headers=headers, timeout=timeout)
+
+
+class CassetteTransport(Transport):
+    """CassetteTransport - Records responses into a directory of gzip files and replays them.
+
+    Recordings are keyed on the canonical url (see `cache.canonical_url()`), so the cache buster of the
+    pbp fetchers does not matter, and stored one file per request as
+    `<cassette_dir>/<host>/<sha1 of the url>.gz`.
+
+    Args:
+        cassette_dir (str): Directory of the recordings, created if missing.
+        mode (str): "record" always goes to the network and (re)writes the recording, "replay" answers
+            from the recording when there is one and goes to the network otherwise, "strict" answers
+            only from recordings and raises `CassetteMissError` for anything else. Only successful and 404
+            responses are recorded, so a 304 or a server error never replaces a good recording.
+
+    Example:
+        `sportsdataverse.transport.set_transport(CassetteTransport("tests/cassettes", mode="strict"))`
+    """
+
+    MODES = ("record", "replay", "strict")
+
+    def __init__(self, cassette_dir, mode="replay"):
+        if mode not in self.MODES:
+            raise ValueError(f"mode must be one of {self.MODES}, got {mode!r}")
+        self.cassette_dir = os.path.abspath(os.path.expanduser(cassette_dir))
+        self.mode = mode
+        self.hits = 0
+        self.recorded = 0
+        os.makedirs(self.cassette_dir, exist_ok=True)
+
+    def path_for(self, url, params=None) -> str:
+        key = canonical_url(url, params)
+        host = urlsplit(key).netloc or "_"
+        return os.path.join(self.cassette_dir, host, hashlib.sha1(key.encode()).hexdigest() + ".gz")
+
+    def get(self, session, url, params=None, headers=None, proxies=None, timeout=None) -> requests.Response:
+        recording = self._lookup(url, params)
+        if recording is not None:
+            return _requests_response(*recording)
+        response = super().get(session, url, params=params, headers=headers, proxies=proxies, timeout=timeout)
+        self._record(url, params, response.url, response.status_code, response.headers, response.content)
+        return response
+
+    async def aget(self, client, url, params=None, headers=None, timeout=None) -> httpx.Response:
+        recording = self._lookup(url, params)
+        if recording is not None:
+            return _httpx_response(*recording)
+        response = await super().aget(client, url, params=params, headers=headers, timeout=timeout)
+        self._record(url, params, str(response.url), response.status_code, response.headers, response.content)
+        return response
+
+    def _lookup(self, url, params):
+        if self.mode == "record":
+            return None
+        path = self.path_for(url, params)
+        if not os.path.exists(path):
+            if self.mode == "strict":
+                raise CassetteMissError(f"CassetteMissError: no recording of {canonical_url(url, params)}")
+            return None
+        with gzip.open(path, "rb") as f:
+            meta = json.loads(f.readline())
+            content = f.read()
+        self.hits += 1
+        return meta["url"], meta["status_code"], meta["headers"], content
+
+    def _record(self, url, params, response_url, status_code, headers, content):
+        # a 304 has no body and a 5xx or 429 is transient, neither may overwrite a good recording
+        if not (200 <= status_code < 300 or status_code == 404):
+            return
+        path = self.path_for(url, params)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        meta = {
+            "url": response_url,
+            "status_code": status_code,
+            "headers": {k: v for k, v in dict(headers).items() if k.lower() in _RECORDED_HEADERS},
+        }
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with gzip.open(tmp_path, "wb") as f:
+            f.write(json.dumps(meta).encode() + b"\n")
+            f.write(content)
+        os.replace(tmp_path, path)
+        self.recorded += 1
+
+
+_RECORDED_HEADERS = {"content-type", "etag", "last-modified", "retry-after"}
+
+
+def _requests_response(url, status_code, headers, content):
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = url
+    response.headers.update(headers)
+    response.encoding = "utf-8"
+    response._content = content
+    return response
+
+
+def _httpx_response(url, status_code, headers, content):
+    return httpx.Response(status_code, headers=headers, content=content, request=httpx.Request("GET", url))
+
+
+def get_transport() -> Transport:
+    """get_transport() - The transport currently used by `download()`, `adownload()` and `ESPNHTTP`."""
+    global _TRANSPORT
+    if _TRANSPORT is None:
+        with _TRANSPORT_LOCK:
+            if _TRANSPORT is None:
+                _TRANSPORT = Transport()
+    return _TRANSPORT
+
+
+def set_transport(transport=None) -> Transport:
+    """set_transport() - Install `transport` for every request, or restore the network one with None.
+
+    Returns:
+        Transport: The transport that was in use before.
+    """
+    global _TRANSPORT
+    with _TRANSPORT_LOCK:
+        previous, _TRANSPORT = _TRANSPORT or Transport(), transport
+    return previous
+
+
+@contextlib.contextmanager
+def use_cassette(cassette_dir, mode="replay"):
+    """use_cassette() - Context manager answering requests from a `CassetteTransport` while it is open.
+
+    Args:
+        cassette_dir (str): Directory of the recordings.
+        mode (str): "record", "replay" or "strict", see `CassetteTransport`.
+
+    Example:
+        `with sportsdataverse.transport.use_cassette("cassettes/nba", mode="strict"):
+            pbp = sportsdataverse.nba.espn_nba_pbp(game_id=401307514)`
+    """
+    cassette = CassetteTransport(cassette_dir, mode=mode)
+    previous = set_transport(cassette)
+    try:
+        yield cassette
+    finally:
+        set_transport(previous)
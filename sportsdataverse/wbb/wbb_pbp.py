@@ -7,7 +7,7 @@ import numpy as np
 import pandas as pd
 import polars as pl
 
-from sportsdataverse.dl_utils import download, flatten_json_iterative
+from sportsdataverse.dl_utils import adownload, download, flatten_json_iterative, run_in_thread
 
 
 def espn_wbb_pbp(game_id: int, raw=False, **kwargs) -> Dict:
@@ -26,14 +26,38 @@ def espn_wbb_pbp(game_id: int, raw=False, **kwargs) -> Dict:
     Example:
         `wbb_df = sportsdataverse.wb.espn_wbb_pbp(game_id=401266534)`
     """
-    # play by play
-    pbp_txt = {"timeouts": {}}
     # summary endpoint for pickcenter array
     summary_url = (
         f"http://site.api.espn.com/apis/site/v2/sports/basketball/womens-college-basketball/summary?event={game_id}"
     )
     summary_resp = download(summary_url, **kwargs)
-    summary = summary_resp.json()
+    return helper_wbb_summary(game_id, summary_resp.json(), raw=raw)
+
+
+async def aespn_wbb_pbp(game_id: int, raw=False, **kwargs) -> Dict:
+    """aespn_wbb_pbp() - Coroutine version of `espn_wbb_pbp()`. The summary is downloaded with
+    `dl_utils.adownload()` and the play-by-play processing runs in a worker thread.
+
+    Args:
+        game_id (int): Unique game_id, can be obtained from espn_wbb_schedule().
+        raw (bool): If True, returns the raw json from the API endpoint. If False, returns a cleaned dictionary of datasets.
+
+    Returns:
+        Dict: Same dictionary as `espn_wbb_pbp()`.
+
+    Example:
+        `wbb_df = await sportsdataverse.wbb.aespn_wbb_pbp(game_id=401266534)`
+    """
+    summary_url = (
+        f"http://site.api.espn.com/apis/site/v2/sports/basketball/womens-college-basketball/summary?event={game_id}"
+    )
+    summary_resp = await adownload(summary_url, **kwargs)
+    return await run_in_thread(lambda: helper_wbb_summary(game_id, summary_resp.json(), raw=raw))
+
+
+def helper_wbb_summary(game_id, summary, raw=False):
+    # play by play
+    pbp_txt = {"timeouts": {}}
     incoming_keys_expected = [
         "boxscore",
         "format",
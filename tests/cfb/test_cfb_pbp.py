@@ -1,7 +1,7 @@
 import polars as pl
 import pytest
 
-from sportsdataverse.cfb.cfb_pbp import CFBPlayProcess
+from sportsdataverse.cfb.cfb_pbp import CFBBatchProcess, CFBPlayProcess
 
 
 @pytest.fixture()
@@ -213,3 +213,46 @@ def test_expected_turnovers(iu_play_base_box):
     )
     assert round(away_exp_xTO, 4) == round(away_actual_xTO, 4)
     assert round(home_exp_xTO, 4) == round(home_actual_xTO, 4)
+
+
+@pytest.fixture()
+def batch_game_ids():
+    yield [401301025, 401411109, 401426563]
+
+
+def test_batch_matches_single_games(batch_game_ids):
+    games = [CFBPlayProcess(gameId=game_id).espn_cfb_pbp() for game_id in batch_game_ids]
+    batch = CFBBatchProcess(games, return_as="polars").run_processing_pipeline()
+
+    assert list(batch.keys()) == batch_game_ids
+    for game_id in batch_game_ids:
+        test = CFBPlayProcess(gameId=game_id, return_as="polars")
+        test.espn_cfb_pbp()
+        single = test.run_processing_pipeline()
+        plays = batch[game_id]["plays"]
+        assert plays.columns == single["plays"].columns
+        assert plays.get_column("game_id").unique().to_list() == [game_id]
+        assert plays.get_column("id").to_list() == single["plays"].get_column("id").to_list()
+        assert plays.get_column("EPA").round(6).to_list() == single["plays"].get_column("EPA").round(6).to_list()
+        assert plays.get_column("wpa").round(6).to_list() == single["plays"].get_column("wpa").round(6).to_list()
+
+
+def test_drive_plays_mixed_types():
+    drives = {
+        "previous": [
+            {
+                "id": "1",
+                "team": {"abbreviation": "UGA"},
+                "plays": [
+                    {"id": "11", "type": {"id": "5"}, "scoringType": 1, "start": {"down": 1}},
+                    {"id": "12", "type": {"id": "24"}, "scoringType": "a", "start": {"down": 2}},
+                    {"id": "13", "type": {"id": "5"}, "start": {"down": 3}},
+                ],
+            }
+        ]
+    }
+    plays = CFBPlayProcess()._CFBPlayProcess__helper_cfb_drive_plays(drives)
+
+    assert plays.get_column("scoringType").to_list() == ["1", "a", None]
+    assert plays.get_column("start.down").to_list() == [1, 2, 3]
+    assert plays.get_column("drive.team.abbreviation").to_list() == ["UGA"] * 3
@@ -0,0 +1,38 @@
+import threading
+import time
+
+import pytest
+
+from sportsdataverse import batch
+
+
+class TestFetchGames:
+    # Tests that every game is yielded once, errors included, without exceeding the concurrency bound
+    def test_fetch_games_bounded_and_streaming(self, monkeypatch):
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def fake_fetcher(game_id, raw, **kwargs):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.01)
+            with lock:
+                state["active"] -= 1
+            if game_id == 3:
+                raise ValueError("bad game")
+            return {"gameId": game_id, "raw": raw}
+
+        monkeypatch.setitem(batch.LEAGUE_FETCHERS, "mbb", fake_fetcher)
+        results = list(batch.fetch_games("mbb", range(20), concurrency=4, raw=True))
+        assert sorted(r.game_id for r in results) == list(range(20))
+        assert state["peak"] <= 4
+        failed = [r for r in results if r.error is not None]
+        assert [r.game_id for r in failed] == [3] and failed[0].result is None
+        assert all(r.result["raw"] for r in results if r.error is None)
+        assert all(r.seconds > 0 for r in results)
+
+    # Tests that an unknown league is rejected
+    def test_fetch_games_unknown_league(self):
+        with pytest.raises(ValueError):
+            next(batch.fetch_games("xfl", [1]))
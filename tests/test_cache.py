@@ -0,0 +1,64 @@
+import json
+
+import requests
+
+from sportsdataverse.cache import ResponseCache, canonical_url
+from sportsdataverse.dl_utils import download
+
+
+def summary(state, completed):
+    return {"header": {"competitions": [{"status": {"type": {"state": state, "completed": completed}}}]}}
+
+
+class RecordingSession:
+    def __init__(self, payload, status_code=200, headers=None):
+        self.payload = payload
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.requests = []
+
+    def get(self, url, params=None, headers=None, **kwargs):
+        self.requests.append(headers or {})
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.url = url
+        response.headers.update(self.headers)
+        response._content = json.dumps(self.payload).encode() if self.status_code == 200 else b""
+        return response
+
+
+class TestResponseCache:
+    # Tests that the cache buster and parameter order do not change the cache key
+    def test_canonical_url(self):
+        busted = canonical_url("http://site.api.espn.com/summary?event=401256137&1693526400000")
+        assert busted == canonical_url("http://site.api.espn.com/summary", params={"event": 401256137})
+        assert canonical_url("http://x.com/a?b=2&a=1") == canonical_url("http://x.com/a", {"a": 1, "b": 2})
+
+    # Tests that the freshness window follows the game status
+    def test_ttl_follows_game_status(self, tmp_path):
+        cache = ResponseCache(tmp_path, live_ttl=5, default_ttl=60)
+        assert cache.ttl_for(json.dumps(summary("post", True)).encode()) is None
+        assert cache.ttl_for(json.dumps(summary("in", False)).encode()) == 5
+        assert cache.ttl_for(json.dumps(summary("pre", False)).encode()) == 60
+        assert cache.ttl_for(b"{}") == 60
+
+    # Tests that a completed game is served from disk without another request
+    def test_completed_game_served_from_cache(self, tmp_path):
+        cache = ResponseCache(tmp_path)
+        session = RecordingSession(summary("post", True))
+        first = download("http://site.api.espn.com/summary?event=1&111", session=session, cache=cache)
+        second = download("http://site.api.espn.com/summary?event=1&222", session=session, cache=cache)
+        assert len(session.requests) == 1
+        assert second.json() == first.json() and second.from_cache
+        assert cache.hits == 1
+
+    # Tests that a stale entry is revalidated with its ETag and reused on a 304
+    def test_stale_entry_revalidated(self, tmp_path):
+        cache = ResponseCache(tmp_path, live_ttl=0)
+        live = RecordingSession(summary("in", False), headers={"ETag": '"v1"'})
+        download("http://site.api.espn.com/summary?event=2", session=live, cache=cache)
+        not_modified = RecordingSession(None, status_code=304)
+        resp = download("http://site.api.espn.com/summary?event=2", session=not_modified, cache=cache)
+        assert not_modified.requests[0]["If-None-Match"] == '"v1"'
+        assert resp.status_code == 200 and resp.json() == summary("in", False)
+        assert cache.revalidated == 1
@@ -1,7 +1,30 @@
+import asyncio
+import json
+import threading
+import time
+
+import httpx
+import pandas as pd
+import polars as pl
+import pyarrow as pa
 import pytest
 import requests
 
-from sportsdataverse.dl_utils import download
+from sportsdataverse.dl_utils import (
+    DownloadResponse,
+    RetryBudget,
+    adownload,
+    configure_async,
+    configure_sessions,
+    convert_frame,
+    download,
+    get_session,
+    reset_single_flight_stats,
+    reset_sessions,
+    session_registry_info,
+    single_flight_stats,
+)
+from sportsdataverse.errors import NoESPNDataError
 
 
 class TestDownload:
@@ -44,3 +67,240 @@ class TestDownload:
         url = "https://thisisnotavalidurl.com"
         with pytest.raises(requests.exceptions.RequestException):
             download(url)
+
+
+class TestSessionRegistry:
+    def setup_method(self):
+        reset_sessions()
+
+    def teardown_method(self):
+        configure_sessions(pool_maxsize=32)
+        reset_sessions()
+
+    # Tests that requests to the same host share one pooled session
+    def test_same_host_reuses_session(self):
+        first = get_session("https://site.api.espn.com/apis/site/v2/sports/football/nfl/summary")
+        second = get_session("https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard")
+        assert first is second
+        assert session_registry_info()["sessions"]["https://site.api.espn.com"]["requests"] == 2
+
+    # Tests that different hosts get their own session
+    def test_different_hosts_get_different_sessions(self):
+        site = get_session("https://site.api.espn.com/apis/site/v2/sports/football/nfl/summary")
+        core = get_session("https://sports.core.api.espn.com/v2/sports/football/leagues/nfl/athletes/1")
+        assert site is not core
+        assert len(session_registry_info()["sessions"]) == 2
+
+    # Tests that resetting and reconfiguring the registry drops the pooled sessions
+    def test_reset_and_configure(self):
+        first = get_session("https://site.api.espn.com/")
+        reset_sessions()
+        assert session_registry_info()["sessions"] == {}
+        assert configure_sessions(pool_maxsize=4)["pool_maxsize"] == 4
+        second = get_session("https://site.api.espn.com/")
+        assert first is not second
+        assert second.get_adapter("https://site.api.espn.com/")._pool_maxsize == 4
+
+
+class TestAsyncDownload:
+    # Tests that adownload retries a failed attempt and drops None params
+    def test_adownload_retries_and_filters_params(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                raise httpx.ConnectError("connection refused", request=request)
+            return httpx.Response(200, json={"ok": True})
+
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                return await adownload(
+                    "https://site.api.espn.com/x", params={"a": 1, "b": None}, client=client, num_retries=1
+                )
+
+        resp = asyncio.run(run())
+        assert resp.json() == {"ok": True}
+        assert len(calls) == 2
+        assert dict(calls[-1].url.params) == {"a": "1"}
+
+    # Tests that max_concurrency also bounds the requests sent with a client passed by the caller
+    def test_max_concurrency_with_own_client(self):
+        in_flight = []
+        peak = []
+
+        async def handler(request):
+            in_flight.append(request)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(request)
+            return httpx.Response(200, json={"ok": True})
+
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                await asyncio.gather(
+                    *[adownload(f"https://site.api.espn.com/{i}", client=client, single_flight=False) for i in range(8)]
+                )
+
+        default = configure_async()["max_concurrency"]
+        configure_async(max_concurrency=2)
+        try:
+            asyncio.run(run())
+        finally:
+            configure_async(max_concurrency=default)
+        assert max(peak) == 2
+
+
+class FakeSession:
+    def __init__(self, statuses, headers=None):
+        self.statuses = list(statuses)
+        self.headers = headers or {}
+        self.calls = 0
+
+    def get(self, url, **kwargs):
+        self.calls += 1
+        response = requests.Response()
+        response.status_code = self.statuses.pop(0)
+        response.url = url
+        response.headers.update(self.headers)
+        response._content = json.dumps({"ok": True}).encode()
+        return response
+
+
+class TestRetryPolicy:
+    # Tests that retryable statuses are retried until a good response comes back
+    def test_retries_retryable_status(self):
+        session = FakeSession([503, 429, 200], headers={"Retry-After": "0"})
+        resp = download("https://site.api.espn.com/x", session=session, backoff_factor=0)
+        assert resp.status_code == 200
+        assert session.calls == 3
+
+    # Tests that a 404 fails immediately without retrying
+    def test_404_is_fatal(self):
+        session = FakeSession([404, 200])
+        with pytest.raises(NoESPNDataError):
+            download("https://site.api.espn.com/x", session=session, backoff_factor=0)
+        assert session.calls == 1
+
+    # Tests that the last error is raised once retries run out
+    def test_retry_limit_raises(self):
+        session = FakeSession([500, 500, 500])
+        with pytest.raises(requests.HTTPError):
+            download("https://site.api.espn.com/x", session=session, num_retries=2, backoff_factor=0)
+        assert session.calls == 3
+
+    # Tests that a shared budget caps retries across downloads
+    def test_retry_budget_is_shared(self):
+        budget = RetryBudget(max_retries=1)
+        first = FakeSession([502, 200])
+        download("https://site.api.espn.com/x", session=first, backoff_factor=0, retry_budget=budget)
+        second = FakeSession([502, 200])
+        with pytest.raises(requests.HTTPError):
+            download("https://site.api.espn.com/x", session=second, backoff_factor=0, retry_budget=budget)
+        assert second.calls == 1 and budget.remaining == 0
+
+
+class TestDownloadResponse:
+    # Tests that the body is decoded once and shared between the 404 check and the caller
+    def test_json_decoded_once(self):
+        session = FakeSession([200])
+        resp = download("https://site.api.espn.com/x", session=session)
+        assert isinstance(resp, DownloadResponse)
+        assert resp.json() is resp.json()
+        assert resp.status_code == 200 and resp.url == "https://site.api.espn.com/x"
+
+
+class SlowSession(FakeSession):
+    def get(self, url, **kwargs):
+        time.sleep(0.2)
+        return super().get(url, **kwargs)
+
+
+class TestSingleFlight:
+    # Tests that concurrent identical downloads share one request but get their own payloads
+    def test_concurrent_identical_requests_coalesce(self):
+        reset_single_flight_stats()
+        session = SlowSession([200] * 5)
+        results = []
+
+        def worker():
+            results.append(download("https://site.api.espn.com/x?a=1", session=session))
+
+        threads = [threading.Thread(target=worker) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert session.calls == 1
+        assert len(results) == 5
+        assert len({id(r.json()) for r in results}) == 5
+        stats = single_flight_stats()
+        assert stats["requests"] == 1 and stats["deduplicated"] == 4 and stats["in_flight"] == 0
+
+    # Tests that coalescing can be turned off per call
+    def test_single_flight_opt_out(self):
+        session = FakeSession([200, 200])
+        download("https://site.api.espn.com/x", session=session, single_flight=False)
+        download("https://site.api.espn.com/x", session=session, single_flight=False)
+        assert session.calls == 2
+
+    # Tests that calls with different settings do not join each other's request
+    def test_different_settings_not_joined(self):
+        session = SlowSession([200, 200])
+        threads = [
+            threading.Thread(
+                target=download, args=("https://site.api.espn.com/x",), kwargs=dict(session=session, timeout=timeout)
+            )
+            for timeout in (5, 30)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert session.calls == 2
+
+    # Tests that cancelling the caller that sent the request leaves it to the callers that joined it
+    def test_cancelled_leader_does_not_cancel_followers(self):
+        calls = []
+
+        async def handler(request):
+            calls.append(request)
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json={"ok": True})
+
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                leader = asyncio.ensure_future(adownload("https://site.api.espn.com/x", client=client))
+                await asyncio.sleep(0)
+                follower = asyncio.ensure_future(adownload("https://site.api.espn.com/x", client=client))
+                await asyncio.sleep(0.01)
+                leader.cancel()
+                return await follower, leader
+
+        follower, leader = asyncio.run(run())
+        assert leader.cancelled()
+        assert follower.json() == {"ok": True}
+        assert len(calls) == 1
+
+
+class TestConvertFrame:
+    # Tests that return_as picks the output type and overrides return_as_pandas
+    def test_return_types(self):
+        df = pl.DataFrame({"game_id": [401220403, 401220404], "team": ["KC", "BUF"]})
+        assert convert_frame(df) is df
+        assert isinstance(convert_frame(df, return_as_pandas=True), pd.DataFrame)
+        table = convert_frame(df, return_as_pandas=True, return_as="arrow")
+        assert isinstance(table, pa.Table)
+        assert table.column("game_id").to_pylist() == [401220403, 401220404]
+
+    # Tests that pandas frames built by the teams helpers convert too
+    def test_pandas_input(self):
+        teams = pd.DataFrame({"team_id": [1, 2]})
+        assert convert_frame(teams, return_as_pandas=True) is teams
+        assert convert_frame(teams).frame_equal(pl.DataFrame({"team_id": [1, 2]}))
+        assert convert_frame(teams, return_as="arrow").num_rows == 2
+
+    # Tests that an unknown return type is rejected
+    def test_unknown_return_type(self):
+        with pytest.raises(ValueError):
+            convert_frame(pl.DataFrame(), return_as="numpy")
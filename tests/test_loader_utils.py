@@ -0,0 +1,390 @@
+import io
+import os
+import threading
+import time
+
+import polars as pl
+import pyarrow.parquet as pq
+import pyreadr
+import pytest
+import requests
+
+from sportsdataverse.errors import SeasonNotFoundError
+from sportsdataverse import loader_utils
+from sportsdataverse.loader_utils import (
+    FileCache,
+    compact_frame,
+    iter_seasons,
+    load_seasons,
+    read_rds_url,
+    scan_seasons,
+)
+from sportsdataverse.metrics import add_hook, remove_hook
+
+
+@pytest.fixture
+def season_files(tmp_path):
+    for season in (2019, 2020, 2021):
+        pl.DataFrame({"season": [season, season], "play": [1, 2]}).write_parquet(tmp_path / f"pbp_{season}.parquet")
+    return str(tmp_path / "pbp_{season}.parquet")
+
+
+class TestLoadSeasons:
+    # Tests that the seasons come back stacked in the requested order
+    def test_concat_in_season_order(self, season_files):
+        df = load_seasons(season_files, [2021, 2019, 2020], min_season=2002, progress=False)
+        assert df["season"].to_list() == [2021, 2021, 2019, 2019, 2020, 2020]
+
+    # Tests that a single season may be passed as an int
+    def test_single_season(self, season_files):
+        df = load_seasons(season_files, 2020, min_season=2002, progress=False)
+        assert df.shape == (2, 2)
+
+    # Tests that seasons are read concurrently, up to max_workers at a time
+    def test_reads_concurrently(self):
+        running, peak, lock = [0], [0], threading.Lock()
+
+        def read(url):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.05)
+            with lock:
+                running[0] -= 1
+            return pl.DataFrame({"url": [url]})
+
+        df = load_seasons("{season}", range(2010, 2016), min_season=2002, read=read, max_workers=3, progress=False)
+        assert df["url"].to_list() == [str(s) for s in range(2010, 2016)]
+        assert peak[0] == 3
+
+    # Tests that an invalid season raises before anything is downloaded
+    def test_validates_before_download(self):
+        reads = []
+        with pytest.raises(SeasonNotFoundError):
+            load_seasons("{season}", [2020, 1990], min_season=2002, read=reads.append, progress=False)
+        assert reads == []
+
+    # Tests that a callable progress hook sees every finished season
+    def test_progress_hook(self, season_files):
+        calls = []
+        load_seasons(season_files, [2019, 2020, 2021], min_season=2002, progress=lambda *a: calls.append(a))
+        assert sorted(calls) == [(1, 3), (2, 3), (3, 3)]
+
+    # Tests that a function may load each season by itself
+    def test_callable_url_template(self):
+        df = load_seasons(lambda season: pl.DataFrame({"season": [season]}), [2003, 2002], 2002, progress=False)
+        assert df["season"].to_list() == [2003, 2002]
+
+    # Tests that missing seasons are skipped only when asked to
+    def test_skip_missing(self, season_files):
+        df = load_seasons(season_files, [2020, 2022], min_season=2002, progress=False, skip_missing=True)
+        assert df["season"].unique().to_list() == [2020]
+        with pytest.raises(Exception):
+            load_seasons(season_files, [2020, 2022], min_season=2002, progress=False)
+
+
+def _response(url, content=b"", headers=None, status_code=200):
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = url
+    response.headers.update(headers or {})
+    response._content = content
+    response._content_consumed = True
+    return response
+
+
+class FileServer:
+    """Serves parquet bytes per url with an ETag, counting HEAD and GET requests."""
+
+    def __init__(self):
+        self.files = {}
+        self.heads = []
+        self.gets = []
+        self.offline = False
+
+    def put(self, url, df, etag):
+        buf = io.BytesIO()
+        df.write_parquet(buf)
+        self.files[url] = (buf.getvalue(), etag)
+
+    def head(self, url, allow_redirects=True, timeout=None):
+        self.heads.append(url)
+        if self.offline:
+            raise requests.ConnectionError("offline")
+        return _response(url, headers={"ETag": self.files[url][1]})
+
+    def put_bytes(self, url, content, etag):
+        self.files[url] = (content, etag)
+
+    def get(self, url, stream=False, timeout=None):
+        self.gets.append(url)
+        if url not in self.files:
+            return _response(url, status_code=404)
+        content, etag = self.files[url]
+        return _response(url, content, headers={"ETag": etag})
+
+
+@pytest.fixture
+def server(monkeypatch):
+    server = FileServer()
+    monkeypatch.setattr(loader_utils, "get_session", lambda url: server)
+    return server
+
+
+class TestFileCache:
+    url = "https://github.com/sportsdataverse/sportsdataverse-data/releases/download/pbp/play_by_play_2023.parquet"
+
+    # Tests that a cached file is revalidated with HEAD and not downloaded again while the ETag matches
+    def test_revalidates_with_head(self, server, tmp_path):
+        server.put(self.url, pl.DataFrame({"a": [1]}), '"v1"')
+        cache = FileCache(tmp_path)
+        path = cache.fetch(self.url)
+        assert path.endswith(".parquet") and cache.fetch(self.url) == path
+        assert (len(server.gets), len(server.heads), cache.revalidated) == (1, 1, 1)
+
+    # Tests that a new ETag on the server triggers a fresh download
+    def test_downloads_new_version(self, server, tmp_path):
+        server.put(self.url, pl.DataFrame({"a": [1]}), '"v1"')
+        cache = FileCache(tmp_path)
+        cache.fetch(self.url)
+        server.put(self.url, pl.DataFrame({"a": [2]}), '"v2"')
+        assert pl.read_parquet(cache.fetch(self.url))["a"].to_list() == [2]
+        assert len(server.gets) == 2
+
+    # Tests that immutable files are never revalidated and that stale copies are served offline
+    def test_immutable_and_offline(self, server, tmp_path):
+        server.put(self.url, pl.DataFrame({"a": [1]}), '"v1"')
+        cache = FileCache(tmp_path)
+        cache.fetch(self.url, immutable=True)
+        cache.fetch(self.url)
+        assert server.heads == []
+        other = self.url.replace("2023", "2024")
+        server.put(other, pl.DataFrame({"a": [1]}), '"v1"')
+        cache.fetch(other)
+        server.offline = True
+        assert os.path.exists(cache.fetch(other)) and cache.stale == 1
+
+    # Tests that the downloads and revalidations reach the metrics hooks as "releases" requests
+    def test_reports_metrics(self, server, tmp_path):
+        server.put(self.url, pl.DataFrame({"a": [1]}), '"v1"')
+        events = []
+        hook = events.append
+        add_hook(hook)
+        try:
+            cache = FileCache(tmp_path)
+            path = cache.fetch(self.url)
+            cache.fetch(self.url)
+        finally:
+            remove_hook(hook)
+        assert [(e.family, e.status, e.cache) for e in events] == [
+            ("releases", 200, "miss"),
+            ("releases", 200, "revalidated"),
+        ]
+        assert events[0].bytes == os.path.getsize(path)
+
+    # Tests that load_seasons reads through a per-call cache_dir and pins completed seasons
+    def test_load_seasons_cache_dir(self, server, tmp_path):
+        template = self.url.replace("2023", "{season}")
+        for season in (2015, 2016):
+            server.put(template.format(season=season), pl.DataFrame({"season": [season]}), '"v1"')
+        for _ in range(2):
+            df = load_seasons(template, [2015, 2016], min_season=2002, progress=False, cache_dir=str(tmp_path))
+        assert df["season"].to_list() == [2015, 2016]
+        assert len(server.gets) == 2 and server.heads == []
+
+
+class TestScanSeasons:
+    template = (
+        "https://github.com/sportsdataverse/sportsdataverse-data/releases/download/pbp/play_by_play_{season}.parquet"
+    )
+
+    # Tests that a multi-season scan stays lazy and pushes select/filter down to every season
+    def test_lazy_multi_season(self, server, tmp_path):
+        for season in (2015, 2016):
+            df = pl.DataFrame({"season": [season] * 3, "week": [1, 2, 3], "epa": [0.1, 0.2, 0.3], "desc": ["x"] * 3})
+            server.put(self.template.format(season=season), df, '"v1"')
+        lf = scan_seasons(self.template, [2016, 2015], min_season=2002, cache_dir=str(tmp_path))
+        assert isinstance(lf, pl.LazyFrame)
+        out = lf.filter(pl.col("week") == 2).select(["season", "epa"]).collect()
+        assert out.to_dicts() == [{"season": 2016, "epa": 0.2}, {"season": 2015, "epa": 0.2}]
+        assert "PROJECT 2/4" in lf.select(["season", "epa"]).explain()
+
+    # Tests that the csv of the NFL teams is scanned from its cached copy
+    def test_scan_teams(self, server, tmp_path):
+        from sportsdataverse.config import NFL_TEAM_LOGO_URL
+        from sportsdataverse.nfl import scan_nfl_teams
+
+        server.put_bytes(
+            NFL_TEAM_LOGO_URL, b"team_abbr,team_name\nKC,Kansas City Chiefs\nNE,New England Patriots\n", '"v1"'
+        )
+        lf = scan_nfl_teams(cache_dir=str(tmp_path))
+        assert isinstance(lf, pl.LazyFrame)
+        assert lf.filter(pl.col("team_abbr") == "NE").collect()["team_name"].to_list() == ["New England Patriots"]
+
+    # Tests that an invalid season raises before any download
+    def test_validates_before_download(self, server, tmp_path):
+        with pytest.raises(SeasonNotFoundError):
+            scan_seasons(self.template, [1990], min_season=2002, cache_dir=str(tmp_path))
+        assert server.gets == []
+
+
+class TestReadRds:
+    url = "https://raw.githubusercontent.com/nflverse/nflverse-pbp/master/schedules/sched_2016.rds"
+
+    # Tests that an rds file is converted to parquet once and read back without pyreadr
+    def test_converts_once(self, server, tmp_path, monkeypatch):
+        rds_path = str(tmp_path / "sched.rds")
+        pyreadr.write_rds(rds_path, pl.DataFrame({"game_id": ["2016_01_NYG_DAL"], "week": [1]}).to_pandas())
+        with open(rds_path, "rb") as f:
+            server.put_bytes(self.url, f.read(), '"v1"')
+        calls = []
+        read_r = pyreadr.read_r
+        monkeypatch.setattr(pyreadr, "read_r", lambda path: calls.append(path) or read_r(path))
+        first = read_rds_url(self.url, cache_dir=str(tmp_path / "cache"))
+        second = read_rds_url(self.url, cache_dir=str(tmp_path / "cache"))
+        assert second.frame_equal(first) and second["week"].to_list() == [1]
+        assert len(calls) == 1
+
+    # Tests that a missing file raises an HTTPError carrying the 404, which lets callers fall back
+    def test_missing_file(self, server, tmp_path):
+        with pytest.raises(requests.HTTPError) as e:
+            read_rds_url(self.url.replace("2016", "2017"), cache_dir=str(tmp_path))
+        assert e.value.response.status_code == 404
+
+    # Tests that the 404 of the optional parquet schedule is kept in the file cache for later processes
+    def test_schedule_parquet_404_remembered(self, server, tmp_path, monkeypatch):
+        from sportsdataverse.nfl import nfl_loaders
+
+        rds_path = str(tmp_path / "sched.rds")
+        pyreadr.write_rds(rds_path, pl.DataFrame({"game_id": ["2016_01_NYG_DAL"], "week": [1]}).to_pandas())
+        with open(rds_path, "rb") as f:
+            server.put_bytes(self.url, f.read(), '"v1"')
+        parquet_url = self.url.replace(".rds", ".parquet")
+        for _ in range(2):
+            monkeypatch.setattr(nfl_loaders, "_MISSING_PARQUET_SCHEDULES", set())
+            df = nfl_loaders.load_nfl_schedule([2016], progress=False, cache_dir=str(tmp_path / "cache"))
+            assert df["week"].to_list() == [1]
+        assert server.gets.count(parquet_url) == 1
+
+    # Tests that without a file cache the parquet 404 still falls back to the rds file
+    def test_schedule_parquet_404_without_cache(self, server, tmp_path, monkeypatch):
+        from sportsdataverse.nfl import nfl_loaders
+
+        rds_path = str(tmp_path / "sched.rds")
+        pyreadr.write_rds(rds_path, pl.DataFrame({"game_id": ["2016_01_NYG_DAL"], "week": [1]}).to_pandas())
+        with open(rds_path, "rb") as f:
+            server.put_bytes(self.url, f.read(), '"v1"')
+        monkeypatch.setattr(nfl_loaders, "_MISSING_PARQUET_SCHEDULES", set())
+        monkeypatch.setattr(loader_utils, "_FILE_CACHE", None)
+        df = nfl_loaders.load_nfl_schedule([2016], progress=False)
+        assert df["week"].to_list() == [1]
+        assert server.gets == [self.url.replace(".rds", ".parquet"), self.url]
+
+    # Tests that the schedule scan reads the parquet file of one season and the rds copy of another
+    def test_scan_schedule(self, server, tmp_path, monkeypatch):
+        from sportsdataverse.nfl import nfl_loaders
+
+        rds_path = str(tmp_path / "sched.rds")
+        pyreadr.write_rds(rds_path, pl.DataFrame({"game_id": ["2016_01_NYG_DAL"], "week": [1]}).to_pandas())
+        with open(rds_path, "rb") as f:
+            server.put_bytes(self.url, f.read(), '"v1"')
+        # pyreadr writes integers as doubles
+        df = pl.DataFrame({"game_id": ["2017_01_KC_NE", "2017_02_KC_PHI"], "week": [1.0, 2.0]})
+        server.put(self.url.replace("2016.rds", "2017.parquet"), df, '"v1"')
+        monkeypatch.setattr(nfl_loaders, "_MISSING_PARQUET_SCHEDULES", set())
+        lf = nfl_loaders.scan_nfl_schedule([2016, 2017], cache_dir=str(tmp_path / "cache"))
+        assert isinstance(lf, pl.LazyFrame)
+        out = lf.filter(pl.col("week") == 1).select("game_id").collect()
+        assert out["game_id"].to_list() == ["2016_01_NYG_DAL", "2017_01_KC_NE"]
+        assert self.url.replace("2016", "2017") not in server.gets
+
+    # Tests that a recorded 404 expires unless the file is immutable
+    def test_missing_expires(self, tmp_path, monkeypatch):
+        cache = FileCache(tmp_path)
+        assert not cache.is_missing(self.url)
+        cache.mark_missing(self.url)
+        assert cache.is_missing(self.url)
+        monkeypatch.setattr(loader_utils, "MISSING_TTL", -1)
+        assert not cache.is_missing(self.url) and cache.is_missing(self.url, immutable=True)
+
+
+class TestIterSeasons:
+    # Tests that seasons are yielded one at a time, in order, with the next one fetched in the background
+    def test_prefetches_next_season(self):
+        started = []
+
+        def load(season):
+            started.append(season)
+            return pl.DataFrame({"season": [season]})
+
+        frames = iter_seasons(load, [2019, 2020, 2021, 2022], 2002, prefetch=1)
+        first = next(frames)
+        time.sleep(0.05)
+        assert first["season"].to_list() == [2019]
+        assert started == [2019, 2020]
+        assert [df["season"][0] for df in frames] == [2020, 2021, 2022]
+
+    # Tests that seasons are validated before the iterator is consumed
+    def test_validates_eagerly(self):
+        with pytest.raises(SeasonNotFoundError):
+            iter_seasons(lambda season: pl.DataFrame(), [1990], 2002)
+
+    # Tests that by="row_group" yields each parquet row group of a local copy of the season
+    def test_row_groups(self, server, tmp_path):
+        url = "https://github.com/sportsdataverse/sportsdataverse-data/releases/download/pbp/pbp_{season}.parquet"
+        buf = io.BytesIO()
+        pl.DataFrame({"play": list(range(10)), "epa": [0.5] * 10}).write_parquet(
+            buf, use_pyarrow=True, row_group_size=4
+        )
+        server.put_bytes(url.format(season=2020), buf.getvalue(), '"v1"')
+        frames = list(iter_seasons(url, 2020, 2002, by="row_group", cache_dir=str(tmp_path), columns=["play"]))
+        metadata = pq.ParquetFile(io.BytesIO(buf.getvalue())).metadata
+        assert len(frames) == metadata.num_row_groups > 1
+        assert sum(df.height for df in frames) == 10
+        assert frames[0].columns == ["play"]
+
+
+class TestCompactFrame:
+    @pytest.fixture
+    def pbp(self):
+        return pl.DataFrame(
+            {
+                "posteam": ["KC", "BUF"] * 50,
+                "desc": [f"play {i}" for i in range(100)],
+                "play_id": list(range(100)),
+                "game_seconds": list(range(0, 36000000, 360000)),
+                "yards_gained": [2.0, 7.5] * 50,
+                "epa": [0.1, None] * 50,
+            }
+        )
+
+    # Tests that columns are cast to smaller dtypes only where no value changes
+    def test_lossless_casts(self, pbp):
+        compact = compact_frame(pbp)
+        assert compact.schema == {
+            "posteam": pl.Categorical,
+            "desc": pl.Utf8,
+            "play_id": pl.Int8,
+            "game_seconds": pl.Int32,
+            "yards_gained": pl.Float32,
+            "epa": pl.Float64,
+        }
+        assert compact.estimated_size() < pbp.estimated_size()
+        for name in pbp.columns:
+            assert compact[name].cast(pbp[name].dtype).series_equal(pbp[name], null_equal=True)
+
+    # Tests that a lazy frame is compacted from the column names alone
+    def test_lazy_frame(self, pbp):
+        schema = compact_frame(pbp.lazy()).schema
+        assert schema["posteam"] == pl.Categorical
+        assert schema["desc"] == pl.Utf8
+        assert schema["play_id"] == pl.Int64
+
+    # Tests that compacted seasons are concatenated under one string cache with the widest dtype of each column
+    def test_load_seasons(self):
+        def load(season):
+            return pl.DataFrame({"team": ["KC", "BUF", str(season)] * 10, "play_id": [season * 100] * 30})
+
+        data = load_seasons(load, [2, 2019], 2, progress=False, compact=True)
+        assert data.schema == {"team": pl.Categorical, "play_id": pl.Int32}
+        assert data["team"].cast(pl.Utf8).to_list()[-3:] == ["KC", "BUF", "2019"]
@@ -0,0 +1,60 @@
+import json
+
+import pytest
+import requests
+
+from sportsdataverse.dl_utils import download
+from sportsdataverse.metrics import MetricsAggregator, url_template
+
+
+class StatusSession:
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+
+    def get(self, url, **kwargs):
+        response = requests.Response()
+        response.status_code = self.statuses.pop(0)
+        response.url = url
+        response._content = json.dumps({"ok": True}).encode()
+        return response
+
+
+class TestMetrics:
+    # Tests that ids and the cache buster are folded out of the url template
+    def test_url_template(self):
+        url = "http://site.api.espn.com/apis/site/v2/sports/football/nfl/summary?event=401220403&1693526400000"
+        assert url_template(url) == "http://site.api.espn.com/apis/site/v2/sports/football/nfl/summary?event={id}"
+        athlete = "https://sports.core.api.espn.com/v2/sports/football/leagues/nfl/athletes/3139477"
+        assert url_template(athlete).endswith("/athletes/{id}")
+
+    # Tests that the aggregator receives one event per download and summarizes it per family
+    def test_aggregator_summary(self):
+        agg = MetricsAggregator()
+        try:
+            download(
+                "https://site.api.espn.com/apis/site/v2/sports/nba/summary?event=1",
+                session=StatusSession([503, 200]),
+                backoff_factor=0,
+                cache=False,
+            )
+            download(
+                "https://sports.core.api.espn.com/v2/sports/nba/athletes/2", session=StatusSession([200]), cache=False
+            )
+            with pytest.raises(Exception):
+                download(
+                    "https://sports.core.api.espn.com/v2/sports/nba/athletes/3",
+                    session=StatusSession([404]),
+                    cache=False,
+                )
+        finally:
+            agg.close()
+        events = {e.url_template.rsplit("/", 1)[-1]: e for e in agg.events}
+        assert len(agg.events) == 3
+        summary_event = events["summary?event={id}"]
+        assert summary_event.status == 200 and summary_event.retries == 1 and summary_event.bytes > 0
+        assert summary_event.dns is None and summary_event.total >= 0
+        summary = agg.summary()
+        assert summary["family"].to_list() == ["athletes", "summary"]
+        assert summary["requests"].to_list() == [2, 1]
+        assert summary["errors"].to_list() == [1, 0]
+        assert {"p50", "p95", "p99"} <= set(summary.columns)
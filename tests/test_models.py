@@ -0,0 +1,70 @@
+import shutil
+import threading
+
+import numpy as np
+import pytest
+from xgboost import DMatrix, train
+
+from sportsdataverse.models import DEFAULT_NTHREAD, configure_models, get_model, model_registry_info, reset_models
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry():
+    reset_models()
+    yield
+    configure_models(nthread=DEFAULT_NTHREAD)
+    reset_models()
+
+
+def save_model(path, seed=0):
+    rng = np.random.default_rng(seed)
+    data = DMatrix(rng.random((50, 3)), label=rng.integers(0, 2, 50))
+    train({"objective": "binary:logistic"}, data, num_boost_round=2).save_model(str(path))
+    return str(path)
+
+
+class TestModelRegistry:
+    # Tests that nothing is loaded until a model is first requested
+    def test_loads_on_first_use(self, tmp_path):
+        path = save_model(tmp_path / "wp.json")
+        assert model_registry_info()["models"] == {}
+        model = get_model(path)
+        assert get_model(path) is model
+        (stats,) = model_registry_info()["models"].values()
+        assert stats["paths"] == [path]
+        assert stats["requests"] == 2
+        assert stats["load_seconds"] >= 0
+
+    # Tests that identical files share one booster and different files do not
+    def test_identical_files_share_booster(self, tmp_path):
+        (tmp_path / "cfb").mkdir()
+        (tmp_path / "nfl").mkdir()
+        cfb_path = save_model(tmp_path / "cfb" / "wp.json")
+        nfl_path = shutil.copy(cfb_path, tmp_path / "nfl" / "wp.json")
+        other_path = save_model(tmp_path / "qbr.json", seed=1)
+        assert get_model(cfb_path) is get_model(nfl_path)
+        assert get_model(other_path) is not get_model(cfb_path)
+        models = model_registry_info()["models"]
+        assert len(models) == 2
+        assert sorted(len(stats["paths"]) for stats in models.values()) == [1, 2]
+
+    # Tests that concurrent first requests load the model once
+    def test_threads_share_booster(self, tmp_path):
+        path = save_model(tmp_path / "wp.json")
+        models = []
+        threads = [threading.Thread(target=lambda: models.append(get_model(path))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len({id(model) for model in models}) == 1
+        assert len(model_registry_info()["models"]) == 1
+
+    # Tests that nthread applies to boosters already loaded and to later ones
+    def test_configure_nthread(self, tmp_path):
+        model = get_model(save_model(tmp_path / "wp.json"))
+        assert configure_models(nthread=1) == {"nthread": 1}
+        assert '"nthread":"1"' in model.save_config()
+        later = get_model(save_model(tmp_path / "qbr.json", seed=1))
+        assert '"nthread":"1"' in later.save_config()
+        assert model_registry_info()["config"] == {"nthread": 1}
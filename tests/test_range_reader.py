@@ -0,0 +1,225 @@
+import io
+from functools import partial
+
+import polars as pl
+import pytest
+import requests
+
+from sportsdataverse import range_reader
+from sportsdataverse.loader_utils import load_seasons, refresh_seasons
+from sportsdataverse.metrics import add_hook, remove_hook
+from sportsdataverse.range_reader import read_parquet_columns
+from sportsdataverse.store import DataStore
+
+
+def _response(url, status_code, content=b"", headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = url
+    response.headers.update(headers or {})
+    response._content = content
+    return response
+
+
+class RangeServer:
+    """Serves one parquet file, honouring Range headers unless `ranges` is False.
+
+    Without `content_length` the HEAD response has no Content-Length, as with chunked responses.
+    """
+
+    url = "https://github.com/sportsdataverse/sportsdataverse-data/releases/download/pbp/play_by_play_2022.parquet"
+
+    def __init__(self, df, ranges=True, row_group_size=None, etag='"v1"', content_length=True):
+        self.etag = etag
+        self.content_length = content_length
+        buf = io.BytesIO()
+        df.write_parquet(buf, row_group_size=row_group_size, compression="uncompressed")
+        self.content = buf.getvalue()
+        self.ranges = ranges
+        self.sent = 0
+        self.gets = []
+
+    def head(self, url, allow_redirects=True, timeout=None):
+        headers = {"ETag": self.etag}
+        if self.content_length:
+            headers["Content-Length"] = str(len(self.content))
+        return _response(url, 200, headers=headers)
+
+    def get(self, url, headers=None, timeout=None):
+        self.gets.append((headers or {}).get("Range"))
+        if not self.ranges or not headers:
+            self.sent += len(self.content)
+            return _response(url, 200, self.content)
+        start, end = headers["Range"].split("=")[1].split("-")
+        if start:
+            start, end = int(start), min(int(end), len(self.content) - 1)
+        else:
+            start, end = max(len(self.content) - int(end), 0), len(self.content) - 1
+        self.sent += end + 1 - start
+        content_range = f"bytes {start}-{end}/{len(self.content)}"
+        return _response(url, 206, self.content[start : end + 1], headers={"Content-Range": content_range})
+
+
+def _wide_frame(rows=5000, cols=30):
+    return pl.DataFrame({f"col_{i}": [float(i * rows + r) for r in range(rows)] for i in range(cols)})
+
+
+@pytest.fixture
+def serve(monkeypatch):
+    def serve(server):
+        monkeypatch.setattr(range_reader, "get_session", lambda url: server)
+        return server
+
+    return serve
+
+
+class TestReadParquetColumns:
+    # Tests that reading a few columns transfers a small fraction of the file
+    def test_reads_only_requested_columns(self, serve, tmp_path):
+        df = _wide_frame()
+        server = serve(RangeServer(df))
+        out = read_parquet_columns(server.url, columns=["col_3", "col_7"], footer_cache_dir=str(tmp_path))
+        assert out.frame_equal(df.select(["col_3", "col_7"]))
+        assert server.sent < len(server.content) * 0.25
+
+    # Tests that the footer comes from the local cache on the next read
+    def test_footer_cache(self, serve, tmp_path):
+        server = serve(RangeServer(_wide_frame()))
+        read_parquet_columns(server.url, columns=["col_1"], footer_cache_dir=str(tmp_path))
+        first = len(server.gets)
+        read_parquet_columns(server.url, columns=["col_1"], footer_cache_dir=str(tmp_path))
+        assert server.gets[first:] == server.gets[1:first]
+        assert len(list(tmp_path.iterdir())) == 1
+
+    # Tests that only the requested row groups are read
+    def test_row_groups(self, serve, tmp_path):
+        df = _wide_frame(rows=1000, cols=3)
+        server = serve(RangeServer(df, row_group_size=250))
+        out = read_parquet_columns(server.url, columns=["col_0"], row_groups=[1], footer_cache_dir=str(tmp_path))
+        assert out["col_0"].to_list() == df["col_0"].to_list()[250:500]
+
+    # Tests that a server ignoring Range still gives the right data
+    def test_server_without_ranges(self, serve, tmp_path):
+        df = _wide_frame(rows=100, cols=4)
+        server = serve(RangeServer(df, ranges=False))
+        out = read_parquet_columns(server.url, columns=["col_2"], footer_cache_dir=str(tmp_path))
+        assert out.frame_equal(df.select("col_2"))
+        assert len(server.gets) == 1
+
+    # Tests that the size comes from a suffix range request when the HEAD has no Content-Length
+    def test_without_content_length(self, serve, tmp_path):
+        df = _wide_frame()
+        server = serve(RangeServer(df, content_length=False))
+        out = read_parquet_columns(server.url, columns=["col_3"], footer_cache_dir=str(tmp_path))
+        assert out.frame_equal(df.select("col_3"))
+        assert server.gets[0] == f"bytes=-{range_reader.TAIL_SIZE}"
+        assert server.sent < len(server.content) * 0.25
+
+    # Tests that the whole file is downloaded once when there is neither a Content-Length nor Range support
+    def test_without_content_length_or_ranges(self, serve, tmp_path):
+        df = _wide_frame(rows=100, cols=4)
+        server = serve(RangeServer(df, ranges=False, content_length=False))
+        out = read_parquet_columns(server.url, columns=["col_2"], footer_cache_dir=str(tmp_path))
+        assert out.frame_equal(df.select("col_2"))
+        assert len(server.gets) == 1
+
+    # Tests that the HEAD and every range request reach the metrics hooks
+    def test_reports_metrics(self, serve, tmp_path):
+        server = serve(RangeServer(_wide_frame(rows=100, cols=4)))
+        events = []
+        hook = events.append
+        add_hook(hook)
+        try:
+            read_parquet_columns(server.url, columns=["col_2"], footer_cache_dir=str(tmp_path))
+        finally:
+            remove_hook(hook)
+        assert len(events) == len(server.gets) + 1
+        assert {e.family for e in events} == {"releases"}
+        assert sum(e.bytes for e in events) == server.sent
+
+    # Tests that load_seasons fetches only the requested columns when no file cache is set
+    def test_load_seasons_columns(self, serve, tmp_path, monkeypatch):
+        monkeypatch.setattr(range_reader, "FOOTER_CACHE_DIR", str(tmp_path))
+        df = _wide_frame(rows=100, cols=5)
+        server = serve(RangeServer(df))
+        out = load_seasons(
+            server.url.replace("2022", "{season}"), [2021, 2022], 2002, progress=False, columns=["col_4"]
+        )
+        assert out["col_4"].to_list() == df["col_4"].to_list() * 2
+        assert None not in server.gets
+
+
+def _pbp(games, plays=200):
+    return pl.DataFrame(
+        {
+            "game_id": [g for g in games for _ in range(plays)],
+            "season": [2023] * (len(games) * plays),
+            "week": [1 + g // 5 for g in games for _ in range(plays)],
+            "desc": [f"game {g} play {p} " * 4 for g in games for p in range(plays)],
+        }
+    )
+
+
+class TestRefreshSeasons:
+    url = RangeServer.url.replace("2022", "{season}")
+
+    # Tests that an unchanged season costs one HEAD and a changed one only the row groups of new games
+    def test_appends_new_games(self, serve, tmp_path):
+        store = DataStore(str(tmp_path / "store"))
+        footers = str(tmp_path / "footers")
+        server = serve(RangeServer(_pbp(range(10)), row_group_size=200))
+        assert refresh_seasons(self.url, 2023, 2002, store, "mbb", "pbp", footer_cache_dir=footers) == {2023: 2000}
+        gets = len(server.gets)
+        assert refresh_seasons(self.url, 2023, 2002, store, "mbb", "pbp", footer_cache_dir=footers) == {2023: 0}
+        assert len(server.gets) == gets
+
+        server = serve(RangeServer(_pbp(range(12)), row_group_size=200, etag='"v2"'))
+        assert refresh_seasons(self.url, 2023, 2002, store, "mbb", "pbp", footer_cache_dir=footers) == {2023: 400}
+        assert server.sent < len(server.content) * 0.5
+        data = store.scan("mbb", "pbp").collect()
+        assert data.height == 2400
+        assert sorted(data["game_id"].unique().to_list()) == list(range(12))
+
+    # Tests that key=None replaces the whole season when the file changed
+    def test_replaces_season(self, serve, tmp_path):
+        store = DataStore(str(tmp_path))
+        serve(RangeServer(_pbp(range(3), plays=2)))
+        refresh_seasons(self.url, 2023, 2002, store, "mbb", "schedule", key=None, footer_cache_dir=str(tmp_path / "f"))
+        serve(RangeServer(_pbp(range(2), plays=2), etag='"v2"'))
+        refresh_seasons(self.url, 2023, 2002, store, "mbb", "schedule", key=None, footer_cache_dir=str(tmp_path / "f"))
+        assert store.scan("mbb", "schedule").collect().height == 4
+
+    # Tests that the in-season NFL datasets are refreshed by replacing the whole season
+    def test_nfl_refresh_replaces_season(self, serve, tmp_path, monkeypatch):
+        from sportsdataverse.nfl import refresh_nfl_injuries
+
+        monkeypatch.setattr(range_reader, "FOOTER_CACHE_DIR", str(tmp_path / "f"))
+        store = DataStore(str(tmp_path / "store"))
+        serve(RangeServer(_pbp(range(3), plays=2)))
+        assert refresh_nfl_injuries(store, [2023]) == {2023: 6}
+        serve(RangeServer(_pbp(range(2), plays=2), etag='"v2"'))
+        assert refresh_nfl_injuries(store, [2023]) == {2023: 4}
+        assert store.scan("nfl", "injuries").collect().height == 4
+
+    # Tests that an empty file leaves the stored season alone and is checked again on the next refresh
+    def test_empty_file_keeps_season(self, serve, tmp_path):
+        store = DataStore(str(tmp_path))
+        refresh = partial(
+            refresh_seasons,
+            self.url,
+            2023,
+            2002,
+            store,
+            "mbb",
+            "schedule",
+            key=None,
+            footer_cache_dir=str(tmp_path / "f"),
+        )
+        serve(RangeServer(_pbp(range(3), plays=2)))
+        refresh()
+        serve(RangeServer(_pbp([]), etag='"v2"'))
+        assert refresh() == {2023: 0}
+        assert store.scan("mbb", "schedule").collect().height == 6
+        server = serve(RangeServer(_pbp(range(2), plays=2), etag='"v2"'))
+        refresh()
+        assert server.gets and store.scan("mbb", "schedule").collect().height == 4
@@ -0,0 +1,55 @@
+import time
+
+import pytest
+
+from sportsdataverse.rate_limit import (
+    FileTokenBucket,
+    RateLimiter,
+    TokenBucket,
+    configure_rate_limits,
+    disable_rate_limits,
+    endpoint_family,
+    get_rate_limiter,
+)
+
+
+class TestRateLimit:
+    # Tests that urls are sorted into the endpoint families that get their own buckets
+    def test_endpoint_family(self):
+        assert endpoint_family("http://sports.core.api.espn.com/v2/sports/basketball/leagues/nba/athletes/1") == (
+            "athletes"
+        )
+        assert endpoint_family("http://site.api.espn.com/apis/site/v2/sports/football/nfl/summary?event=1") == (
+            "summary"
+        )
+        assert endpoint_family("https://statsapi.web.nhl.com/api/v1/schedule") == "other"
+
+    # Tests that a bucket lets a burst through and then spaces requests at the configured rate
+    def test_token_bucket_burst_then_rate(self):
+        bucket = TokenBucket(rate=10, burst=2)
+        assert bucket.reserve() == 0 and bucket.reserve() == 0
+        assert bucket.reserve() == pytest.approx(0.1, abs=0.02)
+
+    # Tests that two file buckets on the same path share one budget
+    def test_file_bucket_is_shared(self, tmp_path):
+        first = FileTokenBucket(rate=1, burst=1, path=str(tmp_path / "b.bucket"))
+        second = FileTokenBucket(rate=1, burst=1, path=str(tmp_path / "b.bucket"))
+        assert first.reserve() == 0
+        assert second.reserve() > 0.9
+
+    # Tests that athlete lookups and summaries use separate buckets and unmatched hosts are not limited
+    def test_rules_are_per_host_and_family(self):
+        limiter = RateLimiter({("sports.core.api.espn.com", "athletes"): (1, 1), ("site.api.espn.com", None): (1, 1)})
+        athlete = "https://sports.core.api.espn.com/v2/sports/football/leagues/nfl/athletes/1"
+        summary = "https://site.api.espn.com/apis/site/v2/sports/football/nfl/summary"
+        assert limiter.bucket_for(athlete) is not limiter.bucket_for(summary)
+        assert limiter.bucket_for("https://example.com/") is None
+        tic = time.monotonic()
+        assert limiter.acquire(athlete) == 0 and limiter.acquire(summary) == 0
+        assert time.monotonic() - tic < 0.5
+
+    # Tests that the global limiter can be switched on and off
+    def test_configure_and_disable(self):
+        assert isinstance(configure_rate_limits(), RateLimiter)
+        disable_rate_limits()
+        assert get_rate_limiter() is None
@@ -0,0 +1,116 @@
+import os
+
+import polars as pl
+import pyarrow as pa
+import pytest
+
+from sportsdataverse import store as store_module
+from sportsdataverse.store import DataStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return DataStore(str(tmp_path))
+
+
+@pytest.fixture
+def pbp():
+    return pl.DataFrame(
+        {
+            "game_id": [1, 1, 2, 3],
+            "season": [2021, 2021, 2021, 2022],
+            "week": [1, 1, 2, 1],
+            "epa": [0.1, -0.2, 0.3, 0.4],
+        }
+    )
+
+
+class TestDataStore:
+    # Tests that rows land in hive partitions and come back with their partition columns
+    def test_write_and_scan(self, store, pbp):
+        paths = store.write(pbp, "nfl", "pbp")
+        assert len(paths) == 3
+        assert "league=nfl/dataset=pbp/season=2021/week=2/" in paths[1]
+        assert store.partitions("nfl", "pbp") == [
+            {"season": 2021, "week": 1},
+            {"season": 2021, "week": 2},
+            {"season": 2022, "week": 1},
+        ]
+        data = store.scan("nfl", "pbp").filter(pl.col("season") == 2021).collect().sort("epa")
+        assert data["game_id"].to_list() == [1, 1, 2]
+        assert data["week"].to_list() == [1, 1, 2]
+
+    # Tests that appends add rows while an overwrite replaces only the partitions it writes
+    def test_append_and_overwrite(self, store, pbp):
+        store.write(pbp, "nfl", "pbp")
+        store.write(pbp.filter(pl.col("game_id") == 3), "nfl", "pbp")
+        assert store.scan("nfl", "pbp").collect().height == 5
+        update = pl.DataFrame({"game_id": [4], "season": [2022], "week": [1], "epa": [1.0], "wp": [0.5]})
+        store.write(update, "nfl", "pbp", mode="overwrite")
+        data = store.scan("nfl", "pbp").collect().sort("game_id")
+        assert data["game_id"].to_list() == [1, 1, 2, 4]
+        assert data["wp"].to_list() == [None, None, None, 0.5]
+
+    # Tests that replace swaps a season as a whole and keeps the old one when the write fails
+    def test_replace(self, store, pbp, monkeypatch):
+        store.write(pbp, "nfl", "pbp")
+        update = pl.DataFrame({"game_id": [5], "week": [3], "epa": [1.0]})
+        store.replace(update, "nfl", "pbp", season=2021)
+        data = store.scan("nfl", "pbp").collect().sort("game_id")
+        assert data["game_id"].to_list() == [3, 5]
+        assert store.partitions("nfl", "pbp") == [{"season": 2021, "week": 3}, {"season": 2022, "week": 1}]
+
+        def fail(*args):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(store_module, "_write_partition", fail)
+        with pytest.raises(OSError):
+            store.replace(pbp.filter(pl.col("season") == 2021), "nfl", "pbp", season=2021)
+        assert store.scan("nfl", "pbp").collect().sort("game_id")["game_id"].to_list() == [3, 5]
+        assert sorted(os.listdir(store.dataset_path("nfl", "pbp"))) == [
+            "_common_metadata",
+            "season=2021",
+            "season=2022",
+        ]
+
+    # Tests that processed plays are stored per game and a rerun replaces the game's earlier copy
+    def test_write_plays(self, store):
+        plays = [{"game_id": 401256137, "season": 2020, "week": 5, "epa": 0.1}]
+        store.write_plays({"gameId": 401256137, "plays": plays}, "cfb")
+        table = pa.table({"game_id": [401256137] * 2, "season": [2020] * 2, "week": [5] * 2, "epa": [0.2, 0.3]})
+        store.write_plays({"gameId": 401256137, "plays": table}, "cfb")
+        store.write_plays({"gameId": 401256138, "plays": plays}, "cfb")
+        data = store.scan("cfb", "plays").collect()
+        assert sorted(data["epa"].to_list()) == [0.1, 0.2, 0.3]
+
+    # Tests that materialize loads and writes one season at a time
+    def test_materialize(self, store):
+        calls = []
+
+        def load_schedule(seasons, return_as_pandas=False):
+            calls.append(seasons)
+            return pl.DataFrame({"game_id": [seasons[0] * 10]})
+
+        store.materialize(load_schedule, "nba", "schedule", range(2021, 2023))
+        assert calls == [[2021], [2022]]
+        assert store.partitions("nba", "schedule") == [{"season": 2021}, {"season": 2022}]
+        assert store.scan("nba", "schedule").collect().sort("season")["game_id"].to_list() == [20210, 20220]
+
+    # Tests that scan reads one schema file instead of every footer and promotes types that differ by season
+    def test_scan_promotes_types(self, store, pbp, monkeypatch):
+        store.write(pbp.filter(pl.col("season") == 2021), "nfl", "pbp")
+        store.write(pbp.filter(pl.col("season") == 2022).with_columns(pl.col("game_id").cast(pl.Float64)), "nfl", "pbp")
+        read_schema = store_module.pq.read_schema
+        calls = []
+        monkeypatch.setattr(store_module.pq, "read_schema", lambda path: calls.append(path) or read_schema(path))
+        out = store.scan("nfl", "pbp").collect().sort(["season", "week"])
+        assert out["game_id"].dtype == pl.Float64 and out["game_id"].to_list() == [1.0, 1.0, 2.0, 3.0]
+        assert len(calls) == 1
+
+    # Tests that bad writes are rejected and that an empty dataset scans to an empty frame
+    def test_errors_and_empty(self, store, pbp):
+        with pytest.raises(ValueError):
+            store.write(pbp, "nfl", "pbp", mode="upsert")
+        with pytest.raises(ValueError):
+            store.write(pbp.with_columns(week=pl.lit(None, dtype=pl.Int64)), "nfl", "pbp")
+        assert store.scan("nfl", "pbp").collect().is_empty()
@@ -0,0 +1,76 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+import requests
+
+from sportsdataverse.dl_utils import adownload, download
+from sportsdataverse.transport import CassetteMissError, CassetteTransport, get_transport, use_cassette
+
+
+class CountingSession:
+    def __init__(self, status_code=200):
+        self.status_code = status_code
+        self.calls = 0
+
+    def get(self, url, params=None, **kwargs):
+        self.calls += 1
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.url = url
+        response.headers["Content-Type"] = "application/json"
+        response._content = json.dumps({"url": url, "params": params}).encode() if self.status_code != 304 else b""
+        return response
+
+
+class TestCassetteTransport:
+    # Tests that a recorded response is replayed without touching the network, cache buster included
+    def test_record_then_strict_replay(self, tmp_path):
+        live = CountingSession()
+        with use_cassette(tmp_path, mode="record") as cassette:
+            recorded = download("http://site.api.espn.com/summary?event=1&111", session=live, cache=False)
+        assert cassette.recorded == 1 and live.calls == 1
+        offline = CountingSession()
+        with use_cassette(tmp_path, mode="strict") as cassette:
+            replayed = download("http://site.api.espn.com/summary?event=1&222", session=offline, cache=False)
+        assert offline.calls == 0 and cassette.hits == 1
+        assert replayed.json() == recorded.json()
+
+    # Tests that strict mode fails on the first attempt for anything not recorded
+    def test_strict_miss_raises(self, tmp_path):
+        session = CountingSession()
+        with use_cassette(tmp_path, mode="strict"):
+            with pytest.raises(CassetteMissError):
+                download("http://site.api.espn.com/summary?event=2", session=session, cache=False)
+        assert session.calls == 0
+        assert not isinstance(get_transport(), CassetteTransport)
+
+    # Tests that adownload replays recordings too
+    def test_async_replay(self, tmp_path):
+        with use_cassette(tmp_path, mode="record"):
+            download("http://site.api.espn.com/scoreboard", params={"dates": 20230101}, session=CountingSession())
+
+        def refuse(request):
+            raise AssertionError("network used during replay")
+
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(refuse)) as client:
+                return await adownload(
+                    "http://site.api.espn.com/scoreboard", params={"dates": 20230101}, client=client, cache=False
+                )
+
+        with use_cassette(tmp_path, mode="strict"):
+            resp = asyncio.run(run())
+        assert resp.json()["params"] == {"dates": 20230101}
+
+    # Tests that a bodiless 304 does not overwrite the recording of the 200
+    def test_not_modified_not_recorded(self, tmp_path):
+        url = "http://site.api.espn.com/summary?event=3"
+        cassette = CassetteTransport(tmp_path, mode="record")
+        cassette.get(CountingSession(), url)
+        cassette.get(CountingSession(status_code=304), url, headers={"If-None-Match": '"abc"'})
+        assert cassette.recorded == 1
+        replayed = CassetteTransport(tmp_path, mode="strict").get(CountingSession(), url)
+        assert replayed.status_code == 200
+        assert replayed.json()["url"] == url